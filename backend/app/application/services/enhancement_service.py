@@ -9,6 +9,7 @@ from sqlalchemy import update as sql_update
 from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
 from app.infrastructure.repositories.profile_repository import ProfileRepository
 from app.application.services.style_extraction_service import StyleExtractionService
+from app.application.services.profile_text_index import build_profile_index
 from app.infrastructure.database.models import MasterProfileModel
 
 
@@ -105,7 +106,8 @@ class EnhancementService:
         if experiences_to_update:
             await self.profile_repo.update_experiences_bulk(
                 profile_id=str(profile_id),
-                experiences=experiences_to_update
+                experiences=experiences_to_update,
+                text_index=build_profile_index(experiences=experiences_to_update)
             )
         
         # Prepare projects with enhanced descriptions for bulk update
@@ -121,7 +123,8 @@ class EnhancementService:
         if projects_to_update:
             await self.profile_repo.update_projects_bulk(
                 profile_id=str(profile_id),
-                projects=projects_to_update
+                projects=projects_to_update,
+                text_index=build_profile_index(projects=projects_to_update)
             )
         
         return {
@@ -3,13 +3,14 @@ Export Renderer Service
 Handles template rendering and document generation (PDF/DOCX).
 """
 
+import hashlib
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from io import BytesIO
-import zipfile
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
@@ -52,15 +53,30 @@ except ImportError as e:
 from app.domain.enums.export_format import ExportFormat
 from app.domain.enums.template_type import TemplateType
 
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# Bump when rendering code changes its output; template edits are detected automatically
+RENDERER_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def renderer_version() -> str:
+    """Renderer code version plus a digest of the template files."""
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATE_DIR.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(TEMPLATE_DIR).as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+    return f"{RENDERER_VERSION}:{digest.hexdigest()[:16]}"
+
 
 class ExportRenderer:
     """Renders structured content into PDF/DOCX using templates."""
     
     def __init__(self):
         """Initialize the renderer with Jinja2 environment."""
-        template_dir = Path(__file__).parent / "templates"
         self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
+            loader=FileSystemLoader(str(TEMPLATE_DIR)),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True
@@ -156,30 +172,6 @@ class ExportRenderer:
         
         return buffer.read()
     
-    def create_batch_export(
-        self,
-        exports: List[Dict[str, Any]]
-    ) -> bytes:
-        """
-        Create a ZIP file containing multiple exports.
-        
-        Args:
-            exports: List of export dictionaries with 'filename' and 'content' keys
-        
-        Returns:
-            ZIP file bytes
-        """
-        buffer = BytesIO()
-        
-        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for export in exports:
-                filename = export['filename']
-                content = export['content']
-                zip_file.writestr(filename, content)
-        
-        buffer.seek(0)
-        return buffer.read()
-    
     def _render_html(
         self,
         structured_content: Dict[str, Any],
@@ -558,3 +550,14 @@ class ExportRenderer:
             # Add spacing between paragraphs
             if i < len(paragraphs) - 1:
                 p.paragraph_format.space_after = Pt(12)
+
+
+_export_renderer: Optional[ExportRenderer] = None
+
+
+def get_export_renderer() -> ExportRenderer:
+    """Get the shared renderer (one Jinja environment and template cache per process)."""
+    global _export_renderer
+    if _export_renderer is None:
+        _export_renderer = ExportRenderer()
+    return _export_renderer
@@ -1,40 +1,75 @@
 """
 Export Service
-Orchestrates document export process: rendering + S3 upload + presigned URLs.
+Orchestrates document export process: rendering + storage upload + download URLs.
 """
 
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
+import asyncio
+import hashlib
+import json
+import tempfile
 import uuid
+import zipfile
 
-from app.domain.entities.export import Export
+from app.domain.entities.export import Export, ExportSummary
 from app.domain.entities.generation import Generation
 from app.domain.enums.export_format import ExportFormat
 from app.domain.enums.template_type import TemplateType
-from app.application.services.export_renderer import ExportRenderer
-from app.infrastructure.storage.s3_storage_adapter import S3StorageAdapter
+from app.application.services.export_renderer import ExportRenderer, renderer_version
+from app.application.services.render_pool import RenderExecutor
+from app.infrastructure.adapters.storage.storage_interface import AsyncStorageInterface
 from app.infrastructure.repositories.generation_repository import GenerationRepository
 from app.infrastructure.repositories.export_repository import ExportRepository
 from app.infrastructure.repositories.job_repository import JobRepository
 
 
+def render_fingerprint(
+    structured_content: Any,
+    format: ExportFormat,
+    template: TemplateType,
+    options: Optional[Dict[str, Any]]
+) -> str:
+    """Hash of everything a rendered document depends on.
+    
+    Options are normalized (unset values dropped, keys sorted) so equivalent
+    requests match; a renderer or template change produces a new hash.
+    """
+    data = json.loads(structured_content) if isinstance(structured_content, str) else structured_content
+    content = {
+        "content": data,
+        "format": format.value,
+        "template": template.value,
+        "options": {key: value for key, value in (options or {}).items() if value is not None},
+        "renderer": renderer_version(),
+    }
+    encoded = json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 class ExportService:
     """Service for handling document exports."""
     
     def __init__(
         self,
         export_renderer: ExportRenderer,
-        s3_adapter: S3StorageAdapter,
+        storage: AsyncStorageInterface,
         generation_repository: GenerationRepository,
         export_repository: ExportRepository,
-        job_repository: JobRepository
+        job_repository: JobRepository,
+        render_executor: Optional[RenderExecutor] = None
     ):
-        """Initialize export service with dependencies."""
+        """Initialize export service with dependencies.
+        
+        With a render_executor, documents are rendered on its worker
+        processes; otherwise export_renderer renders them in-process.
+        """
         self.renderer = export_renderer
-        self.s3_adapter = s3_adapter
+        self.storage = storage
         self.generation_repo = generation_repository
         self.export_repo = export_repository
         self.job_repo = job_repository
+        self.render_executor = render_executor
     
     async def export_to_pdf(
         self,
@@ -70,11 +105,17 @@ class ExportService:
         if not generation.content_structured:
             raise ValueError(f"Generation {generation_id} has no structured content")
         
+        # Identical earlier export: reuse its file, only presign a fresh URL
+        render_hash = render_fingerprint(
+            generation.content_structured, ExportFormat.PDF, template, options
+        )
+        existing = await self._find_rendered(user_id, generation_id, render_hash)
+        if existing:
+            return existing
+        
         # Render PDF
-        pdf_bytes = self.renderer.render_pdf(
-            structured_content=generation.content_structured,
-            template=template,
-            options=options
+        pdf_bytes = await self._render(
+            ExportFormat.PDF, generation.content_structured, template, options
         )
         
         # Create export entity
@@ -82,8 +123,8 @@ class ExportService:
         filename = self._generate_filename(generation, ExportFormat.PDF)
         s3_key = Export.generate_s3_key(user_id, export_id, ExportFormat.PDF)
         
-        # Upload to S3
-        self.s3_adapter.upload_file(
+        # Upload to storage
+        await self.storage.upload_file(
             file_content=pdf_bytes,
             key=s3_key,
             content_type='application/pdf'
@@ -94,7 +135,7 @@ class ExportService:
         page_count = self._estimate_page_count(pdf_bytes, ExportFormat.PDF)
         
         # Generate presigned URL (1 hour expiry)
-        download_url = self.s3_adapter.generate_presigned_url(
+        download_url = await self.storage.generate_presigned_url(
             key=s3_key,
             expiration=3600  # 1 hour
         )
@@ -117,7 +158,8 @@ class ExportService:
                 'created_from': str(generation.id)
             },
             download_url=download_url,
-            expires_at=datetime.utcnow() + timedelta(days=30)
+            expires_at=datetime.utcnow() + timedelta(days=30),
+            render_hash=render_hash
         )
         
         # Save to database
@@ -156,11 +198,17 @@ class ExportService:
         if not generation.content_structured:
             raise ValueError(f"Generation {generation_id} has no structured content")
         
+        # Identical earlier export: reuse its file, only presign a fresh URL
+        render_hash = render_fingerprint(
+            generation.content_structured, ExportFormat.DOCX, template, options
+        )
+        existing = await self._find_rendered(user_id, generation_id, render_hash)
+        if existing:
+            return existing
+        
         # Render DOCX
-        docx_bytes = self.renderer.render_docx(
-            structured_content=generation.content_structured,
-            template=template,
-            options=options
+        docx_bytes = await self._render(
+            ExportFormat.DOCX, generation.content_structured, template, options
         )
         
         # Create export entity
@@ -168,8 +216,8 @@ class ExportService:
         filename = self._generate_filename(generation, ExportFormat.DOCX)
         s3_key = Export.generate_s3_key(user_id, export_id, ExportFormat.DOCX)
         
-        # Upload to S3
-        self.s3_adapter.upload_file(
+        # Upload to storage
+        await self.storage.upload_file(
             file_content=docx_bytes,
             key=s3_key,
             content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document'
@@ -179,7 +227,7 @@ class ExportService:
         file_size = len(docx_bytes)
         
         # Generate presigned URL (1 hour expiry)
-        download_url = self.s3_adapter.generate_presigned_url(
+        download_url = await self.storage.generate_presigned_url(
             key=s3_key,
             expiration=3600
         )
@@ -202,7 +250,8 @@ class ExportService:
                 'created_from': str(generation.id)
             },
             download_url=download_url,
-            expires_at=datetime.utcnow() + timedelta(days=30)
+            expires_at=datetime.utcnow() + timedelta(days=30),
+            render_hash=render_hash
         )
         
         # Save to database
@@ -221,6 +270,10 @@ class ExportService:
         """
         Create a batch export (ZIP) of multiple generations.
         
+        Documents are rendered concurrently and written into a ZIP on a
+        temporary file as each one finishes, then the file is streamed to
+        storage, so memory holds only the documents being rendered.
+        
         Args:
             user_id: User ID
             generation_ids: List of generation IDs to export
@@ -234,53 +287,35 @@ class ExportService:
         if format not in [ExportFormat.PDF, ExportFormat.DOCX]:
             raise ValueError("Batch export only supports PDF and DOCX formats")
         
-        # Render all generations
-        exports = []
+        generations = []
         for gen_id in generation_ids:
-            generation = await self.generation_repo.get_by_id(gen_id, user_id)
-            if not generation or not generation.content_structured:
+            generation = await self.generation_repo.get_by_id(gen_id)
+            if not generation or generation.user_id != user_id or not generation.content_structured:
                 continue
-            
-            # Render based on format
-            if format == ExportFormat.PDF:
-                content = self.renderer.render_pdf(
-                    structured_content=generation.content_structured,
-                    template=template,
-                    options=options
-                )
-            else:  # DOCX
-                content = self.renderer.render_docx(
-                    structured_content=generation.content_structured,
-                    template=template,
-                    options=options
-                )
-            
-            filename = self._generate_filename(generation, format)
-            exports.append({
-                'filename': filename,
-                'content': content
-            })
+            generations.append(generation)
         
-        if not exports:
+        if not generations:
             raise ValueError("No valid generations found for export")
         
-        # Create ZIP file
-        zip_bytes = self.renderer.create_batch_export(exports)
-        
         # Create export entity
         export_id = str(uuid.uuid4())
         filename = f"batch_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.zip"
         s3_key = Export.generate_s3_key(user_id, export_id, ExportFormat.ZIP)
         
-        # Upload to S3
-        self.s3_adapter.upload_file(
-            file_content=zip_bytes,
-            key=s3_key,
-            content_type='application/zip'
-        )
+        with tempfile.TemporaryFile() as archive:
+            await self._write_batch_zip(archive, generations, format, template, options)
+            file_size = archive.tell()
+            archive.seek(0)
+            
+            # Upload to storage (multipart on S3 for large archives)
+            await self.storage.upload_fileobj(
+                fileobj=archive,
+                key=s3_key,
+                content_type='application/zip'
+            )
         
         # Generate presigned URL
-        download_url = self.s3_adapter.generate_presigned_url(
+        download_url = await self.storage.generate_presigned_url(
             key=s3_key,
             expiration=3600
         )
@@ -290,16 +325,17 @@ class ExportService:
             id=export_id,
             user_id=user_id,
             generation_id=None,  # Batch export
+            job_id=None,
             format=ExportFormat.ZIP,
             template=template,
             filename=filename,
             file_path=s3_key,
-            file_size_bytes=len(zip_bytes),
+            file_size_bytes=file_size,
             page_count=None,
             options=options or {},
-            metadata={
-                'generation_ids': generation_ids,
-                'file_count': len(exports),
+            export_metadata={
+                'generation_ids': [str(generation.id) for generation in generations],
+                'file_count': len(generations),
                 'individual_format': format.value
             },
             download_url=download_url,
@@ -323,7 +359,7 @@ class ExportService:
             return None
         
         # Regenerate presigned URL (fresh 1-hour expiry)
-        export.download_url = self.s3_adapter.generate_presigned_url(
+        export.download_url = await self.storage.generate_presigned_url(
             key=export.file_path,
             expiration=3600
         )
@@ -351,7 +387,7 @@ class ExportService:
         valid_exports = []
         for export in exports:
             if not export.is_expired():
-                export.download_url = self.s3_adapter.generate_presigned_url(
+                export.download_url = await self.storage.generate_presigned_url(
                     key=export.file_path,
                     expiration=3600
                 )
@@ -359,6 +395,34 @@ class ExportService:
         
         return valid_exports
     
+    async def list_export_summaries(
+        self,
+        user_id: int,
+        job_id: Optional[str] = None,
+        format: Optional[ExportFormat] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[ExportSummary]:
+        """List lightweight export rows for list screens, with fresh download URLs."""
+        summaries = await self.export_repo.list_summaries_by_user(
+            user_id=user_id,
+            job_id=job_id,
+            format=format,
+            limit=limit,
+            offset=offset
+        )
+        
+        valid_summaries = []
+        for summary in summaries:
+            if not summary.is_expired():
+                summary.download_url = await self.storage.generate_presigned_url(
+                    key=summary.file_path,
+                    expiration=3600
+                )
+                valid_summaries.append(summary)
+        
+        return valid_summaries
+    
     async def list_job_exports(
         self,
         user_id: int,
@@ -408,7 +472,7 @@ class ExportService:
         for export in exports:
             if not export.is_expired():
                 # Regenerate download URL
-                export.download_url = self.s3_adapter.generate_presigned_url(
+                export.download_url = await self.storage.generate_presigned_url(
                     key=export.file_path,
                     expiration=3600
                 )
@@ -433,14 +497,14 @@ class ExportService:
         }
     
     async def delete_export(self, export_id: str, user_id: int) -> bool:
-        """Delete an export (removes from S3 and database)."""
+        """Delete an export (removes from storage and database)."""
         export = await self.export_repo.get_by_id(export_id, user_id)
         
         if not export:
             return False
         
-        # Delete from S3
-        self.s3_adapter.delete_file(export.file_path)
+        # Delete from storage
+        await self.storage.delete_file(export.file_path)
         
         # Delete from database
         await self.export_repo.delete(export_id, user_id)
@@ -451,6 +515,73 @@ class ExportService:
         """Clean up expired exports (background job)."""
         return await self.export_repo.cleanup_expired()
     
+    async def _find_rendered(
+        self,
+        user_id: int,
+        generation_id: str,
+        render_hash: str
+    ) -> Optional[Export]:
+        """Unexpired export with the same render hash, with a fresh download URL."""
+        export = await self.export_repo.get_by_render_hash(user_id, generation_id, render_hash)
+        if not export:
+            return None
+        
+        export.download_url = await self.storage.generate_presigned_url(
+            key=export.file_path,
+            expiration=3600
+        )
+        return export
+    
+    async def _write_batch_zip(
+        self,
+        archive,
+        generations: List[Generation],
+        format: ExportFormat,
+        template: TemplateType,
+        options: Optional[Dict[str, Any]]
+    ) -> None:
+        """Render generations concurrently, adding each to the ZIP as soon as it is done."""
+        # One render per worker, so a batch neither fills the render queue nor buffers results
+        workers = self.render_executor.workers if self.render_executor is not None else 1
+        limit = asyncio.Semaphore(max(1, workers))
+        
+        async def render_member(index: int, generation: Generation):
+            async with limit:
+                content = await self._render(
+                    format, generation.content_structured, template, options
+                )
+            return index, generation, content
+        
+        tasks = [
+            asyncio.ensure_future(render_member(index, generation))
+            for index, generation in enumerate(generations, 1)
+        ]
+        try:
+            with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                for next_member in asyncio.as_completed(tasks):
+                    index, generation, content = await next_member
+                    # Prefix keeps names unique and in request order
+                    name = f"{index:02d}_{self._generate_filename(generation, format)}"
+                    await asyncio.to_thread(zip_file.writestr, name, content)
+                    del content
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _render(
+        self,
+        format: ExportFormat,
+        structured_content: Dict[str, Any],
+        template: TemplateType,
+        options: Optional[Dict[str, Any]]
+    ) -> bytes:
+        """Render one document to PDF or DOCX bytes."""
+        if self.render_executor is not None:
+            return await self.render_executor.render(format, structured_content, template, options)
+        if format == ExportFormat.PDF:
+            return self.renderer.render_pdf(structured_content, template, options)
+        return self.renderer.render_docx(structured_content, template, options)
+    
     def _generate_filename(self, generation: Generation, format: ExportFormat) -> str:
         """Generate filename for export."""
         # Extract name from generation (if available in metadata)
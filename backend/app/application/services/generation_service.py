@@ -1,8 +1,10 @@
 """Generation service for resumes and cover letters."""
 
+from dataclasses import dataclass, field
 from uuid import UUID, uuid4
-from typing import Optional, List, Dict
+from typing import Any, AsyncIterator, Optional, List, Dict, Set, Union
 from datetime import datetime
+import asyncio
 import logging
 import json
 
@@ -10,14 +12,98 @@ from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
 from app.infrastructure.repositories.generation_repository import GenerationRepository
 from app.infrastructure.repositories.profile_repository import ProfileRepository
 from app.infrastructure.repositories.job_repository import JobRepository
-from app.application.services.ranking_service import RankingService
+from app.infrastructure.database.connection import get_session_factory
+from app.application.services.ranking_service import RankingService, is_ranking_current
 from app.application.services.style_extraction_service import StyleExtractionService
+from app.application.services.keyword_taxonomy import get_keyword_taxonomy
+from app.core.config import get_settings
 from app.domain.entities.generation import Generation
 from app.domain.enums.document_type import DocumentType
 from app.domain.enums.generation_status import GenerationStatus
 
 logger = logging.getLogger(__name__)
 
+# Deferred ATS scoring outlives the request that started it. Tasks are kept
+# here so shutdown can drain them, with one event per generation for waiters.
+_ats_tasks: Set[asyncio.Task] = set()
+_ats_done: Dict[UUID, asyncio.Event] = {}
+
+
+async def wait_for_ats_score(generation_id: UUID, timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for deferred scoring of a generation.
+    
+    Only scoring started by this process can be awaited; callers should
+    re-read the generation afterwards either way.
+    
+    Returns:
+        True if scoring finished while waiting
+    """
+    event = _ats_done.get(generation_id)
+    if event is None:
+        return False
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def flush_ats_scoring() -> None:
+    """Wait for deferred ATS scoring to finish (used at shutdown and in tests)."""
+    if _ats_tasks:
+        await asyncio.gather(*_ats_tasks, return_exceptions=True)
+
+
+@dataclass
+class CoverLetterContext:
+    """Everything the cover letter LLM call and persistence step need."""
+    user_id: int
+    job_id: UUID
+    ranking: Any
+    profile: Any
+    job: Any
+    style: Optional[Dict]
+    profile_data: Dict
+    job_description: str
+    company_name: str
+    hiring_manager_name: Optional[str]
+    max_paragraphs: int
+
+
+@dataclass
+class BatchGenerationContext:
+    """Data loaded once for a batch: profile, style, jobs and their stored rankings."""
+    user_id: int
+    job_ids: List[UUID]
+    document_types: List[DocumentType]
+    profile: Any
+    experiences: List
+    style: Optional[Dict]
+    ranking_mode: str
+    text_index: Optional[Dict[str, Dict]]
+    jobs: Dict[UUID, Any]
+    rankings: Dict[UUID, Any]
+
+
+@dataclass
+class BatchJobResult:
+    """Generations for one job of a batch, or why it failed."""
+    job_id: UUID
+    generations: List[Generation] = field(default_factory=list)
+    error: Optional[str] = None
+    # Freshly computed ranking (None when the stored one was reused)
+    ranking: Any = None
+    replaced_ranking_id: Optional[UUID] = None
+
+
+@dataclass
+class BatchSummary:
+    """Totals for a batch, yielded once everything is saved."""
+    total_jobs: int
+    succeeded: int
+    failed: int
+    generation_ids: List[UUID]
+
 
 class GenerationService:
     """Service for generating resumes and cover letters."""
@@ -29,7 +115,8 @@ class GenerationService:
         profile_repo: ProfileRepository,
         job_repo: JobRepository,
         ranking_service: RankingService,
-        style_service: StyleExtractionService
+        style_service: StyleExtractionService,
+        session_factory=None
     ):
         self.llm = llm_adapter
         self.generation_repo = generation_repo
@@ -37,6 +124,8 @@ class GenerationService:
         self.job_repo = job_repo
         self.ranking_service = ranking_service
         self.style_service = style_service
+        # Deferred ATS results are written from a fresh session; the request's is closed by then
+        self._session_factory = session_factory
     
     async def generate_resume(
         self,
@@ -45,9 +134,14 @@ class GenerationService:
         max_experiences: int = 5,
         max_projects: int = 3,
         include_summary: bool = True,
-        custom_prompt: Optional[str] = None
+        custom_prompt: Optional[str] = None,
+        defer_ats: bool = False
     ) -> Generation:
-        """Generate resume for a specific job (no LLM, fast compilation)."""
+        """Generate resume for a specific job (no LLM, fast compilation).
+        
+        With ``defer_ats`` the resume is saved and returned with ``ats_status``
+        pending, and the LLM ATS analysis updates it in the background.
+        """
         # Get or create ranking
         ranking = await self.ranking_service.get_ranking_for_job(user_id, job_id)
         if not ranking:
@@ -63,6 +157,26 @@ class GenerationService:
         
         # Get ranked experiences
         experiences = await self.profile_repo.get_experiences_by_profile_id(profile.id)
+        
+        generation = self._build_resume(
+            user_id, job_id, ranking, profile, experiences,
+            max_experiences, max_projects, include_summary
+        )
+        
+        return await self._score_and_save(generation, job, defer_ats)
+    
+    def _build_resume(
+        self,
+        user_id: int,
+        job_id: UUID,
+        ranking,
+        profile,
+        experiences: List,
+        max_experiences: int,
+        max_projects: int,
+        include_summary: bool
+    ) -> Generation:
+        """Compile an unscored resume from a ranking and already-loaded profile content."""
         exp_dict = {str(exp.id): exp for exp in experiences}  # Direct UUID matching
         
         # Debug logging
@@ -219,11 +333,7 @@ class GenerationService:
             summary=summary if include_summary else None
         )
         
-        # Calculate ATS score using LLM
-        ats_result = await self._calculate_ats_score(resume_text, job)
-        
-        # Create generation entity
-        generation = Generation(
+        return Generation(
             id=uuid4(),
             user_id=user_id,
             job_id=job_id,
@@ -231,16 +341,8 @@ class GenerationService:
             document_type=DocumentType.RESUME,
             content_text=resume_text,
             content_structured=json.dumps(content_structured),
-            status=GenerationStatus.COMPLETED,
-            ats_score=ats_result["score"],
-            ats_feedback=ats_result.get("analysis", ""),
-            llm_metadata=str(ats_result.get("llm_metadata", {}))
+            status=GenerationStatus.COMPLETED
         )
-        
-        # Save generation
-        await self.generation_repo.create(generation)
-        
-        return generation
     
     async def generate_cover_letter(
         self,
@@ -249,9 +351,67 @@ class GenerationService:
         company_name: Optional[str] = None,
         hiring_manager_name: Optional[str] = None,
         max_paragraphs: int = 4,
-        custom_prompt: Optional[str] = None
+        custom_prompt: Optional[str] = None,
+        defer_ats: bool = False
     ) -> Generation:
         """Generate cover letter for a specific job (LLM-powered)."""
+        context = await self.prepare_cover_letter(
+            user_id, job_id, company_name, hiring_manager_name, max_paragraphs
+        )
+        
+        # Generate cover letter using LLM
+        cover_letter_text = await self.llm.generate_cover_letter(
+            job_description=context.job_description,
+            profile_data=context.profile_data,
+            writing_style=context.style,
+            company_name=context.company_name,
+            hiring_manager=context.hiring_manager_name,
+            max_paragraphs=context.max_paragraphs
+        )
+        
+        return await self._save_cover_letter(context, cover_letter_text, defer_ats)
+    
+    async def stream_cover_letter(
+        self,
+        context: CoverLetterContext,
+        defer_ats: bool = False
+    ) -> AsyncIterator[Union[str, Generation]]:
+        """Stream cover letter text as it is generated, then save it.
+        
+        Yields text deltas from the LLM, then the persisted Generation as
+        the final item once the stream completes.
+        
+        Args:
+            context: Result of prepare_cover_letter
+            defer_ats: Save without waiting for the ATS score
+        """
+        chunks = []
+        async for delta in self.llm.stream_cover_letter(
+            job_description=context.job_description,
+            profile_data=context.profile_data,
+            writing_style=context.style,
+            company_name=context.company_name,
+            hiring_manager=context.hiring_manager_name,
+            max_paragraphs=context.max_paragraphs
+        ):
+            chunks.append(delta)
+            yield delta
+        
+        yield await self._save_cover_letter(context, "".join(chunks).strip(), defer_ats)
+    
+    async def prepare_cover_letter(
+        self,
+        user_id: int,
+        job_id: UUID,
+        company_name: Optional[str] = None,
+        hiring_manager_name: Optional[str] = None,
+        max_paragraphs: int = 4
+    ) -> CoverLetterContext:
+        """Load ranking, profile, job and style for a cover letter.
+        
+        Raises:
+            ValueError: If the profile or job does not exist
+        """
         # Get or create ranking
         ranking = await self.ranking_service.get_ranking_for_job(user_id, job_id)
         if not ranking:
@@ -272,6 +432,26 @@ class GenerationService:
         
         # Get ranked experiences and projects with UUID matching
         experiences = await self.profile_repo.get_experiences_by_profile_id(profile.id)
+        
+        return self._cover_letter_context(
+            user_id, job_id, ranking, profile, job, style, experiences,
+            company_name, hiring_manager_name, max_paragraphs
+        )
+    
+    def _cover_letter_context(
+        self,
+        user_id: int,
+        job_id: UUID,
+        ranking,
+        profile,
+        job,
+        style: Optional[Dict],
+        experiences: List,
+        company_name: Optional[str],
+        hiring_manager_name: Optional[str],
+        max_paragraphs: int
+    ) -> CoverLetterContext:
+        """Pick the ranked content for a cover letter from already-loaded data."""
         exp_dict = {str(exp.id): exp for exp in experiences}  # Direct UUID matching
         
         ranked_exps = []
@@ -349,48 +529,280 @@ class GenerationService:
             "projects": ranked_projs
         }
         
-        # Generate cover letter using LLM
-        job_description = job.description or f"{job.title} at {job.company}"
-        cover_letter_text = await self.llm.generate_cover_letter(
-            job_description=job_description,
+        return CoverLetterContext(
+            user_id=user_id,
+            job_id=job_id,
+            ranking=ranking,
+            profile=profile,
+            job=job,
+            style=style,
             profile_data=profile_data,
-            writing_style=style,
+            job_description=job.description or f"{job.title} at {job.company}",
             company_name=company_name or job.company,
-            hiring_manager=hiring_manager_name,
+            hiring_manager_name=hiring_manager_name,
             max_paragraphs=max_paragraphs
         )
-        
+    
+    async def _save_cover_letter(
+        self,
+        context: CoverLetterContext,
+        cover_letter_text: str,
+        defer_ats: bool = False
+    ) -> Generation:
+        """Score and persist a finished cover letter."""
+        generation = self._build_cover_letter(context, cover_letter_text)
+        return await self._score_and_save(generation, context.job, defer_ats)
+    
+    def _build_cover_letter(self, context: CoverLetterContext, cover_letter_text: str) -> Generation:
+        """Unscored cover letter generation for finished LLM text."""
         # Build structured content for export templates
         content_structured = self._build_structured_cover_letter(
-            profile=profile,
+            profile=context.profile,
             cover_letter_text=cover_letter_text,
-            company_name=company_name or job.company,
-            job_title=job.title
+            company_name=context.company_name,
+            job_title=context.job.title
         )
         
-        # Calculate ATS score using LLM
-        ats_result = await self._calculate_ats_score(cover_letter_text, job)
-        
-        # Create generation entity
-        generation = Generation(
+        return Generation(
             id=uuid4(),
-            user_id=user_id,
-            job_id=job_id,
-            ranking_id=ranking.id,
+            user_id=context.user_id,
+            job_id=context.job_id,
+            ranking_id=context.ranking.id,
             document_type=DocumentType.COVER_LETTER,
             content_text=cover_letter_text,
             content_structured=json.dumps(content_structured),
-            status=GenerationStatus.COMPLETED,
-            ats_score=ats_result["score"],
-            ats_feedback=ats_result.get("analysis", ""),
-            llm_metadata=str(ats_result.get("llm_metadata", {}))
+            status=GenerationStatus.COMPLETED
         )
+    
+    async def _score_and_save(self, generation: Generation, job, defer_ats: bool) -> Generation:
+        """Attach the ATS score and save, or save now and score in the background."""
+        if defer_ats:
+            generation.ats_status = GenerationStatus.PENDING
+            await self.generation_repo.create(generation)
+            self._schedule_ats_score(generation.id, generation.content_text, job)
+            return generation
+        
+        await self._apply_ats_score(generation, job)
         
         # Save generation
         await self.generation_repo.create(generation)
         
         return generation
     
+    async def _apply_ats_score(self, generation: Generation, job) -> None:
+        """Calculate the ATS score using LLM and set it on the generation."""
+        ats_result = await self._calculate_ats_score(generation.content_text, job)
+        generation.ats_score = ats_result["score"]
+        generation.ats_feedback = ats_result.get("analysis", "")
+        generation.ats_status = GenerationStatus.COMPLETED
+        generation.llm_metadata = str(ats_result.get("llm_metadata", {}))
+    
+    def _schedule_ats_score(self, generation_id: UUID, text: str, job) -> None:
+        """Start ATS scoring for a saved generation without blocking the caller."""
+        _ats_done[generation_id] = asyncio.Event()
+        task = asyncio.create_task(self._run_ats_score(generation_id, text, job))
+        _ats_tasks.add(task)
+        task.add_done_callback(_ats_tasks.discard)
+    
+    async def _run_ats_score(self, generation_id: UUID, text: str, job) -> None:
+        """Score a generation and record the result (or the failure) on its row."""
+        try:
+            ats_result = await self._calculate_ats_score(text, job)
+            result = {
+                "ats_status": GenerationStatus.COMPLETED,
+                "ats_score": ats_result["score"],
+                "ats_feedback": ats_result.get("analysis", ""),
+                "llm_metadata": str(ats_result.get("llm_metadata", {}))
+            }
+        except Exception as e:
+            logger.error(f"Deferred ATS scoring failed for generation {generation_id}: {e}")
+            result = {
+                "ats_status": GenerationStatus.FAILED,
+                "ats_feedback": f"ATS scoring failed: {str(e)}"
+            }
+        
+        try:
+            factory = self._session_factory or get_session_factory()
+            async with factory() as session:
+                await GenerationRepository(session).update_ats_result(generation_id, **result)
+        except Exception as e:
+            logger.error(f"Failed to save ATS result for generation {generation_id}: {e}")
+        finally:
+            _ats_done.pop(generation_id).set()
+    
+    async def prepare_batch(
+        self,
+        user_id: int,
+        job_ids: List[UUID],
+        document_types: List[DocumentType]
+    ) -> BatchGenerationContext:
+        """Load everything a batch needs in one pass: profile and style once, then each job.
+        
+        Missing jobs are kept (as None) and reported per job by stream_batch.
+        
+        Raises:
+            ValueError: If the user has no profile
+        """
+        profile = await self.profile_repo.get_active_by_user_id(user_id)
+        if not profile:
+            raise ValueError("No profile found")
+        
+        experiences = await self.profile_repo.get_experiences_by_profile_id(profile.id) or []
+        style = None
+        if DocumentType.COVER_LETTER in document_types:
+            style = await self.style_service.get_user_style(user_id)
+        
+        ranking_mode = get_settings().ranking_mode
+        text_index = None
+        if ranking_mode != "llm":
+            text_index = await self.profile_repo.get_text_index(profile.id)
+        
+        job_ids = list(dict.fromkeys(job_ids))
+        jobs: Dict[UUID, Any] = {}
+        rankings: Dict[UUID, Any] = {}
+        for job_id in job_ids:
+            jobs[job_id] = await self.job_repo.get_by_id(str(job_id), user_id)
+            if jobs[job_id]:
+                rankings[job_id] = await self.ranking_service.get_ranking_for_job(user_id, job_id)
+        
+        return BatchGenerationContext(
+            user_id=user_id,
+            job_ids=job_ids,
+            document_types=list(dict.fromkeys(document_types)),
+            profile=profile,
+            experiences=experiences,
+            style=style,
+            ranking_mode=ranking_mode,
+            text_index=text_index,
+            jobs=jobs,
+            rankings=rankings
+        )
+    
+    async def stream_batch(
+        self,
+        context: BatchGenerationContext,
+        max_experiences: int = 5,
+        max_projects: int = 3,
+        include_summary: bool = True,
+        max_paragraphs: int = 4,
+        defer_ats: bool = False
+    ) -> AsyncIterator[Union[BatchJobResult, BatchSummary]]:
+        """Generate documents for every job of a batch, yielding each job as it finishes.
+        
+        Ranking and LLM calls run for up to ``batch_generation_concurrency``
+        jobs at a time and never touch the database. Once all jobs are done,
+        new rankings and then all generations are saved, each in a single
+        transaction, and a BatchSummary is yielded last. Nothing is saved if
+        the stream is abandoned before then.
+        
+        Args:
+            context: Result of prepare_batch
+            defer_ats: Save without waiting for ATS scores
+        """
+        semaphore = asyncio.Semaphore(get_settings().batch_generation_concurrency)
+        
+        async def run(job_id: UUID) -> BatchJobResult:
+            async with semaphore:
+                try:
+                    return await self._generate_batch_job(
+                        context, job_id, max_experiences, max_projects,
+                        include_summary, max_paragraphs, defer_ats
+                    )
+                except Exception as e:
+                    logger.error(f"Batch generation failed for job {job_id}: {e}")
+                    return BatchJobResult(job_id=job_id, error=str(e))
+        
+        tasks = [asyncio.create_task(run(job_id)) for job_id in context.job_ids]
+        results: List[BatchJobResult] = []
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                results.append(result)
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        # Generations reference their ranking, so rankings are saved first
+        await self.ranking_service.save_rankings(
+            [result.ranking for result in results if result.ranking],
+            [result.replaced_ranking_id for result in results if result.ranking and result.replaced_ranking_id]
+        )
+        generations = [generation for result in results for generation in result.generations]
+        await self.generation_repo.create_many(generations)
+        
+        if defer_ats:
+            for generation in generations:
+                self._schedule_ats_score(
+                    generation.id, generation.content_text, context.jobs[generation.job_id]
+                )
+        
+        succeeded = sum(1 for result in results if not result.error)
+        yield BatchSummary(
+            total_jobs=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            generation_ids=[generation.id for generation in generations]
+        )
+    
+    async def _generate_batch_job(
+        self,
+        context: BatchGenerationContext,
+        job_id: UUID,
+        max_experiences: int,
+        max_projects: int,
+        include_summary: bool,
+        max_paragraphs: int,
+        defer_ats: bool
+    ) -> BatchJobResult:
+        """Rank (unless the stored ranking is current) and build documents for one job."""
+        job = context.jobs.get(job_id)
+        if not job:
+            return BatchJobResult(job_id=job_id, error="Job not found")
+        
+        result = BatchJobResult(job_id=job_id)
+        projects = context.profile.projects or []
+        ranking = context.rankings.get(job_id)
+        if not ranking or not is_ranking_current(
+            ranking, job, context.experiences, projects, context.ranking_mode
+        ):
+            result.replaced_ranking_id = ranking.id if ranking else None
+            ranking = await self.ranking_service.compute_ranking(
+                context.user_id, job_id, job, context.profile, context.experiences,
+                projects, context.ranking_mode, context.text_index
+            )
+            result.ranking = ranking
+        
+        generations = []
+        if DocumentType.RESUME in context.document_types:
+            generations.append(self._build_resume(
+                context.user_id, job_id, ranking, context.profile, context.experiences,
+                max_experiences, max_projects, include_summary
+            ))
+        if DocumentType.COVER_LETTER in context.document_types:
+            letter_context = self._cover_letter_context(
+                context.user_id, job_id, ranking, context.profile, job, context.style,
+                context.experiences, None, None, max_paragraphs
+            )
+            cover_letter_text = await self.llm.generate_cover_letter(
+                job_description=letter_context.job_description,
+                profile_data=letter_context.profile_data,
+                writing_style=letter_context.style,
+                company_name=letter_context.company_name,
+                hiring_manager=letter_context.hiring_manager_name,
+                max_paragraphs=letter_context.max_paragraphs
+            )
+            generations.append(self._build_cover_letter(letter_context, cover_letter_text))
+        
+        if defer_ats:
+            for generation in generations:
+                generation.ats_status = GenerationStatus.PENDING
+        else:
+            await asyncio.gather(*(self._apply_ats_score(generation, job) for generation in generations))
+        
+        result.generations = generations
+        return result
+    
     async def get_generation_history(
         self,
         user_id: int,
@@ -622,9 +1034,12 @@ class GenerationService:
         
         job_description = job.description or f"{job.title} at {job.company}"
         
+        # Jobs parsed before the taxonomy may still list aliases separately
+        job_keywords = get_keyword_taxonomy().canonicalize(job.parsed_keywords)
+        
         # Use LLM to calculate ATS score
         return await self.llm.calculate_ats_score(
             document_text=text,
             job_description=job_description,
-            job_keywords=job.parsed_keywords
+            job_keywords=job_keywords
         )
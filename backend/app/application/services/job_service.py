@@ -1,15 +1,109 @@
 """Job service for business logic and text parsing."""
 
+import asyncio
+import base64
+import binascii
 import json
-import re
+import logging
+import multiprocessing
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union
 
-from app.domain.entities.job import Job
+from pydantic import ValidationError
+
+from app.application.services.job_text_parser import (
+    detect_remote,
+    extract_benefits,
+    extract_location,
+    extract_requirements,
+    extract_salary,
+    parse_job_text,
+    parse_keywords,
+)
+from app.core.config import get_settings
+from app.domain.entities.job import Job, JobSummary
 from app.infrastructure.repositories.job_repository import JobRepository
 
+logger = logging.getLogger(__name__)
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_job_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the worker pool for bulk job parsing, creating it on first use.
+    
+    Returns:
+        Process pool, or None when JOB_PARSE_WORKERS is 0
+    """
+    global _parse_pool
+    workers = get_settings().job_parse_workers
+    if _parse_pool is None and workers > 0:
+        # Spawn keeps workers free of the event loop and open DB connections
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _parse_pool
+
+
+def shutdown_job_parse_pool() -> None:
+    """Stop the bulk job parsing workers."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=True, cancel_futures=True)
+        _parse_pool = None
+
+
+def _parse_or_error(raw_text: str) -> Union[Dict[str, Any], Exception]:
+    try:
+        return parse_job_text(raw_text)
+    except Exception as e:
+        return e
+
+
+@dataclass
+class JobImportResult:
+    """Outcome of one posting in a bulk import."""
+    index: int
+    job: Optional[Job] = None
+    error: Optional[str] = None
+
+
+def encode_job_cursor(job: Union[Job, JobSummary]) -> str:
+    """Encode a job's (created_at, id) position as an opaque pagination cursor.
+    
+    Args:
+        job: Last job (or job summary) on the current page
+        
+    Returns:
+        URL-safe cursor string for the next page
+    """
+    payload = json.dumps([job.created_at.isoformat(), job.id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_job_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a pagination cursor produced by encode_job_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        
+    Returns:
+        Tuple of (created_at, job_id)
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(job_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
 
 class JobService:
     """Service for job-related business logic."""
@@ -47,6 +141,78 @@ class JobService:
         # Create job via repository
         return await self.repository.create(job_data)
     
+    async def bulk_import(
+        self,
+        user_id: int,
+        items: List[Union[str, Dict[str, Any]]]
+    ) -> List[JobImportResult]:
+        """Create many jobs from raw texts and/or structured dicts.
+        
+        Raw texts are parsed on the worker pool in parallel, then every valid
+        job is written with a single batched insert. Items that fail parsing or
+        validation are reported individually and do not block the others.
+        
+        Args:
+            user_id: User ID
+            items: Raw job texts or create_structured keyword dicts
+            
+        Returns:
+            One result per item, in input order
+            
+        Raises:
+            Exception: If the batched insert fails (nothing is saved)
+        """
+        raw_indexes = [i for i, item in enumerate(items) if isinstance(item, str)]
+        parsed = await self._parse_texts([items[i] for i in raw_indexes])
+        parsed_by_index = dict(zip(raw_indexes, parsed))
+        
+        results = []
+        jobs = []
+        for index, item in enumerate(items):
+            if isinstance(parsed_by_index.get(index), Exception):
+                error = f"Could not parse job text: {parsed_by_index[index]}"
+                results.append(JobImportResult(index=index, error=error))
+                continue
+            try:
+                if isinstance(item, str):
+                    job_data = {
+                        "user_id": user_id,
+                        "source": "user_created",
+                        "raw_text": item,
+                        **parsed_by_index[index]
+                    }
+                else:
+                    job_data = self._structured_job_data(user_id=user_id, **item)
+                job = Job(**job_data)
+            except (ValidationError, ValueError, TypeError) as e:
+                results.append(JobImportResult(index=index, error=str(e)))
+                continue
+            jobs.append(job)
+            results.append(JobImportResult(index=index, job=job))
+        
+        await self.repository.create_many(jobs)
+        return results
+    
+    async def _parse_texts(self, texts: List[str]) -> List[Union[Dict[str, Any], Exception]]:
+        """Parse raw job texts, fanning out to the worker pool when it helps.
+        
+        Returns:
+            Parsed fields or the exception raised, per text
+        """
+        pool = get_job_parse_pool()
+        if pool is not None and len(texts) > 1:
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *(loop.run_in_executor(pool, parse_job_text, text) for text in texts),
+                return_exceptions=True
+            )
+            if not any(isinstance(result, BrokenProcessPool) for result in results):
+                return results
+            # A worker died; replace the pool and parse this batch in-process
+            logger.error("Job parse pool broke, parsing bulk import inline")
+            shutdown_job_parse_pool()
+        return [_parse_or_error(text) for text in texts]
+    
     async def create_from_url(self, user_id: int, url: str) -> Job:
         """Create job by fetching from URL.
         
@@ -108,34 +274,20 @@ class JobService:
         Raises:
             ValueError: If source is 'mock' (mock jobs should not be saved to database)
         """
-        # Prevent mock jobs from being saved to database
-        if source == "mock":
-            raise ValueError("Mock jobs cannot be saved to database. Use browse_jobs() to access mock data.")
-        
-        # Parse keywords from description and title
-        text_for_keywords = f"{title} {company}"
-        if description:
-            text_for_keywords += f" {description}"
-        
-        keywords = await self._parse_keywords(text_for_keywords)
-        
-        # Create job data dictionary
-        job_data = {
-            "user_id": user_id,
-            "source": source,
-            "title": title,
-            "company": company,
-            "location": location,
-            "description": description,
-            "requirements": requirements or [],
-            "benefits": benefits or [],
-            "parsed_keywords": keywords,
-            "salary_range": salary_range,
-            "remote": remote,
-            "employment_type": employment_type,
-            "status": status,
-            "raw_text": None  # No raw text for structured input
-        }
+        job_data = self._structured_job_data(
+            user_id=user_id,
+            source=source,
+            title=title,
+            company=company,
+            location=location,
+            description=description,
+            requirements=requirements,
+            benefits=benefits,
+            salary_range=salary_range,
+            remote=remote,
+            employment_type=employment_type,
+            status=status
+        )
         
         # Create job via repository
         return await self.repository.create(job_data)
@@ -146,7 +298,8 @@ class JobService:
         status: Optional[str] = None,
         source: Optional[str] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[Job]:
         """Get jobs for a specific user with filters.
         
@@ -155,11 +308,26 @@ class JobService:
             status: Filter by status
             source: Filter by source
             limit: Maximum number of results
-            offset: Pagination offset
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: Keyset cursor from a previous page (see encode_job_cursor)
             
         Returns:
             List of Job entities
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
+        if cursor:
+            after_created_at, after_id = decode_job_cursor(cursor)
+            return await self.repository.get_user_jobs_after(
+                user_id=user_id,
+                after_created_at=after_created_at,
+                after_id=after_id,
+                status=status,
+                source=source,
+                limit=limit
+            )
+        
         return await self.repository.get_user_jobs(
             user_id=user_id,
             status=status,
@@ -168,6 +336,40 @@ class JobService:
             offset=offset
         )
     
+    async def get_user_job_summaries(
+        self,
+        user_id: int,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> List[JobSummary]:
+        """Get list-view summaries of a user's jobs with filters.
+        
+        Args:
+            user_id: User ID
+            status: Filter by status
+            source: Filter by source
+            limit: Maximum number of results
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: Keyset cursor from a previous page (see encode_job_cursor)
+            
+        Returns:
+            List of JobSummary entities
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return await self.repository.get_user_job_summaries(
+            user_id=user_id,
+            status=status,
+            source=source,
+            limit=limit,
+            offset=offset,
+            after=decode_job_cursor(cursor) if cursor else None
+        )
+    
     async def browse_jobs(
         self,
         limit: int = 20,
@@ -220,16 +422,11 @@ class JobService:
         Returns:
             Total number of user's jobs
         """
-        # For now, get all jobs and count them
-        # TODO: Add efficient count method to repository
-        jobs = await self.repository.get_user_jobs(
+        return await self.repository.count_user_jobs(
             user_id=user_id,
             status=status,
-            source=source,
-            limit=1000,  # Large limit to get all
-            offset=0
+            source=source
         )
-        return len(jobs)
     
     async def get_by_id(self, job_id: str, user_id: int) -> Optional[Job]:
         """Get job by ID.
@@ -266,49 +463,60 @@ class JobService:
         """
         return await self.repository.delete(job_id)
     
-    async def _parse_job_text(self, raw_text: str) -> Dict[str, Any]:
-        """Parse raw job text to extract structured data.
+    def _structured_job_data(
+        self,
+        user_id: int,
+        source: str,
+        title: str,
+        company: str,
+        location: Optional[str] = None,
+        description: Optional[str] = None,
+        requirements: Optional[List[str]] = None,
+        benefits: Optional[List[str]] = None,
+        salary_range: Optional[str] = None,
+        remote: bool = False,
+        employment_type: str = "full_time",
+        status: str = "active"
+    ) -> Dict[str, Any]:
+        """Build job data for structured input, tagging keywords from its text.
         
-        Args:
-            raw_text: Raw job description text
-            
-        Returns:
-            Dictionary of parsed job fields
+        Raises:
+            ValueError: If source is 'mock'
         """
-        lines = [line.strip() for line in raw_text.split('\n') if line.strip()]
-        
-        # Extract basic fields
-        title = lines[0] if len(lines) > 0 else "Untitled Position"
-        company = lines[1] if len(lines) > 1 else "Unknown Company"
-        location = await self._extract_location(raw_text)
-        
-        # Extract parsed data
-        keywords = await self._parse_keywords(raw_text)
-        requirements = await self._extract_requirements(raw_text)
-        benefits = await self._extract_benefits(raw_text)
-        salary_range = await self._extract_salary(raw_text)
-        remote = await self._detect_remote(raw_text)
+        # Prevent mock jobs from being saved to database
+        if source == "mock":
+            raise ValueError("Mock jobs cannot be saved to database. Use browse_jobs() to access mock data.")
         
-        # Extract description (skip first 2 lines: title and company)
-        # Keep location if it's on line 3, or include from line 3 onwards
-        description_start_idx = 2
-        if len(lines) > 2 and location and lines[2] == location:
-            description_start_idx = 3
+        # Parse keywords from description and title
+        text_for_keywords = f"{title} {company}"
+        if description:
+            text_for_keywords += f" {description}"
         
-        description = '\n'.join(lines[description_start_idx:]) if len(lines) > description_start_idx else raw_text
+        keywords = parse_keywords(text_for_keywords)
         
-        return {
+        # Create job data dictionary
+        job_data = {
+            "user_id": user_id,
+            "source": source,
             "title": title,
             "company": company,
             "location": location,
             "description": description,
+            "requirements": requirements or [],
+            "benefits": benefits or [],
             "parsed_keywords": keywords,
-            "requirements": requirements,
-            "benefits": benefits,
             "salary_range": salary_range,
             "remote": remote,
-            "status": "active"
+            "employment_type": employment_type,
+            "status": status,
+            "raw_text": None  # No raw text for structured input
         }
+        
+        return job_data
+    
+    async def _parse_job_text(self, raw_text: str) -> Dict[str, Any]:
+        """Parse raw job text to extract structured data (see job_text_parser)."""
+        return parse_job_text(raw_text)
     
     async def _fetch_job_from_url(self, url: str) -> Dict[str, Any]:
         """Fetch job data from URL.
@@ -336,461 +544,28 @@ class JobService:
         }
     
     async def _parse_keywords(self, text: str) -> List[str]:
-        """Extract keywords from job text with comprehensive 2024-2025 tech stack coverage.
-        
-        Args:
-            text: Job text
-            
-        Returns:
-            List of keywords (lowercase)
-        """
-        # Comprehensive tech keywords based on 2024-2025 industry trends
-        tech_keywords = [
-            # Top Programming Languages (2024-2025 most demanded)
-            "javascript", "typescript", "python", "java", "c#", "c++", "php", "ruby", "go", "golang",
-            "rust", "swift", "kotlin", "scala", "r", "perl", "bash", "powershell", "shell",
-            "objective-c", "dart", "lua", "groovy", "elixir", "haskell", "clojure", "f#",
-            # Short codes (need special handling)
-            "js", "ts",
-            
-            # Markup & Data
-            "sql", "nosql", "html", "html5", "css", "css3", "xml", "json", "yaml", "toml", "markdown",
-            
-            # Frontend Frameworks & Libraries (React ecosystem dominant)
-            "react", "react.js", "reactjs", "vue", "vue.js", "vuejs", "angular", "angularjs", 
-            "svelte", "sveltekit", "next.js", "nextjs", "nuxt", "nuxt.js", "gatsby", "remix",
-            "solid.js", "solidjs", "preact", "lit", "web components", "alpine.js",
-            "jquery", "backbone", "ember", "meteor",
-            
-            # CSS Frameworks & Tools
-            "tailwind", "tailwindcss", "bootstrap", "material-ui", "mui", "ant design", "chakra ui",
-            "styled-components", "sass", "scss", "less", "postcss", "emotion",
-            
-            # State Management
-            "redux", "mobx", "zustand", "recoil", "jotai", "pinia", "vuex", "context api", "xstate",
-            
-            # Backend Frameworks (Node.js, Python, Java, .NET)
-            "node.js", "nodejs", "express", "express.js", "nest.js", "nestjs", "koa", "fastify", "hapi",
-            "django", "flask", "fastapi", "pyramid", "tornado", "aiohttp", "quart",
-            "spring", "spring boot", "spring cloud", "micronaut", "quarkus", "play framework",
-            ".net", "dotnet", "asp.net", "asp.net core", "blazor", "entity framework", "ef core",
-            "rails", "ruby on rails", "sinatra", "laravel", "symfony", "codeigniter", "cakephp",
-            "gin", "echo", "fiber", "beego", "actix", "rocket", "axum", "warp",
-            
-            # API Technologies
-            "rest", "restful", "rest api", "graphql", "grpc", "grpc-web", "websocket", "soap",
-            "openapi", "swagger", "postman", "insomnia", "api gateway", "webhooks",
-            
-            # Mobile Development
-            "ios", "android", "react native", "flutter", "xamarin", "ionic", "cordova", "phonegap",
-            "swiftui", "jetpack compose", "mobile development", "native development",
-            
-            # Cloud Platforms (AWS dominance, Azure, GCP)
-            "aws", "amazon web services", "azure", "microsoft azure", "gcp", "google cloud platform",
-            "google cloud", "ibm cloud", "oracle cloud", "digitalocean", "linode", "heroku", "vercel",
-            "netlify", "cloudflare", "firebase", "supabase", "amplify",
-            
-            # AWS Services
-            "ec2", "s3", "lambda", "rds", "dynamodb", "cloudfront", "route 53", "elastic beanstalk",
-            "eks", "ecs", "fargate", "sns", "sqs", "api gateway", "cloudwatch", "iam",
-            
-            # Azure Services
-            "azure functions", "azure devops", "azure sql", "cosmos db", "azure storage",
-            "azure kubernetes service", "aks", "azure active directory", "azure ad",
-            
-            # GCP Services
-            "compute engine", "cloud functions", "cloud run", "cloud storage", "bigquery",
-            "cloud sql", "firestore", "cloud pub/sub", "gke", "google kubernetes engine",
-            
-            # Container & Orchestration
-            "docker", "docker compose", "podman", "kubernetes", "k8s", "helm", "rancher",
-            "openshift", "nomad", "docker swarm", "containerd",
-            
-            # CI/CD & DevOps Tools
-            "jenkins", "github actions", "gitlab ci", "gitlab ci/cd", "circleci", "travis ci",
-            "bamboo", "teamcity", "azure pipelines", "codepipeline", "harness", "spinnaker",
-            "argo cd", "argocd", "flux", "tekton",
-            
-            # Infrastructure as Code
-            "terraform", "terragrunt", "pulumi", "cloudformation", "aws cdk", "bicep", "arm templates",
-            "ansible", "puppet", "chef", "saltstack", "crossplane",
-            
-            # Databases - SQL
-            "postgresql", "postgres", "mysql", "mariadb", "microsoft sql server", "sql server",
-            "mssql", "oracle", "oracle database", "db2", "sqlite", "cockroachdb", "yugabytedb",
-            
-            # Databases - NoSQL
-            "mongodb", "cassandra", "couchbase", "couchdb", "dynamodb", "redis", "memcached",
-            "neo4j", "arangodb", "orientdb", "ravendb", "rethinkdb",
-            
-            # Search & Analytics
-            "elasticsearch", "opensearch", "solr", "algolia", "meilisearch", "typesense",
-            "splunk", "datadog", "new relic", "prometheus", "grafana", "kibana",
-            
-            # Message Queues & Streaming
-            "kafka", "apache kafka", "rabbitmq", "activemq", "zeromq", "nats", "redis streams",
-            "amazon sqs", "amazon sns", "google pub/sub", "azure service bus", "pulsar",
-            
-            # Data Processing & Big Data
-            "spark", "apache spark", "hadoop", "apache hadoop", "flink", "storm", "airflow",
-            "luigi", "prefect", "dagster", "dbt", "snowflake", "databricks", "redshift",
-            "bigquery", "presto", "trino", "hive",
-            
-            # Machine Learning & AI (Rapidly growing 2024-2025)
-            "machine learning", "ml", "deep learning", "ai", "artificial intelligence",
-            "tensorflow", "pytorch", "keras", "scikit-learn", "sklearn", "pandas", "numpy",
-            "opencv", "hugging face", "transformers", "langchain", "llamaindex", "openai",
-            "gpt", "llm", "large language models", "generative ai", "mlops", "mlflow",
-            "kubeflow", "sagemaker", "vertex ai", "azure ml",
-            
-            # Testing Frameworks
-            "jest", "mocha", "chai", "jasmine", "cypress", "playwright", "selenium", "webdriver",
-            "pytest", "unittest", "nose", "junit", "testng", "mockito", "jest", "vitest",
-            "testing library", "enzyme", "karma", "protractor", "puppeteer",
-            
-            # Build Tools & Bundlers
-            "webpack", "vite", "rollup", "parcel", "esbuild", "swc", "turbopack", "gulp",
-            "grunt", "maven", "gradle", "ant", "make", "cmake", "bazel", "nx", "turborepo",
-            
-            # Version Control
-            "git", "github", "gitlab", "bitbucket", "subversion", "svn", "mercurial", "perforce",
-            "git flow", "github flow", "trunk-based development",
-            
-            # Project Management & Collaboration
-            "jira", "confluence", "trello", "asana", "monday.com", "notion", "clickup",
-            "slack", "microsoft teams", "teams", "discord", "zoom", "linear",
-            
-            # IDEs & Editors
-            "vs code", "visual studio code", "visual studio", "intellij", "intellij idea",
-            "pycharm", "webstorm", "phpstorm", "rider", "goland", "eclipse", "netbeans",
-            "sublime text", "atom", "vim", "neovim", "emacs", "jupyter", "jupyter notebook",
-            "colab", "google colab",
-            
-            # Methodologies & Practices (2024-2025 focus)
-            "agile", "scrum", "kanban", "lean", "devops", "devsecops", "sre", "site reliability engineering",
-            "ci/cd", "continuous integration", "continuous deployment", "continuous delivery",
-            "tdd", "test-driven development", "bdd", "behavior-driven development",
-            "pair programming", "mob programming", "code review", "refactoring",
-            
-            # Architecture & Patterns
-            "microservices", "monolith", "serverless", "event-driven", "cqrs", "event sourcing",
-            "domain-driven design", "ddd", "clean architecture", "hexagonal architecture",
-            "mvvm", "mvc", "mvp", "solid", "design patterns", "distributed systems",
-            
-            # Programming Paradigms
-            "oop", "object-oriented programming", "functional programming", "reactive programming",
-            "procedural programming", "declarative programming", "imperative programming",
-            
-            # Security
-            "oauth", "oauth2", "openid connect", "oidc", "jwt", "saml", "ssl", "tls", "https",
-            "encryption", "authentication", "authorization", "rbac", "abac", "zero trust",
-            "penetration testing", "vulnerability assessment", "owasp", "sast", "dast",
-            
-            # Observability & Monitoring
-            "prometheus", "grafana", "datadog", "new relic", "dynatrace", "appdynamics",
-            "splunk", "elastic stack", "elk stack", "jaeger", "zipkin", "opentelemetry",
-            "logging", "monitoring", "tracing", "metrics", "alerting",
-            
-            # Web Servers & Proxies
-            "nginx", "apache", "apache httpd", "tomcat", "iis", "caddy", "traefik", "envoy",
-            "haproxy", "varnish", "squid",
-            
-            # Operating Systems & Platforms
-            "linux", "unix", "ubuntu", "debian", "centos", "rhel", "red hat", "fedora",
-            "arch linux", "windows", "windows server", "macos", "freebsd",
-            
-            # Blockchain & Web3 (Growing 2024-2025)
-            "blockchain", "ethereum", "solidity", "web3", "smart contracts", "bitcoin",
-            "hyperledger", "polygon", "solana", "nft", "defi",
-            
-            # Emerging Technologies
-            "edge computing", "iot", "internet of things", "5g", "quantum computing",
-            "ar", "vr", "augmented reality", "virtual reality", "metaverse",
-            
-            # Data Formats & Protocols
-            "protobuf", "protocol buffers", "avro", "thrift", "messagepack", "cbor",
-            "http", "http/2", "http/3", "tcp", "udp", "mqtt", "amqp",
-            
-            # Analytics & Business Intelligence
-            "analytics", "data analytics", "business intelligence", "bi", "tableau",
-            "power bi", "looker", "metabase", "superset", "qlik", "sisense",
-            "google analytics", "mixpanel", "amplitude", "segment"
-        ]
-        
-        text_lower = text.lower()
-        found_keywords = set()  # Use set to avoid duplicates
-        
-        # Sort by length (descending) to match longer phrases first (e.g., "spring boot" before "spring")
-        tech_keywords.sort(key=len, reverse=True)
-        
-        for keyword in tech_keywords:
-            # Special handling for keywords with special chars
-            if '#' in keyword or '++' in keyword:
-                # For C# and C++, use simpler contains check (case-sensitive for these)
-                if keyword in text or keyword.upper() in text or keyword.lower() in text:
-                    found_keywords.add(keyword)
-            elif keyword in ['r', 'c', 'd', 'f', 'go']:
-                # Single letter languages need exact word boundary + context check
-                # Only match if it appears as a standalone word with likely context
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    # Additional context check for single letters to reduce false positives
-                    context_patterns = {
-                        'r': r'\b(r\s+language|r\s+programming|ggplot|dplyr|tidyverse|cran)\b',
-                        'c': r'\b(c\s+language|c\s+programming|ansi\s+c|iso\s+c)\b',
-                        'd': r'\b(d\s+language|d\s+programming|dlang)\b',
-                        'f': r'\b(f#|f\s+sharp)\b',
-                        'go': r'\b(golang|go\s+lang)\b'
-                    }
-                    if keyword in context_patterns and re.search(context_patterns[keyword], text_lower, re.IGNORECASE):
-                        found_keywords.add(keyword)
-                    elif keyword == 'go' and re.search(r'\bgolang\b', text_lower, re.IGNORECASE):
-                        found_keywords.add('go')
-            else:
-                # Use word boundaries for regular keywords
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    found_keywords.add(keyword)
-        
-        return sorted(list(found_keywords))  # Return sorted list
+        """Extract canonical tech keywords from job text."""
+        return parse_keywords(text)
     
     async def _extract_location(self, text: str) -> Optional[str]:
-        """Extract location from text.
-        
-        Args:
-            text: Job text
-            
-        Returns:
-            Location string or None
-        """
-        # Look for location patterns in first few lines
-        lines = text.split('\n')[:5]
-        
-        for line in lines:
-            # Match patterns like "Seattle, WA", "San Francisco, CA (Remote)", etc.
-            location_match = re.search(
-                r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})',
-                line
-            )
-            if location_match:
-                return location_match.group(1)
-        
-        return None
+        """Extract location from text."""
+        return extract_location(text)
     
     async def _extract_requirements(self, text: str) -> List[str]:
-        """Extract job requirements from text.
-        
-        Args:
-            text: Job text
-            
-        Returns:
-            List of requirements
-        """
-        requirements = []
-        lines = text.split('\n')
-        
-        # Look for requirements section with various heading patterns
-        in_requirements = False
-        requirement_headers = [
-            'requirement', 'qualifications', 'required', 'must have',
-            'what you\'ll need', 'what we\'re looking for', 'you have',
-            'minimum qualifications', 'basic qualifications', 'you should have'
-        ]
-        
-        # Track if we found a requirements section with a header
-        found_header_section = False
-        
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-            
-            # Check for requirements section headers
-            if any(header in line_lower for header in requirement_headers):
-                in_requirements = True
-                found_header_section = True
-                continue
-            
-            if in_requirements:
-                # Stop at next major section
-                stop_keywords = ['benefit', 'perks', 'we offer', 'why join', 'about us', 
-                                'about the company', 'responsibilities', 'what you\'ll do']
-                if any(keyword in line_lower for keyword in stop_keywords):
-                    in_requirements = False
-                    continue
-                
-                # Extract requirement lines
-                if line.strip() and not line.startswith('#'):
-                    # Remove bullet points and clean
-                    cleaned = re.sub(r'^[\-\*•\d+\.\)]\s*', '', line.strip())
-                    if cleaned and len(cleaned) > 5:  # Avoid very short lines
-                        requirements.append(cleaned)
-        
-        # If no requirements found with headers, look for unlabeled requirements at the end
-        # These often appear after benefit descriptions or EEO statements
-        if not found_header_section or len(requirements) < 2:
-            requirements = await self._extract_unlabeled_requirements(lines)
-        
-        return requirements[:15]  # Limit to 15 requirements
-    
-    async def _extract_unlabeled_requirements(self, lines: List[str]) -> List[str]:
-        """Extract requirements that don't have a section header.
-        
-        Args:
-            lines: Lines of job text
-            
-        Returns:
-            List of requirement strings
-        """
-        requirements = []
-        
-        # Find where long prose paragraphs end and short requirement lines begin
-        # Typically requirements are at the end and are shorter, more concise lines
-        potential_reqs_start = -1
-        
-        for i in range(len(lines) - 1, max(len(lines) - 15, 0), -1):  # Look at last 15 lines
-            line = lines[i].strip()
-            if not line or len(line) < 10:  # Skip empty or very short lines
-                continue
-            
-            # Strong requirement indicators (things that must be met)
-            strong_requirement_indicators = [
-                'degree', 'bachelor', 'master', 'phd', 'bs/', 'ba/', 'ms/', 'ma/',
-                'years of experience', 'years experience', 'proficient in', 
-                'certification', 'certified', 'eligible to work', 'authorized to work',
-                'vaccination', 'vaccinated', 'must have', 'required:', 'require:',
-                'minimum', 'at least'
-            ]
-            
-            # Words that indicate this is NOT a requirement
-            exclusion_indicators = [
-                'we offer', 'you will receive', 'you\'ll get', 'opportunity to',
-                'work with', 'learn more', 'see our', 'click here', 'apply now',
-                'join our', 'our team', 'we are', 'about us', 'http', '@',
-                'write software', 'build', 'create', 'develop'  # These are responsibilities
-            ]
-            
-            line_lower = line.lower()
-            
-            # Skip lines with exclusion indicators
-            if any(indicator in line_lower for indicator in exclusion_indicators):
-                continue
-            
-            # Check if line has strong requirement indicators
-            has_strong_req = any(indicator in line_lower for indicator in strong_requirement_indicators)
-            
-            # If line has strong requirement indicators and isn't too long, likely a requirement
-            if len(line) < 300 and has_strong_req:
-                # Clean and add
-                cleaned = re.sub(r'^[\-\*•\d+\.\)]\s*', '', line)
-                if cleaned and cleaned not in requirements:
-                    requirements.insert(0, cleaned)  # Insert at beginning to maintain order
-        
-        return requirements
+        """Extract job requirements from text."""
+        return extract_requirements(text)
     
     async def _extract_benefits(self, text: str) -> List[str]:
-        """Extract job benefits from text.
-        
-        Args:
-            text: Job text
-            
-        Returns:
-            List of benefits
-        """
-        benefits = []
-        lines = text.split('\n')
-        
-        # Look for benefits section with various heading patterns
-        in_benefits = False
-        benefit_headers = [
-            'benefit', 'perks', 'we offer', 'what we offer', 'why join',
-            'what you\'ll get', 'compensation and benefits', 'rewards',
-            'what you get'
-        ]
-        
-        lines_after_benefits_header = 0
-        
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Check for benefits section headers
-            if any(header in line_lower for header in benefit_headers):
-                in_benefits = True
-                lines_after_benefits_header = 0
-                continue
-            
-            if in_benefits:
-                lines_after_benefits_header += 1
-                
-                # Stop at next major section or when we hit requirements-like content
-                stop_keywords = ['requirement', 'qualifications', 'responsibilities', 
-                                'about the role', 'what you\'ll do', 'equal opportunity',
-                                'you should', 'you must', 'you have', 'relocation']
-                
-                # Strong requirement indicators that should stop benefits extraction
-                requirement_indicators = [
-                    'bs/', 'ba/', 'ms/', 'ma/', 'bachelor', 'master', 'phd',
-                    'years of experience', 'years experience',
-                    'certified', 'certification required', 'eligible to work',
-                    'authorized to work', 'must have', 'vaccination', 'visa sponsorship'
-                ]
-                
-                # Stop if we see requirement indicators OR if we've gone 10+ lines past header
-                # (to avoid pulling in unrelated content)
-                has_req_indicator = any(indicator in line_lower for indicator in requirement_indicators)
-                has_stop_keyword = any(keyword in line_lower for keyword in stop_keywords)
-                
-                if has_req_indicator or has_stop_keyword or lines_after_benefits_header > 10:
-                    in_benefits = False
-                    continue
-                
-                # Extract benefit lines - must be substantial text
-                if line.strip() and not line.startswith('#') and len(line.strip()) > 20:
-                    # Remove bullet points and clean
-                    cleaned = re.sub(r'^[\-\*•\d+\.\)]\s*', '', line.strip())
-                    if cleaned and 'http' not in cleaned.lower():
-                        benefits.append(cleaned)
-        
-        return benefits[:15]  # Limit to 15 benefits
+        """Extract job benefits from text."""
+        return extract_benefits(text)
     
     async def _extract_salary(self, text: str) -> Optional[str]:
-        """Extract salary range from text.
-        
-        Args:
-            text: Job text
-            
-        Returns:
-            Salary range string (e.g., "120000-180000") or None
-        """
-        # Pattern 1: $120,000 - $180,000
-        pattern1 = r'\$(\d{1,3}(?:,\d{3})*)\s*-\s*\$(\d{1,3}(?:,\d{3})*)'
-        match1 = re.search(pattern1, text)
-        if match1:
-            low = match1.group(1).replace(',', '')
-            high = match1.group(2).replace(',', '')
-            return f"{low}-{high}"
-        
-        # Pattern 2: 100k-150k
-        pattern2 = r'(\d+)k\s*-\s*(\d+)k'
-        match2 = re.search(pattern2, text, re.IGNORECASE)
-        if match2:
-            low = int(match2.group(1)) * 1000
-            high = int(match2.group(2)) * 1000
-            return f"{low}-{high}"
-        
-        return None
+        """Extract salary range from text (e.g. "120000-180000")."""
+        return extract_salary(text)
     
     async def _detect_remote(self, text: str) -> bool:
-        """Detect if position is remote from text.
-        
-        Args:
-            text: Job text
-            
-        Returns:
-            True if remote work detected
-        """
-        text_lower = text.lower()
-        remote_keywords = ['remote', 'work from home', 'wfh', 'hybrid', 'distributed']
-        
-        return any(keyword in text_lower for keyword in remote_keywords)
+        """Detect if position is remote from text."""
+        return detect_remote(text)
     
     async def _load_mock_jobs(self) -> List[Dict[str, Any]]:
         """Load mock jobs from JSON file.
@@ -0,0 +1,311 @@
+"""Pure-CPU parsing of raw job posting text.
+
+Everything here is synchronous and free of I/O so postings can be parsed on
+a worker pool (see JobService.bulk_import); JobService wraps these helpers.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from app.application.services.keyword_taxonomy import get_keyword_taxonomy
+
+
+def parse_job_text(raw_text: str) -> Dict[str, Any]:
+    """Parse raw job text to extract structured data.
+
+    Args:
+        raw_text: Raw job description text
+
+    Returns:
+        Dictionary of parsed job fields
+    """
+    lines = [line.strip() for line in raw_text.split('\n') if line.strip()]
+
+    # Extract basic fields
+    title = lines[0] if len(lines) > 0 else "Untitled Position"
+    company = lines[1] if len(lines) > 1 else "Unknown Company"
+    location = extract_location(raw_text)
+
+    # Extract parsed data
+    keywords = parse_keywords(raw_text)
+    requirements = extract_requirements(raw_text)
+    benefits = extract_benefits(raw_text)
+    salary_range = extract_salary(raw_text)
+    remote = detect_remote(raw_text)
+
+    # Extract description (skip first 2 lines: title and company)
+    # Keep location if it's on line 3, or include from line 3 onwards
+    description_start_idx = 2
+    if len(lines) > 2 and location and lines[2] == location:
+        description_start_idx = 3
+
+    description = '\n'.join(lines[description_start_idx:]) if len(lines) > description_start_idx else raw_text
+
+    return {
+        "title": title,
+        "company": company,
+        "location": location,
+        "description": description,
+        "parsed_keywords": keywords,
+        "requirements": requirements,
+        "benefits": benefits,
+        "salary_range": salary_range,
+        "remote": remote,
+        "status": "active"
+    }
+
+
+def parse_keywords(text: str) -> List[str]:
+    """Extract keywords from job text with comprehensive 2024-2025 tech stack coverage.
+
+    Args:
+        text: Job text
+
+    Returns:
+        List of canonical keywords (lowercase), aliases such as "reactjs" folded in
+    """
+    return get_keyword_taxonomy().extract(text)
+
+
+def extract_location(text: str) -> Optional[str]:
+    """Extract location from text.
+
+    Args:
+        text: Job text
+
+    Returns:
+        Location string or None
+    """
+    # Look for location patterns in first few lines
+    lines = text.split('\n')[:5]
+
+    for line in lines:
+        # Match patterns like "Seattle, WA", "San Francisco, CA (Remote)", etc.
+        location_match = re.search(
+            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})',
+            line
+        )
+        if location_match:
+            return location_match.group(1)
+
+    return None
+
+
+def extract_requirements(text: str) -> List[str]:
+    """Extract job requirements from text.
+
+    Args:
+        text: Job text
+
+    Returns:
+        List of requirements
+    """
+    requirements = []
+    lines = text.split('\n')
+
+    # Look for requirements section with various heading patterns
+    in_requirements = False
+    requirement_headers = [
+        'requirement', 'qualifications', 'required', 'must have',
+        'what you\'ll need', 'what we\'re looking for', 'you have',
+        'minimum qualifications', 'basic qualifications', 'you should have'
+    ]
+
+    # Track if we found a requirements section with a header
+    found_header_section = False
+
+    for i, line in enumerate(lines):
+        line_lower = line.lower().strip()
+
+        # Check for requirements section headers
+        if any(header in line_lower for header in requirement_headers):
+            in_requirements = True
+            found_header_section = True
+            continue
+
+        if in_requirements:
+            # Stop at next major section
+            stop_keywords = ['benefit', 'perks', 'we offer', 'why join', 'about us', 
+                            'about the company', 'responsibilities', 'what you\'ll do']
+            if any(keyword in line_lower for keyword in stop_keywords):
+                in_requirements = False
+                continue
+
+            # Extract requirement lines
+            if line.strip() and not line.startswith('#'):
+                # Remove bullet points and clean
+                cleaned = re.sub(r'^[\-\*•\d+\.\)]\s*', '', line.strip())
+                if cleaned and len(cleaned) > 5:  # Avoid very short lines
+                    requirements.append(cleaned)
+
+    # If no requirements found with headers, look for unlabeled requirements at the end
+    # These often appear after benefit descriptions or EEO statements
+    if not found_header_section or len(requirements) < 2:
+        requirements = _extract_unlabeled_requirements(lines)
+
+    return requirements[:15]  # Limit to 15 requirements
+
+
+def _extract_unlabeled_requirements(lines: List[str]) -> List[str]:
+    """Extract requirements that don't have a section header.
+
+    Args:
+        lines: Lines of job text
+
+    Returns:
+        List of requirement strings
+    """
+    requirements = []
+
+    # Find where long prose paragraphs end and short requirement lines begin
+    # Typically requirements are at the end and are shorter, more concise lines
+    potential_reqs_start = -1
+
+    for i in range(len(lines) - 1, max(len(lines) - 15, 0), -1):  # Look at last 15 lines
+        line = lines[i].strip()
+        if not line or len(line) < 10:  # Skip empty or very short lines
+            continue
+
+        # Strong requirement indicators (things that must be met)
+        strong_requirement_indicators = [
+            'degree', 'bachelor', 'master', 'phd', 'bs/', 'ba/', 'ms/', 'ma/',
+            'years of experience', 'years experience', 'proficient in', 
+            'certification', 'certified', 'eligible to work', 'authorized to work',
+            'vaccination', 'vaccinated', 'must have', 'required:', 'require:',
+            'minimum', 'at least'
+        ]
+
+        # Words that indicate this is NOT a requirement
+        exclusion_indicators = [
+            'we offer', 'you will receive', 'you\'ll get', 'opportunity to',
+            'work with', 'learn more', 'see our', 'click here', 'apply now',
+            'join our', 'our team', 'we are', 'about us', 'http', '@',
+            'write software', 'build', 'create', 'develop'  # These are responsibilities
+        ]
+
+        line_lower = line.lower()
+
+        # Skip lines with exclusion indicators
+        if any(indicator in line_lower for indicator in exclusion_indicators):
+            continue
+
+        # Check if line has strong requirement indicators
+        has_strong_req = any(indicator in line_lower for indicator in strong_requirement_indicators)
+
+        # If line has strong requirement indicators and isn't too long, likely a requirement
+        if len(line) < 300 and has_strong_req:
+            # Clean and add
+            cleaned = re.sub(r'^[\-\*•\d+\.\)]\s*', '', line)
+            if cleaned and cleaned not in requirements:
+                requirements.insert(0, cleaned)  # Insert at beginning to maintain order
+
+    return requirements
+
+
+def extract_benefits(text: str) -> List[str]:
+    """Extract job benefits from text.
+
+    Args:
+        text: Job text
+
+    Returns:
+        List of benefits
+    """
+    benefits = []
+    lines = text.split('\n')
+
+    # Look for benefits section with various heading patterns
+    in_benefits = False
+    benefit_headers = [
+        'benefit', 'perks', 'we offer', 'what we offer', 'why join',
+        'what you\'ll get', 'compensation and benefits', 'rewards',
+        'what you get'
+    ]
+
+    lines_after_benefits_header = 0
+
+    for line in lines:
+        line_lower = line.lower().strip()
+
+        # Check for benefits section headers
+        if any(header in line_lower for header in benefit_headers):
+            in_benefits = True
+            lines_after_benefits_header = 0
+            continue
+
+        if in_benefits:
+            lines_after_benefits_header += 1
+
+            # Stop at next major section or when we hit requirements-like content
+            stop_keywords = ['requirement', 'qualifications', 'responsibilities', 
+                            'about the role', 'what you\'ll do', 'equal opportunity',
+                            'you should', 'you must', 'you have', 'relocation']
+
+            # Strong requirement indicators that should stop benefits extraction
+            requirement_indicators = [
+                'bs/', 'ba/', 'ms/', 'ma/', 'bachelor', 'master', 'phd',
+                'years of experience', 'years experience',
+                'certified', 'certification required', 'eligible to work',
+                'authorized to work', 'must have', 'vaccination', 'visa sponsorship'
+            ]
+
+            # Stop if we see requirement indicators OR if we've gone 10+ lines past header
+            # (to avoid pulling in unrelated content)
+            has_req_indicator = any(indicator in line_lower for indicator in requirement_indicators)
+            has_stop_keyword = any(keyword in line_lower for keyword in stop_keywords)
+
+            if has_req_indicator or has_stop_keyword or lines_after_benefits_header > 10:
+                in_benefits = False
+                continue
+
+            # Extract benefit lines - must be substantial text
+            if line.strip() and not line.startswith('#') and len(line.strip()) > 20:
+                # Remove bullet points and clean
+                cleaned = re.sub(r'^[\-\*•\d+\.\)]\s*', '', line.strip())
+                if cleaned and 'http' not in cleaned.lower():
+                    benefits.append(cleaned)
+
+    return benefits[:15]  # Limit to 15 benefits
+
+
+def extract_salary(text: str) -> Optional[str]:
+    """Extract salary range from text.
+
+    Args:
+        text: Job text
+
+    Returns:
+        Salary range string (e.g., "120000-180000") or None
+    """
+    # Pattern 1: $120,000 - $180,000
+    pattern1 = r'\$(\d{1,3}(?:,\d{3})*)\s*-\s*\$(\d{1,3}(?:,\d{3})*)'
+    match1 = re.search(pattern1, text)
+    if match1:
+        low = match1.group(1).replace(',', '')
+        high = match1.group(2).replace(',', '')
+        return f"{low}-{high}"
+
+    # Pattern 2: 100k-150k
+    pattern2 = r'(\d+)k\s*-\s*(\d+)k'
+    match2 = re.search(pattern2, text, re.IGNORECASE)
+    if match2:
+        low = int(match2.group(1)) * 1000
+        high = int(match2.group(2)) * 1000
+        return f"{low}-{high}"
+
+    return None
+
+
+def detect_remote(text: str) -> bool:
+    """Detect if position is remote from text.
+
+    Args:
+        text: Job text
+
+    Returns:
+        True if remote work detected
+    """
+    text_lower = text.lower()
+    remote_keywords = ['remote', 'work from home', 'wfh', 'hybrid', 'distributed']
+
+    return any(keyword in text_lower for keyword in remote_keywords)
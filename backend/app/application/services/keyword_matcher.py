@@ -0,0 +1,93 @@
+"""Precompiled single-pass keyword matcher used to tag job postings."""
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Set
+
+# Non-ASCII characters that still match ASCII letters in lowercased text under
+# re.IGNORECASE; folded so the trie agrees with the original regex search
+_IGNORECASE_EXTRAS = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+
+# Trie node key marking the end of a keyword (never a text character)
+_END = ""
+
+
+def _is_word_char(ch: str) -> bool:
+    """Whether ``ch`` counts as a word character for regex ``\\b``."""
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """Find keywords in text in a single pass over a prebuilt trie.
+    
+    Matches exactly what a separate ``\\bkeyword\\b`` case-insensitive search
+    per keyword would, including overlapping phrases ("spring boot" and
+    "spring"). Keywords containing ``#`` or ``++`` are plain substring checks,
+    and keywords in ``context_patterns`` also need their pattern to match.
+    """
+    
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        context_patterns: Optional[Dict[str, Pattern]] = None
+    ):
+        self.context_patterns = context_patterns or {}
+        self._substring_keywords: List[str] = []
+        self._trie: Dict = {}
+        leading_non_word: Set[str] = set()
+        
+        for keyword in sorted(set(keywords)):
+            if '#' in keyword or '++' in keyword:
+                self._substring_keywords.append(keyword)
+                continue
+            node = self._trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[_END] = keyword
+            if not _is_word_char(keyword[0]):
+                leading_non_word.add(keyword[0])
+        
+        # A match can only start where \b holds before its first character:
+        # at the start of a word, or at e.g. "." right after a word (".net")
+        starts = [r'(?<!\w)(?=\w)']
+        if leading_non_word:
+            chars = "".join(re.escape(ch) for ch in sorted(leading_non_word))
+            starts.append(rf'(?<=\w)(?=[{chars}])')
+        self._start_pattern = re.compile("|".join(starts))
+    
+    def find(self, text: str) -> List[str]:
+        """Return the sorted, de-duplicated keywords present in ``text``."""
+        found: Set[str] = set()
+        
+        # For C# and C++, use simpler contains check (case-sensitive for these)
+        for keyword in self._substring_keywords:
+            if keyword in text or keyword.upper() in text or keyword.lower() in text:
+                found.add(keyword)
+        
+        text_lower = text.lower()
+        scan = text_lower.translate(_IGNORECASE_EXTRAS)
+        length = len(scan)
+        
+        for start in self._start_pattern.finditer(scan):
+            node = self._trie
+            i = start.start()
+            while i < length:
+                node = node.get(scan[i])
+                if node is None:
+                    break
+                i += 1
+                keyword = node.get(_END)
+                if keyword is not None and self._ends_on_boundary(keyword, scan, i):
+                    found.add(keyword)
+        
+        for keyword, context in self.context_patterns.items():
+            if keyword in found and not context.search(text_lower):
+                found.discard(keyword)
+        
+        return sorted(found)
+    
+    @staticmethod
+    def _ends_on_boundary(keyword: str, text: str, end: int) -> bool:
+        """Whether \\b holds right after ``keyword`` ending at ``end``."""
+        next_is_word = end < len(text) and _is_word_char(text[end])
+        return next_is_word != _is_word_char(keyword[-1])
+
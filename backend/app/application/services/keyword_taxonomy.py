@@ -0,0 +1,140 @@
+"""Loadable tech keyword taxonomy: canonical names, aliases and categories."""
+
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from app.core.config import get_settings
+from app.application.services.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+# Relative taxonomy paths are resolved against the backend directory
+BACKEND_DIR = Path(__file__).parent.parent.parent.parent
+
+
+@dataclass
+class TaxonomyEntry:
+    """One keyword with the spellings that map to it."""
+    canonical: str
+    category: str
+    aliases: List[str] = field(default_factory=list)
+    context: Optional[str] = None  # Regex required before the bare canonical name counts
+
+
+class KeywordTaxonomy:
+    """Compiled taxonomy that extracts canonical keywords from text."""
+
+    def __init__(self, entries: Iterable[TaxonomyEntry], version: int = 1):
+        self.version = version
+        self.entries: Dict[str, TaxonomyEntry] = {}
+        self._canonical: Dict[str, str] = {}
+        contexts = {}
+
+        for entry in entries:
+            canonical = entry.canonical.lower()
+            if canonical in self.entries:
+                raise ValueError(f"Duplicate taxonomy keyword: {canonical}")
+            self.entries[canonical] = entry
+            for surface in [canonical, *(alias.lower() for alias in entry.aliases)]:
+                if self._canonical.get(surface, canonical) != canonical:
+                    raise ValueError(
+                        f"'{surface}' maps to both {self._canonical[surface]} and {canonical}"
+                    )
+                self._canonical[surface] = canonical
+            if entry.context:
+                contexts[canonical] = re.compile(entry.context, re.IGNORECASE)
+
+        self.matcher = KeywordMatcher(self._canonical, context_patterns=contexts)
+
+    @property
+    def terms(self) -> List[str]:
+        """Every recognised spelling: canonical names and aliases."""
+        return list(self._canonical)
+
+    def extract(self, text: str) -> List[str]:
+        """Return the sorted canonical keywords mentioned in ``text``."""
+        return sorted({self._canonical[surface] for surface in self.matcher.find(text)})
+
+    def canonicalize(self, keywords: Iterable[str]) -> List[str]:
+        """Map keywords to canonical names, dropping duplicates and keeping unknown ones."""
+        seen = []
+        for keyword in keywords:
+            keyword = keyword.lower()
+            canonical = self._canonical.get(keyword, keyword)
+            if canonical not in seen:
+                seen.append(canonical)
+        return seen
+
+    def category(self, keyword: str) -> Optional[str]:
+        """Category of a keyword or alias, or None if it is not in the taxonomy."""
+        canonical = self._canonical.get(keyword.lower())
+        return self.entries[canonical].category if canonical else None
+
+    @classmethod
+    def load(cls, path: Path) -> "KeywordTaxonomy":
+        """Load and compile a taxonomy JSON file.
+
+        Raises:
+            ValueError: If the file is malformed or keywords conflict
+        """
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            entries = [TaxonomyEntry(**entry) for entry in data["keywords"]]
+        except (KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid keyword taxonomy {path}: {e}")
+        return cls(entries, version=data.get("version", 1))
+
+
+_taxonomy: Optional[KeywordTaxonomy] = None
+_taxonomy_mtime: Optional[int] = None
+
+
+def get_taxonomy_path() -> Path:
+    """Configured taxonomy file location."""
+    path = Path(get_settings().keyword_taxonomy_path)
+    return path if path.is_absolute() else BACKEND_DIR / path
+
+
+def reload_keyword_taxonomy() -> KeywordTaxonomy:
+    """Load the taxonomy file again, replacing the compiled one.
+
+    A broken file is logged and ignored while a previous taxonomy is loaded,
+    so editing the file in place never takes keyword extraction down.
+    """
+    global _taxonomy, _taxonomy_mtime
+    path = get_taxonomy_path()
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        taxonomy = KeywordTaxonomy.load(path)
+    except (OSError, ValueError) as e:
+        if _taxonomy is None:
+            raise
+        # Don't retry until the file changes again
+        _taxonomy_mtime = _file_mtime(path)
+        logger.error(f"Keeping previous keyword taxonomy, reload failed: {e}")
+        return _taxonomy
+
+    _taxonomy, _taxonomy_mtime = taxonomy, mtime
+    logger.info(f"Keyword taxonomy v{taxonomy.version} loaded ({len(taxonomy.entries)} keywords)")
+    return taxonomy
+
+
+def get_keyword_taxonomy() -> KeywordTaxonomy:
+    """Get the compiled taxonomy, reloading it if the file changed on disk."""
+    if _taxonomy is None:
+        return reload_keyword_taxonomy()
+    mtime = _file_mtime(get_taxonomy_path())
+    changed = mtime is not None and mtime != _taxonomy_mtime
+    return reload_keyword_taxonomy() if changed else _taxonomy
+
+
+def _file_mtime(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
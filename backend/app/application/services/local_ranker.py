@@ -0,0 +1,140 @@
+"""Deterministic lexical ranking of profile content against a job (BM25)."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.application.services.keyword_taxonomy import get_keyword_taxonomy
+from app.application.services.profile_text_index import (
+    KEYWORD_PREFIX,
+    build_experience_index,
+    build_project_index,
+    is_current,
+    keyword_terms,
+    tokenize,
+)
+
+
+class LexicalIndex:
+    """BM25 index over a small set of documents, scored with NumPy."""
+
+    def __init__(self, documents: Sequence[Tuple[str, Mapping[str, int]]], k1: float = 1.2, b: float = 0.75):
+        """Build the index.
+
+        Args:
+            documents: (document ID, term frequencies) pairs, in tie-break order
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.ids = [doc_id for doc_id, _ in documents]
+        self.vocabulary: Dict[str, int] = {}
+        rows, cols, counts = [], [], []
+        for row, (_, terms) in enumerate(documents):
+            for term, count in terms.items():
+                rows.append(row)
+                cols.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                counts.append(count)
+
+        tf = np.zeros((len(self.ids), len(self.vocabulary)))
+        tf[np.array(rows, dtype=int), np.array(cols, dtype=int)] = counts
+
+        lengths = tf.sum(axis=1)
+        avg_length = lengths.mean() if len(lengths) and lengths.mean() > 0 else 1.0
+        saturation = k1 * (1 - b + b * lengths / avg_length)
+        self._weights = tf * (k1 + 1) / (tf + saturation[:, None])
+
+        doc_freq = np.count_nonzero(tf, axis=0)
+        # Non-negative BM25+ style idf: tiny profiles would otherwise give negative weights
+        self._idf = np.log1p((len(self.ids) - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def score(self, query: Dict[str, float]) -> np.ndarray:
+        """BM25 score of every document for weighted query terms."""
+        query_vector = np.zeros(len(self.vocabulary))
+        for term, weight in query.items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                query_vector[column] += weight
+        return self._weights @ (query_vector * self._idf)
+
+    def rank(self, query: Dict[str, float]) -> List[Tuple[str, float]]:
+        """Document IDs with scores, best first; ties keep index order."""
+        scores = self.score(query)
+        order = np.argsort(-scores, kind="stable")
+        return [(self.ids[i], float(scores[i])) for i in order]
+
+
+@dataclass
+class LocalRanking:
+    """Result of ranking a profile locally."""
+    ranked_experience_ids: List[str]
+    ranked_project_ids: List[str]
+    relevance_scores: Dict[str, float] = field(default_factory=dict)
+    keyword_matches: Dict[str, int] = field(default_factory=dict)
+
+
+def job_query(job) -> Dict[str, float]:
+    """Weighted query terms for a job: parsed keywords count double.
+
+    Args:
+        job: Job entity (parsed_keywords, requirements, description, title)
+    """
+    taxonomy = get_keyword_taxonomy()
+    text = "\n".join([job.title or "", job.description or "", *(job.requirements or [])])
+    keywords = set(taxonomy.canonicalize(job.parsed_keywords or [])) | set(taxonomy.extract(text))
+
+    query: Dict[str, float] = {}
+    for term in tokenize(text):
+        query[term] = query.get(term, 0.0) + 1.0
+    for term in keyword_terms(keywords):
+        query[term] = query.get(term, 0.0) + 2.0
+    return query
+
+
+def rank_profile_content(
+    job,
+    experiences: Sequence,
+    projects: Sequence,
+    text_index: Optional[Mapping[str, Dict[str, Any]]] = None
+) -> LocalRanking:
+    """Rank experiences and projects by lexical relevance to a job.
+
+    Deterministic: the same job and profile always give the same order, and
+    ties keep the profile's own ordering.
+
+    Args:
+        job: Job entity
+        experiences: Profile experiences (with id)
+        projects: Profile projects (with id)
+        text_index: Stored profile text index by item ID; missing or stale
+            entries are built on the fly
+
+    Returns:
+        LocalRanking with IDs as strings
+    """
+    text_index = text_index or {}
+
+    def item_terms(item, build) -> Mapping[str, int]:
+        stored = text_index.get(str(item.id))
+        return (stored if is_current(stored) else build(item))["terms"]
+
+    query = job_query(job)
+    exp_docs = [(str(exp.id), item_terms(exp, build_experience_index)) for exp in experiences]
+    proj_docs = [(str(proj.id), item_terms(proj, build_project_index)) for proj in projects]
+
+    ranked_exps = LexicalIndex(exp_docs).rank(query) if exp_docs else []
+    ranked_projs = LexicalIndex(proj_docs).rank(query) if proj_docs else []
+
+    job_keywords = {term for term in query if term.startswith(KEYWORD_PREFIX)}
+    keyword_matches: Dict[str, int] = {}
+    for _, terms in exp_docs + proj_docs:
+        for term in job_keywords.intersection(terms):
+            keyword = term[len(KEYWORD_PREFIX):]
+            keyword_matches[keyword] = keyword_matches.get(keyword, 0) + 1
+
+    return LocalRanking(
+        ranked_experience_ids=[doc_id for doc_id, _ in ranked_exps],
+        ranked_project_ids=[doc_id for doc_id, _ in ranked_projs],
+        relevance_scores={doc_id: round(score, 4) for doc_id, score in ranked_exps + ranked_projs},
+        keyword_matches=dict(sorted(keyword_matches.items())),
+    )
@@ -3,6 +3,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from app.application.services.profile_text_index import build_profile_index
 from app.core.exceptions import ValidationException, NotFoundError, ForbiddenException
 from app.domain.entities.profile import Profile, PersonalInfo, Skills, Experience, Education, Project
 from app.infrastructure.repositories.profile_repository import ProfileRepository
@@ -14,6 +15,14 @@ class ProfileService:
     def __init__(self, profile_repository: ProfileRepository):
         self.profile_repository = profile_repository
 
+    async def _save_profile(self, profile: Profile) -> Profile:
+        """Update the profile, keeping text index entries of rows whose text is unchanged."""
+        previous_index = await self.profile_repository.get_text_index(profile.id)
+        return await self.profile_repository.update(
+            profile,
+            text_index=build_profile_index(profile.experiences, profile.projects, previous_index)
+        )
+
     async def create_profile(
         self,
         user_id: int,
@@ -97,7 +106,9 @@ class ProfileService:
 
         print(f"DEBUG: About to create profile in repository")
         try:
-            created_profile = await self.profile_repository.create(profile)
+            created_profile = await self.profile_repository.create(
+                profile, text_index=build_profile_index(profile.experiences, profile.projects)
+            )
             print(f"DEBUG: Profile created successfully in repository with ID: {created_profile.id}")
             return created_profile
         except Exception as e:
@@ -240,7 +251,7 @@ class ProfileService:
 
         print(f"DEBUG: About to update profile in repository")
         try:
-            updated_profile = await self.profile_repository.update(existing_profile)
+            updated_profile = await self._save_profile(existing_profile)
             print(f"DEBUG: Profile updated successfully in repository")
             return updated_profile
         except Exception as e:
@@ -306,7 +317,9 @@ class ProfileService:
             raise ValidationException(f"Invalid experience data: {str(e)}")
 
         try:
-            result = await self.profile_repository.create_experiences_bulk(profile_id, experiences)
+            result = await self.profile_repository.create_experiences_bulk(
+                profile_id, experiences, text_index=build_profile_index(experiences=experiences)
+            )
             print(f"DEBUG: Successfully created {len(result)} experiences in repository")
             return result
         except Exception as e:
@@ -353,7 +366,9 @@ class ProfileService:
             raise ValidationException(f"Invalid experience data: {str(e)}")
 
         try:
-            result = await self.profile_repository.update_experiences_bulk(profile_id, experiences)
+            result = await self.profile_repository.update_experiences_bulk(
+                profile_id, experiences, text_index=build_profile_index(experiences=experiences)
+            )
             print(f"DEBUG: Successfully updated {len(result)} experiences in repository")
             return result
         except Exception as e:
@@ -502,7 +517,9 @@ class ProfileService:
             raise ValidationException(f"Invalid project data: {str(e)}")
 
         try:
-            result = await self.profile_repository.create_projects_bulk(profile_id, projects)
+            result = await self.profile_repository.create_projects_bulk(
+                profile_id, projects, text_index=build_profile_index(projects=projects)
+            )
             print(f"DEBUG: Successfully created {len(result)} projects in repository")
             return result
         except Exception as e:
@@ -537,7 +554,9 @@ class ProfileService:
             raise ValidationException(f"Invalid project data: {str(e)}")
 
         try:
-            result = await self.profile_repository.update_projects_bulk(profile_id, projects)
+            result = await self.profile_repository.update_projects_bulk(
+                profile_id, projects, text_index=build_profile_index(projects=projects)
+            )
             print(f"DEBUG: Successfully updated {len(result)} projects in repository")
             return result
         except Exception as e:
@@ -586,7 +605,7 @@ class ProfileService:
             new_skills = Skills(**skills_data)
             profile.skills = new_skills
             print(f"DEBUG: Skills validation successful, updating profile")
-            updated_profile = await self.profile_repository.update(profile)
+            updated_profile = await self._save_profile(profile)
             print(f"DEBUG: Successfully updated skills in repository")
             return updated_profile.skills
         except Exception as e:
@@ -608,7 +627,7 @@ class ProfileService:
         new_skills = existing_skills.union(set(skills))
         profile.skills.technical = list(new_skills)
 
-        updated_profile = await self.profile_repository.update(profile)
+        updated_profile = await self._save_profile(profile)
         return updated_profile.skills
 
     async def remove_technical_skills(
@@ -624,7 +643,7 @@ class ProfileService:
         skills_to_remove = set(skills)
         profile.skills.technical = [s for s in profile.skills.technical if s not in skills_to_remove]
 
-        updated_profile = await self.profile_repository.update(profile)
+        updated_profile = await self._save_profile(profile)
         return updated_profile.skills
 
     async def add_soft_skills(
@@ -641,7 +660,7 @@ class ProfileService:
         new_skills = existing_skills.union(set(skills))
         profile.skills.soft = list(new_skills)
 
-        updated_profile = await self.profile_repository.update(profile)
+        updated_profile = await self._save_profile(profile)
         return updated_profile.skills
 
     async def remove_soft_skills(
@@ -657,7 +676,7 @@ class ProfileService:
         skills_to_remove = set(skills)
         profile.skills.soft = [s for s in profile.skills.soft if s not in skills_to_remove]
 
-        updated_profile = await self.profile_repository.update(profile)
+        updated_profile = await self._save_profile(profile)
         return updated_profile.skills
 
     async def update_custom_fields(
@@ -676,7 +695,7 @@ class ProfileService:
         for field in fields:
             profile.custom_fields[field["key"]] = field["value"]
 
-        updated_profile = await self.profile_repository.update(profile)
+        updated_profile = await self._save_profile(profile)
         return updated_profile.custom_fields or {}
 
     async def get_custom_fields(self, profile_id: str, user_id: int) -> Dict[str, Any]:
@@ -693,7 +712,7 @@ class ProfileService:
         """Update all custom fields for a profile (full replacement)."""
         profile = await self.get_profile(profile_id, user_id)
         profile.custom_fields = custom_fields
-        updated_profile = await self.profile_repository.update(profile)
+        updated_profile = await self._save_profile(profile)
         return updated_profile.custom_fields or {}
 
     def _calculate_completeness(self, profile: Profile) -> Dict[str, Any]:
@@ -0,0 +1,114 @@
+"""Derived text index for profile experiences and projects.
+
+Each experience/project row stores its tokenized text as term frequencies
+plus the canonical skills it mentions. The profile services build the
+entries when rows are written and hand them to ProfileRepository to store;
+ranking then reads these instead of re-tokenizing the profile per request.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.application.services.keyword_taxonomy import get_keyword_taxonomy
+
+# Bump when tokenization changes so stored indexes are rebuilt
+INDEX_VERSION = 1
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+# Taxonomy keywords are indexed as extra "kw:<canonical>" terms so aliases
+# (ReactJS/React, K8s/Kubernetes) and multi-word skills match as one term
+KEYWORD_PREFIX = "kw:"
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the "
+    "their this to was we were will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def keyword_terms(keywords: Iterable[str]) -> List[str]:
+    """Index terms for canonical taxonomy keywords."""
+    return [KEYWORD_PREFIX + keyword for keyword in keywords]
+
+
+def experience_text(experience) -> str:
+    """Text of an experience that is indexed."""
+    return "\n".join([
+        experience.title or "",
+        getattr(experience, "description", None) or "",
+        getattr(experience, "enhanced_description", None) or "",
+        *(getattr(experience, "achievements", None) or []),
+    ])
+
+
+def project_text(project) -> str:
+    """Text of a project that is indexed."""
+    return "\n".join([
+        project.name or "",
+        getattr(project, "description", None) or "",
+        getattr(project, "enhanced_description", None) or "",
+        " ".join(getattr(project, "technologies", None) or []),
+    ])
+
+
+def build_experience_index(experience, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Index entry for one experience, reusing ``previous`` if its text is unchanged."""
+    return _build_index(experience_text(experience), (), previous)
+
+
+def build_project_index(project, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Index entry for one project (technologies count as skills)."""
+    technologies = getattr(project, "technologies", None) or []
+    return _build_index(project_text(project), technologies, previous)
+
+
+def build_profile_index(
+    experiences: Iterable = (),
+    projects: Iterable = (),
+    previous: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Index entries by row ID for experiences and projects about to be written.
+    
+    Rows whose entry in ``previous`` is current and whose text is unchanged
+    keep that entry.
+    """
+    previous = previous or {}
+    index = {exp.id: build_experience_index(exp, previous.get(exp.id)) for exp in experiences}
+    index.update({proj.id: build_project_index(proj, previous.get(proj.id)) for proj in projects})
+    return index
+
+
+def is_current(index: Optional[Dict[str, Any]]) -> bool:
+    """Whether a stored entry was built with the current tokenizer and taxonomy."""
+    return bool(index) and index.get("version") == INDEX_VERSION \
+        and index.get("taxonomy") == get_keyword_taxonomy().version
+
+
+def _build_index(
+    text: str,
+    technologies: Iterable[str],
+    previous: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    technologies = list(technologies)
+    content_hash = hashlib.sha256(f"{text}\0{technologies}".encode("utf-8")).hexdigest()
+    if is_current(previous) and previous.get("hash") == content_hash:
+        return previous
+
+    taxonomy = get_keyword_taxonomy()
+    skills = sorted(set(taxonomy.extract(text)) | set(taxonomy.canonicalize(technologies)))
+    terms = Counter(tokenize(text) + keyword_terms(skills))
+    return {
+        "version": INDEX_VERSION,
+        "taxonomy": taxonomy.version,
+        "hash": content_hash,
+        "length": sum(terms.values()),
+        "terms": dict(terms),
+        "skills": skills,
+    }
@@ -1,8 +1,14 @@
 """Ranking service for content ranking."""
 
+import hashlib
+import json
+import logging
+import time
 from uuid import UUID, uuid4
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from app.application.services.local_ranker import rank_profile_content
+from app.core.config import get_settings
 from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
 from app.infrastructure.repositories.ranking_repository import RankingRepository
 from app.infrastructure.repositories.profile_repository import ProfileRepository
@@ -10,6 +16,8 @@ from app.infrastructure.repositories.job_repository import JobRepository
 from app.domain.entities.job_content_ranking import JobContentRanking
 from app.domain.enums.generation_status import GenerationStatus
 
+logger = logging.getLogger(__name__)
+
 
 class RankingService:
     """Service for creating and managing content rankings."""
@@ -30,16 +38,24 @@ class RankingService:
         self,
         user_id: int,
         job_id: UUID,
-        custom_prompt: Optional[str] = None
+        custom_prompt: Optional[str] = None,
+        mode: Optional[str] = None,
+        force: bool = False
     ) -> JobContentRanking:
-        """Create content ranking for a job."""
-        # Delete existing ranking for this job+profile (force regeneration with updated system)
-        existing = await self.ranking_repo.get_by_job(user_id, job_id)
-        if existing:
-            await self.ranking_repo.delete(existing.id)
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"Deleted old ranking {existing.id} for job {job_id} to create fresh ranking")
+        """Create content ranking for a job.
+        
+        The stored ranking is returned as-is when the job text and the ranked
+        profile content are unchanged since it was made (same fingerprint).
+        
+        Args:
+            user_id: User ID
+            job_id: Job to rank the profile against
+            custom_prompt: Reserved for prompt customization
+            mode: "llm" (full LLM ranking), "local" (BM25 only, no LLM call) or
+                "hybrid" (BM25 shortlist reranked by the LLM); defaults to RANKING_MODE
+            force: Regenerate even if the stored ranking is still current
+        """
+        mode = mode or get_settings().ranking_mode
         
         # Get job
         job = await self.job_repo.get_by_id(str(job_id), user_id)
@@ -52,12 +68,142 @@ class RankingService:
             raise ValueError("No profile found")
         
         # Get experiences and projects
-        experiences = await self.profile_repo.get_experiences_by_profile_id(profile.id)
+        experiences = await self.profile_repo.get_experiences_by_profile_id(profile.id) or []
+        projects = (profile.projects if hasattr(profile, 'projects') else None) or []
+        
+        existing = await self.ranking_repo.get_by_job(user_id, job_id)
+        if existing and not force and is_ranking_current(existing, job, experiences, projects, mode):
+            logger.info(f"Reusing ranking {existing.id} for job {job_id}: content unchanged")
+            return existing
+        
+        text_index = await self.profile_repo.get_text_index(profile.id) if mode != "llm" else None
+        ranking = await self.compute_ranking(
+            user_id, job_id, job, profile, experiences, projects, mode, text_index
+        )
+        
+        if existing:
+            # Replace the stale ranking for this job+profile
+            await self.ranking_repo.delete(existing.id)
+            logger.info(f"Deleted old ranking {existing.id} for job {job_id} to create fresh ranking")
+        
+        # Save ranking
+        await self.ranking_repo.create(ranking)
         
-        # Debug: Check what we got
-        if not experiences:
-            experiences = []
+        return ranking
+    
+    async def compute_ranking(
+        self,
+        user_id: int,
+        job_id: UUID,
+        job,
+        profile,
+        experiences: Sequence,
+        projects: Sequence,
+        mode: str,
+        text_index: Optional[Dict[str, Dict]] = None
+    ) -> JobContentRanking:
+        """Rank already-loaded profile content for a job without touching the database.
+        
+        Args:
+            text_index: Stored profile text index (local and hybrid modes)
+            
+        Returns:
+            Unsaved ranking with its content fingerprint set
+        """
+        started = time.perf_counter()
+        relevance_scores = None
+        if mode == "llm":
+            ranked_exp_uuids, ranked_proj_uuids, result = await self._rank_with_llm(
+                job, experiences, projects
+            )
+        else:
+            local = rank_profile_content(job, experiences, projects, text_index)
+            relevance_scores = local.relevance_scores
+            if mode == "hybrid":
+                ranked_exp_uuids, ranked_proj_uuids, result = await self._rank_hybrid(
+                    job, experiences, projects, local
+                )
+            else:
+                ranked_exp_uuids = local.ranked_experience_ids
+                ranked_proj_uuids = local.ranked_project_ids
+                result = {
+                    "ranking_rationale": "Ranked locally by keyword relevance (BM25) to the job description, requirements and keywords",
+                    "keyword_matches": local.keyword_matches,
+                    "llm_metadata": {},
+                }
+        
+        llm_metadata = dict(result.get("llm_metadata") or {})
+        llm_metadata["ranker"] = mode
+        llm_metadata["ranking_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"Ranked job {job_id} with {mode} ranker in {llm_metadata['ranking_ms']}ms")
         
+        return JobContentRanking(
+            id=uuid4(),
+            user_id=user_id,
+            job_id=job_id,
+            profile_id=UUID(profile.id),  # profile.id is UUID string from DB
+            ranked_experience_ids=ranked_exp_uuids,  # Store UUIDs in database
+            ranked_project_ids=ranked_proj_uuids,    # Store UUIDs in database
+            ranking_rationale=result.get("ranking_rationale"),
+            keyword_matches=result.get("keyword_matches"),
+            relevance_scores=relevance_scores,
+            llm_metadata=str(llm_metadata),
+            status=GenerationStatus.COMPLETED,
+            content_fingerprint=ranking_fingerprint(job, experiences, projects, mode)
+        )
+    
+    async def save_rankings(
+        self,
+        rankings: List[JobContentRanking],
+        replaced_ids: List[UUID]
+    ) -> None:
+        """Save new rankings and delete the ones they replace, in one transaction."""
+        await self.ranking_repo.replace_many(rankings, replaced_ids)
+    
+    async def _rank_hybrid(
+        self,
+        job,
+        experiences: Sequence,
+        projects: Sequence,
+        local
+    ) -> Tuple[List[str], List[str], Dict]:
+        """Rerank only the local top-K experiences and projects with the LLM.
+        
+        The LLM order of the shortlist comes first; shortlisted items the LLM
+        omitted and everything below the cut follow in local order.
+        """
+        top_k = get_settings().ranking_hybrid_top_k
+        exp_by_id = {str(exp.id): exp for exp in experiences}
+        proj_by_id = {str(proj.id): proj for proj in projects}
+        exp_shortlist = local.ranked_experience_ids[:top_k]
+        proj_shortlist = local.ranked_project_ids[:top_k]
+        
+        llm_exps, llm_projs, result = await self._rank_with_llm(
+            job,
+            [exp_by_id[exp_id] for exp_id in exp_shortlist],
+            [proj_by_id[proj_id] for proj_id in proj_shortlist]
+        )
+        
+        ranked_exp_uuids = _merge_rankings(llm_exps, local.ranked_experience_ids)
+        ranked_proj_uuids = _merge_rankings(llm_projs, local.ranked_project_ids)
+        result = dict(result)
+        result["llm_metadata"] = {
+            **(result.get("llm_metadata") or {}),
+            "llm_candidates": len(exp_shortlist) + len(proj_shortlist),
+        }
+        return ranked_exp_uuids, ranked_proj_uuids, result
+    
+    async def _rank_with_llm(
+        self,
+        job,
+        experiences: Sequence,
+        projects: Sequence
+    ) -> Tuple[List[str], List[str], Dict]:
+        """Rank experiences and projects with the LLM.
+        
+        Returns:
+            (ranked experience UUIDs, ranked project UUIDs, raw LLM result)
+        """
         # Create integer-to-UUID mapping for experiences
         exp_id_to_int = {}
         int_to_exp_id = {}
@@ -78,17 +224,10 @@ class RankingService:
         ]
         
         # Debug logging
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"Sending {len(exp_list)} experiences to LLM for ranking")
         logger.info(f"Experience integer IDs being sent: {[exp['id'] for exp in exp_list]}")
         logger.info(f"Integer-to-UUID mapping: {int_to_exp_id}")
         
-        # Get projects from profile
-        projects = profile.projects if hasattr(profile, 'projects') else []
-        if not projects:
-            projects = []
-        
         # Create integer-to-UUID mapping for projects
         proj_id_to_int = {}
         int_to_proj_id = {}
@@ -155,25 +294,7 @@ class RankingService:
         logger.info(f"Mapped back to {len(ranked_exp_uuids)} experience UUIDs: {ranked_exp_uuids}")
         logger.info(f"Mapped back to {len(ranked_proj_uuids)} project UUIDs: {ranked_proj_uuids}")
         
-        # Create ranking entity
-        ranking = JobContentRanking(
-            id=uuid4(),
-            user_id=user_id,
-            job_id=job_id,
-            profile_id=UUID(profile.id),  # profile.id is UUID string from DB
-            ranked_experience_ids=ranked_exp_uuids,  # Store UUIDs in database
-            ranked_project_ids=ranked_proj_uuids,    # Store UUIDs in database
-            ranking_rationale=result.get("ranking_rationale"),
-            keyword_matches=result.get("keyword_matches"),
-            relevance_scores=None,  # Could add later
-            llm_metadata=str(result.get("llm_metadata")),
-            status=GenerationStatus.COMPLETED
-        )
-        
-        # Save ranking
-        await self.ranking_repo.create(ranking)
-        
-        return ranking
+        return ranked_exp_uuids, ranked_proj_uuids, result
     
     async def get_ranking_for_job(
         self,
@@ -182,3 +303,49 @@ class RankingService:
     ) -> Optional[JobContentRanking]:
         """Get ranking for a specific job."""
         return await self.ranking_repo.get_by_job(user_id, job_id)
+
+
+def is_ranking_current(ranking: JobContentRanking, job, experiences: Sequence, projects: Sequence, mode: str) -> bool:
+    """Whether a stored ranking was made from the same job, profile content and ranker."""
+    return ranking.content_fingerprint == ranking_fingerprint(job, experiences, projects, mode)
+
+
+def ranking_fingerprint(job, experiences: Sequence, projects: Sequence, mode: str) -> str:
+    """Hash of everything a ranking depends on: job text, ranked content and ranker.
+    
+    Any edit to the job or to an experience/project (or adding, removing or
+    reordering them) changes the fingerprint.
+    """
+    content = {
+        "mode": mode,
+        "job": [
+            job.title, job.company, job.description,
+            list(job.requirements or []), list(job.parsed_keywords or []),
+        ],
+        "experiences": [
+            [
+                str(exp.id), exp.title, exp.company,
+                getattr(exp, "description", None),
+                getattr(exp, "enhanced_description", None),
+                list(getattr(exp, "achievements", None) or []),
+            ]
+            for exp in experiences
+        ],
+        "projects": [
+            [
+                str(proj.id), proj.name,
+                getattr(proj, "description", None),
+                getattr(proj, "enhanced_description", None),
+                list(getattr(proj, "technologies", None) or []),
+            ]
+            for proj in projects
+        ],
+    }
+    encoded = json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _merge_rankings(preferred: List[str], fallback: List[str]) -> List[str]:
+    """Preferred order first, then the remaining fallback IDs in their order."""
+    seen = set(preferred)
+    return list(preferred) + [item_id for item_id in fallback if item_id not in seen]
@@ -0,0 +1,247 @@
+"""Process pool that renders PDF/DOCX exports off the event loop."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+
+from app.application.services.export_renderer import (
+    PYTHON_DOCX_AVAILABLE,
+    WEASYPRINT_AVAILABLE,
+    ExportRenderer,
+)
+from app.core.config import get_settings
+from app.domain.enums.export_format import ExportFormat
+from app.domain.enums.template_type import TemplateType
+
+logger = logging.getLogger(__name__)
+
+
+class RenderQueueFullError(Exception):
+    """Raised when every render worker is busy and the queue is at its limit."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        super().__init__(f"Export rendering is busy ({limit} renders pending); try again shortly")
+
+
+class RenderTimeoutError(Exception):
+    """Raised when one render takes longer than the configured timeout."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(f"Export rendering did not finish within {timeout}s")
+
+
+# Each worker process keeps one renderer (Jinja environment, loaded fonts)
+_worker_renderer: Optional[ExportRenderer] = None
+
+
+def _warm_worker() -> None:
+    """Pool initializer: build the renderer and load WeasyPrint/python-docx once."""
+    global _worker_renderer
+    _worker_renderer = ExportRenderer()
+    try:
+        if WEASYPRINT_AVAILABLE:
+            from weasyprint import HTML
+            HTML(string="<p>warm-up</p>").write_pdf()
+        if PYTHON_DOCX_AVAILABLE:
+            from docx import Document
+            Document()
+    except Exception as e:
+        # A failed warm-up only costs the first render its start-up time
+        logger.warning(f"Render worker warm-up failed: {e}")
+
+
+def _render_in_worker(
+    format: ExportFormat,
+    structured_content: Dict[str, Any],
+    template: TemplateType,
+    options: Optional[Dict[str, Any]]
+) -> bytes:
+    renderer = _worker_renderer or ExportRenderer()
+    if format == ExportFormat.PDF:
+        return renderer.render_pdf(structured_content, template, options)
+    return renderer.render_docx(structured_content, template, options)
+
+
+def _noop() -> None:
+    return None
+
+
+class RenderExecutor:
+    """Run PDF/DOCX renders on a pool of warm worker processes.
+
+    At most ``workers + max_queue`` renders are accepted at once; beyond
+    that callers get RenderQueueFullError instead of piling up. A render
+    that outlives ``timeout`` fails with RenderTimeoutError (its worker
+    finishes the job and is then reused; until then it still counts as
+    pending). With ``workers`` = 0 renders
+    run on a thread of this process, which keeps the event loop free but
+    shares the GIL with request handling.
+    """
+
+    def __init__(self, workers: int, max_queue: int, timeout: float):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._renderer: Optional[ExportRenderer] = None
+        self.pending = 0
+        self.rendered = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    @property
+    def capacity(self) -> int:
+        return max(1, self.workers) + self.max_queue
+
+    def start(self) -> None:
+        """Create the pool and start every worker so the first exports skip the warm-up."""
+        if self.workers <= 0 or self._pool is not None:
+            return
+        # Spawn keeps workers free of the event loop and open DB connections
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+        for _ in range(self.workers):
+            self._pool.submit(_noop)
+
+    async def render(
+        self,
+        format: ExportFormat,
+        structured_content: Dict[str, Any],
+        template: TemplateType,
+        options: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """Render one document to PDF or DOCX bytes without blocking the event loop.
+
+        Raises:
+            RenderQueueFullError: If the render queue is full
+            RenderTimeoutError: If the render takes longer than ``timeout``
+            RuntimeError: If the format's rendering library is not installed
+        """
+        if self.pending >= self.capacity:
+            self.rejected += 1
+            raise RenderQueueFullError(self.capacity)
+
+        self.pending += 1
+        try:
+            try:
+                content = await self._submit(format, structured_content, template, options)
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory); the pool was replaced, try once more
+                logger.error("Render pool broke, restarting workers")
+                content = await self._submit(format, structured_content, template, options)
+            self.rendered += 1
+            return content
+        finally:
+            self.pending -= 1
+
+    async def _submit(
+        self,
+        format: ExportFormat,
+        structured_content: Dict[str, Any],
+        template: TemplateType,
+        options: Optional[Dict[str, Any]]
+    ) -> bytes:
+        args = (format, structured_content, template, options)
+        pool = None
+        job = None
+        future = None
+        try:
+            if self.workers > 0:
+                self.start()
+                pool = self._pool
+                job = pool.submit(_render_in_worker, *args)
+                future = asyncio.wrap_future(job)
+            else:
+                if self._renderer is None:
+                    self._renderer = ExportRenderer()
+                future = asyncio.ensure_future(asyncio.to_thread(self._render_inline, *args))
+            return await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise RenderTimeoutError(self.timeout)
+        except BrokenProcessPool:
+            self._discard_pool(pool)
+            raise
+        finally:
+            if future is not None and not future.done():
+                # The worker keeps rendering after a timeout or cancellation; it
+                # holds its place against capacity until it actually finishes
+                if job is not None:
+                    job.cancel()
+                self.pending += 1
+                future.add_done_callback(self._abandoned_render_done)
+
+    def _abandoned_render_done(self, future: asyncio.Future) -> None:
+        self.pending -= 1
+        if not future.cancelled():
+            future.exception()  # consumed so asyncio does not log it as unretrieved
+
+    def _discard_pool(self, pool: Optional[ProcessPoolExecutor]) -> None:
+        """Drop a broken pool without waiting on it; later renders start a new one."""
+        if pool is None:
+            return
+        # Another render may already have replaced it; never shut down the new pool
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False)
+
+    def _render_inline(self, format, structured_content, template, options) -> bytes:
+        if format == ExportFormat.PDF:
+            return self._renderer.render_pdf(structured_content, template, options)
+        return self._renderer.render_docx(structured_content, template, options)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; the next render starts a new pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def snapshot(self) -> dict:
+        """Return pool size and render counters as a plain dictionary."""
+        return {
+            "workers": self.workers,
+            "capacity": self.capacity,
+            "pending": self.pending,
+            "rendered": self.rendered,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
+
+
+_render_executor: Optional[RenderExecutor] = None
+
+
+def get_render_executor() -> RenderExecutor:
+    """Get the shared render executor; workers start on first use outside the app lifespan."""
+    global _render_executor
+    if _render_executor is None:
+        settings = get_settings()
+        _render_executor = RenderExecutor(
+            workers=settings.export_render_workers,
+            max_queue=settings.export_render_queue_limit,
+            timeout=settings.export_render_timeout_seconds,
+        )
+    return _render_executor
+
+
+def init_render_executor() -> RenderExecutor:
+    """Create the shared render executor and start its workers (idempotent)."""
+    executor = get_render_executor()
+    executor.start()
+    return executor
+
+
+def shutdown_render_executor() -> None:
+    """Stop the render workers and drop the shared executor."""
+    global _render_executor
+    if _render_executor is not None:
+        _render_executor.shutdown()
+        _render_executor = None
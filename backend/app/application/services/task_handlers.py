@@ -0,0 +1,114 @@
+"""Background task handlers: long-running LLM and export work run off the request."""
+
+import json
+from typing import Any, Dict
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.enhancement_service import EnhancementService
+from app.application.services.export_renderer import get_export_renderer
+from app.application.services.export_service import ExportService
+from app.application.services.generation_service import GenerationService
+from app.application.services.ranking_service import RankingService
+from app.application.services.render_pool import get_render_executor
+from app.application.services.style_extraction_service import StyleExtractionService
+from app.domain.entities.background_task import BackgroundTask
+from app.domain.enums.export_format import ExportFormat
+from app.domain.enums.template_type import TemplateType
+from app.infrastructure.adapters.llm.llm_client import get_llm_adapter
+from app.infrastructure.repositories.export_repository import ExportRepository
+from app.infrastructure.repositories.generation_repository import GenerationRepository
+from app.infrastructure.repositories.job_repository import JobRepository
+from app.infrastructure.repositories.profile_repository import ProfileRepository
+from app.infrastructure.repositories.ranking_repository import RankingRepository
+from app.infrastructure.repositories.sample_repository import SampleRepository
+from app.infrastructure.repositories.writing_style_repository import WritingStyleRepository
+from app.infrastructure.storage.async_storage import get_storage
+
+ENHANCE_PROFILE = "enhance_profile"
+COVER_LETTER = "cover_letter"
+BATCH_EXPORT = "batch_export"
+
+
+async def run_profile_enhancement(session: AsyncSession, task: BackgroundTask) -> Dict[str, Any]:
+    """Enhance a profile; the result matches the synchronous enhance endpoint."""
+    llm = get_llm_adapter()
+    style_service = StyleExtractionService(
+        llm, SampleRepository(session), WritingStyleRepository(session)
+    )
+    enhancement_service = EnhancementService(llm, ProfileRepository(session), style_service)
+
+    result = await enhancement_service.enhance_profile(
+        profile_id=UUID(task.payload["profile_id"]),
+        user_id=task.user_id,
+        custom_prompt=task.payload.get("custom_prompt")
+    )
+    # Stored as JSON on the task row
+    return json.loads(json.dumps(result, default=str))
+
+
+async def run_cover_letter(session: AsyncSession, task: BackgroundTask) -> Dict[str, Any]:
+    """Generate and save a cover letter; fetch it with GET /generations/{id}."""
+    llm = get_llm_adapter()
+    profile_repo = ProfileRepository(session)
+    job_repo = JobRepository(session)
+    ranking_service = RankingService(llm, RankingRepository(session), profile_repo, job_repo)
+    style_service = StyleExtractionService(
+        llm, SampleRepository(session), WritingStyleRepository(session)
+    )
+    generation_service = GenerationService(
+        llm, GenerationRepository(session), profile_repo, job_repo, ranking_service, style_service
+    )
+
+    payload = task.payload
+    generation = await generation_service.generate_cover_letter(
+        user_id=task.user_id,
+        job_id=UUID(payload["job_id"]),
+        company_name=payload.get("company_name"),
+        hiring_manager_name=payload.get("hiring_manager_name"),
+        max_paragraphs=payload.get("max_paragraphs", 4),
+        custom_prompt=payload.get("custom_prompt"),
+        defer_ats=payload.get("defer_ats_score", False)
+    )
+    return {
+        "generation_id": str(generation.id),
+        "job_id": str(generation.job_id),
+        "ats_score": generation.ats_score,
+        "ats_status": generation.ats_status.value if generation.ats_status else None
+    }
+
+
+async def run_batch_export(session: AsyncSession, task: BackgroundTask) -> Dict[str, Any]:
+    """Render generations into a ZIP; the download URL is in the result."""
+    export_service = ExportService(
+        export_renderer=get_export_renderer(),
+        storage=get_storage(),
+        generation_repository=GenerationRepository(session),
+        export_repository=ExportRepository(session),
+        job_repository=JobRepository(session),
+        render_executor=get_render_executor()
+    )
+
+    payload = task.payload
+    export = await export_service.batch_export(
+        user_id=task.user_id,
+        generation_ids=payload["generation_ids"],
+        format=ExportFormat(payload["format"]),
+        template=TemplateType(payload["template"]),
+        options=payload.get("options")
+    )
+    return {
+        "export_id": str(export.id),
+        "filename": export.filename,
+        "file_size_bytes": export.file_size_bytes,
+        "download_url": export.download_url,
+        "expires_at": export.expires_at.isoformat() if export.expires_at else None
+    }
+
+
+TASK_HANDLERS = {
+    ENHANCE_PROFILE: run_profile_enhancement,
+    COVER_LETTER: run_cover_letter,
+    BATCH_EXPORT: run_batch_export,
+}
@@ -0,0 +1,276 @@
+"""Background task queue: tasks stored in SQLite and run by worker coroutines.
+
+API requests enqueue a task row and return its ID immediately. Workers
+claim due tasks, run the registered handler with their own session and
+record the result. Failed attempts are retried with exponential backoff;
+``ValueError`` (missing or invalid input) fails the task at once.
+
+A claimed task is leased to the claiming process, which renews the lease
+while the handler runs. Only tasks whose lease has expired are requeued,
+so several processes can share the table without running a task twice.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.task_handlers import TASK_HANDLERS
+from app.core.config import get_settings
+from app.domain.entities.background_task import BackgroundTask
+from app.infrastructure.adapters.llm.rate_limit import LLMRateLimitError, set_llm_user
+from app.infrastructure.database.connection import get_session_factory
+from app.infrastructure.repositories.task_repository import TaskRepository
+
+logger = logging.getLogger(__name__)
+
+# Runs one task with a worker-owned session and returns its JSON result
+TaskHandler = Callable[[AsyncSession, BackgroundTask], Awaitable[Dict[str, Any]]]
+
+
+class TaskQueue:
+    """Bounded pool of workers draining the background_tasks table."""
+
+    def __init__(
+        self,
+        handlers: Mapping[str, TaskHandler],
+        workers: int = 2,
+        max_attempts: int = 3,
+        backoff_seconds: float = 5.0,
+        poll_interval: float = 2.0,
+        lease_seconds: float = 60.0,
+        session_factory=None
+    ):
+        self.handlers = dict(handlers)
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        # Identifies this process's leases in the table
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._session_factory = session_factory
+        self._next_requeue = 0.0
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._worker_tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._worker_tasks)
+
+    def session_factory(self):
+        factory = self._session_factory or get_session_factory()
+        return factory()
+
+    async def start(self) -> None:
+        """Requeue tasks whose lease expired (their process died) and start the workers."""
+        if self.running:
+            return
+        await self.requeue_expired()
+
+        self._stopping = False
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"task-worker-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Let running tasks finish for up to ``timeout`` seconds, then cancel them.
+
+        Cancelled tasks are released back to the queue straight away.
+        """
+        if not self.running:
+            return
+        self._stopping = True
+        self._wake.set()
+        _, pending = await asyncio.wait(self._worker_tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._worker_tasks = []
+        if pending:
+            async with self.session_factory() as session:
+                released = await TaskRepository(session).release(self.owner)
+            logger.info(f"Released {released} interrupted background tasks")
+
+    async def requeue_expired(self) -> int:
+        """Requeue running tasks whose lease expired without being renewed."""
+        self._next_requeue = asyncio.get_running_loop().time() + self.lease_seconds
+        async with self.session_factory() as session:
+            requeued = await TaskRepository(session).requeue_expired()
+        if requeued:
+            logger.info(f"Requeued {requeued} background tasks with expired leases")
+        return requeued
+
+    async def enqueue(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        task_type: str,
+        payload: Dict[str, Any]
+    ) -> BackgroundTask:
+        """Save a queued task and wake a worker.
+
+        Args:
+            session: Request session; the task is committed before returning
+            payload: JSON-serializable handler arguments
+
+        Raises:
+            ValueError: If no handler is registered for ``task_type``
+        """
+        if task_type not in self.handlers:
+            raise ValueError(f"Unknown task type: {task_type}")
+
+        task = BackgroundTask(
+            id=uuid4(),
+            user_id=user_id,
+            task_type=task_type,
+            payload=payload,
+            max_attempts=self.max_attempts
+        )
+        await TaskRepository(session).create(task)
+        self._wake.set()
+        return task
+
+    def retry_delay(self, attempts: int) -> float:
+        """Seconds to wait after ``attempts`` failed attempts."""
+        return self.backoff_seconds * 2 ** (attempts - 1)
+
+    async def run_next(self) -> bool:
+        """Claim and run one due task.
+
+        Returns:
+            False if no task was due
+        """
+        async with self.session_factory() as session:
+            task = await TaskRepository(session).claim_next(self.owner, self.lease_seconds)
+        if task is None:
+            return False
+
+        logger.info(f"Running {task.task_type} task {task.id} (attempt {task.attempts})")
+        set_llm_user(task.user_id)
+        heartbeat = None
+        try:
+            async with self.session_factory() as session:
+                work = asyncio.create_task(self.handlers[task.task_type](session, task))
+                heartbeat = asyncio.create_task(self._keep_lease(task, work))
+                try:
+                    result = await work
+                except asyncio.CancelledError:
+                    if not heartbeat.done():
+                        raise  # the queue is stopping
+                    # Lease lost: the run that now holds the task records its outcome
+                    return True
+        except Exception as e:
+            await self._record_failure(task, e)
+        else:
+            async with self.session_factory() as session:
+                recorded = await TaskRepository(session).mark_completed(task.id, self.owner, result)
+            if not recorded:
+                logger.warning(f"{task.task_type} task {task.id} finished after losing its lease; result discarded")
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+        return True
+
+    async def _keep_lease(self, task: BackgroundTask, work: asyncio.Task) -> None:
+        """Renew the task's lease every third of the lease period while it runs.
+
+        If the lease is lost (it expired and another run claimed the task)
+        the handler is cancelled so the task never runs twice at once.
+        """
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with self.session_factory() as session:
+                    renewed = await TaskRepository(session).renew_lease(
+                        task.id, self.owner, datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+                    )
+            except Exception as e:
+                logger.error(f"Could not renew lease of task {task.id}: {e}")
+                continue
+            if not renewed:
+                logger.warning(f"{task.task_type} task {task.id} lease lost to another worker; cancelling it")
+                work.cancel()
+                return
+
+    async def _record_failure(self, task: BackgroundTask, error: Exception) -> None:
+        message = f"{type(error).__name__}: {error}"
+        async with self.session_factory() as session:
+            repo = TaskRepository(session)
+            if isinstance(error, ValueError) or task.attempts >= task.max_attempts:
+                logger.error(f"{task.task_type} task {task.id} failed: {message}")
+                recorded = await repo.mark_failed(task.id, self.owner, message)
+            else:
+                delay = self.retry_delay(task.attempts)
+                if isinstance(error, LLMRateLimitError):
+                    # No point retrying before the user's token budget has refilled
+                    delay = max(delay, error.retry_after)
+                logger.warning(f"{task.task_type} task {task.id} failed, retrying in {delay}s: {message}")
+                recorded = await repo.schedule_retry(
+                    task.id, self.owner, message, datetime.utcnow() + timedelta(seconds=delay)
+                )
+        if not recorded:
+            logger.warning(f"{task.task_type} task {task.id} failed after losing its lease; outcome discarded")
+
+    async def _worker(self) -> None:
+        while not self._stopping:
+            try:
+                if asyncio.get_running_loop().time() >= self._next_requeue:
+                    await self.requeue_expired()
+                if await self.run_next():
+                    continue
+            except Exception as e:
+                # Database trouble: back off instead of spinning
+                logger.error(f"Background task worker error: {e}")
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+_task_queue: Optional[TaskQueue] = None
+
+
+def create_task_queue() -> TaskQueue:
+    """Build a queue with the application's handlers and settings."""
+    settings = get_settings()
+    return TaskQueue(
+        handlers=TASK_HANDLERS,
+        workers=settings.task_queue_workers,
+        max_attempts=settings.task_max_attempts,
+        backoff_seconds=settings.task_retry_backoff_seconds,
+        poll_interval=settings.task_poll_interval_seconds,
+        lease_seconds=settings.task_lease_seconds
+    )
+
+
+async def init_task_queue() -> TaskQueue:
+    """Create the shared queue and start its workers (idempotent)."""
+    queue = get_task_queue()
+    await queue.start()
+    logger.info(f"Background task queue started with {queue.workers} workers")
+    return queue
+
+
+def get_task_queue() -> TaskQueue:
+    """Get the shared queue, creating it (without workers) outside the app lifespan."""
+    global _task_queue
+    if _task_queue is None:
+        _task_queue = create_task_queue()
+    return _task_queue
+
+
+async def shutdown_task_queue() -> None:
+    """Stop the workers and drop the shared queue."""
+    global _task_queue
+    if _task_queue is not None:
+        await _task_queue.stop()
+    _task_queue = None
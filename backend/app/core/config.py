@@ -1,7 +1,7 @@
 """Core configuration settings."""
 
 from functools import lru_cache
-from typing import List
+from typing import Dict, List
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,6 +15,63 @@ class Settings(BaseSettings):
         alias="DATABASE_URL",
         description="SQLAlchemy connection string"
     )
+    db_pool_size: int = Field(
+        default=5,
+        alias="DB_POOL_SIZE",
+        description="Persistent connections kept in the shared engine pool"
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        alias="DB_MAX_OVERFLOW",
+        description="Extra connections allowed above pool size under load"
+    )
+    db_pool_timeout: float = Field(
+        default=30.0,
+        alias="DB_POOL_TIMEOUT",
+        description="Seconds to wait for a free pooled connection"
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        alias="DB_POOL_RECYCLE",
+        description="Seconds after which pooled connections are replaced (-1 disables)"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        alias="DB_POOL_PRE_PING",
+        description="Test pooled connections for liveness before checkout"
+    )
+    db_auto_migrate: bool = Field(
+        default=False,
+        alias="DB_AUTO_MIGRATE",
+        description="Apply pending schema migrations at startup instead of failing"
+    )
+
+    # SQLite production profile (WAL, tuned pragmas, single writer connection)
+    sqlite_production_mode: bool = Field(
+        default=False,
+        alias="SQLITE_PRODUCTION_MODE",
+        description="Enable WAL, tuned pragmas and single-writer routing for file SQLite"
+    )
+    sqlite_reader_pool_size: int = Field(
+        default=4,
+        alias="SQLITE_READER_POOL_SIZE",
+        description="Reader connections used when the SQLite production profile is on"
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        alias="SQLITE_BUSY_TIMEOUT_MS",
+        description="Milliseconds a connection waits on a locked database"
+    )
+    sqlite_cache_size: int = Field(
+        default=-64000,
+        alias="SQLITE_CACHE_SIZE",
+        description="Page cache size; negative values are KiB (default 64 MB)"
+    )
+    sqlite_mmap_size: int = Field(
+        default=268435456,
+        alias="SQLITE_MMAP_SIZE",
+        description="Bytes of the database file to memory-map (default 256 MB)"
+    )
 
     # JWT Configuration  
     secret_key: str = Field(
@@ -53,6 +110,150 @@ class Settings(BaseSettings):
         description="Groq API key for LLM operations"
     )
     
+    # Shared LLM client (connection pool and per-model concurrency limits)
+    llm_http2: bool = Field(
+        default=True,
+        alias="LLM_HTTP2",
+        description="Use HTTP/2 for the pooled LLM API connection"
+    )
+    llm_max_connections: int = Field(
+        default=20,
+        alias="LLM_MAX_CONNECTIONS",
+        description="Maximum open connections to the LLM API"
+    )
+    llm_max_keepalive_connections: int = Field(
+        default=10,
+        alias="LLM_MAX_KEEPALIVE_CONNECTIONS",
+        description="Idle connections kept alive for reuse"
+    )
+    llm_keepalive_expiry: float = Field(
+        default=30.0,
+        alias="LLM_KEEPALIVE_EXPIRY",
+        description="Seconds an idle LLM connection is kept open"
+    )
+    llm_request_timeout: float = Field(
+        default=60.0,
+        alias="LLM_REQUEST_TIMEOUT",
+        description="Seconds to wait for an LLM API response"
+    )
+    llm_fast_model_concurrency: int = Field(
+        default=8,
+        alias="LLM_FAST_MODEL_CONCURRENCY",
+        description="Concurrent calls allowed to the fast model (ranking, style, ATS)"
+    )
+    llm_quality_model_concurrency: int = Field(
+        default=4,
+        alias="LLM_QUALITY_MODEL_CONCURRENCY",
+        description="Concurrent calls allowed to the quality model (generation, enhancement)"
+    )
+    llm_queue_timeout: float = Field(
+        default=30.0,
+        alias="LLM_QUEUE_TIMEOUT",
+        description="Seconds a call waits for a model slot before failing with 503"
+    )
+    
+    # Per-user LLM token budgets (0 disables the budget for that model)
+    llm_user_fast_tokens_per_minute: int = Field(
+        default=60000,
+        ge=0,
+        alias="LLM_USER_FAST_TOKENS_PER_MINUTE",
+        description="Tokens per minute each user may spend on the fast model"
+    )
+    llm_user_quality_tokens_per_minute: int = Field(
+        default=20000,
+        ge=0,
+        alias="LLM_USER_QUALITY_TOKENS_PER_MINUTE",
+        description="Tokens per minute each user may spend on the quality model"
+    )
+    llm_user_max_wait_seconds: float = Field(
+        default=10.0,
+        ge=0,
+        alias="LLM_USER_MAX_WAIT_SECONDS",
+        description="Seconds a call may wait for its user's budget to refill before failing with 429"
+    )
+    llm_user_weights: Dict[str, float] = Field(
+        default_factory=dict,
+        alias="LLM_USER_WEIGHTS",
+        description='Fair-queuing weight by user ID as JSON, e.g. {"42": 2.0}; others weigh 1'
+    )
+    
+    # LLM call resilience (deadlines, retries, hedging, model fallback)
+    llm_fast_model_deadline_seconds: float = Field(
+        default=20.0,
+        gt=0,
+        alias="LLM_FAST_MODEL_DEADLINE_SECONDS",
+        description="Seconds one fast-model attempt may take before it is retried"
+    )
+    llm_quality_model_deadline_seconds: float = Field(
+        default=45.0,
+        gt=0,
+        alias="LLM_QUALITY_MODEL_DEADLINE_SECONDS",
+        description="Seconds one quality-model attempt may take before it is retried"
+    )
+    llm_max_retries: int = Field(
+        default=2,
+        ge=0,
+        alias="LLM_MAX_RETRIES",
+        description="Retries after a 429, 5xx, timeout or connection error"
+    )
+    llm_retry_backoff_seconds: float = Field(
+        default=0.5,
+        ge=0,
+        alias="LLM_RETRY_BACKOFF_SECONDS",
+        description="Base of the jittered exponential retry delay"
+    )
+    llm_retry_max_backoff_seconds: float = Field(
+        default=8.0,
+        ge=0,
+        alias="LLM_RETRY_MAX_BACKOFF_SECONDS",
+        description="Longest retry delay; a longer Retry-After fails the call instead"
+    )
+    llm_hedge_enabled: bool = Field(
+        default=False,
+        alias="LLM_HEDGE_ENABLED",
+        description="Send a duplicate request when a call outlives the model's p95 latency"
+    )
+    llm_hedge_min_delay_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        alias="LLM_HEDGE_MIN_DELAY_SECONDS",
+        description="Never hedge a call sooner than this"
+    )
+    llm_fallback_enabled: bool = Field(
+        default=True,
+        alias="LLM_FALLBACK_ENABLED",
+        description="Fall back from the quality model to the fast model under pressure"
+    )
+    llm_fallback_queue_depth: int = Field(
+        default=8,
+        ge=0,
+        alias="LLM_FALLBACK_QUEUE_DEPTH",
+        description="Quality-model queue depth at which new calls use the fast model (0 disables)"
+    )
+    
+    # LLM response cache for deterministic (low-temperature) calls
+    llm_cache_backend: str = Field(
+        default="sqlite",
+        alias="LLM_CACHE_BACKEND",
+        pattern="^(none|memory|sqlite)$",
+        description="none, memory (per-process LRU) or sqlite (LRU in front of a persistent table)"
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600,
+        alias="LLM_CACHE_TTL_SECONDS",
+        description="Seconds a cached LLM response stays valid"
+    )
+    llm_cache_max_entries: int = Field(
+        default=1000,
+        alias="LLM_CACHE_MAX_ENTRIES",
+        description="Entries kept in the in-memory LRU"
+    )
+    llm_cache_max_temperature: float = Field(
+        default=0.3,
+        alias="LLM_CACHE_MAX_TEMPERATURE",
+        description="Calls at or below this temperature are cached unless they opt out"
+    )
+    
     # AWS S3 Configuration for Document Exports
     aws_access_key_id: str = Field(
         ...,
@@ -74,6 +275,12 @@ class Settings(BaseSettings):
         alias="S3_REGION",
         description="AWS S3 region"
     )
+    storage_io_workers: int = Field(
+        default=10,
+        ge=1,
+        alias="STORAGE_IO_WORKERS",
+        description="Threads (and S3 connections) for storage I/O off the event loop"
+    )
     
     # Export Configuration
     export_max_file_size_mb: int = Field(
@@ -91,6 +298,102 @@ class Settings(BaseSettings):
         alias="EXPORT_RETENTION_DAYS",
         description="Days to retain exports before auto-deletion"
     )
+    export_render_workers: int = Field(
+        default=2,
+        ge=0,
+        alias="EXPORT_RENDER_WORKERS",
+        description="Worker processes rendering PDF/DOCX exports (0 renders on a thread)"
+    )
+    export_render_queue_limit: int = Field(
+        default=16,
+        ge=0,
+        alias="EXPORT_RENDER_QUEUE_LIMIT",
+        description="Renders allowed to wait for a busy worker before exports fail with 503"
+    )
+    export_render_timeout_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        alias="EXPORT_RENDER_TIMEOUT_SECONDS",
+        description="Seconds one document render may take before the export fails with 504"
+    )
+    
+    # Job Parsing Configuration
+    keyword_taxonomy_path: str = Field(
+        default="data/keyword_taxonomy.json",
+        alias="KEYWORD_TAXONOMY_PATH",
+        description="Keyword taxonomy JSON (relative to the backend directory); reloaded when it changes"
+    )
+    job_parse_workers: int = Field(
+        default=2,
+        ge=0,
+        alias="JOB_PARSE_WORKERS",
+        description="Worker processes for bulk job text parsing (0 parses in the request)"
+    )
+    job_bulk_import_max_items: int = Field(
+        default=100,
+        alias="JOB_BULK_IMPORT_MAX_ITEMS",
+        description="Maximum postings accepted by one bulk job import"
+    )
+    
+    # Content Ranking Configuration
+    ranking_mode: str = Field(
+        default="llm",
+        pattern="^(llm|local|hybrid)$",
+        alias="RANKING_MODE",
+        description="Default ranker: llm, local (BM25 only) or hybrid (BM25 shortlist reranked by the LLM)"
+    )
+    ranking_hybrid_top_k: int = Field(
+        default=5,
+        ge=1,
+        alias="RANKING_HYBRID_TOP_K",
+        description="Experiences and projects each sent to the LLM in hybrid ranking"
+    )
+
+    # Batch Generation Configuration
+    batch_generation_max_jobs: int = Field(
+        default=20,
+        ge=1,
+        alias="BATCH_GENERATION_MAX_JOBS",
+        description="Maximum jobs accepted by one batch generation request"
+    )
+    batch_generation_concurrency: int = Field(
+        default=4,
+        ge=1,
+        alias="BATCH_GENERATION_CONCURRENCY",
+        description="Jobs ranked and generated at the same time within a batch"
+    )
+
+    # Background Task Queue Configuration
+    task_queue_workers: int = Field(
+        default=2,
+        ge=0,
+        alias="TASK_QUEUE_WORKERS",
+        description="Worker coroutines running queued tasks (0 queues without running them)"
+    )
+    task_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        alias="TASK_MAX_ATTEMPTS",
+        description="Attempts per task before it is marked failed"
+    )
+    task_retry_backoff_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        alias="TASK_RETRY_BACKOFF_SECONDS",
+        description="Delay before the first retry; doubles with each further attempt"
+    )
+    task_poll_interval_seconds: float = Field(
+        default=2.0,
+        gt=0,
+        alias="TASK_POLL_INTERVAL_SECONDS",
+        description="How often idle workers check for due tasks (new tasks wake them immediately)"
+    )
+    task_lease_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        alias="TASK_LEASE_SECONDS",
+        description="How long a running task stays claimed without a heartbeat before it is requeued"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
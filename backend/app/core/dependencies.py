@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.application.services.auth_service import AuthService
 from app.application.services.job_service import JobService
 from app.core.security import get_user_id_from_token
+from app.infrastructure.adapters.llm.rate_limit import set_llm_user
 from app.infrastructure.database.connection import get_db_session
 from app.infrastructure.repositories.user_repository import UserRepository
 from app.infrastructure.repositories.job_repository import JobRepository
@@ -48,6 +49,8 @@ async def get_current_user(
                 detail="Invalid authentication token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        # LLM calls made while serving this request count against this user's budget
+        set_llm_user(user_id)
         return user_id
     except Exception:
         raise HTTPException(
@@ -0,0 +1,41 @@
+"""Background task entity."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from ..enums.generation_status import GenerationStatus
+
+
+@dataclass
+class BackgroundTask:
+    """Long-running work queued by an API request and run by a worker.
+    
+    Status reuses GenerationStatus: PENDING is queued (including waiting to
+    retry), GENERATING is running, then COMPLETED or FAILED. A running task
+    is leased to the worker process in ``claimed_by`` until
+    ``lease_expires_at``; the worker renews the lease while it runs.
+    """
+    
+    id: UUID
+    user_id: int
+    task_type: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    status: GenerationStatus = GenerationStatus.PENDING
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    max_attempts: int = 3
+    run_after: datetime = None
+    created_at: datetime = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    claimed_by: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.utcnow()
+        if self.run_after is None:
+            self.run_after = self.created_at
@@ -30,6 +30,7 @@ class Export:
     cache_expires_at: Optional[datetime] = None  # Cache expiration (typically 7 days)
     expires_at: datetime = None  # S3 expiration (30 days)
     created_at: datetime = None
+    render_hash: Optional[str] = None  # Identifies identical renders for reuse
     
     def __post_init__(self):
         if self.created_at is None:
@@ -56,3 +57,26 @@ class Export:
         """
         extension = format.value
         return f"exports/{user_id}/{export_id}.{extension}"
+
+
+@dataclass
+class ExportSummary:
+    """Export list-view row without options or local cache fields."""
+    
+    id: str
+    generation_id: Optional[str]
+    job_id: Optional[str]
+    format: ExportFormat
+    template: TemplateType
+    filename: str
+    file_path: str  # S3 object key, needed to presign download_url
+    file_size_bytes: int
+    expires_at: datetime
+    created_at: datetime
+    page_count: Optional[int] = None
+    export_metadata: Optional[dict] = None
+    download_url: Optional[str] = None
+    
+    def is_expired(self) -> bool:
+        """Check if export has expired."""
+        return datetime.utcnow() > self.expires_at
@@ -23,6 +23,7 @@ class Generation:
     content_structured: Optional[str] = None
     ats_score: Optional[float] = None
     ats_feedback: Optional[str] = None
+    ats_status: Optional[GenerationStatus] = None
     llm_metadata: Optional[str] = None
     created_at: datetime = None
     
@@ -40,3 +41,16 @@ class Generation:
     def mark_failed(self) -> None:
         """Mark generation as failed."""
         self.status = GenerationStatus.FAILED
+
+
+@dataclass
+class GenerationSummary:
+    """Generation list-view row without the generated content."""
+    
+    id: UUID
+    job_id: UUID
+    document_type: DocumentType
+    status: GenerationStatus
+    ats_score: Optional[float] = None
+    ats_status: Optional[GenerationStatus] = None
+    created_at: datetime = None
@@ -51,3 +51,20 @@ class Job(BaseModel):
             }
         }
     }
+
+
+class JobSummary(BaseModel):
+    """Lightweight job view for list screens (no description, raw text or parsed lists)."""
+    
+    id: str = Field(..., description="UUID of the job")
+    source: str = Field(..., description="Job source: user_created, indeed, linkedin, mock, etc.")
+    title: str = Field(..., description="Job title")
+    company: str = Field(..., description="Company name")
+    location: Optional[str] = Field(None, description="Job location")
+    salary_range: Optional[str] = Field(None, description="Salary range")
+    remote: bool = Field(default=False, description="Remote position flag")
+    employment_type: str = Field(default="full_time", description="Employment type")
+    status: str = Field(default="active", description="Job status: active, archived, draft")
+    application_status: str = Field(default="not_applied", description="Application status")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
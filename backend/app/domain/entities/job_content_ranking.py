@@ -24,6 +24,7 @@ class JobContentRanking:
     llm_metadata: Optional[str] = None
     status: GenerationStatus = GenerationStatus.COMPLETED
     created_at: datetime = None
+    content_fingerprint: Optional[str] = None  # Hash of the ranked job and profile content
     
     def __post_init__(self):
         if self.created_at is None:
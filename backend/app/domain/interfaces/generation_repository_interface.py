@@ -4,8 +4,9 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
-from ..entities.generation import Generation
+from ..entities.generation import Generation, GenerationSummary
 from ..enums.document_type import DocumentType
+from ..enums.generation_status import GenerationStatus
 
 
 class GenerationRepositoryInterface(ABC):
@@ -16,6 +17,11 @@ class GenerationRepositoryInterface(ABC):
         """Create a new generation."""
         pass
     
+    @abstractmethod
+    async def create_many(self, generations: List[Generation]) -> List[Generation]:
+        """Insert several generations in one transaction."""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, generation_id: UUID) -> Optional[Generation]:
         """Get generation by ID."""
@@ -33,11 +39,35 @@ class GenerationRepositoryInterface(ABC):
         """List generations for a user with pagination."""
         pass
     
+    @abstractmethod
+    async def list_summaries_by_user(
+        self,
+        user_id: int,
+        document_type: Optional[DocumentType] = None,
+        job_id: Optional[UUID] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[GenerationSummary]:
+        """List generation summaries (no content) for a user with pagination."""
+        pass
+    
     @abstractmethod
     async def update(self, generation: Generation) -> Generation:
         """Update generation."""
         pass
     
+    @abstractmethod
+    async def update_ats_result(
+        self,
+        generation_id: UUID,
+        ats_status: GenerationStatus,
+        ats_score: Optional[float] = None,
+        ats_feedback: Optional[str] = None,
+        llm_metadata: Optional[str] = None
+    ) -> bool:
+        """Record a deferred ATS result for a generation."""
+        pass
+    
     @abstractmethod
     async def delete(self, generation_id: UUID) -> bool:
         """Delete generation."""
@@ -1,7 +1,7 @@
 """Job content ranking repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from ..entities.job_content_ranking import JobContentRanking
@@ -15,6 +15,15 @@ class RankingRepositoryInterface(ABC):
         """Create a new ranking."""
         pass
     
+    @abstractmethod
+    async def replace_many(
+        self,
+        rankings: List[JobContentRanking],
+        replaced_ids: List[UUID]
+    ) -> None:
+        """Insert rankings and delete the ones they replace in one transaction."""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, ranking_id: UUID) -> Optional[JobContentRanking]:
         """Get ranking by ID."""
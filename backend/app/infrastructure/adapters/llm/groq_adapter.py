@@ -2,11 +2,15 @@
 
 import json
 import time
-from typing import Dict, Optional
+from contextlib import asynccontextmanager, nullcontext
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional
 from groq import AsyncGroq
 from opentelemetry import trace
 
 from .llm_interface import LLMInterface
+from .rate_limit import LLMRateLimitError, current_llm_user, estimate_tokens
+from .resilience import LLMUpstreamError
+from .response_cache import make_cache_key
 
 # Get tracer for this module
 tracer = trace.get_tracer(__name__)
@@ -15,9 +19,30 @@ tracer = trace.get_tracer(__name__)
 class GroqAdapter(LLMInterface):
     """Groq LLM adapter using real API."""
     
-    def __init__(self, api_key: str):
-        """Initialize Groq client."""
-        self.client = AsyncGroq(api_key=api_key)
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[AsyncGroq] = None,
+        limiter=None,
+        response_cache=None,
+        token_limiter=None,
+        resilience=None
+    ):
+        """Initialize Groq client.
+        
+        Args:
+            api_key: Groq API key, used when no client is given
+            client: Pre-built (shared, pooled) AsyncGroq client
+            limiter: Optional ModelConcurrencyLimiter bounding calls per model
+            response_cache: Optional LLMResponseCache for deterministic calls
+            token_limiter: Optional UserTokenLimiter enforcing per-user token budgets
+            resilience: Optional LLMResiliencePolicy (deadlines, retries, hedging, fallback)
+        """
+        self.client = client if client is not None else AsyncGroq(api_key=api_key)
+        self.limiter = limiter
+        self.response_cache = response_cache
+        self.token_limiter = token_limiter
+        self.resilience = resilience
         self.fast_model = "llama-3.1-8b-instant"  # For ranking, style extraction
         self.quality_model = "llama-3.3-70b-versatile"  # For generation, enhancement
     
@@ -27,9 +52,15 @@ class GroqAdapter(LLMInterface):
         max_tokens: int = 2000,
         temperature: float = 0.7,
         model: Optional[str] = None,
+        cache: Optional[bool] = None,
         **kwargs
     ) -> Dict:
-        """Generate completion from Groq."""
+        """Generate completion from Groq.
+        
+        Args:
+            cache: True/False to force or skip the response cache; None caches
+                only low-temperature (deterministic) calls
+        """
         if model is None:
             model = self.quality_model
             
@@ -41,38 +72,220 @@ class GroqAdapter(LLMInterface):
             span.set_attribute("llm.temperature", temperature)
             span.set_attribute("llm.prompt_length", len(prompt))
             
+            cache_key = None
+            if self.response_cache and self.response_cache.should_cache(temperature, cache):
+                cache_key = make_cache_key(
+                    model, prompt, max_tokens, temperature, kwargs.get("response_format")
+                )
+                cached = await self.response_cache.get(cache_key)
+                span.set_attribute("llm.cache_hit", cached is not None)
+                if cached is not None:
+                    return cached
+            
+            routed = self._route(model)
+            if routed != model:
+                span.set_attribute("llm.fallback_model", routed)
+            try:
+                result = await self._complete(routed, prompt, max_tokens, temperature, span, **kwargs)
+            except LLMUpstreamError as e:
+                fallback = self.resilience.fallback_for(routed, e) if self.resilience else None
+                if fallback is None:
+                    raise
+                span.set_attribute("llm.fallback_model", fallback)
+                result = await self._complete(fallback, prompt, max_tokens, temperature, span, **kwargs)
+            
+            # Answers from a fallback model are not cached under the requested model
+            if cache_key and result["model"] == model:
+                self.response_cache.set(cache_key, model, result)
+            return result
+    
+    async def _complete(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        span,
+        **kwargs
+    ) -> Dict:
+        """One admitted completion on ``model``, retried and hedged per the policy."""
+        async with self._admit(model, prompt, max_tokens) as usage:
             start_time = time.time()
             
             try:
-                response = await self.client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    **kwargs
+                response = await self._call(
+                    model,
+                    lambda: self.client.chat.completions.create(
+                        model=model,
+                        messages=[{"role": "user", "content": prompt}],
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **kwargs
+                    ),
+                    admit_hedge=lambda: self._admit_hedge(model, prompt, max_tokens)
                 )
-                
-                processing_time = time.time() - start_time
-                
-                # Add response metrics to span
-                span.set_attribute("llm.response_tokens", response.usage.total_tokens)
-                span.set_attribute("llm.prompt_tokens", response.usage.prompt_tokens)
-                span.set_attribute("llm.completion_tokens", response.usage.completion_tokens)
-                span.set_attribute("llm.processing_time_ms", processing_time * 1000)
-                
-                return {
-                    "content": response.choices[0].message.content,
-                    "tokens": response.usage.total_tokens,
-                    "model": model,
-                    "processing_time": processing_time,
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens
-                }
             except Exception as e:
                 # Record exception in span
                 span.record_exception(e)
                 span.set_attribute("error", True)
-                raise Exception(f"Groq API error: {str(e)}")
+                raise LLMUpstreamError(e) from e
+            
+            processing_time = time.time() - start_time
+            
+            # Add response metrics to span
+            span.set_attribute("llm.response_tokens", response.usage.total_tokens)
+            span.set_attribute("llm.prompt_tokens", response.usage.prompt_tokens)
+            span.set_attribute("llm.completion_tokens", response.usage.completion_tokens)
+            span.set_attribute("llm.processing_time_ms", processing_time * 1000)
+            usage["tokens"] = response.usage.total_tokens
+            
+            return {
+                "content": response.choices[0].message.content,
+                "tokens": response.usage.total_tokens,
+                "model": model,
+                "processing_time": processing_time,
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens
+            }
+    
+    async def stream_completion(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a completion from Groq, yielding text deltas as they arrive.
+        
+        Holds the model's concurrency slot until the stream is exhausted.
+        Streamed calls are never cached or hedged.
+        """
+        if model is None:
+            model = self.quality_model
+        model = self._route(model)
+        
+        with tracer.start_as_current_span("groq.stream_completion") as span:
+            span.set_attribute("llm.model", model)
+            span.set_attribute("llm.provider", "groq")
+            span.set_attribute("llm.max_tokens", max_tokens)
+            span.set_attribute("llm.temperature", temperature)
+            span.set_attribute("llm.prompt_length", len(prompt))
+            
+            async with self._admit(model, prompt, max_tokens) as usage:
+                start_time = time.time()
+                try:
+                    # Only opening the stream is retried; a partial answer cannot be
+                    stream = await self._call(
+                        model,
+                        lambda: self.client.chat.completions.create(
+                            model=model,
+                            messages=[{"role": "user", "content": prompt}],
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            stream=True,
+                            **kwargs
+                        ),
+                        hedge=False
+                    )
+                    first_token = True
+                    streamed_chars = 0
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            # Streams carry no usage block; charge prompt plus text so far
+                            streamed_chars += len(delta)
+                            usage["tokens"] = estimate_tokens(prompt, 0) + streamed_chars // 4
+                            if first_token:
+                                span.set_attribute(
+                                    "llm.time_to_first_token_ms", (time.time() - start_time) * 1000
+                                )
+                                first_token = False
+                            yield delta
+                except Exception as e:
+                    span.record_exception(e)
+                    span.set_attribute("error", True)
+                    raise LLMUpstreamError(e) from e
+                
+                span.set_attribute("llm.processing_time_ms", (time.time() - start_time) * 1000)
+    
+    def _route(self, model: str) -> str:
+        """Model to call: the fallback while ``model``'s slot queue is too deep."""
+        if self.resilience is None or self.limiter is None:
+            return model
+        return self.resilience.route(model, self.limiter.queue_depth(model))
+    
+    async def _call(
+        self,
+        model: str,
+        call: Callable[[], Awaitable],
+        hedge: bool = True,
+        admit_hedge: Optional[Callable] = None
+    ):
+        """Run one API request under the resilience policy, if any."""
+        if self.resilience is None:
+            return await call()
+        return await self.resilience.run(model, call, hedge=hedge, admit_hedge=admit_hedge)
+    
+    @asynccontextmanager
+    async def _admit(self, model: str, prompt: str, max_tokens: int) -> AsyncIterator[Dict]:
+        """Reserve the current user's token budget and a model slot for one call.
+        
+        Yields a dict; set ``usage["tokens"]`` to the real usage so the
+        budget is charged for it (an unset value refunds the reservation).
+        
+        Raises:
+            LLMRateLimitError: If the user's budget does not refill in time
+            LLMQueueTimeoutError: If no model slot frees up in time
+        """
+        user = current_llm_user.get()
+        estimate = estimate_tokens(prompt, max_tokens)
+        reservation = None
+        if self.token_limiter and user is not None:
+            reservation = await self.token_limiter.reserve(user, model, estimate)
+        
+        usage = {"tokens": 0}
+        try:
+            slot = self.limiter.slot(model, user, estimate) if self.limiter else nullcontext()
+            async with slot:
+                yield usage
+        finally:
+            if reservation is not None:
+                self.token_limiter.settle(reservation, usage["tokens"])
+    
+    @asynccontextmanager
+    async def _admit_hedge(self, model: str, prompt: str, max_tokens: int) -> AsyncIterator[bool]:
+        """Admit a hedged duplicate only if a model slot and budget are free right now.
+        
+        The duplicate counts against the model's concurrency limit and is
+        charged its full estimate to the user's budget (its real usage is
+        unknown once it loses the race and is cancelled).
+        
+        Yields:
+            True if the duplicate may be sent, False to skip hedging
+        """
+        user = current_llm_user.get()
+        estimate = estimate_tokens(prompt, max_tokens)
+        reservation = None
+        if self.token_limiter and user is not None:
+            try:
+                reservation = await self.token_limiter.reserve(user, model, estimate, max_wait=0)
+            except LLMRateLimitError:
+                yield False
+                return
+        
+        used = 0
+        try:
+            slot = self.limiter.try_slot(model) if self.limiter else nullcontext(True)
+            async with slot as admitted:
+                if admitted and reservation is not None:
+                    used = reservation.tokens
+                yield admitted
+        finally:
+            if reservation is not None:
+                self.token_limiter.settle(reservation, used)
     
     async def extract_writing_style(self, sample_text: str) -> Dict:
         """Extract writing style from sample text."""
@@ -452,6 +665,53 @@ Return ONLY valid JSON. No markdown, no extra text."""
         max_paragraphs: int = 4
     ) -> str:
         """Generate personalized cover letter."""
+        prompt = self._build_cover_letter_prompt(
+            job_description, profile_data, writing_style,
+            company_name, hiring_manager, max_paragraphs
+        )
+
+        result = await self.generate_completion(
+            prompt=prompt,
+            max_tokens=1500,
+            temperature=0.8,
+            model=self.quality_model
+        )
+        
+        return result["content"].strip()
+    
+    async def stream_cover_letter(
+        self,
+        job_description: str,
+        profile_data: Dict,
+        writing_style: Optional[Dict] = None,
+        company_name: Optional[str] = None,
+        hiring_manager: Optional[str] = None,
+        max_paragraphs: int = 4
+    ) -> AsyncIterator[str]:
+        """Stream a personalized cover letter token by token."""
+        prompt = self._build_cover_letter_prompt(
+            job_description, profile_data, writing_style,
+            company_name, hiring_manager, max_paragraphs
+        )
+        
+        async for delta in self.stream_completion(
+            prompt=prompt,
+            max_tokens=1500,
+            temperature=0.8,
+            model=self.quality_model
+        ):
+            yield delta
+    
+    def _build_cover_letter_prompt(
+        self,
+        job_description: str,
+        profile_data: Dict,
+        writing_style: Optional[Dict],
+        company_name: Optional[str],
+        hiring_manager: Optional[str],
+        max_paragraphs: int
+    ) -> str:
+        """Build the cover letter prompt shared by the blocking and streaming calls."""
         style_instruction = ""
         if writing_style:
             tone = writing_style.get("tone", "professional")
@@ -546,15 +806,8 @@ STRICT CONTENT RULES:
 - Maintain complete honesty and authenticity - hiring managers will verify claims
 
 Return ONLY the cover letter text, no additional commentary."""
-
-        result = await self.generate_completion(
-            prompt=prompt,
-            max_tokens=1500,
-            temperature=0.8,
-            model=self.quality_model
-        )
         
-        return result["content"].strip()
+        return prompt
     
     async def calculate_ats_score(
         self,
@@ -0,0 +1,328 @@
+"""Process-wide LLM client with a pooled HTTP connection and per-model concurrency limits."""
+
+import asyncio
+import heapq
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Hashable, List, Optional, Tuple
+
+import httpx
+from groq import AsyncGroq
+
+from app.core.config import get_settings
+from .groq_adapter import GroqAdapter
+from .rate_limit import LLMRateLimitError, UserTokenLimiter
+from .resilience import LLMResiliencePolicy
+from .response_cache import create_response_cache
+
+logger = logging.getLogger(__name__)
+
+
+class LLMQueueTimeoutError(Exception):
+    """Raised when a call waits too long for a free model concurrency slot."""
+
+    def __init__(self, model: str, timeout: float):
+        self.model = model
+        self.timeout = timeout
+        super().__init__(f"Timed out after {timeout}s waiting for an LLM slot on {model}")
+
+
+class ModelMetrics:
+    """Queue and wait statistics for one model's concurrency slots.
+
+    All updates happen on the event loop thread, so no lock is needed.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def snapshot(self) -> dict:
+        """Return the counters as a plain dictionary."""
+        avg_wait = self.total_wait_seconds / self.acquired if self.acquired else 0.0
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(avg_wait * 1000, 3),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+class FairSlots:
+    """Concurrency slots handed out in weighted-fair order across users.
+
+    Each waiter is tagged with a virtual finish time: it starts at the later
+    of the scheduler's virtual clock and the user's previous finish, and
+    adds cost / weight. A freed slot goes to the smallest tag, so a user
+    with many queued calls takes turns with others instead of blocking them.
+    With a single user this is plain FIFO.
+    """
+
+    _MAX_TRACKED_USERS = 1024
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._virtual_time = 0.0
+        self._last_finish: Dict[Hashable, float] = {}
+        self._waiters: List[Tuple[float, int, float, asyncio.Future]] = []
+        self._sequence = 0
+
+    async def acquire(self, user: Hashable = None, cost: float = 1.0, weight: float = 1.0) -> None:
+        start = max(self._virtual_time, self._last_finish.get(user, 0.0))
+        finish = start + cost / weight
+        self._last_finish[user] = finish
+        if len(self._last_finish) > self._MAX_TRACKED_USERS:
+            self._last_finish = {
+                key: tag for key, tag in self._last_finish.items() if tag > self._virtual_time
+            }
+
+        if self.in_use < self.limit and not self._waiters:
+            self.in_use += 1
+            self._virtual_time = max(self._virtual_time, start)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._sequence += 1
+        heapq.heappush(self._waiters, (finish, self._sequence, start, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled: pass the slot on
+                self.release()
+            raise
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free and nobody is queued for it."""
+        if self.in_use < self.limit and not self._waiters:
+            self.in_use += 1
+            return True
+        return False
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, start, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._virtual_time = max(self._virtual_time, start)
+            future.set_result(None)
+            return
+        self.in_use -= 1
+
+
+class ModelConcurrencyLimiter:
+    """Bound concurrent LLM calls per model; excess callers queue with a timeout.
+
+    Queued callers are served in weighted-fair order across users (see
+    FairSlots), weighted by ``user_weights`` (default 1).
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        default_limit: int,
+        queue_timeout: float,
+        user_weights: Optional[Dict[str, float]] = None
+    ):
+        self.default_limit = default_limit
+        self.queue_timeout = queue_timeout
+        self.user_weights = user_weights or {}
+        self._slots: Dict[str, FairSlots] = {}
+        self._metrics: Dict[str, ModelMetrics] = {}
+        for model, limit in limits.items():
+            self._add_model(model, limit)
+
+    def _add_model(self, model: str, limit: int) -> None:
+        self._slots[model] = FairSlots(limit)
+        self._metrics[model] = ModelMetrics(limit)
+
+    @asynccontextmanager
+    async def slot(self, model: str, user: Hashable = None, cost: float = 1.0) -> AsyncIterator[None]:
+        """Hold one of ``model``'s concurrency slots for the duration of the block.
+
+        Args:
+            user: Caller's user ID, for fair ordering among queued calls
+            cost: Estimated tokens, so large calls count for more of a user's turn
+
+        Raises:
+            LLMQueueTimeoutError: If no slot frees up within ``queue_timeout``
+        """
+        if model not in self._slots:
+            self._add_model(model, self.default_limit)
+        slots = self._slots[model]
+        metrics = self._metrics[model]
+        weight = self.user_weights.get(str(user), 1.0)
+
+        metrics.queued += 1
+        metrics.max_queued = max(metrics.max_queued, metrics.queued)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(slots.acquire(user, cost, weight), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            metrics.timeouts += 1
+            raise LLMQueueTimeoutError(model, self.queue_timeout)
+        finally:
+            metrics.queued -= 1
+
+        wait_seconds = time.perf_counter() - start
+        metrics.acquired += 1
+        metrics.total_wait_seconds += wait_seconds
+        metrics.max_wait_seconds = max(metrics.max_wait_seconds, wait_seconds)
+        metrics.in_flight += 1
+        try:
+            yield
+        finally:
+            metrics.in_flight -= 1
+            slots.release()
+
+    @asynccontextmanager
+    async def try_slot(self, model: str) -> AsyncIterator[bool]:
+        """Hold one of ``model``'s slots if one is free right now, without queueing.
+
+        Yields:
+            True if a slot is held for the block, False if none was free
+        """
+        if model not in self._slots:
+            self._add_model(model, self.default_limit)
+        slots = self._slots[model]
+        metrics = self._metrics[model]
+        if not slots.try_acquire():
+            yield False
+            return
+
+        metrics.acquired += 1
+        metrics.in_flight += 1
+        try:
+            yield True
+        finally:
+            metrics.in_flight -= 1
+            slots.release()
+
+    def queue_depth(self, model: str) -> int:
+        """Callers currently waiting for one of ``model``'s slots."""
+        metrics = self._metrics.get(model)
+        return metrics.queued if metrics else 0
+
+    def snapshot(self) -> dict:
+        """Return per-model queue depth and wait statistics."""
+        return {model: metrics.snapshot() for model, metrics in self._metrics.items()}
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+_llm_adapter: Optional[GroqAdapter] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the pooled keep-alive HTTP client shared by all LLM calls."""
+    settings = get_settings()
+    return httpx.AsyncClient(
+        http2=settings.llm_http2,
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(settings.llm_request_timeout, connect=10.0),
+    )
+
+
+def init_llm_adapter() -> GroqAdapter:
+    """Create the shared LLM adapter once per process (idempotent)."""
+    global _http_client, _llm_adapter
+    if _llm_adapter is not None:
+        return _llm_adapter
+
+    settings = get_settings()
+    _http_client = create_http_client()
+    # Retries are owned by the resilience policy, not the SDK
+    client = AsyncGroq(api_key=settings.groq_api_key, http_client=_http_client, max_retries=0)
+    _llm_adapter = GroqAdapter(client=client, response_cache=create_response_cache())
+    _llm_adapter.limiter = ModelConcurrencyLimiter(
+        limits={
+            _llm_adapter.fast_model: settings.llm_fast_model_concurrency,
+            _llm_adapter.quality_model: settings.llm_quality_model_concurrency,
+        },
+        default_limit=settings.llm_quality_model_concurrency,
+        queue_timeout=settings.llm_queue_timeout,
+        user_weights=settings.llm_user_weights,
+    )
+    _llm_adapter.token_limiter = UserTokenLimiter(
+        tokens_per_minute={
+            _llm_adapter.fast_model: settings.llm_user_fast_tokens_per_minute,
+            _llm_adapter.quality_model: settings.llm_user_quality_tokens_per_minute,
+        },
+        default_tokens_per_minute=settings.llm_user_quality_tokens_per_minute,
+        max_wait=settings.llm_user_max_wait_seconds,
+    )
+    _llm_adapter.resilience = LLMResiliencePolicy(
+        deadlines={
+            _llm_adapter.fast_model: settings.llm_fast_model_deadline_seconds,
+            _llm_adapter.quality_model: settings.llm_quality_model_deadline_seconds,
+        },
+        default_deadline=settings.llm_quality_model_deadline_seconds,
+        max_retries=settings.llm_max_retries,
+        backoff_base=settings.llm_retry_backoff_seconds,
+        backoff_max=settings.llm_retry_max_backoff_seconds,
+        hedge=settings.llm_hedge_enabled,
+        hedge_min_delay=settings.llm_hedge_min_delay_seconds,
+        fallbacks=(
+            {_llm_adapter.quality_model: _llm_adapter.fast_model}
+            if settings.llm_fallback_enabled else {}
+        ),
+        fallback_queue_depth=settings.llm_fallback_queue_depth,
+    )
+    logger.info(
+        f"LLM client initialized (http2={settings.llm_http2}, "
+        f"fast={settings.llm_fast_model_concurrency}, "
+        f"quality={settings.llm_quality_model_concurrency})"
+    )
+    return _llm_adapter
+
+
+def get_llm_adapter() -> GroqAdapter:
+    """Get the shared LLM adapter, creating it lazily outside the app lifespan."""
+    return _llm_adapter if _llm_adapter is not None else init_llm_adapter()
+
+
+async def close_llm_adapter() -> None:
+    """Close the pooled HTTP client and drop the shared adapter."""
+    global _http_client, _llm_adapter
+    if _llm_adapter is not None and _llm_adapter.response_cache is not None:
+        await _llm_adapter.response_cache.flush()
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _llm_adapter = None
+
+
+def get_llm_status() -> dict:
+    """Report whether the shared client exists, per-model queue and cache metrics."""
+    if _llm_adapter is None:
+        return {"initialized": False}
+    return {
+        "initialized": True,
+        "http2": get_settings().llm_http2,
+        "models": _llm_adapter.limiter.snapshot() if _llm_adapter.limiter else {},
+        "user_budgets": (
+            _llm_adapter.token_limiter.snapshot() if _llm_adapter.token_limiter else None
+        ),
+        "resilience": (
+            _llm_adapter.resilience.snapshot() if _llm_adapter.resilience else None
+        ),
+        "cache": (
+            _llm_adapter.response_cache.metrics.snapshot()
+            if _llm_adapter.response_cache else None
+        ),
+    }
@@ -0,0 +1,153 @@
+"""Per-user LLM token budgets: token buckets keyed by user and model."""
+
+import asyncio
+import math
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+# User the current request (or background task) is making LLM calls for.
+# Set once per request by get_current_user; copied into tasks it spawns.
+current_llm_user: ContextVar[Optional[int]] = ContextVar("current_llm_user", default=None)
+
+
+def set_llm_user(user_id: Optional[int]) -> None:
+    """Attribute LLM calls made from the current context to ``user_id``."""
+    current_llm_user.set(user_id)
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """Upper-bound token cost of a call before it runs (about 4 characters per token)."""
+    return len(prompt) // 4 + max_tokens
+
+
+class LLMRateLimitError(Exception):
+    """Raised when a user's token budget would not refill within the allowed wait."""
+
+    def __init__(self, model: str, retry_after: float):
+        self.model = model
+        self.retry_after = retry_after
+        super().__init__(
+            f"LLM token budget for {model} exhausted; retry in {self.retry_after_seconds}s"
+        )
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Whole seconds, for the Retry-After header."""
+        return max(1, math.ceil(self.retry_after))
+
+
+class TokenBucket:
+    """Token bucket that may go into debt: reservations are taken up front."""
+
+    def __init__(self, capacity: float, refill_per_second: float, now: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def seconds_until_non_negative(self) -> float:
+        return -self.tokens / self.refill_per_second if self.tokens < 0 else 0.0
+
+
+@dataclass
+class TokenReservation:
+    """Tokens held for one call, settled against actual usage afterwards."""
+    key: Tuple[Hashable, str]
+    tokens: float
+
+
+class UserTokenLimiter:
+    """Token-per-minute budgets per (user, model).
+
+    A call reserves its estimated cost immediately. If that leaves the
+    bucket in debt, the caller waits for it to refill, or is rejected with
+    LLMRateLimitError when the wait would exceed ``max_wait``. Once the
+    call returns, the reservation is corrected to the real token usage.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: Dict[str, int],
+        default_tokens_per_minute: int,
+        max_wait: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.tokens_per_minute = dict(tokens_per_minute)
+        self.default_tokens_per_minute = default_tokens_per_minute
+        self.max_wait = max_wait
+        self.clock = clock
+        self._buckets: Dict[Tuple[Hashable, str], TokenBucket] = {}
+        self.throttled = 0
+        self.rejected = 0
+
+    def _bucket(self, key: Tuple[Hashable, str]) -> Optional[TokenBucket]:
+        quota = self.tokens_per_minute.get(key[1], self.default_tokens_per_minute)
+        if quota <= 0:
+            return None
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(quota, quota / 60.0, self.clock())
+        return bucket
+
+    async def reserve(
+        self,
+        user: Hashable,
+        model: str,
+        tokens: int,
+        max_wait: Optional[float] = None
+    ) -> Optional[TokenReservation]:
+        """Take ``tokens`` from the user's budget for ``model``, waiting if needed.
+
+        Args:
+            max_wait: Longest acceptable wait for this call (default: the limiter's)
+
+        Returns:
+            The reservation, or None when the model has no quota
+
+        Raises:
+            LLMRateLimitError: If the budget would not recover within ``max_wait``
+        """
+        if max_wait is None:
+            max_wait = self.max_wait
+        key = (user, model)
+        bucket = self._bucket(key)
+        if bucket is None:
+            return None
+
+        # A single call larger than the whole budget waits for a full bucket, not forever
+        cost = min(tokens, bucket.capacity)
+        bucket.refill(self.clock())
+        bucket.tokens -= cost
+        wait = bucket.seconds_until_non_negative()
+        if wait > max_wait:
+            bucket.tokens += cost
+            self.rejected += 1
+            raise LLMRateLimitError(model, wait)
+        if wait > 0:
+            self.throttled += 1
+            await asyncio.sleep(wait)
+        return TokenReservation(key, cost)
+
+    def settle(self, reservation: Optional[TokenReservation], used_tokens: int) -> None:
+        """Charge actual usage instead of the estimate (refunds unused tokens)."""
+        if reservation is None:
+            return
+        bucket = self._buckets.get(reservation.key)
+        if bucket is not None:
+            bucket.tokens = min(bucket.capacity, bucket.tokens + reservation.tokens - used_tokens)
+
+    def snapshot(self) -> dict:
+        """Return budget counters as a plain dictionary."""
+        return {
+            "tokens_per_minute": self.tokens_per_minute,
+            "default_tokens_per_minute": self.default_tokens_per_minute,
+            "tracked_budgets": len(self._buckets),
+            "throttled": self.throttled,
+            "rejected": self.rejected,
+        }
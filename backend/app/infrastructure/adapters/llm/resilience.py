@@ -0,0 +1,261 @@
+"""Retry, deadline, hedging and fallback policy for LLM API calls."""
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import AsyncExitStack
+from typing import Any, AsyncContextManager, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+import groq
+
+T = TypeVar("T")
+
+# Admits a hedged duplicate: enters with a truthy value if it may be sent now
+HedgeAdmission = Callable[[], AsyncContextManager[Any]]
+
+
+class LLMDeadlineExceeded(asyncio.TimeoutError):
+    """Raised when one attempt runs past its model's deadline."""
+
+    def __init__(self, model: str, deadline: float):
+        self.model = model
+        self.deadline = deadline
+        super().__init__(f"{model} did not respond within {deadline}s")
+
+
+class LLMUpstreamError(Exception):
+    """An LLM API call failed after the resilience policy gave up on it."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+        self.retryable = is_retryable(error)
+        super().__init__(f"Groq API error: {str(error)}")
+
+
+def is_retryable(error: Exception) -> bool:
+    """Rate limits, server errors, timeouts and dropped connections are transient."""
+    if isinstance(error, (asyncio.TimeoutError, groq.APITimeoutError, groq.APIConnectionError)):
+        return True
+    if isinstance(error, groq.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After / retry-after-ms), if any."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        # HTTP-date form; fall back to our own backoff
+        return None
+    return None
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies per model."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, model: str, seconds: float) -> None:
+        self._samples.setdefault(model, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, model: str, q: float) -> Optional[float]:
+        """The ``q`` quantile of recent latencies, or None until enough samples exist."""
+        samples = self._samples.get(model)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def snapshot(self) -> dict:
+        return {
+            model: {
+                "samples": len(samples),
+                "p50_ms": round((self.percentile(model, 0.5) or 0) * 1000, 3),
+                "p95_ms": round((self.percentile(model, 0.95) or 0) * 1000, 3),
+            }
+            for model, samples in self._samples.items()
+        }
+
+
+class LLMResiliencePolicy:
+    """Per-model deadlines, jittered retries, request hedging and model fallback.
+
+    Each attempt is bounded by its model's deadline. Retryable failures are
+    retried with full-jitter exponential backoff, waiting at least as long
+    as the server's Retry-After (a Retry-After longer than ``backoff_max``
+    is not retried). With hedging on, a duplicate request is sent once an
+    attempt outlives the model's recent p95 latency and the first answer
+    wins. ``fallbacks`` maps a model to a cheaper one used when the
+    preferred model's queue is deep or its retries are exhausted.
+    """
+
+    def __init__(
+        self,
+        deadlines: Dict[str, float],
+        default_deadline: float,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        hedge: bool = False,
+        hedge_min_delay: float = 1.0,
+        fallbacks: Optional[Dict[str, str]] = None,
+        fallback_queue_depth: int = 0,
+        latency: Optional[LatencyTracker] = None
+    ):
+        self.deadlines = dict(deadlines)
+        self.default_deadline = default_deadline
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge = hedge
+        self.hedge_min_delay = hedge_min_delay
+        self.fallbacks = fallbacks or {}
+        self.fallback_queue_depth = fallback_queue_depth
+        self.latency = latency or LatencyTracker()
+        self.retries = 0
+        self.deadline_timeouts = 0
+        self.hedges = 0
+        self.hedges_skipped = 0
+        self.hedge_wins = 0
+        self.fallbacks_used = 0
+
+    def deadline(self, model: str) -> float:
+        return self.deadlines.get(model, self.default_deadline)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number ``attempt + 1`` (full jitter, floored by Retry-After)."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """When to send a duplicate request; None while hedging is off or latency is unknown."""
+        if not self.hedge:
+            return None
+        p95 = self.latency.percentile(model, 0.95)
+        return None if p95 is None else max(self.hedge_min_delay, p95)
+
+    def route(self, model: str, queue_depth: int) -> str:
+        """Send calls to the fallback model while ``model`` has a deep slot queue."""
+        fallback = self.fallbacks.get(model)
+        if fallback and self.fallback_queue_depth and queue_depth >= self.fallback_queue_depth:
+            self.fallbacks_used += 1
+            return fallback
+        return model
+
+    def fallback_for(self, model: str, error: LLMUpstreamError) -> Optional[str]:
+        """Model to try once more after ``model`` failed transiently, if any."""
+        fallback = self.fallbacks.get(model) if error.retryable else None
+        if fallback:
+            self.fallbacks_used += 1
+        return fallback
+
+    async def run(
+        self,
+        model: str,
+        call: Callable[[], Awaitable[T]],
+        hedge: bool = True,
+        admit_hedge: Optional[HedgeAdmission] = None
+    ) -> T:
+        """Run ``call`` under the policy; raises the last error once retries are spent.
+
+        ``admit_hedge`` gates each hedged duplicate (e.g. on a free model
+        slot and token budget); the duplicate is skipped when it declines.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(model, call, hedge, admit_hedge)
+            except Exception as e:
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    raise
+                retry_after = retry_after_seconds(e)
+                if retry_after is not None and retry_after > self.backoff_max:
+                    raise
+                delay = self.backoff(attempt, retry_after)
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _attempt(
+        self,
+        model: str,
+        call: Callable[[], Awaitable[T]],
+        hedge: bool,
+        admit_hedge: Optional[HedgeAdmission]
+    ) -> T:
+        deadline = self.deadline(model)
+        delay = self.hedge_delay(model) if hedge else None
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                call() if delay is None else self._hedged(call, delay, admit_hedge), timeout=deadline
+            )
+        except asyncio.TimeoutError:
+            self.deadline_timeouts += 1
+            raise LLMDeadlineExceeded(model, deadline)
+        self.latency.record(model, time.perf_counter() - start)
+        return result
+
+    async def _hedged(
+        self,
+        call: Callable[[], Awaitable[T]],
+        delay: float,
+        admit_hedge: Optional[HedgeAdmission]
+    ) -> T:
+        primary = asyncio.ensure_future(call())
+        backup = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            async with AsyncExitStack() as admission:
+                # The duplicate is held to its own slot and budget until it finishes
+                if admit_hedge is not None and not await admission.enter_async_context(admit_hedge()):
+                    self.hedges_skipped += 1
+                    return await primary
+
+                self.hedges += 1
+                backup = asyncio.ensure_future(call())
+                pending = {primary, backup}
+                try:
+                    while True:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            if task.exception() is None:
+                                if task is backup:
+                                    self.hedge_wins += 1
+                                return task.result()
+                        if not pending:
+                            # Both copies failed; surface the later error
+                            return done.pop().result()
+                finally:
+                    if not backup.done():
+                        backup.cancel()
+        finally:
+            if not primary.done():
+                primary.cancel()
+
+    def snapshot(self) -> dict:
+        """Return retry, hedge, fallback and latency counters as a plain dictionary."""
+        return {
+            "retries": self.retries,
+            "deadline_timeouts": self.deadline_timeouts,
+            "hedges": self.hedges,
+            "hedges_skipped": self.hedges_skipped,
+            "hedge_wins": self.hedge_wins,
+            "fallbacks": self.fallbacks_used,
+            "latency": self.latency.snapshot(),
+        }
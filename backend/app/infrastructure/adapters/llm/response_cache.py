@@ -0,0 +1,243 @@
+"""Content-addressed cache for deterministic LLM completions."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import delete, select
+
+from app.core.config import get_settings
+from app.infrastructure.database.connection import get_session_factory
+from app.infrastructure.database.models import LLMResponseCacheModel
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    model: str,
+    prompt: str,
+    max_tokens: int,
+    temperature: float,
+    response_format: Optional[Dict[str, Any]] = None
+) -> str:
+    """Hash every input that affects an LLM response into a stable cache key."""
+    payload = json.dumps(
+        [model, prompt, max_tokens, temperature, response_format],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Storage for cached completion results."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict]:
+        """Return the cached result, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, model: str, value: Dict) -> None:
+        """Store a result under ``key``."""
+        pass
+
+
+class InMemoryLRUCache(CacheBackend):
+    """Per-process LRU cache with a fixed time-to-live."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, model: str, value: Dict) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(CacheBackend):
+    """Cache stored in the llm_response_cache table, so it survives restarts.
+
+    Sessions come from the shared session factory unless one is given, so
+    the cache follows engine re-initialisation.
+    """
+
+    def __init__(self, ttl_seconds: float, session_factory=None):
+        self.ttl_seconds = ttl_seconds
+        self._session_factory = session_factory
+
+    def session_factory(self):
+        factory = self._session_factory or get_session_factory()
+        return factory()
+
+    async def get(self, key: str) -> Optional[Dict]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(LLMResponseCacheModel.response).where(
+                    LLMResponseCacheModel.key == key,
+                    LLMResponseCacheModel.expires_at > datetime.utcnow(),
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def set(self, key: str, model: str, value: Dict) -> None:
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            await session.merge(LLMResponseCacheModel(
+                key=key,
+                model=model,
+                response=value,
+                created_at=now,
+                expires_at=now + timedelta(seconds=self.ttl_seconds),
+            ))
+            await session.commit()
+
+    async def purge_expired(self) -> int:
+        """Delete expired rows and return how many were removed."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                delete(LLMResponseCacheModel).where(
+                    LLMResponseCacheModel.expires_at <= datetime.utcnow()
+                )
+            )
+            await session.commit()
+            return result.rowcount
+
+
+class TieredCache(CacheBackend):
+    """In-memory LRU in front of a persistent backend; persistent hits are promoted."""
+
+    def __init__(self, memory: InMemoryLRUCache, persistent: CacheBackend):
+        self.memory = memory
+        self.persistent = persistent
+
+    async def get(self, key: str) -> Optional[Dict]:
+        value = await self.memory.get(key)
+        if value is None:
+            value = await self.persistent.get(key)
+            if value is not None:
+                await self.memory.set(key, "", value)
+        return value
+
+    async def set(self, key: str, model: str, value: Dict) -> None:
+        await self.memory.set(key, model, value)
+        await self.persistent.set(key, model, value)
+
+
+class ResponseCacheMetrics:
+    """Hit/miss counters and the token spend the hits avoided."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.errors = 0
+        self.tokens_saved = 0
+
+    def snapshot(self) -> dict:
+        """Return the counters as a plain dictionary."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "tokens_saved": self.tokens_saved,
+        }
+
+
+class LLMResponseCache:
+    """Cache policy and metrics around a backend.
+
+    Backend failures are logged and counted but never fail the LLM call.
+    Stores run as background tasks: the request that produced the response
+    may still hold the SQLite writer connection, and must not wait on it.
+    """
+
+    def __init__(self, backend: CacheBackend, max_temperature: float):
+        self.backend = backend
+        self.max_temperature = max_temperature
+        self.metrics = ResponseCacheMetrics()
+        self._pending: Set[asyncio.Task] = set()
+
+    def should_cache(self, temperature: float, requested: Optional[bool]) -> bool:
+        """Honour an explicit per-call choice, else cache only low-temperature calls."""
+        if requested is not None:
+            return requested
+        return temperature <= self.max_temperature
+
+    async def get(self, key: str) -> Optional[Dict]:
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self.metrics.errors += 1
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+        if value is None:
+            self.metrics.misses += 1
+            return None
+        self.metrics.hits += 1
+        self.metrics.tokens_saved += value.get("tokens") or 0
+        return {**value, "cached": True}
+
+    def set(self, key: str, model: str, value: Dict) -> None:
+        """Schedule storing ``value`` without blocking the caller."""
+        task = asyncio.create_task(self._store(key, model, value))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _store(self, key: str, model: str, value: Dict) -> None:
+        try:
+            await self.backend.set(key, model, value)
+            self.metrics.stores += 1
+        except Exception as e:
+            self.metrics.errors += 1
+            logger.warning(f"LLM cache write failed: {e}")
+
+    async def flush(self) -> None:
+        """Wait for scheduled stores to finish (used at shutdown and in tests)."""
+        if self._pending:
+            await asyncio.gather(*self._pending)
+
+
+def create_response_cache() -> Optional[LLMResponseCache]:
+    """Build the response cache selected by LLM_CACHE_BACKEND, or None if disabled."""
+    settings = get_settings()
+    backend_name = settings.llm_cache_backend
+    if backend_name == "none":
+        return None
+
+    memory = InMemoryLRUCache(settings.llm_cache_max_entries, settings.llm_cache_ttl_seconds)
+    if backend_name == "memory":
+        backend: CacheBackend = memory
+    elif backend_name == "sqlite":
+        backend = TieredCache(memory, SQLiteResponseCache(settings.llm_cache_ttl_seconds))
+    else:
+        raise ValueError(f"Unknown LLM_CACHE_BACKEND: {backend_name}")
+
+    return LLMResponseCache(backend, max_temperature=settings.llm_cache_max_temperature)
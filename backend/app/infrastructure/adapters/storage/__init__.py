@@ -1,9 +1,10 @@
 """Storage adapters package."""
 
-from .storage_interface import StorageInterface
+from .storage_interface import AsyncStorageInterface, StorageInterface
 from .s3_adapter import S3StorageAdapter, get_s3_adapter
 
 __all__ = [
+    'AsyncStorageInterface',
     'StorageInterface',
     'S3StorageAdapter',
     'get_s3_adapter',
@@ -105,3 +105,76 @@ class StorageInterface(ABC):
             List of file metadata dicts
         """
         pass
+
+
+class AsyncStorageInterface(ABC):
+    """
+    Non-blocking storage backend for export files, addressed by storage key.
+    
+    Every method may be awaited from request handlers: implementations
+    must not block the event loop on network or disk I/O.
+    """
+    
+    @abstractmethod
+    async def upload_file(
+        self,
+        file_content: bytes,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        """
+        Store file content under a key.
+        
+        Returns:
+            Storage key
+        """
+        pass
+    
+    @abstractmethod
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        """
+        Stream a readable binary file object, positioned at the start, to a key.
+        
+        Returns:
+            Storage key
+        """
+        pass
+    
+    @abstractmethod
+    async def generate_presigned_url(self, key: str, expiration: int = 3600) -> str:
+        """
+        Generate a time-limited download URL.
+        
+        Returns:
+            Download URL string
+        """
+        pass
+    
+    @abstractmethod
+    async def delete_file(self, key: str) -> None:
+        """Delete a file (best-effort; a missing key is not an error)."""
+        pass
+    
+    @abstractmethod
+    async def file_exists(self, key: str) -> bool:
+        """Return True if a file is stored under the key."""
+        pass
+    
+    @abstractmethod
+    async def get_file_content(self, key: str) -> Optional[bytes]:
+        """
+        Read a whole file.
+        
+        Returns:
+            File content as bytes or None if not found
+        """
+        pass
+    
+    def close(self) -> None:
+        """Release clients and worker threads held by the backend."""
+        pass
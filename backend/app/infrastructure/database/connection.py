@@ -1,47 +1,289 @@
 """Database connection and utilities."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import text
+import time
+import threading
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy import event, exc, text
 
 from app.core.config import get_settings
 
 
+class PoolMetrics:
+    """Cumulative connection pool checkout statistics.
+
+    Counters are updated from the pool's checkout path, which runs in
+    SQLAlchemy's sync greenlet context, so a lock keeps them consistent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        """Record a successful checkout and how long it waited."""
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            if wait_seconds > self.max_wait_seconds:
+                self.max_wait_seconds = wait_seconds
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up waiting for a connection."""
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Return the counters as a plain dictionary."""
+        with self._lock:
+            avg_wait = self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(avg_wait * 1000, 3),
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+                "total_wait_ms": round(self.total_wait_seconds * 1000, 3),
+            }
+
+
+pool_metrics = PoolMetrics()
+writer_pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait time into ``metrics``."""
+
+    metrics = pool_metrics
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+class WriterQueuePool(InstrumentedAsyncQueuePool):
+    """Single-connection pool for the SQLite writer; its wait queue is the write queue."""
+
+    metrics = writer_pool_metrics
+
+
+# Statements that never modify the database when issued as raw text
+_READ_ONLY_PREFIXES = ("SELECT", "WITH", "EXPLAIN", "PRAGMA")
+
+
+class SQLiteRoutingSession(Session):
+    """Session that sends writes to one writer engine and reads to a reader pool.
+
+    Once the writer has joined the current transaction every later statement
+    goes to it as well, so a transaction always reads its own uncommitted
+    writes. Engines are passed through the session ``info`` dictionary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        writer = self.info["writer_engine"]
+        if self._flushing or _is_write_statement(clause) or self._writer_in_transaction(writer):
+            return writer
+        return self.info["reader_engine"]
+
+    def _writer_in_transaction(self, writer) -> bool:
+        transaction = self._transaction
+        while transaction is not None:
+            if writer in transaction._connections:
+                return True
+            transaction = transaction._parent
+        return False
+
+
+def _is_write_statement(clause) -> bool:
+    """Return True for INSERT/UPDATE/DELETE constructs and non-SELECT raw SQL."""
+    if isinstance(clause, UpdateBase):
+        return True
+    if isinstance(clause, TextClause):
+        return not clause.text.lstrip().upper().startswith(_READ_ONLY_PREFIXES)
+    return False
+
+
+# Process-wide engines and session factory, created by init_engine() in the app lifespan.
+# The writer engine only exists when the SQLite production profile is enabled.
+_engine: Optional[AsyncEngine] = None
+_writer_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker] = None
+
+
 def get_database_url() -> str:
     """Get database URL from settings."""
     settings = get_settings()
     return settings.database_url
 
 
-def create_engine():
-    """Create database engine."""
+def _is_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def sqlite_profile_enabled(database_url: Optional[str] = None) -> bool:
+    """Whether the SQLite production profile applies to this database URL."""
+    database_url = database_url or get_database_url()
+    return (
+        get_settings().sqlite_production_mode
+        and make_url(database_url).get_backend_name() == "sqlite"
+        and not _is_memory_sqlite(database_url)
+    )
+
+
+def _pool_options(database_url: str, writer: bool = False) -> dict:
+    """Build pool keyword arguments for create_async_engine.
+
+    In-memory SQLite must keep its single StaticPool connection, so pool
+    settings only apply to file-backed or server databases.
+    """
+    if _is_memory_sqlite(database_url):
+        return {}
+
+    settings = get_settings()
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if sqlite_profile_enabled(database_url):
+        if writer:
+            options.update(poolclass=WriterQueuePool, pool_size=1, max_overflow=0)
+        else:
+            options.update(pool_size=settings.sqlite_reader_pool_size, max_overflow=0)
+    return options
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply the production SQLite pragmas to each new DBAPI connection."""
+    settings = get_settings()
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+def create_engine(writer: bool = False):
+    """Create a new database engine.
+
+    Application code should use get_engine(); this is kept for one-off
+    scripts that manage their own engine lifecycle.
+
+    Args:
+        writer: Build the single-connection writer engine used by the
+            SQLite production profile
+    """
     database_url = get_database_url()
-    return create_async_engine(
+    engine = create_async_engine(
         database_url,
         echo=False,
         future=True,
+        **_pool_options(database_url, writer=writer),
     )
+    if sqlite_profile_enabled(database_url):
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return engine
 
 
-def create_session_factory(engine):
-    """Create session factory."""
+def create_session_factory(engine, writer_engine: Optional[AsyncEngine] = None):
+    """Create session factory.
+
+    When a writer engine is given, sessions route writes to it and reads to
+    ``engine``.
+    """
+    if writer_engine is None:
+        return async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
     return async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
+        class_=AsyncSession,
+        sync_session_class=SQLiteRoutingSession,
+        expire_on_commit=False,
+        info={
+            "reader_engine": engine.sync_engine,
+            "writer_engine": writer_engine.sync_engine,
+        },
     )
 
 
+def init_engine() -> AsyncEngine:
+    """Create the shared engine and session factory if not already created."""
+    global _engine, _writer_engine, _session_factory
+    if _engine is None:
+        _engine = create_engine()
+        if sqlite_profile_enabled():
+            _writer_engine = create_engine(writer=True)
+        _session_factory = create_session_factory(_engine, _writer_engine)
+    return _engine
+
+
+def get_writer_engine() -> AsyncEngine:
+    """Get the engine that owns schema changes and writes.
+
+    This is the dedicated writer under the SQLite production profile and the
+    shared engine otherwise.
+    """
+    init_engine()
+    return _writer_engine if _writer_engine is not None else _engine
+
+
+def get_engine() -> AsyncEngine:
+    """Get the shared engine, creating it lazily outside the app lifespan."""
+    return _engine if _engine is not None else init_engine()
+
+
+def get_session_factory() -> async_sessionmaker:
+    """Get the session factory bound to the shared engine."""
+    if _session_factory is None:
+        init_engine()
+    return _session_factory
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections and drop the shared engines."""
+    global _engine, _writer_engine, _session_factory
+    for engine in (_engine, _writer_engine):
+        if engine is not None:
+            await engine.dispose()
+    _engine = None
+    _writer_engine = None
+    _session_factory = None
+
+
 async def get_db_session():
-    """Dependency to get database session."""
-    engine = create_engine()
-    session_factory = create_session_factory(engine)
+    """Dependency to get database session from the shared pool."""
+    session_factory = get_session_factory()
 
     async with session_factory() as session:
-        try:
-            yield session
-        finally:
-            pass  # Session automatically closed by async context manager
-    
-    await engine.dispose()
+        yield session
 
 
 # Alias for compatibility
@@ -51,15 +293,43 @@ get_session = get_db_session
 async def check_database_health() -> bool:
     """Check database connectivity."""
     try:
-        engine = create_engine()
-        async with engine.begin() as conn:
+        async with get_engine().connect() as conn:
             await conn.execute(text("SELECT 1"))
-        await engine.dispose()
         return True
     except Exception:
         return False
 
 
+def _engine_pool_status(engine: Optional[AsyncEngine], metrics: PoolMetrics) -> dict:
+    status = {"initialized": engine is not None, **metrics.snapshot()}
+    if engine is None:
+        return status
+
+    pool = engine.pool
+    status["pool_class"] = type(pool).__name__
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
+    return status
+
+
+def get_pool_status() -> dict:
+    """Get current pool occupancy and cumulative checkout metrics."""
+    status = _engine_pool_status(_engine, pool_metrics)
+    if _writer_engine is not None:
+        status["writer"] = _engine_pool_status(_writer_engine, writer_pool_metrics)
+    return status
+
+
 async def get_database_info() -> dict:
     """Get database information."""
-    return {"status": "connected", "type": "sqlite"}
\ No newline at end of file
+    return {
+        "status": "connected",
+        "type": "sqlite",
+        "production_profile": sqlite_profile_enabled(),
+        "pool": get_pool_status()
+    }
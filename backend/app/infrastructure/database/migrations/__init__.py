@@ -0,0 +1,21 @@
+"""Versioned schema migrations for the JobWise database."""
+
+from .runner import (
+    Migration,
+    SchemaOutOfDateError,
+    ensure_schema_current,
+    get_current_version,
+    get_migrations,
+    latest_version,
+    upgrade,
+)
+
+__all__ = [
+    "Migration",
+    "SchemaOutOfDateError",
+    "ensure_schema_current",
+    "get_current_version",
+    "get_migrations",
+    "latest_version",
+    "upgrade",
+]
@@ -0,0 +1,48 @@
+"""Command line entry point for running migrations out-of-band.
+
+Usage:
+    python -m app.infrastructure.database.migrations upgrade [--target N]
+    python -m app.infrastructure.database.migrations current
+    python -m app.infrastructure.database.migrations history
+"""
+
+import argparse
+import asyncio
+
+from app.infrastructure.database.connection import dispose_engine, get_writer_engine
+
+from .runner import get_current_version, get_migrations, latest_version, upgrade
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="JobWise database migrations")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = subparsers.add_parser("upgrade", help="Apply pending migrations")
+    upgrade_parser.add_argument("--target", type=int, default=None, help="Stop at this version")
+    subparsers.add_parser("current", help="Show the applied schema version")
+    subparsers.add_parser("history", help="List known migrations")
+    args = parser.parse_args()
+
+    engine = get_writer_engine()
+    try:
+        if args.command == "upgrade":
+            applied = await upgrade(engine, target=args.target)
+            if applied:
+                print(f"Applied migrations: {', '.join(str(v) for v in applied)}")
+            else:
+                print("Database schema already up to date")
+            print(f"Schema version: {await get_current_version(engine)}")
+        elif args.command == "current":
+            current = await get_current_version(engine)
+            print(f"Schema version: {current} (latest: {latest_version()})")
+        else:
+            current = await get_current_version(engine)
+            for migration in get_migrations():
+                marker = "x" if migration.version <= current else " "
+                print(f"[{marker}] {migration.version:04d} {migration.description}")
+    finally:
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
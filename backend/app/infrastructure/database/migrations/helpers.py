@@ -0,0 +1,30 @@
+"""Helpers for writing idempotent migrations."""
+
+from typing import List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+def table_exists(conn: Connection, table: str) -> bool:
+    """Whether ``table`` exists."""
+    return inspect(conn).has_table(table)
+
+
+def column_names(conn: Connection, table: str) -> List[str]:
+    """Column names of ``table``, or an empty list when it does not exist."""
+    if not table_exists(conn, table):
+        return []
+    return [column["name"] for column in inspect(conn).get_columns(table)]
+
+
+def add_column_if_missing(conn: Connection, table: str, column: str, ddl_type: str) -> bool:
+    """Add a nullable column unless it is already present.
+
+    Returns:
+        True if the column was added
+    """
+    if column in column_names(conn, table):
+        return False
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+    return True
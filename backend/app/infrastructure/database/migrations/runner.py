@@ -0,0 +1,155 @@
+"""Migration runner backed by a ``schema_version`` table.
+
+Each migration module in ``versions`` defines ``VERSION``, ``DESCRIPTION``
+and a synchronous ``upgrade(conn)`` that runs inside its own transaction
+together with the version row insert. Migrations must be idempotent with
+respect to schema that already exists, because databases created before
+versioning was introduced start at version 0; see ``helpers`` for
+existence-checked DDL.
+"""
+
+import logging
+from datetime import datetime
+from types import ModuleType
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from . import versions
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION_TABLE = "schema_version"
+
+
+class Migration:
+    """A single ordered schema change."""
+
+    def __init__(self, module: ModuleType):
+        self.version: int = module.VERSION
+        self.description: str = module.DESCRIPTION
+        self._upgrade = module.upgrade
+
+    def upgrade(self, conn: Connection) -> None:
+        """Apply the schema change on a synchronous connection."""
+        self._upgrade(conn)
+
+    def __repr__(self) -> str:
+        return f"Migration({self.version}, {self.description!r})"
+
+
+class SchemaOutOfDateError(RuntimeError):
+    """Raised at startup when the database is behind the code's schema version."""
+
+    def __init__(self, current: int, expected: int):
+        super().__init__(
+            f"Database schema is at version {current}, expected {expected}. "
+            "Run 'python -m app.infrastructure.database.migrations upgrade' "
+            "or set DB_AUTO_MIGRATE=true."
+        )
+        self.current = current
+        self.expected = expected
+
+
+def get_migrations() -> List[Migration]:
+    """Return all migrations ordered by version."""
+    migrations = sorted((Migration(m) for m in versions.MIGRATION_MODULES), key=lambda m: m.version)
+    seen = set()
+    for migration in migrations:
+        if migration.version in seen:
+            raise ValueError(f"Duplicate migration version {migration.version}")
+        seen.add(migration.version)
+    return migrations
+
+
+def latest_version() -> int:
+    """Version the current code expects the database to be at."""
+    migrations = get_migrations()
+    return migrations[-1].version if migrations else 0
+
+
+def _ensure_version_table(conn: Connection) -> None:
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} ("
+        "version INTEGER PRIMARY KEY, "
+        "description VARCHAR NOT NULL, "
+        "applied_at TIMESTAMP NOT NULL)"
+    ))
+
+
+def _read_version(conn: Connection) -> int:
+    try:
+        result = conn.execute(text(f"SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE}"))
+    except (OperationalError, ProgrammingError):
+        # Version table not created yet: unversioned or empty database
+        return 0
+    return result.scalar() or 0
+
+
+async def get_current_version(engine: AsyncEngine) -> int:
+    """Read the applied schema version with a single query."""
+    async with engine.connect() as conn:
+        return await conn.run_sync(_read_version)
+
+
+async def upgrade(engine: AsyncEngine, target: Optional[int] = None) -> List[int]:
+    """Apply pending migrations up to ``target`` (default: latest).
+
+    Returns:
+        Versions that were applied, in order
+    """
+    applied = []
+    for migration in get_migrations():
+        if target is not None and migration.version > target:
+            break
+
+        async with engine.begin() as conn:
+            await conn.run_sync(_ensure_version_table)
+            # Re-check inside the transaction in case another process got here first
+            if migration.version <= await conn.run_sync(_read_version):
+                continue
+
+            logger.info(f"Applying migration {migration.version}: {migration.description}")
+            await conn.run_sync(migration.upgrade)
+            await conn.execute(
+                text(
+                    f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description, applied_at) "
+                    "VALUES (:version, :description, :applied_at)"
+                ),
+                {
+                    "version": migration.version,
+                    "description": migration.description,
+                    "applied_at": datetime.utcnow(),
+                },
+            )
+        applied.append(migration.version)
+
+    return applied
+
+
+async def ensure_schema_current(engine: AsyncEngine, auto_migrate: bool = False) -> int:
+    """Startup check that the database matches the code's schema version.
+
+    Args:
+        engine: Engine used for schema changes
+        auto_migrate: Apply pending migrations instead of failing
+
+    Returns:
+        The schema version in effect
+
+    Raises:
+        SchemaOutOfDateError: If the database is behind and auto_migrate is off
+    """
+    expected = latest_version()
+    current = await get_current_version(engine)
+    if current >= expected:
+        return current
+
+    if not auto_migrate:
+        raise SchemaOutOfDateError(current, expected)
+
+    await upgrade(engine)
+    return expected
@@ -0,0 +1,33 @@
+"""Ordered migration modules. Append new migrations to MIGRATION_MODULES."""
+
+from . import (
+    v0001_initial_schema,
+    v0002_exports_export_metadata,
+    v0003_exports_job_id_and_cache,
+    v0004_generations_content_structured,
+    v0005_hot_query_indexes,
+    v0006_jobs_keyset_index,
+    v0007_llm_response_cache,
+    v0008_generations_ats_status,
+    v0009_rankings_content_fingerprint,
+    v0010_profile_text_index,
+    v0011_background_tasks,
+    v0012_exports_render_hash,
+    v0013_background_task_leases,
+)
+
+MIGRATION_MODULES = [
+    v0001_initial_schema,
+    v0002_exports_export_metadata,
+    v0003_exports_job_id_and_cache,
+    v0004_generations_content_structured,
+    v0005_hot_query_indexes,
+    v0006_jobs_keyset_index,
+    v0007_llm_response_cache,
+    v0008_generations_ats_status,
+    v0009_rankings_content_fingerprint,
+    v0010_profile_text_index,
+    v0011_background_tasks,
+    v0012_exports_render_hash,
+    v0013_background_task_leases,
+]
@@ -0,0 +1,250 @@
+"""Create the tables that existed when versioning was introduced.
+
+Fresh databases get the full version-1 schema here; databases created
+before versioning only gain their missing tables (e.g. ``exports``), and
+the following migrations bring existing tables up to date. The DDL is
+frozen as of version 1; later schema changes belong in later migrations.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..helpers import table_exists
+
+VERSION = 1
+DESCRIPTION = "Initial schema"
+
+# (table, CREATE TABLE, its indexes), in foreign-key order
+TABLES = [
+    ("users", """
+        CREATE TABLE users (
+            id INTEGER NOT NULL,
+            email VARCHAR NOT NULL,
+            password_hash VARCHAR NOT NULL,
+            full_name VARCHAR NOT NULL,
+            is_active BOOLEAN,
+            is_verified BOOLEAN,
+            created_at DATETIME,
+            updated_at DATETIME,
+            PRIMARY KEY (id)
+        )""", [
+        "CREATE UNIQUE INDEX ix_users_email ON users (email)",
+    ]),
+    ("jobs", """
+        CREATE TABLE jobs (
+            id VARCHAR NOT NULL,
+            user_id INTEGER,
+            source VARCHAR NOT NULL,
+            title VARCHAR(200) NOT NULL,
+            company VARCHAR(200) NOT NULL,
+            location VARCHAR(200),
+            description TEXT,
+            raw_text TEXT,
+            parsed_keywords JSON,
+            requirements JSON,
+            benefits JSON,
+            salary_range VARCHAR,
+            remote BOOLEAN,
+            employment_type VARCHAR,
+            status VARCHAR,
+            application_status VARCHAR,
+            created_at DATETIME,
+            updated_at DATETIME,
+            PRIMARY KEY (id),
+            FOREIGN KEY(user_id) REFERENCES users (id)
+        )""", [
+        "CREATE INDEX ix_jobs_application_status ON jobs (application_status)",
+        "CREATE INDEX ix_jobs_created_at ON jobs (created_at)",
+        "CREATE INDEX ix_jobs_source ON jobs (source)",
+        "CREATE INDEX ix_jobs_status ON jobs (status)",
+        "CREATE INDEX ix_jobs_user_id ON jobs (user_id)",
+    ]),
+    ("master_profiles", """
+        CREATE TABLE master_profiles (
+            id VARCHAR NOT NULL,
+            user_id INTEGER NOT NULL,
+            personal_info JSON NOT NULL,
+            professional_summary TEXT,
+            enhanced_professional_summary TEXT,
+            enhancement_metadata JSON,
+            skills JSON NOT NULL,
+            custom_fields JSON,
+            created_at DATETIME,
+            updated_at DATETIME,
+            PRIMARY KEY (id),
+            FOREIGN KEY(user_id) REFERENCES users (id)
+        )""", [
+        "CREATE INDEX ix_master_profiles_user_id ON master_profiles (user_id)",
+    ]),
+    ("sample_documents", """
+        CREATE TABLE sample_documents (
+            id VARCHAR NOT NULL,
+            user_id INTEGER NOT NULL,
+            document_type VARCHAR NOT NULL,
+            original_filename VARCHAR NOT NULL,
+            full_text TEXT NOT NULL,
+            writing_style JSON,
+            word_count INTEGER,
+            character_count INTEGER,
+            is_active BOOLEAN,
+            created_at DATETIME,
+            updated_at DATETIME,
+            PRIMARY KEY (id),
+            FOREIGN KEY(user_id) REFERENCES users (id)
+        )""", [
+        "CREATE INDEX ix_sample_documents_created_at ON sample_documents (created_at)",
+        "CREATE INDEX ix_sample_documents_document_type ON sample_documents (document_type)",
+        "CREATE INDEX ix_sample_documents_is_active ON sample_documents (is_active)",
+        "CREATE INDEX ix_sample_documents_user_id ON sample_documents (user_id)",
+    ]),
+    ("education", """
+        CREATE TABLE education (
+            id VARCHAR NOT NULL,
+            profile_id VARCHAR NOT NULL,
+            institution VARCHAR NOT NULL,
+            degree VARCHAR NOT NULL,
+            field_of_study VARCHAR NOT NULL,
+            start_date VARCHAR NOT NULL,
+            end_date VARCHAR NOT NULL,
+            gpa FLOAT,
+            honors JSON,
+            PRIMARY KEY (id),
+            FOREIGN KEY(profile_id) REFERENCES master_profiles (id)
+        )""", [
+        "CREATE INDEX ix_education_profile_id ON education (profile_id)",
+    ]),
+    ("experiences", """
+        CREATE TABLE experiences (
+            id VARCHAR NOT NULL,
+            profile_id VARCHAR NOT NULL,
+            title VARCHAR NOT NULL,
+            company VARCHAR NOT NULL,
+            location VARCHAR,
+            start_date VARCHAR NOT NULL,
+            end_date VARCHAR,
+            is_current BOOLEAN,
+            description TEXT,
+            achievements JSON,
+            enhanced_description TEXT,
+            enhancement_metadata JSON,
+            PRIMARY KEY (id),
+            FOREIGN KEY(profile_id) REFERENCES master_profiles (id)
+        )""", [
+        "CREATE INDEX ix_experiences_profile_id ON experiences (profile_id)",
+    ]),
+    ("job_content_rankings", """
+        CREATE TABLE job_content_rankings (
+            id VARCHAR NOT NULL,
+            user_id INTEGER NOT NULL,
+            job_id VARCHAR NOT NULL,
+            profile_id VARCHAR NOT NULL,
+            ranked_experience_ids JSON NOT NULL,
+            ranked_project_ids JSON NOT NULL,
+            ranking_rationale TEXT,
+            keyword_matches JSON,
+            relevance_scores JSON,
+            llm_metadata JSON,
+            status VARCHAR,
+            created_at DATETIME,
+            PRIMARY KEY (id),
+            FOREIGN KEY(user_id) REFERENCES users (id),
+            FOREIGN KEY(job_id) REFERENCES jobs (id),
+            FOREIGN KEY(profile_id) REFERENCES master_profiles (id)
+        )""", [
+        "CREATE INDEX ix_job_content_rankings_job_id ON job_content_rankings (job_id)",
+        "CREATE INDEX ix_job_content_rankings_user_id ON job_content_rankings (user_id)",
+    ]),
+    ("projects", """
+        CREATE TABLE projects (
+            id VARCHAR NOT NULL,
+            profile_id VARCHAR NOT NULL,
+            name VARCHAR NOT NULL,
+            description TEXT NOT NULL,
+            technologies JSON,
+            url VARCHAR,
+            start_date VARCHAR NOT NULL,
+            end_date VARCHAR,
+            enhanced_description TEXT,
+            enhancement_metadata JSON,
+            PRIMARY KEY (id),
+            FOREIGN KEY(profile_id) REFERENCES master_profiles (id)
+        )""", [
+        "CREATE INDEX ix_projects_profile_id ON projects (profile_id)",
+    ]),
+    ("writing_styles", """
+        CREATE TABLE writing_styles (
+            id VARCHAR NOT NULL,
+            user_id INTEGER NOT NULL,
+            extracted_style JSON NOT NULL,
+            sample_document_id VARCHAR NOT NULL,
+            extraction_date DATETIME,
+            llm_metadata JSON,
+            PRIMARY KEY (id),
+            FOREIGN KEY(user_id) REFERENCES users (id),
+            FOREIGN KEY(sample_document_id) REFERENCES sample_documents (id)
+        )""", [
+        "CREATE INDEX ix_writing_styles_user_id ON writing_styles (user_id)",
+    ]),
+    ("generations", """
+        CREATE TABLE generations (
+            id VARCHAR NOT NULL,
+            user_id INTEGER NOT NULL,
+            job_id VARCHAR NOT NULL,
+            ranking_id VARCHAR,
+            document_type VARCHAR NOT NULL,
+            content_text TEXT NOT NULL,
+            content_structured TEXT,
+            status VARCHAR,
+            ats_score FLOAT,
+            ats_feedback TEXT,
+            llm_metadata JSON,
+            created_at DATETIME,
+            PRIMARY KEY (id),
+            FOREIGN KEY(user_id) REFERENCES users (id),
+            FOREIGN KEY(job_id) REFERENCES jobs (id),
+            FOREIGN KEY(ranking_id) REFERENCES job_content_rankings (id)
+        )""", [
+        "CREATE INDEX ix_generations_job_id ON generations (job_id)",
+        "CREATE INDEX ix_generations_user_id ON generations (user_id)",
+    ]),
+    ("exports", """
+        CREATE TABLE exports (
+            id VARCHAR NOT NULL,
+            user_id INTEGER NOT NULL,
+            generation_id VARCHAR,
+            job_id VARCHAR,
+            format VARCHAR NOT NULL,
+            template VARCHAR NOT NULL,
+            filename VARCHAR NOT NULL,
+            file_path VARCHAR NOT NULL,
+            file_size_bytes INTEGER NOT NULL,
+            page_count INTEGER,
+            options JSON,
+            export_metadata JSON,
+            download_url VARCHAR,
+            expires_at DATETIME NOT NULL,
+            local_cache_path VARCHAR,
+            cache_expires_at DATETIME,
+            created_at DATETIME,
+            PRIMARY KEY (id),
+            FOREIGN KEY(user_id) REFERENCES users (id),
+            FOREIGN KEY(generation_id) REFERENCES generations (id),
+            FOREIGN KEY(job_id) REFERENCES jobs (id)
+        )""", [
+        "CREATE INDEX ix_exports_created_at ON exports (created_at)",
+        "CREATE INDEX ix_exports_format ON exports (format)",
+        "CREATE INDEX ix_exports_generation_id ON exports (generation_id)",
+        "CREATE INDEX ix_exports_job_id ON exports (job_id)",
+        "CREATE INDEX ix_exports_user_id ON exports (user_id)",
+    ]),
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for table, create_table, indexes in TABLES:
+        # Existing (pre-versioning) tables are left to the following migrations
+        if table_exists(conn, table):
+            continue
+        conn.execute(text(create_table))
+        for create_index in indexes:
+            conn.execute(text(create_index))
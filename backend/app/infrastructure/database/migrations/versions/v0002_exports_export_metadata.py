@@ -0,0 +1,19 @@
+"""Rename exports.metadata to export_metadata (was fix_export_metadata_column.py)."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..helpers import add_column_if_missing, column_names
+
+VERSION = 2
+DESCRIPTION = "Rename exports.metadata to export_metadata"
+
+
+def upgrade(conn: Connection) -> None:
+    columns = column_names(conn, "exports")
+    if "export_metadata" in columns:
+        return
+    if "metadata" in columns:
+        conn.execute(text("ALTER TABLE exports RENAME COLUMN metadata TO export_metadata"))
+    else:
+        add_column_if_missing(conn, "exports", "export_metadata", "JSON")
@@ -0,0 +1,27 @@
+"""Add job filtering and mobile cache columns to exports (was migrate_exports_add_job_id_and_cache.py)."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..helpers import add_column_if_missing
+
+VERSION = 3
+DESCRIPTION = "Add exports.job_id, local_cache_path and cache_expires_at"
+
+
+def upgrade(conn: Connection) -> None:
+    if add_column_if_missing(conn, "exports", "job_id", "VARCHAR"):
+        # Backfill the denormalized job_id from the exported generation
+        conn.execute(text(
+            "UPDATE exports SET job_id = ("
+            "SELECT job_id FROM generations WHERE generations.id = exports.generation_id"
+            ") WHERE generation_id IS NOT NULL"
+        ))
+    add_column_if_missing(conn, "exports", "local_cache_path", "VARCHAR")
+    add_column_if_missing(conn, "exports", "cache_expires_at", "DATETIME")
+
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_exports_job_id ON exports (job_id)"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_exports_user_job_created "
+        "ON exports (user_id, job_id, created_at)"
+    ))
@@ -0,0 +1,12 @@
+"""Add structured export content to generations (was add_content_structured_column.py)."""
+
+from sqlalchemy.engine import Connection
+
+from ..helpers import add_column_if_missing
+
+VERSION = 4
+DESCRIPTION = "Add generations.content_structured"
+
+
+def upgrade(conn: Connection) -> None:
+    add_column_if_missing(conn, "generations", "content_structured", "TEXT")
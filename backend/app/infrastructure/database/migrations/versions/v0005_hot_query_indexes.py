@@ -0,0 +1,27 @@
+"""Composite indexes for the hot list/lookup queries."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+VERSION = 5
+DESCRIPTION = "Add composite indexes for hot queries"
+
+INDEXES = [
+    "ix_jobs_user_id_created_at ON jobs (user_id, created_at)",
+    "ix_sample_documents_user_type_active_created "
+    "ON sample_documents (user_id, document_type, is_active, created_at)",
+    "ix_writing_styles_user_id_extraction_date ON writing_styles (user_id, extraction_date)",
+    "ix_job_content_rankings_user_job_created "
+    "ON job_content_rankings (user_id, job_id, created_at)",
+    "ix_generations_user_id_created_at ON generations (user_id, created_at)",
+    "ix_generations_user_type_created ON generations (user_id, document_type, created_at)",
+    "ix_generations_user_job_created ON generations (user_id, job_id, created_at)",
+    "ix_exports_user_id_created_at ON exports (user_id, created_at)",
+    "ix_exports_user_format_created ON exports (user_id, format, created_at)",
+    "ix_exports_user_job_format_created ON exports (user_id, job_id, format, created_at)",
+]
+
+
+def upgrade(conn: Connection) -> None:
+    for index in INDEXES:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index}"))
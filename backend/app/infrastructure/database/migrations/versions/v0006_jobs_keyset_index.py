@@ -0,0 +1,14 @@
+"""Extend the jobs list index with id so keyset pagination is index-ordered."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+VERSION = 6
+DESCRIPTION = "Replace ix_jobs_user_id_created_at with ix_jobs_user_created_id"
+
+
+def upgrade(conn: Connection) -> None:
+    conn.execute(text("DROP INDEX IF EXISTS ix_jobs_user_id_created_at"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_user_created_id ON jobs (user_id, created_at, id)"
+    ))
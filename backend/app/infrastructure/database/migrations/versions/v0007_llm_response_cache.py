@@ -0,0 +1,23 @@
+"""Persistent LLM response cache table."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+VERSION = 7
+DESCRIPTION = "Add llm_response_cache table"
+
+
+def upgrade(conn: Connection) -> None:
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS llm_response_cache (
+            "key" VARCHAR(64) NOT NULL,
+            model VARCHAR NOT NULL,
+            response JSON NOT NULL,
+            created_at DATETIME NOT NULL,
+            expires_at DATETIME NOT NULL,
+            PRIMARY KEY ("key")
+        )"""))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_llm_response_cache_expires_at "
+        "ON llm_response_cache (expires_at)"
+    ))
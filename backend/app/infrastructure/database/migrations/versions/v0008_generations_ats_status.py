@@ -0,0 +1,12 @@
+"""Track deferred ATS scoring on generations."""
+
+from sqlalchemy.engine import Connection
+
+from ..helpers import add_column_if_missing
+
+VERSION = 8
+DESCRIPTION = "Add generations.ats_status"
+
+
+def upgrade(conn: Connection) -> None:
+    add_column_if_missing(conn, "generations", "ats_status", "VARCHAR")
@@ -0,0 +1,12 @@
+"""Fingerprint rankings so unchanged job/profile content can reuse them."""
+
+from sqlalchemy.engine import Connection
+
+from ..helpers import add_column_if_missing
+
+VERSION = 9
+DESCRIPTION = "Add job_content_rankings.content_fingerprint"
+
+
+def upgrade(conn: Connection) -> None:
+    add_column_if_missing(conn, "job_content_rankings", "content_fingerprint", "VARCHAR(64)")
@@ -0,0 +1,14 @@
+"""Store a derived text index on experiences and projects."""
+
+from sqlalchemy.engine import Connection
+
+from ..helpers import add_column_if_missing
+
+VERSION = 10
+DESCRIPTION = "Add experiences.text_index and projects.text_index"
+
+
+def upgrade(conn: Connection) -> None:
+    # Existing rows stay NULL and are indexed on their next write (or on the fly)
+    add_column_if_missing(conn, "experiences", "text_index", "JSON")
+    add_column_if_missing(conn, "projects", "text_index", "JSON")
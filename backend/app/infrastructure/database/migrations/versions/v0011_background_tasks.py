@@ -0,0 +1,36 @@
+"""Background task queue table."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+VERSION = 11
+DESCRIPTION = "Add background_tasks table"
+
+
+def upgrade(conn: Connection) -> None:
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS background_tasks (
+            id VARCHAR NOT NULL,
+            user_id INTEGER NOT NULL,
+            task_type VARCHAR NOT NULL,
+            status VARCHAR NOT NULL,
+            payload JSON NOT NULL,
+            result JSON,
+            error TEXT,
+            attempts INTEGER NOT NULL,
+            max_attempts INTEGER NOT NULL,
+            run_after DATETIME NOT NULL,
+            created_at DATETIME NOT NULL,
+            started_at DATETIME,
+            completed_at DATETIME,
+            PRIMARY KEY (id),
+            FOREIGN KEY(user_id) REFERENCES users (id)
+        )"""))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_background_tasks_status_run_after "
+        "ON background_tasks (status, run_after)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_background_tasks_user_created "
+        "ON background_tasks (user_id, created_at)"
+    ))
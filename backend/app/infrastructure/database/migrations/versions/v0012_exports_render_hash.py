@@ -0,0 +1,17 @@
+"""Key exports by what they render so identical re-exports reuse the stored file."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..helpers import add_column_if_missing
+
+VERSION = 12
+DESCRIPTION = "Add exports.render_hash and its lookup index"
+
+
+def upgrade(conn: Connection) -> None:
+    # Existing exports stay NULL and are never reused
+    add_column_if_missing(conn, "exports", "render_hash", "VARCHAR(64)")
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_exports_user_render_hash ON exports (user_id, render_hash)"
+    ))
@@ -0,0 +1,14 @@
+"""Lease running background tasks to the worker process that claimed them."""
+
+from sqlalchemy.engine import Connection
+
+from ..helpers import add_column_if_missing
+
+VERSION = 13
+DESCRIPTION = "Add background_tasks.claimed_by and lease_expires_at"
+
+
+def upgrade(conn: Connection) -> None:
+    # Tasks already running have no lease and are requeued by the next worker to start
+    add_column_if_missing(conn, "background_tasks", "claimed_by", "VARCHAR(128)")
+    add_column_if_missing(conn, "background_tasks", "lease_expires_at", "DATETIME")
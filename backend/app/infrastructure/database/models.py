@@ -1,7 +1,7 @@
 """Database models."""
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, Float, JSON
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, Float, JSON, Index
 from sqlalchemy.dialects.sqlite import INTEGER
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import declarative_base, relationship
@@ -77,6 +77,9 @@ class ExperienceModel(Base):
     enhanced_description = Column(Text)  # AI-polished version with stronger action verbs, quantification
     enhancement_metadata = Column(JSON, default=dict)  # {"model": "llama-3.3-70b", "timestamp": "...", "improvements": ["added metrics", "stronger verbs"]}
 
+    # Derived text index (term frequencies, skills), rebuilt when the row is written
+    text_index = Column(JSON)
+
 
 class EducationModel(Base):
     """Education database model."""
@@ -112,6 +115,9 @@ class ProjectModel(Base):
     enhanced_description = Column(Text)  # AI-polished version with technical depth, impact metrics
     enhancement_metadata = Column(JSON, default=dict)  # {"model": "llama-3.3-70b", "timestamp": "...", "improvements": ["added impact", "technical details"]}
 
+    # Derived text index (term frequencies, skills), rebuilt when the row is written
+    text_index = Column(JSON)
+
 
 class JobModel(Base):
     """Job database model."""
@@ -139,6 +145,11 @@ class JobModel(Base):
     # Relationships
     user = relationship("UserModel", backref="jobs")
 
+    __table_args__ = (
+        # GET /jobs: user's jobs newest first, id breaks ties for keyset pages
+        Index("ix_jobs_user_created_id", "user_id", "created_at", "id"),
+    )
+
 
 class SampleDocumentModel(Base):
     """Sample document database model for writing style extraction."""
@@ -159,6 +170,14 @@ class SampleDocumentModel(Base):
     # Relationships
     user = relationship("UserModel", backref="sample_documents")
 
+    __table_args__ = (
+        # get_active_sample and filtered list_by_user (newest first)
+        Index(
+            "ix_sample_documents_user_type_active_created",
+            "user_id", "document_type", "is_active", "created_at"
+        ),
+    )
+
 
 class WritingStyleModel(Base):
     """Writing style extracted from sample documents."""
@@ -174,6 +193,11 @@ class WritingStyleModel(Base):
     # Relationships
     user = relationship("UserModel", backref="writing_styles")
 
+    __table_args__ = (
+        # get_by_user: most recent style first
+        Index("ix_writing_styles_user_id_extraction_date", "user_id", "extraction_date"),
+    )
+
 
 class JobContentRankingModel(Base):
     """Job-specific content ranking."""
@@ -189,6 +213,7 @@ class JobContentRankingModel(Base):
     keyword_matches = Column(JSON)
     relevance_scores = Column(JSON)
     llm_metadata = Column(JSON)
+    content_fingerprint = Column(String(64))  # Hash of the job and profile content that was ranked
     status = Column(String, default="completed")
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -196,6 +221,11 @@ class JobContentRankingModel(Base):
     user = relationship("UserModel", backref="content_rankings")
     job = relationship("JobModel", backref="content_rankings")
 
+    __table_args__ = (
+        # get_by_job: latest ranking for (user, job)
+        Index("ix_job_content_rankings_user_job_created", "user_id", "job_id", "created_at"),
+    )
+
 
 class GenerationModel(Base):
     """Generated documents (resumes and cover letters)."""
@@ -211,6 +241,7 @@ class GenerationModel(Base):
     status = Column(String, default="pending")
     ats_score = Column(Float)
     ats_feedback = Column(Text)
+    ats_status = Column(String, nullable=True)  # pending, completed, failed (NULL on older rows)
     llm_metadata = Column(JSON)
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -218,6 +249,13 @@ class GenerationModel(Base):
     user = relationship("UserModel", backref="generations")
     job = relationship("JobModel", backref="generations")
 
+    __table_args__ = (
+        # list_by_user with no filter, document_type filter, or job_id filter (newest first)
+        Index("ix_generations_user_id_created_at", "user_id", "created_at"),
+        Index("ix_generations_user_type_created", "user_id", "document_type", "created_at"),
+        Index("ix_generations_user_job_created", "user_id", "job_id", "created_at"),
+    )
+
 
 class ExportModel(Base):
     """Export database model for document exports (PDF/DOCX/ZIP)."""
@@ -239,6 +277,7 @@ class ExportModel(Base):
     expires_at = Column(DateTime, nullable=False)  # 30 days from creation
     local_cache_path = Column(String)  # Mobile local cache path
     cache_expires_at = Column(DateTime)  # Local cache expiration (7 days)
+    render_hash = Column(String(64))  # Hash of content, template, options and renderer version
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     
     # Relationships
@@ -246,5 +285,53 @@ class ExportModel(Base):
     generation = relationship("GenerationModel", backref="exports")
     job = relationship("JobModel", backref="exports")
 
+    __table_args__ = (
+        # list_by_user (optionally by format) and list_by_job (optionally by format), newest first
+        Index("ix_exports_user_id_created_at", "user_id", "created_at"),
+        Index("ix_exports_user_format_created", "user_id", "format", "created_at"),
+        Index("idx_exports_user_job_created", "user_id", "job_id", "created_at"),
+        Index("ix_exports_user_job_format_created", "user_id", "job_id", "format", "created_at"),
+        # get_by_render_hash: reuse an identical, unexpired export
+        Index("ix_exports_user_render_hash", "user_id", "render_hash"),
+    )
+
+
+class LLMResponseCacheModel(Base):
+    """Persistent cache of deterministic LLM responses, keyed by request hash."""
+    __tablename__ = "llm_response_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256 of model, prompt and sampling params
+    model = Column(String, nullable=False)
+    response = Column(JSON, nullable=False)  # generate_completion result dict
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+
+class BackgroundTaskModel(Base):
+    """Queued long-running work (enhancement, cover letters, batch exports)."""
+    __tablename__ = "background_tasks"
+
+    id = Column(String, primary_key=True)  # UUID as string
+    user_id = Column(INTEGER, ForeignKey("users.id"), nullable=False)
+    task_type = Column(String, nullable=False)  # enhance_profile, cover_letter, batch_export
+    status = Column(String, nullable=False, default="pending")  # GenerationStatus: pending=queued, generating=running
+    payload = Column(JSON, nullable=False, default=dict)
+    result = Column(JSON)
+    error = Column(Text)
+    attempts = Column(INTEGER, nullable=False, default=0)
+    max_attempts = Column(INTEGER, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)  # Retry backoff
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime)
+    claimed_by = Column(String(128))  # Worker process running the task
+    lease_expires_at = Column(DateTime)  # Renewed while running; expired leases are requeued
+
+    __table_args__ = (
+        # Workers claim the oldest due queued task; users list their own newest first
+        Index("ix_background_tasks_status_run_after", "status", "run_after"),
+        Index("ix_background_tasks_user_created", "user_id", "created_at"),
+    )
+
 
 # Removed PromptTemplateModel - prompts are now stored in source code
\ No newline at end of file
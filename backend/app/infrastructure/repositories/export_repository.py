@@ -9,7 +9,7 @@ from datetime import datetime
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.export import Export
+from app.domain.entities.export import Export, ExportSummary
 from app.domain.enums.export_format import ExportFormat
 from app.domain.enums.template_type import TemplateType
 from app.infrastructure.database.models import ExportModel
@@ -49,7 +49,8 @@ class ExportRepository:
             local_cache_path=export.local_cache_path,
             cache_expires_at=export.cache_expires_at,
             expires_at=export.expires_at,
-            created_at=export.created_at
+            created_at=export.created_at,
+            render_hash=export.render_hash
         )
         
         self.session.add(export_model)
@@ -81,6 +82,37 @@ class ExportRepository:
         
         return self._to_entity(export_model)
     
+    async def get_by_render_hash(
+        self,
+        user_id: int,
+        generation_id: str,
+        render_hash: str
+    ) -> Optional[Export]:
+        """
+        Get the newest unexpired export of a generation with identical render inputs.
+        
+        Args:
+            user_id: User ID (for authorization)
+            generation_id: Generation the export was made from
+            render_hash: Hash of content, format, template, options and renderer version
+        
+        Returns:
+            Export entity or None
+        """
+        stmt = select(ExportModel).where(
+            ExportModel.user_id == user_id,
+            ExportModel.render_hash == render_hash,
+            ExportModel.generation_id == generation_id,
+            ExportModel.expires_at > datetime.utcnow()
+        ).order_by(ExportModel.created_at.desc()).limit(1)
+        result = await self.session.execute(stmt)
+        export_model = result.scalar_one_or_none()
+        
+        if not export_model:
+            return None
+        
+        return self._to_entity(export_model)
+    
     async def list_by_user(
         self,
         user_id: int,
@@ -102,20 +134,73 @@ class ExportRepository:
         Returns:
             List of export entities
         """
-        stmt = select(ExportModel).where(ExportModel.user_id == user_id)
+        stmt = self._list_by_user_query(
+            select(ExportModel), user_id, format, job_id, limit, offset
+        )
         
-        if format:
-            stmt = stmt.where(ExportModel.format == format.value)
+        result = await self.session.execute(stmt)
+        export_models = result.scalars().all()
         
-        if job_id:
-            stmt = stmt.where(ExportModel.job_id == job_id)
+        return [self._to_entity(model) for model in export_models]
+    
+    async def list_summaries_by_user(
+        self,
+        user_id: int,
+        format: Optional[ExportFormat] = None,
+        job_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[ExportSummary]:
+        """
+        List export summaries for a user, selecting only list-view columns.
         
-        stmt = stmt.order_by(ExportModel.created_at.desc()).limit(limit).offset(offset)
+        Args:
+            user_id: User ID
+            format: Optional format filter
+            job_id: Optional job ID filter
+            limit: Maximum results
+            offset: Pagination offset
+        
+        Returns:
+            List of export summaries
+        """
+        stmt = self._list_by_user_query(
+            select(
+                ExportModel.id,
+                ExportModel.generation_id,
+                ExportModel.job_id,
+                ExportModel.format,
+                ExportModel.template,
+                ExportModel.filename,
+                ExportModel.file_path,
+                ExportModel.file_size_bytes,
+                ExportModel.page_count,
+                ExportModel.export_metadata,
+                ExportModel.expires_at,
+                ExportModel.created_at
+            ),
+            user_id, format, job_id, limit, offset
+        )
         
         result = await self.session.execute(stmt)
-        export_models = result.scalars().all()
         
-        return [self._to_entity(model) for model in export_models]
+        return [
+            ExportSummary(
+                id=row.id,
+                generation_id=row.generation_id,
+                job_id=row.job_id,
+                format=ExportFormat(row.format),
+                template=TemplateType(row.template),
+                filename=row.filename,
+                file_path=row.file_path,
+                file_size_bytes=row.file_size_bytes,
+                page_count=row.page_count,
+                export_metadata=row.export_metadata or {},
+                expires_at=row.expires_at,
+                created_at=row.created_at
+            )
+            for row in result
+        ]
     
     async def list_by_job(
         self,
@@ -202,6 +287,26 @@ class ExportRepository:
         
         return count
     
+    def _list_by_user_query(
+        self,
+        stmt,
+        user_id: int,
+        format: Optional[ExportFormat],
+        job_id: Optional[str],
+        limit: int,
+        offset: int
+    ):
+        """Apply the list_by_user filters, newest-first ordering and pagination."""
+        stmt = stmt.where(ExportModel.user_id == user_id)
+        
+        if format:
+            stmt = stmt.where(ExportModel.format == format.value)
+        
+        if job_id:
+            stmt = stmt.where(ExportModel.job_id == job_id)
+        
+        return stmt.order_by(ExportModel.created_at.desc()).limit(limit).offset(offset)
+    
     def _to_entity(self, model: ExportModel) -> Export:
         """Convert database model to domain entity."""
         return Export(
@@ -221,5 +326,6 @@ class ExportRepository:
             local_cache_path=model.local_cache_path,
             cache_expires_at=model.cache_expires_at,
             expires_at=model.expires_at,
-            created_at=model.created_at
+            created_at=model.created_at,
+            render_hash=model.render_hash
         )
@@ -5,10 +5,10 @@ from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.generation import Generation
+from app.domain.entities.generation import Generation, GenerationSummary
 from app.domain.enums.document_type import DocumentType
 from app.domain.enums.generation_status import GenerationStatus
 from app.domain.interfaces.generation_repository_interface import GenerationRepositoryInterface
@@ -23,7 +23,38 @@ class GenerationRepository(GenerationRepositoryInterface):
     
     async def create(self, generation: Generation) -> Generation:
         """Create a new generation."""
-        model = GenerationModel(
+        model = self._to_model(generation)
+        
+        self.session.add(model)
+        await self.session.commit()
+        await self.session.refresh(model)
+        
+        return generation
+    
+    async def create_many(self, generations: List[Generation]) -> List[Generation]:
+        """Insert several generations in one transaction.
+        
+        Args:
+            generations: Generation entities (ids and timestamps already set)
+            
+        Returns:
+            The inserted generations, in the same order
+        """
+        if not generations:
+            return []
+        
+        try:
+            self.session.add_all([self._to_model(generation) for generation in generations])
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        
+        return generations
+    
+    def _to_model(self, generation: Generation) -> GenerationModel:
+        """Build the database row for a generation."""
+        return GenerationModel(
             id=str(generation.id),
             user_id=generation.user_id,
             job_id=str(generation.job_id),
@@ -34,15 +65,10 @@ class GenerationRepository(GenerationRepositoryInterface):
             status=generation.status.value,
             ats_score=generation.ats_score,
             ats_feedback=generation.ats_feedback,
+            ats_status=generation.ats_status.value if generation.ats_status else None,
             llm_metadata=generation.llm_metadata,
             created_at=generation.created_at
         )
-        
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        
-        return generation
     
     async def get_by_id(self, generation_id: UUID) -> Optional[Generation]:
         """Get generation by ID."""
@@ -67,6 +93,7 @@ class GenerationRepository(GenerationRepositoryInterface):
             status=GenerationStatus(model.status),
             ats_score=model.ats_score,
             ats_feedback=model.ats_feedback,
+            ats_status=GenerationStatus(model.ats_status) if model.ats_status else None,
             llm_metadata=model.llm_metadata,
             created_at=model.created_at
         )
@@ -80,15 +107,9 @@ class GenerationRepository(GenerationRepositoryInterface):
         offset: int = 0
     ) -> List[Generation]:
         """List generations for a user with pagination."""
-        query = select(GenerationModel).where(GenerationModel.user_id == user_id)
-        
-        if document_type:
-            query = query.where(GenerationModel.document_type == document_type.value)
-        
-        if job_id:
-            query = query.where(GenerationModel.job_id == str(job_id))
-        
-        query = query.order_by(GenerationModel.created_at.desc()).limit(limit).offset(offset)
+        query = self._list_by_user_query(
+            select(GenerationModel), user_id, document_type, job_id, limit, offset
+        )
         
         result = await self.session.execute(query)
         models = result.scalars().all()
@@ -105,12 +126,70 @@ class GenerationRepository(GenerationRepositoryInterface):
                 status=GenerationStatus(model.status),
                 ats_score=model.ats_score,
                 ats_feedback=model.ats_feedback,
+                ats_status=GenerationStatus(model.ats_status) if model.ats_status else None,
                 llm_metadata=model.llm_metadata,
                 created_at=model.created_at
             )
             for model in models
         ]
     
+    async def list_summaries_by_user(
+        self,
+        user_id: int,
+        document_type: Optional[DocumentType] = None,
+        job_id: Optional[UUID] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[GenerationSummary]:
+        """List generation summaries for a user without loading content columns."""
+        query = self._list_by_user_query(
+            select(
+                GenerationModel.id,
+                GenerationModel.job_id,
+                GenerationModel.document_type,
+                GenerationModel.status,
+                GenerationModel.ats_score,
+                GenerationModel.ats_status,
+                GenerationModel.created_at
+            ),
+            user_id, document_type, job_id, limit, offset
+        )
+        
+        result = await self.session.execute(query)
+        
+        return [
+            GenerationSummary(
+                id=UUID(row.id),
+                job_id=UUID(row.job_id),
+                document_type=DocumentType(row.document_type),
+                status=GenerationStatus(row.status),
+                ats_score=row.ats_score,
+                ats_status=GenerationStatus(row.ats_status) if row.ats_status else None,
+                created_at=row.created_at
+            )
+            for row in result
+        ]
+    
+    def _list_by_user_query(
+        self,
+        query,
+        user_id: int,
+        document_type: Optional[DocumentType],
+        job_id: Optional[UUID],
+        limit: int,
+        offset: int
+    ):
+        """Apply the list_by_user filters, newest-first ordering and pagination."""
+        query = query.where(GenerationModel.user_id == user_id)
+        
+        if document_type:
+            query = query.where(GenerationModel.document_type == document_type.value)
+        
+        if job_id:
+            query = query.where(GenerationModel.job_id == str(job_id))
+        
+        return query.order_by(GenerationModel.created_at.desc()).limit(limit).offset(offset)
+    
     async def update(self, generation: Generation) -> Generation:
         """Update generation."""
         query = select(GenerationModel).where(
@@ -128,6 +207,7 @@ class GenerationRepository(GenerationRepositoryInterface):
         model.status = generation.status.value
         model.ats_score = generation.ats_score
         model.ats_feedback = generation.ats_feedback
+        model.ats_status = generation.ats_status.value if generation.ats_status else None
         model.llm_metadata = generation.llm_metadata
         
         await self.session.commit()
@@ -135,6 +215,32 @@ class GenerationRepository(GenerationRepositoryInterface):
         
         return generation
     
+    async def update_ats_result(
+        self,
+        generation_id: UUID,
+        ats_status: GenerationStatus,
+        ats_score: Optional[float] = None,
+        ats_feedback: Optional[str] = None,
+        llm_metadata: Optional[str] = None
+    ) -> bool:
+        """Record a deferred ATS result without touching the generated content.
+        
+        Returns:
+            False if the generation no longer exists
+        """
+        query = update(GenerationModel).where(
+            GenerationModel.id == str(generation_id)
+        ).values(
+            ats_status=ats_status.value,
+            ats_score=ats_score,
+            ats_feedback=ats_feedback,
+            llm_metadata=llm_metadata
+        )
+        
+        result = await self.session.execute(query)
+        await self.session.commit()
+        return result.rowcount > 0
+    
     async def delete(self, generation_id: UUID) -> bool:
         """Delete generation."""
         query = select(GenerationModel).where(
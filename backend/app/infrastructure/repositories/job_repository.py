@@ -2,13 +2,13 @@
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete, func, tuple_
 from sqlalchemy.orm import selectinload
 
 from app.infrastructure.database.models import JobModel
-from app.domain.entities.job import Job
+from app.domain.entities.job import Job, JobSummary
 
 
 class JobRepository:
@@ -35,26 +35,7 @@ class JobRepository:
         job_entity = Job(**job_data)
         
         # Create database model from entity
-        job_model = JobModel(
-            id=job_entity.id,
-            user_id=job_entity.user_id,
-            source=job_entity.source,
-            title=job_entity.title,
-            company=job_entity.company,
-            location=job_entity.location,
-            description=job_entity.description,
-            raw_text=job_entity.raw_text,
-            parsed_keywords=job_entity.parsed_keywords,
-            requirements=job_entity.requirements,
-            benefits=job_entity.benefits,
-            salary_range=job_entity.salary_range,
-            remote=job_entity.remote,
-            employment_type=job_entity.employment_type,
-            status=job_entity.status,
-            application_status=job_entity.application_status,
-            created_at=job_entity.created_at,
-            updated_at=job_entity.updated_at
-        )
+        job_model = JobModel(**self._entity_to_row(job_entity))
         
         self.db.add(job_model)
         await self.db.commit()
@@ -62,6 +43,27 @@ class JobRepository:
         
         return self._model_to_entity(job_model)
 
+    async def create_many(self, jobs: List[Job]) -> List[Job]:
+        """Insert several jobs in one transaction with a single executemany.
+        
+        Args:
+            jobs: Validated Job entities (ids and timestamps already set)
+            
+        Returns:
+            The inserted jobs, in the same order
+        """
+        if not jobs:
+            return []
+        
+        try:
+            await self.db.execute(insert(JobModel), [self._entity_to_row(job) for job in jobs])
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        
+        return jobs
+
     async def get_by_id(self, job_id: str, user_id: int) -> Optional[Job]:
         """Get job by ID with user authorization.
         
@@ -104,25 +106,118 @@ class JobRepository:
         Returns:
             List of Job entities (excludes source='mock')
         """
-        stmt = select(JobModel).where(JobModel.user_id == user_id)
+        stmt = self._user_jobs_page(
+            select(JobModel), user_id, status, source, limit, offset=offset
+        )
         
-        # ALWAYS exclude mock jobs (they should never be in database anyway)
-        stmt = stmt.where(JobModel.source != "mock")
+        result = await self.db.execute(stmt)
+        job_models = result.scalars().all()
         
-        # Apply filters
-        if status:
-            stmt = stmt.where(JobModel.status == status)
-        if source:
-            stmt = stmt.where(JobModel.source == source)
+        return [self._model_to_entity(job_model) for job_model in job_models]
+
+    async def get_user_jobs_after(
+        self,
+        user_id: int,
+        after_created_at: datetime,
+        after_id: str,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 20
+    ) -> List[Job]:
+        """Get the page of a user's jobs that follows a given job (keyset pagination).
         
-        # Order and paginate
-        stmt = stmt.order_by(JobModel.created_at.desc()).limit(limit).offset(offset)
+        Uses the same ordering as get_user_jobs, but seeks past the previous
+        page's last (created_at, id) instead of skipping rows with OFFSET, so
+        deep pages cost the same as the first one.
+        
+        Args:
+            user_id: User ID
+            after_created_at: created_at of the last job on the previous page
+            after_id: ID of the last job on the previous page
+            status: Optional status filter (active, archived, draft)
+            source: Optional source filter (user_created, imported, etc.)
+            limit: Maximum number of results
+            
+        Returns:
+            List of Job entities (excludes source='mock')
+        """
+        stmt = self._user_jobs_page(
+            select(JobModel), user_id, status, source, limit,
+            after=(after_created_at, after_id)
+        )
         
         result = await self.db.execute(stmt)
         job_models = result.scalars().all()
         
         return [self._model_to_entity(job_model) for job_model in job_models]
 
+    async def get_user_job_summaries(
+        self,
+        user_id: int,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> List[JobSummary]:
+        """Get list-view rows for a user's jobs without the heavy text columns.
+        
+        Selects only the columns in JobSummary, so description, raw_text and
+        the JSON keyword/requirement lists are never read from disk.
+        
+        Args:
+            user_id: User ID
+            status: Optional status filter (active, archived, draft)
+            source: Optional source filter (user_created, imported, etc.)
+            limit: Maximum number of results
+            offset: Number of results to skip (ignored when after is given)
+            after: Optional (created_at, id) of the previous page's last job
+            
+        Returns:
+            List of JobSummary entities (excludes source='mock')
+        """
+        columns = [getattr(JobModel, name) for name in JobSummary.model_fields]
+        stmt = self._user_jobs_page(
+            select(*columns), user_id, status, source, limit, offset=offset, after=after
+        )
+        
+        result = await self.db.execute(stmt)
+        return [
+            JobSummary(
+                **{
+                    **row._mapping,
+                    "remote": bool(row.remote),
+                    "employment_type": row.employment_type or "full_time",
+                    "application_status": row.application_status or "not_applied",
+                }
+            )
+            for row in result
+        ]
+
+    async def count_user_jobs(
+        self,
+        user_id: int,
+        status: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> int:
+        """Count a user's jobs with the same filters as get_user_jobs.
+        
+        Args:
+            user_id: User ID
+            status: Optional status filter (active, archived, draft)
+            source: Optional source filter (user_created, imported, etc.)
+            
+        Returns:
+            Number of matching jobs (excludes source='mock')
+        """
+        stmt = (
+            select(func.count())
+            .select_from(JobModel)
+            .where(*self._user_jobs_filters(user_id, status, source))
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+
     async def update(self, job_id: str, **kwargs) -> Optional[Job]:
         """Update a job.
         
@@ -168,6 +263,62 @@ class JobRepository:
         
         return result.rowcount > 0
 
+    def _user_jobs_filters(
+        self,
+        user_id: int,
+        status: Optional[str],
+        source: Optional[str]
+    ) -> list:
+        """Build the WHERE conditions shared by the user job list and count queries."""
+        # ALWAYS exclude mock jobs (they should never be in database anyway)
+        conditions = [JobModel.user_id == user_id, JobModel.source != "mock"]
+        if status:
+            conditions.append(JobModel.status == status)
+        if source:
+            conditions.append(JobModel.source == source)
+        return conditions
+
+    def _user_jobs_page(
+        self,
+        stmt,
+        user_id: int,
+        status: Optional[str],
+        source: Optional[str],
+        limit: int,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None
+    ):
+        """Apply the user job filters, newest-first ordering and offset or keyset paging."""
+        stmt = stmt.where(*self._user_jobs_filters(user_id, status, source))
+        if after is not None:
+            stmt = stmt.where(tuple_(JobModel.created_at, JobModel.id) < tuple_(*after))
+        else:
+            stmt = stmt.offset(offset)
+        return stmt.order_by(JobModel.created_at.desc(), JobModel.id.desc()).limit(limit)
+
+    def _entity_to_row(self, job: Job) -> dict:
+        """Column values for inserting a job entity."""
+        return {
+            "id": job.id,
+            "user_id": job.user_id,
+            "source": job.source,
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "description": job.description,
+            "raw_text": job.raw_text,
+            "parsed_keywords": job.parsed_keywords,
+            "requirements": job.requirements,
+            "benefits": job.benefits,
+            "salary_range": job.salary_range,
+            "remote": job.remote,
+            "employment_type": job.employment_type,
+            "status": job.status,
+            "application_status": job.application_status,
+            "created_at": job.created_at,
+            "updated_at": job.updated_at
+        }
+
     def _model_to_entity(self, model: JobModel) -> Job:
         """Convert database model to domain entity.
         
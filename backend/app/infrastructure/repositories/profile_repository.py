@@ -23,8 +23,16 @@ class ProfileRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, profile: Profile) -> Profile:
-        """Create a new profile with all related data."""
+    async def create(
+        self,
+        profile: Profile,
+        text_index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Profile:
+        """Create a new profile with all related data.
+        
+        ``text_index`` holds the text index entry to store per experience/project ID.
+        """
+        text_index = text_index or {}
         # Create main profile
         profile_model = MasterProfileModel(
             id=profile.id,
@@ -51,7 +59,8 @@ class ProfileRepository:
                 end_date=exp.end_date,
                 is_current=exp.is_current,
                 description=exp.description,
-                achievements=exp.achievements
+                achievements=exp.achievements,
+                text_index=text_index.get(exp.id)
             )
             self.session.add(exp_model)
 
@@ -81,7 +90,8 @@ class ProfileRepository:
                 technologies=proj.technologies,
                 url=proj.url,
                 start_date=proj.start_date,
-                end_date=proj.end_date
+                end_date=proj.end_date,
+                text_index=text_index.get(proj.id)
             )
             self.session.add(proj_model)
 
@@ -137,8 +147,16 @@ class ProfileRepository:
         profiles = await self.get_by_user_id(user_id, limit=1, offset=0)
         return profiles[0] if profiles else None
 
-    async def update(self, profile: Profile) -> Profile:
-        """Update profile and all related data."""
+    async def update(
+        self,
+        profile: Profile,
+        text_index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Profile:
+        """Update profile and all related data.
+        
+        ``text_index`` holds the text index entry to store per experience/project ID.
+        """
+        text_index = text_index or {}
         # Update main profile
         stmt = update(MasterProfileModel).where(
             MasterProfileModel.id == profile.id
@@ -177,7 +195,8 @@ class ProfileRepository:
                 is_current=exp.is_current,
                 description=exp.description,
                 enhanced_description=exp.enhanced_description,
-                achievements=exp.achievements
+                achievements=exp.achievements,
+                text_index=text_index.get(exp.id)
             )
             self.session.add(exp_model)
 
@@ -205,7 +224,8 @@ class ProfileRepository:
                 technologies=proj.technologies,
                 url=proj.url,
                 start_date=proj.start_date,
-                end_date=proj.end_date
+                end_date=proj.end_date,
+                text_index=text_index.get(proj.id)
             )
             self.session.add(proj_model)
 
@@ -242,8 +262,17 @@ class ProfileRepository:
         count = result.scalar()
         return count if count is not None else 0
 
-    async def create_experiences_bulk(self, profile_id: str, experiences: List[Experience]) -> List[Experience]:
-        """Create multiple experiences for a profile."""
+    async def create_experiences_bulk(
+        self,
+        profile_id: str,
+        experiences: List[Experience],
+        text_index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> List[Experience]:
+        """Create multiple experiences for a profile.
+        
+        ``text_index`` holds the text index entry to store per row ID.
+        """
+        text_index = text_index or {}
         # Get all existing experiences for this profile
         stmt = select(ExperienceModel).where(ExperienceModel.profile_id == profile_id)
         result = await self.session.execute(stmt)
@@ -274,7 +303,8 @@ class ProfileRepository:
                     is_current=exp.is_current,
                     description=exp.description,
                     enhanced_description=exp.enhanced_description,
-                    achievements=exp.achievements
+                    achievements=exp.achievements,
+                    text_index=text_index.get(exp.id)
                 )
                 self.session.add(exp_model)
                 created_experiences.append(exp)
@@ -309,8 +339,17 @@ class ProfileRepository:
 
         return experiences
 
-    async def update_experiences_bulk(self, profile_id: str, experiences: List[Experience]) -> List[Experience]:
-        """Update multiple experiences for a profile."""
+    async def update_experiences_bulk(
+        self,
+        profile_id: str,
+        experiences: List[Experience],
+        text_index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> List[Experience]:
+        """Update multiple experiences for a profile.
+        
+        ``text_index`` holds the text index entry to store per row ID.
+        """
+        text_index = text_index or {}
         for exp in experiences:
             stmt = update(ExperienceModel).where(
                 ExperienceModel.id == exp.id,
@@ -324,7 +363,8 @@ class ProfileRepository:
                 is_current=exp.is_current,
                 description=exp.description,
                 enhanced_description=exp.enhanced_description,
-                achievements=exp.achievements
+                achievements=exp.achievements,
+                text_index=text_index.get(exp.id)
             )
             await self.session.execute(stmt)
 
@@ -407,8 +447,17 @@ class ProfileRepository:
         await self.session.commit()
         return result.rowcount
 
-    async def create_projects_bulk(self, profile_id: str, projects: List[Project]) -> List[Project]:
-        """Create multiple projects for a profile."""
+    async def create_projects_bulk(
+        self,
+        profile_id: str,
+        projects: List[Project],
+        text_index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> List[Project]:
+        """Create multiple projects for a profile.
+        
+        ``text_index`` holds the text index entry to store per row ID.
+        """
+        text_index = text_index or {}
         # Get all existing projects for this profile
         stmt = select(ProjectModel).where(ProjectModel.profile_id == profile_id)
         result = await self.session.execute(stmt)
@@ -440,7 +489,8 @@ class ProfileRepository:
                     technologies=proj.technologies,
                     url=proj.url,
                     start_date=proj.start_date,
-                    end_date=proj.end_date
+                    end_date=proj.end_date,
+                    text_index=text_index.get(proj.id)
                 )
                 self.session.add(proj_model)
                 created_projects.append(proj)
@@ -449,8 +499,17 @@ class ProfileRepository:
             await self.session.commit()
         return created_projects
 
-    async def update_projects_bulk(self, profile_id: str, projects: List[Project]) -> List[Project]:
-        """Update multiple projects for a profile."""
+    async def update_projects_bulk(
+        self,
+        profile_id: str,
+        projects: List[Project],
+        text_index: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> List[Project]:
+        """Update multiple projects for a profile.
+        
+        ``text_index`` holds the text index entry to store per row ID.
+        """
+        text_index = text_index or {}
         for proj in projects:
             stmt = update(ProjectModel).where(
                 ProjectModel.id == proj.id,
@@ -462,7 +521,8 @@ class ProfileRepository:
                 technologies=proj.technologies,
                 url=proj.url,
                 start_date=proj.start_date,
-                end_date=proj.end_date
+                end_date=proj.end_date,
+                text_index=text_index.get(proj.id)
             )
             await self.session.execute(stmt)
 
@@ -479,6 +539,22 @@ class ProfileRepository:
         await self.session.commit()
         return result.rowcount
 
+    async def get_text_index(self, profile_id: str) -> Dict[str, Dict[str, Any]]:
+        """Stored text index entries for a profile's experiences and projects.
+        
+        Returns:
+            Index entry by experience/project ID (rows not yet indexed are omitted)
+        """
+        index: Dict[str, Dict[str, Any]] = {}
+        for model in (ExperienceModel, ProjectModel):
+            stmt = select(model.id, model.text_index).where(
+                model.profile_id == profile_id,
+                model.text_index.is_not(None)
+            )
+            result = await self.session.execute(stmt)
+            index.update({row_id: text_index for row_id, text_index in result.all()})
+        return index
+
     async def _model_to_entity(self, profile_model: MasterProfileModel) -> Profile:
         """Convert database model to domain entity."""
         from app.domain.entities.profile import PersonalInfo, Skills
@@ -1,11 +1,11 @@
 """Job content ranking repository implementation."""
 
 import json
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.job_content_ranking import JobContentRanking
@@ -22,7 +22,38 @@ class RankingRepository(RankingRepositoryInterface):
     
     async def create(self, ranking: JobContentRanking) -> JobContentRanking:
         """Create a new ranking."""
-        model = JobContentRankingModel(
+        model = self._to_model(ranking)
+        
+        self.session.add(model)
+        await self.session.commit()
+        await self.session.refresh(model)
+        
+        return ranking
+    
+    async def replace_many(
+        self,
+        rankings: List[JobContentRanking],
+        replaced_ids: List[UUID]
+    ) -> None:
+        """Insert rankings and delete the ones they replace in a single transaction."""
+        if not rankings and not replaced_ids:
+            return
+        try:
+            if replaced_ids:
+                await self.session.execute(
+                    delete(JobContentRankingModel).where(
+                        JobContentRankingModel.id.in_([str(ranking_id) for ranking_id in replaced_ids])
+                    )
+                )
+            self.session.add_all([self._to_model(ranking) for ranking in rankings])
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+    
+    def _to_model(self, ranking: JobContentRanking) -> JobContentRankingModel:
+        """Build the database row for a ranking."""
+        return JobContentRankingModel(
             id=str(ranking.id),
             user_id=ranking.user_id,
             job_id=str(ranking.job_id),
@@ -33,15 +64,10 @@ class RankingRepository(RankingRepositoryInterface):
             keyword_matches=json.dumps(ranking.keyword_matches) if ranking.keyword_matches else None,
             relevance_scores=json.dumps(ranking.relevance_scores) if ranking.relevance_scores else None,
             llm_metadata=ranking.llm_metadata,
+            content_fingerprint=ranking.content_fingerprint,
             status=ranking.status.value,
             created_at=ranking.created_at
         )
-        
-        self.session.add(model)
-        await self.session.commit()
-        await self.session.refresh(model)
-        
-        return ranking
     
     async def get_by_id(self, ranking_id: UUID) -> Optional[JobContentRanking]:
         """Get ranking by ID."""
@@ -67,7 +93,8 @@ class RankingRepository(RankingRepositoryInterface):
             relevance_scores=json.loads(model.relevance_scores) if model.relevance_scores else None,
             llm_metadata=model.llm_metadata,
             status=GenerationStatus(model.status),
-            created_at=model.created_at
+            created_at=model.created_at,
+            content_fingerprint=model.content_fingerprint
         )
     
     async def get_by_job(
@@ -101,7 +128,8 @@ class RankingRepository(RankingRepositoryInterface):
             relevance_scores=json.loads(model.relevance_scores) if model.relevance_scores else None,
             llm_metadata=model.llm_metadata,
             status=GenerationStatus(model.status),
-            created_at=model.created_at
+            created_at=model.created_at,
+            content_fingerprint=model.content_fingerprint
         )
     
     async def update(self, ranking: JobContentRanking) -> JobContentRanking:
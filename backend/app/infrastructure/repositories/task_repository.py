@@ -0,0 +1,243 @@
+"""Background task repository implementation."""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.background_task import BackgroundTask
+from app.domain.enums.generation_status import GenerationStatus
+from app.infrastructure.database.models import BackgroundTaskModel
+
+
+class TaskRepository:
+    """Repository for the background task queue table."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, task: BackgroundTask) -> BackgroundTask:
+        """Queue a new task."""
+        self.session.add(BackgroundTaskModel(
+            id=str(task.id),
+            user_id=task.user_id,
+            task_type=task.task_type,
+            status=task.status.value,
+            payload=task.payload,
+            attempts=task.attempts,
+            max_attempts=task.max_attempts,
+            run_after=task.run_after,
+            created_at=task.created_at
+        ))
+        await self.session.commit()
+        return task
+
+    async def get_by_id(self, task_id: UUID, user_id: int) -> Optional[BackgroundTask]:
+        """Get a task owned by a user."""
+        result = await self.session.execute(
+            select(BackgroundTaskModel).where(
+                BackgroundTaskModel.id == str(task_id),
+                BackgroundTaskModel.user_id == user_id
+            )
+        )
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def claim_next(
+        self,
+        owner: str,
+        lease_seconds: float,
+        now: Optional[datetime] = None
+    ) -> Optional[BackgroundTask]:
+        """Mark the oldest due queued task as running, leased to ``owner``, and return it.
+
+        The status check in the UPDATE makes the claim atomic, so two
+        workers never run the same task.
+
+        Returns:
+            The claimed task (attempts already incremented), or None if none is due
+        """
+        now = now or datetime.utcnow()
+        result = await self.session.execute(
+            select(BackgroundTaskModel)
+            .where(
+                BackgroundTaskModel.status == GenerationStatus.PENDING.value,
+                BackgroundTaskModel.run_after <= now
+            )
+            .order_by(BackgroundTaskModel.run_after)
+            .limit(1)
+        )
+        model = result.scalar_one_or_none()
+        if not model:
+            return None
+
+        claimed = await self.session.execute(
+            update(BackgroundTaskModel)
+            .where(
+                BackgroundTaskModel.id == model.id,
+                BackgroundTaskModel.status == GenerationStatus.PENDING.value
+            )
+            .values(
+                status=GenerationStatus.GENERATING.value,
+                attempts=BackgroundTaskModel.attempts + 1,
+                started_at=now,
+                claimed_by=owner,
+                lease_expires_at=now + timedelta(seconds=lease_seconds)
+            )
+        )
+        await self.session.commit()
+        if claimed.rowcount == 0:
+            return None
+
+        await self.session.refresh(model)
+        return self._to_entity(model)
+
+    async def mark_completed(self, task_id: UUID, owner: str, result: Dict[str, Any]) -> bool:
+        """Record a successful run, if ``owner`` still holds the task's lease.
+
+        Returns:
+            False if the lease was lost (the task now belongs to another run)
+        """
+        return await self._update(
+            task_id,
+            owner,
+            status=GenerationStatus.COMPLETED.value,
+            result=result,
+            error=None,
+            completed_at=datetime.utcnow(),
+            claimed_by=None,
+            lease_expires_at=None
+        )
+
+    async def mark_failed(self, task_id: UUID, owner: str, error: str) -> bool:
+        """Record a permanent failure, if ``owner`` still holds the task's lease.
+
+        Returns:
+            False if the lease was lost (the task now belongs to another run)
+        """
+        return await self._update(
+            task_id,
+            owner,
+            status=GenerationStatus.FAILED.value,
+            error=error,
+            completed_at=datetime.utcnow(),
+            claimed_by=None,
+            lease_expires_at=None
+        )
+
+    async def schedule_retry(
+        self,
+        task_id: UUID,
+        owner: str,
+        error: str,
+        run_after: datetime
+    ) -> bool:
+        """Put a failed attempt back in the queue, not to run before ``run_after``.
+
+        Returns:
+            False if ``owner`` no longer holds the task's lease
+        """
+        return await self._update(
+            task_id,
+            owner,
+            status=GenerationStatus.PENDING.value,
+            error=error,
+            run_after=run_after,
+            claimed_by=None,
+            lease_expires_at=None
+        )
+
+    async def renew_lease(self, task_id: UUID, owner: str, lease_expires_at: datetime) -> bool:
+        """Extend a running task's lease if ``owner`` still holds it.
+
+        Returns:
+            False if the task is no longer running under this owner
+        """
+        result = await self.session.execute(
+            update(BackgroundTaskModel)
+            .where(
+                BackgroundTaskModel.id == str(task_id),
+                BackgroundTaskModel.status == GenerationStatus.GENERATING.value,
+                BackgroundTaskModel.claimed_by == owner
+            )
+            .values(lease_expires_at=lease_expires_at)
+        )
+        await self.session.commit()
+        return result.rowcount > 0
+
+    async def requeue_expired(self, now: Optional[datetime] = None) -> int:
+        """Queue again running tasks whose lease has expired.
+
+        An expired lease means the worker process that claimed the task
+        stopped renewing it (crashed or was killed). Tasks still leased to
+        a live process, e.g. during a rolling restart, are left alone.
+        Running tasks without a lease predate leases and are requeued too.
+
+        Returns:
+            Number of tasks requeued
+        """
+        now = now or datetime.utcnow()
+        result = await self.session.execute(
+            update(BackgroundTaskModel)
+            .where(
+                BackgroundTaskModel.status == GenerationStatus.GENERATING.value,
+                or_(
+                    BackgroundTaskModel.lease_expires_at.is_(None),
+                    BackgroundTaskModel.lease_expires_at < now
+                )
+            )
+            .values(status=GenerationStatus.PENDING.value, claimed_by=None, lease_expires_at=None)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def release(self, owner: str) -> int:
+        """Queue again every task still running under ``owner`` (on shutdown).
+
+        Returns:
+            Number of tasks requeued
+        """
+        result = await self.session.execute(
+            update(BackgroundTaskModel)
+            .where(
+                BackgroundTaskModel.status == GenerationStatus.GENERATING.value,
+                BackgroundTaskModel.claimed_by == owner
+            )
+            .values(status=GenerationStatus.PENDING.value, claimed_by=None, lease_expires_at=None)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def _update(self, task_id: UUID, owner: str, **values) -> bool:
+        # Only the run holding the lease may record the outcome
+        result = await self.session.execute(
+            update(BackgroundTaskModel)
+            .where(
+                BackgroundTaskModel.id == str(task_id),
+                BackgroundTaskModel.claimed_by == owner
+            )
+            .values(**values)
+        )
+        await self.session.commit()
+        return result.rowcount > 0
+
+    def _to_entity(self, model: BackgroundTaskModel) -> BackgroundTask:
+        return BackgroundTask(
+            id=UUID(model.id),
+            user_id=model.user_id,
+            task_type=model.task_type,
+            payload=model.payload or {},
+            status=GenerationStatus(model.status),
+            result=model.result,
+            error=model.error,
+            attempts=model.attempts,
+            max_attempts=model.max_attempts,
+            run_after=model.run_after,
+            created_at=model.created_at,
+            started_at=model.started_at,
+            completed_at=model.completed_at,
+            claimed_by=model.claimed_by,
+            lease_expires_at=model.lease_expires_at
+        )
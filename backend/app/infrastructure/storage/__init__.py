@@ -1,5 +1,21 @@
 """Infrastructure storage adapters."""
 
 from .s3_storage_adapter import S3StorageAdapter
+from .async_storage import (
+    InMemoryStorage,
+    LocalAsyncStorage,
+    S3AsyncStorage,
+    close_storage,
+    get_storage,
+    init_storage,
+)
 
-__all__ = ["S3StorageAdapter"]
+__all__ = [
+    "S3StorageAdapter",
+    "S3AsyncStorage",
+    "LocalAsyncStorage",
+    "InMemoryStorage",
+    "init_storage",
+    "get_storage",
+    "close_storage",
+]
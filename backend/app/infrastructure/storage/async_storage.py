@@ -0,0 +1,215 @@
+"""Async storage backends for exports: S3, local disk and in-memory."""
+
+import asyncio
+import functools
+import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from app.core.config import get_settings
+from app.infrastructure.adapters.storage.storage_interface import AsyncStorageInterface
+from app.infrastructure.storage.s3_storage_adapter import (
+    LOCAL_STORAGE_PATH,
+    S3StorageAdapter,
+    local_download_url,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class S3AsyncStorage(AsyncStorageInterface):
+    """S3 backend running the blocking boto3 calls on a bounded thread pool.
+    
+    At most ``max_workers`` storage calls run at once (matching the boto3
+    client's connection pool); further calls wait in the pool's queue
+    without holding up the event loop.
+    """
+    
+    def __init__(self, adapter: S3StorageAdapter, max_workers: int):
+        self.adapter = adapter
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="storage-io")
+    
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+    
+    async def upload_file(
+        self,
+        file_content: bytes,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        return await self._run(self.adapter.upload_file, file_content, key, content_type)
+    
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        return await self._run(self.adapter.upload_fileobj, fileobj, key, content_type)
+    
+    async def generate_presigned_url(self, key: str, expiration: int = 3600) -> str:
+        return await self._run(self.adapter.generate_presigned_url, key, expiration)
+    
+    async def delete_file(self, key: str) -> None:
+        await self._run(self.adapter.delete_file, key)
+    
+    async def file_exists(self, key: str) -> bool:
+        return await self._run(self.adapter.file_exists, key)
+    
+    async def get_file_content(self, key: str) -> Optional[bytes]:
+        return await self._run(self.adapter.get_file_content, key)
+    
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        if self.adapter.s3_client is not None:
+            self.adapter.s3_client.close()
+
+
+class LocalAsyncStorage(AsyncStorageInterface):
+    """Local-disk backend; file reads and writes run on worker threads.
+    
+    Files live flat under ``root`` (``/`` in keys becomes ``_``) and are
+    served by the exports download endpoint.
+    """
+    
+    def __init__(self, root: Path = LOCAL_STORAGE_PATH):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, key: str) -> Path:
+        return self.root / key.replace('/', '_')
+    
+    def _write(self, key: str, write) -> str:
+        with open(self._path(key), 'wb') as f:
+            write(f)
+        return key
+    
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        return path.read_bytes() if path.exists() else None
+    
+    async def upload_file(
+        self,
+        file_content: bytes,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        await asyncio.to_thread(self._write, key, lambda f: f.write(file_content))
+        logger.info(f"✓ Saved {len(file_content)} bytes to local: {self._path(key)}")
+        return key
+    
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        await asyncio.to_thread(self._write, key, lambda f: shutil.copyfileobj(fileobj, f))
+        logger.info(f"✓ Streamed to local: {self._path(key)}")
+        return key
+    
+    async def generate_presigned_url(self, key: str, expiration: int = 3600) -> str:
+        return local_download_url(key, expiration)
+    
+    async def delete_file(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+    
+    async def file_exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._path(key).exists)
+    
+    async def get_file_content(self, key: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self._read, key)
+    
+    async def local_path(self, key: str) -> Optional[Path]:
+        """Path of a stored file, for streaming it from the download endpoint.
+        
+        Returns:
+            The file's path under ``root``, or None if no such file exists
+        """
+        path = self._path(key)
+        return path if await asyncio.to_thread(path.is_file) else None
+
+
+class InMemoryStorage(AsyncStorageInterface):
+    """Dictionary-backed storage for tests and local experiments."""
+    
+    def __init__(self):
+        self.files: Dict[str, Tuple[bytes, str]] = {}
+    
+    async def upload_file(
+        self,
+        file_content: bytes,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        self.files[key] = (bytes(file_content), content_type)
+        return key
+    
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        return await self.upload_file(fileobj.read(), key, content_type)
+    
+    async def generate_presigned_url(self, key: str, expiration: int = 3600) -> str:
+        expires_at = int((datetime.utcnow() + timedelta(seconds=expiration)).timestamp())
+        return f"memory://{key}?expires={expires_at}"
+    
+    async def delete_file(self, key: str) -> None:
+        self.files.pop(key, None)
+    
+    async def file_exists(self, key: str) -> bool:
+        return key in self.files
+    
+    async def get_file_content(self, key: str) -> Optional[bytes]:
+        stored = self.files.get(key)
+        return stored[0] if stored else None
+
+
+_storage: Optional[AsyncStorageInterface] = None
+
+
+def init_storage() -> AsyncStorageInterface:
+    """Create the shared storage backend once per process (idempotent).
+    
+    The S3 bucket is validated here. Without boto3 or credentials, or if
+    the client cannot be built or S3 refuses the bucket, exports are kept
+    on local disk instead; if S3 is merely unreachable it stays selected
+    and the bucket is validated on first use.
+    """
+    global _storage
+    if _storage is None:
+        settings = get_settings()
+        adapter = S3StorageAdapter(
+            bucket_name=settings.s3_bucket_name,
+            region=settings.s3_region,
+            access_key=settings.aws_access_key_id,
+            secret_key=settings.aws_secret_access_key,
+            max_pool_connections=settings.storage_io_workers
+        )
+        if adapter.use_s3:
+            _storage = S3AsyncStorage(adapter, max_workers=settings.storage_io_workers)
+        else:
+            _storage = LocalAsyncStorage(adapter.local_storage_path)
+    return _storage
+
+
+def get_storage() -> AsyncStorageInterface:
+    """Get the shared storage backend, creating it lazily outside the app lifespan."""
+    return _storage if _storage is not None else init_storage()
+
+
+def close_storage() -> None:
+    """Close the shared storage backend and drop it."""
+    global _storage
+    if _storage is not None:
+        _storage.close()
+    _storage = None
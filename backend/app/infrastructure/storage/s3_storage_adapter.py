@@ -1,8 +1,10 @@
 """S3 Storage Adapter - Full AWS S3 Implementation with local fallback."""
 
 import os
+import shutil
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from datetime import datetime, timedelta
 import hashlib
 import logging
@@ -10,8 +12,20 @@ import logging
 # Try to import boto3 for real S3
 try:
     import boto3
-    from botocore.exceptions import ClientError, NoCredentialsError
+    from botocore.config import Config
+    from botocore.exceptions import (
+        BotoCoreError,
+        ClientError,
+        ConnectionClosedError,
+        ConnectTimeoutError,
+        EndpointConnectionError,
+        ReadTimeoutError,
+    )
     BOTO3_AVAILABLE = True
+    # Failures after which the client is rebuilt and the bucket re-validated
+    CONNECTION_ERRORS = (EndpointConnectionError, ConnectionClosedError)
+    # Failures that only mean S3 is unreachable right now, not misconfigured
+    UNREACHABLE_ERRORS = CONNECTION_ERRORS + (ConnectTimeoutError, ReadTimeoutError)
 except ImportError:
     BOTO3_AVAILABLE = False
     print("Warning: boto3 not installed. Install with: pip install boto3")
@@ -19,6 +33,20 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Local fallback directory (backend/storage/exports), served by the download endpoint
+LOCAL_STORAGE_PATH = Path(__file__).parent.parent.parent.parent / "storage" / "exports"
+
+
+def local_download_url(key: str, expiration: int = 3600) -> str:
+    """Download endpoint URL for a locally stored file, with an expiring token."""
+    # Generate a token for security (simple hash-based), over the file name
+    # the download endpoint receives
+    filename = key.replace('/', '_')
+    expires_at = int((datetime.utcnow() + timedelta(seconds=expiration)).timestamp())
+    token = hashlib.md5(f"{filename}{expires_at}".encode()).hexdigest()[:16]
+    
+    return f"/api/v1/exports/download/{filename}?token={token}&expires={expires_at}"
+
 
 class S3StorageAdapter:
     """
@@ -31,7 +59,8 @@ class S3StorageAdapter:
         bucket_name: Optional[str] = None,
         region: Optional[str] = None,
         access_key: Optional[str] = None,
-        secret_key: Optional[str] = None
+        secret_key: Optional[str] = None,
+        max_pool_connections: int = 10
     ):
         """Initialize storage adapter.
         
@@ -40,54 +69,55 @@ class S3StorageAdapter:
             region: AWS region (defaults to env var S3_REGION)
             access_key: AWS access key (defaults to env var AWS_ACCESS_KEY_ID)
             secret_key: AWS secret key (defaults to env var AWS_SECRET_ACCESS_KEY)
+            max_pool_connections: HTTP connections the boto3 client keeps open
         """
         # Load from environment if not provided
         self.bucket_name = bucket_name or os.getenv('S3_BUCKET_NAME', 'jobwise-exports')
         self.region = region or os.getenv('S3_REGION', 'us-west-2')
         self.access_key = access_key or os.getenv('AWS_ACCESS_KEY_ID')
         self.secret_key = secret_key or os.getenv('AWS_SECRET_ACCESS_KEY')
+        self.max_pool_connections = max_pool_connections
         
-        # Determine if we can use S3
+        # Determine if we can use S3 (validated once here, not per request)
         self.use_s3 = False
         self.s3_client = None
+        self.local_storage_path = LOCAL_STORAGE_PATH
+        # Serializes client rebuilds and bucket checks across storage threads
+        self._client_lock = threading.Lock()
+        self._connect()
+    
+    def _connect(self) -> None:
+        """Create the boto3 client and validate (or create) the bucket.
+        
+        Falls back to local file storage when boto3 or credentials are
+        missing, the client cannot be built (e.g. an invalid region) or S3
+        rejects access to the bucket. If S3 merely cannot be reached
+        (connection error, timeout or 5xx at startup) S3 stays selected and
+        the bucket is validated on first use instead. Runs once, when the
+        adapter is created.
+        """
+        self.use_s3 = False
+        self.s3_client = None
+        self._bucket_ready = False
         
         if BOTO3_AVAILABLE and self.access_key and self.secret_key:
+            client = None
             try:
-                # Initialize S3 client with credentials
-                self.s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=self.access_key,
-                    aws_secret_access_key=self.secret_key,
-                    region_name=self.region
-                )
-                
-                # Test connection by checking if bucket exists or create it
-                try:
-                    self.s3_client.head_bucket(Bucket=self.bucket_name)
-                    logger.info(f"✓ Connected to S3 bucket: {self.bucket_name}")
+                client = self._create_client()
+                self._ensure_bucket(client)
+                self.use_s3 = True
+            except (ClientError, BotoCoreError) as e:
+                if client is not None and self._is_unreachable(e):
+                    logger.warning(f"S3 unreachable at startup ({e}); validating bucket on first use")
                     self.use_s3 = True
-                except ClientError as e:
-                    error_code = e.response['Error']['Code']
-                    if error_code == '404':
-                        # Bucket doesn't exist, create it
-                        logger.info(f"Creating S3 bucket: {self.bucket_name}")
-                        if self.region == 'us-east-1':
-                            self.s3_client.create_bucket(Bucket=self.bucket_name)
-                        else:
-                            self.s3_client.create_bucket(
-                                Bucket=self.bucket_name,
-                                CreateBucketConfiguration={'LocationConstraint': self.region}
-                            )
-                        logger.info(f"✓ S3 bucket created: {self.bucket_name}")
-                        self.use_s3 = True
-                    else:
-                        logger.error(f"S3 bucket access error: {e}")
-                        raise
-                        
-            except (ClientError, NoCredentialsError) as e:
-                logger.warning(f"Failed to initialize S3: {e}")
-                logger.warning("Falling back to local file storage")
-                self.use_s3 = False
+                else:
+                    # Missing credentials, bad region, refused bucket access...
+                    logger.warning(f"Failed to initialize S3: {e}")
+                    logger.warning("Falling back to local file storage")
+            if self.use_s3:
+                self.s3_client = client
+            elif client is not None:
+                client.close()
         else:
             if not BOTO3_AVAILABLE:
                 logger.warning("boto3 not available. Using local file storage.")
@@ -96,10 +126,96 @@ class S3StorageAdapter:
         
         # Setup local storage if S3 not available
         if not self.use_s3:
-            self.local_storage_path = Path(__file__).parent.parent.parent.parent / "storage" / "exports"
             self.local_storage_path.mkdir(parents=True, exist_ok=True)
             logger.info(f"Using local file storage at: {self.local_storage_path}")
     
+    @staticmethod
+    def _is_unreachable(error: Exception) -> bool:
+        """Whether ``error`` means S3 is unreachable right now rather than misconfigured."""
+        if isinstance(error, ClientError):
+            return error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500
+        return isinstance(error, UNREACHABLE_ERRORS)
+    
+    def _ensure_bucket(self, client) -> None:
+        """Check the bucket exists, creating it if missing."""
+        # Test connection by checking if bucket exists or create it
+        try:
+            client.head_bucket(Bucket=self.bucket_name)
+            logger.info(f"✓ Connected to S3 bucket: {self.bucket_name}")
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code != '404':
+                logger.error(f"S3 bucket access error: {e}")
+                raise
+            # Bucket doesn't exist, create it
+            logger.info(f"Creating S3 bucket: {self.bucket_name}")
+            if self.region == 'us-east-1':
+                client.create_bucket(Bucket=self.bucket_name)
+            else:
+                client.create_bucket(
+                    Bucket=self.bucket_name,
+                    CreateBucketConfiguration={'LocationConstraint': self.region}
+                )
+            logger.info(f"✓ S3 bucket created: {self.bucket_name}")
+        self._bucket_ready = True
+    
+    def _create_client(self):
+        """Initialize S3 client with credentials."""
+        return boto3.client(
+            's3',
+            aws_access_key_id=self.access_key,
+            aws_secret_access_key=self.secret_key,
+            region_name=self.region,
+            config=Config(max_pool_connections=self.max_pool_connections)
+        )
+    
+    def _s3_call(self, operation: str, *args, **kwargs):
+        """Call a boto3 client method, reconnecting once if the connection failed.
+        
+        The reconnect rebuilds the client and re-validates the bucket; if
+        that fails too the error propagates and S3 stays selected, so the
+        next call tries again rather than silently switching to local files.
+        Safe to call from several threads at once.
+        """
+        client = self.s3_client
+        try:
+            if not self._bucket_ready:
+                # S3 was unreachable when the adapter was created
+                client = self._validated_client()
+            return getattr(client, operation)(*args, **kwargs)
+        except CONNECTION_ERRORS as e:
+            logger.warning(f"S3 {operation} failed ({e}); reconnecting")
+            client = self._reconnect(client)
+            if "Fileobj" in kwargs:
+                # Resend a streamed upload from the start
+                kwargs["Fileobj"].seek(0)
+            return getattr(client, operation)(*args, **kwargs)
+    
+    def _validated_client(self):
+        """Return the current client, validating the bucket first if still needed."""
+        with self._client_lock:
+            if not self._bucket_ready:
+                self._ensure_bucket(self.s3_client)
+            return self.s3_client
+    
+    def _reconnect(self, failed):
+        """Replace ``failed`` with a new, validated client and return the current one.
+        
+        Threads that hit the same broken client share one rebuild: only the
+        first replaces it, the rest pick up its replacement.
+        """
+        with self._client_lock:
+            if self.s3_client is failed:
+                client = self._create_client()
+                try:
+                    self._ensure_bucket(client)
+                except Exception:
+                    client.close()
+                    raise
+                self.s3_client = client
+                failed.close()
+            return self.s3_client
+    
     def upload_file(
         self,
         file_content: bytes,
@@ -120,7 +236,8 @@ class S3StorageAdapter:
         if self.use_s3:
             try:
                 # Upload to S3
-                self.s3_client.put_object(
+                self._s3_call(
+                    "put_object",
                     Bucket=self.bucket_name,
                     Key=key,
                     Body=file_content,
@@ -142,6 +259,49 @@ class S3StorageAdapter:
             logger.info(f"✓ Saved {len(file_content)} bytes to local: {file_path}")
             return key
     
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        key: str,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        """
+        Stream a file object to storage without reading it into memory.
+        
+        S3 switches to a multipart upload for large files.
+        
+        Args:
+            fileobj: Readable binary file object, positioned at the start
+            key: Storage key (path)
+            content_type: MIME type
+        
+        Returns:
+            Storage key
+        """
+        if self.use_s3:
+            try:
+                self._s3_call(
+                    "upload_fileobj",
+                    Fileobj=fileobj,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    ExtraArgs={'ContentType': content_type}
+                )
+                logger.info(f"✓ Streamed upload to S3: s3://{self.bucket_name}/{key}")
+                return key
+            except ClientError as e:
+                logger.error(f"S3 upload failed: {e}")
+                raise RuntimeError(f"Failed to upload to S3: {e}")
+        else:
+            file_path = self.local_storage_path / key.replace('/', '_')
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(file_path, 'wb') as f:
+                shutil.copyfileobj(fileobj, f)
+            
+            logger.info(f"✓ Streamed to local: {file_path}")
+            return key
+    
     def generate_presigned_url(
         self,
         key: str,
@@ -160,7 +320,8 @@ class S3StorageAdapter:
         if self.use_s3:
             try:
                 # Generate presigned URL for S3
-                url = self.s3_client.generate_presigned_url(
+                url = self._s3_call(
+                    "generate_presigned_url",
                     'get_object',
                     Params={
                         'Bucket': self.bucket_name,
@@ -174,14 +335,7 @@ class S3StorageAdapter:
                 logger.error(f"Failed to generate presigned URL: {e}")
                 raise RuntimeError(f"Failed to generate download URL: {e}")
         else:
-            # Return local file path URL
-            file_path = self.local_storage_path / key.replace('/', '_')
-            
-            # Generate a token for security (simple hash-based)
-            expires_at = int((datetime.utcnow() + timedelta(seconds=expiration)).timestamp())
-            token = hashlib.md5(f"{key}{expires_at}".encode()).hexdigest()[:16]
-            
-            return f"/api/v1/exports/download/{key.replace('/', '_')}?token={token}&expires={expires_at}"
+            return local_download_url(key, expiration)
     
     def delete_file(self, key: str) -> None:
         """
@@ -192,7 +346,8 @@ class S3StorageAdapter:
         """
         if self.use_s3:
             try:
-                self.s3_client.delete_object(
+                self._s3_call(
+                    "delete_object",
                     Bucket=self.bucket_name,
                     Key=key
                 )
@@ -218,7 +373,8 @@ class S3StorageAdapter:
         """
         if self.use_s3:
             try:
-                self.s3_client.head_object(
+                self._s3_call(
+                    "head_object",
                     Bucket=self.bucket_name,
                     Key=key
                 )
@@ -241,7 +397,8 @@ class S3StorageAdapter:
         """
         if self.use_s3:
             try:
-                response = self.s3_client.head_object(
+                response = self._s3_call(
+                    "head_object",
                     Bucket=self.bucket_name,
                     Key=key
                 )
@@ -266,7 +423,8 @@ class S3StorageAdapter:
         """
         if self.use_s3:
             try:
-                response = self.s3_client.get_object(
+                response = self._s3_call(
+                    "get_object",
                     Bucket=self.bucket_name,
                     Key=key
                 )
@@ -282,3 +440,4 @@ class S3StorageAdapter:
         return None
         # return response['ContentLength']
         return 0
+
@@ -8,14 +8,37 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import get_settings
 from app.core.tracing import setup_tracing
-from app.infrastructure.database.connection import create_engine
-from app.infrastructure.database.models import Base
+from app.infrastructure.database.connection import (
+    init_engine,
+    get_writer_engine,
+    dispose_engine,
+    check_database_health,
+    get_pool_status,
+)
+from app.infrastructure.database.migrations import ensure_schema_current
+from app.infrastructure.adapters.llm.llm_client import (
+    LLMRateLimitError,
+    init_llm_adapter,
+    close_llm_adapter,
+    get_llm_status,
+)
+from app.application.services.generation_service import flush_ats_scoring
+from app.application.services.job_service import shutdown_job_parse_pool
+from app.application.services.render_pool import (
+    get_render_executor,
+    init_render_executor,
+    shutdown_render_executor,
+)
+from app.application.services.keyword_taxonomy import reload_keyword_taxonomy
+from app.application.services.task_queue import init_task_queue, shutdown_task_queue
+from app.infrastructure.storage.async_storage import close_storage, init_storage
 from app.presentation.api.auth import router as auth_router
 from app.presentation.api.profile import router as profile_router
 from app.presentation.api.job import router as job_router
 from app.presentation.api.v1.samples import router as samples_router
 from app.presentation.api.generation import router as generation_router
 from app.presentation.api.export import router as export_router
+from app.presentation.api.tasks import router as tasks_router
 
 settings = get_settings()
 
@@ -29,19 +52,32 @@ async def lifespan(app: FastAPI):
     """Handle application startup and shutdown events."""
     # Startup
     try:
-        engine = create_engine()
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        await engine.dispose()
-        logger.info("Database tables created successfully")
+        init_engine()
+        schema_version = await ensure_schema_current(
+            get_writer_engine(), auto_migrate=settings.db_auto_migrate
+        )
+        logger.info(f"Database schema at version {schema_version}")
     except Exception as e:
-        logger.error(f"Failed to create database tables: {e}")
+        logger.error(f"Database schema check failed: {e}")
         raise
 
+    init_llm_adapter()
+    reload_keyword_taxonomy()
+    await init_task_queue()
+    init_render_executor()
+    init_storage()
+
     yield
 
     # Shutdown
     logger.info("Shutting down JobWise Backend...")
+    await shutdown_task_queue()
+    await flush_ats_scoring()
+    await close_llm_adapter()
+    shutdown_job_parse_pool()
+    shutdown_render_executor()
+    close_storage()
+    await dispose_engine()
 
 
 def create_application() -> FastAPI:
@@ -67,7 +103,15 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Exception handler
+    # Exception handlers
+    @app.exception_handler(LLMRateLimitError)
+    async def llm_rate_limit_handler(request: Request, exc: LLMRateLimitError):
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after_seconds)}
+        )
+
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
         logger.error(f"Global exception: {exc}", exc_info=True)
@@ -83,6 +127,7 @@ def create_application() -> FastAPI:
     app.include_router(samples_router, prefix="/api/v1")
     app.include_router(generation_router)  # AI Generation API
     app.include_router(export_router)  # Export API (PDF/DOCX/ZIP)
+    app.include_router(tasks_router)  # Background tasks (202 + polling)
 
     # Setup OpenTelemetry tracing
     setup_tracing(app, service_name="jobwise-backend", service_version="1.0.0")
@@ -92,6 +137,25 @@ def create_application() -> FastAPI:
         """Health check endpoint."""
         return {"status": "healthy"}
 
+    @app.get("/health/database")
+    async def database_health_check():
+        """Database connectivity and connection pool saturation metrics."""
+        healthy = await check_database_health()
+        return {
+            "status": "healthy" if healthy else "unhealthy",
+            "pool": get_pool_status()
+        }
+
+    @app.get("/health/llm")
+    async def llm_health_check():
+        """Shared LLM client status with per-model queue depth and wait times."""
+        return get_llm_status()
+
+    @app.get("/health/exports")
+    async def exports_health_check():
+        """Export render pool size, queue depth and render counters."""
+        return get_render_executor().snapshot()
+
     return app
 
 
@@ -6,7 +6,6 @@ Endpoints for document export (PDF/DOCX/ZIP).
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import FileResponse
-from pathlib import Path
 import hashlib
 from datetime import datetime
 
@@ -20,17 +19,23 @@ from app.presentation.schemas.export import (
     TemplateInfo,
     TemplateListResponse,
     ExportedFileListResponse,
+    ExportSummaryListResponse,
+    ExportSummaryResponse,
     JobExportsResponse
 )
 from app.application.services.export_service import ExportService
-from app.application.services.export_renderer import ExportRenderer
-from app.infrastructure.storage.s3_storage_adapter import S3StorageAdapter
+from app.application.services.export_renderer import get_export_renderer
+from app.application.services.render_pool import (
+    RenderQueueFullError,
+    RenderTimeoutError,
+    get_render_executor,
+)
+from app.infrastructure.storage.async_storage import LocalAsyncStorage, get_storage
 from app.infrastructure.repositories.generation_repository import GenerationRepository
 from app.infrastructure.repositories.export_repository import ExportRepository
 from app.infrastructure.repositories.job_repository import JobRepository
 from app.infrastructure.database.connection import get_session
 from app.core.dependencies import get_current_user
-from app.core.config import get_settings
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -40,27 +45,31 @@ router = APIRouter(prefix="/api/v1/exports", tags=["exports"])
 # Dependency injection
 def get_export_service(session: AsyncSession = Depends(get_session)) -> ExportService:
     """Get export service instance."""
-    settings = get_settings()
-    renderer = ExportRenderer()
-    s3_adapter = S3StorageAdapter(
-        bucket_name=settings.s3_bucket_name,
-        region=settings.s3_region,
-        access_key=settings.aws_access_key_id,
-        secret_key=settings.aws_secret_access_key
-    )
     generation_repo = GenerationRepository(session)
     export_repo = ExportRepository(session)
     job_repo = JobRepository(session)
     
     return ExportService(
-        export_renderer=renderer,
-        s3_adapter=s3_adapter,
+        export_renderer=get_export_renderer(),
+        storage=get_storage(),
         generation_repository=generation_repo,
         export_repository=export_repo,
-        job_repository=job_repo
+        job_repository=job_repo,
+        render_executor=get_render_executor()
     )
 
 
+def _render_unavailable(error: Exception) -> HTTPException:
+    """503 while the render queue is full, 504 when a render times out."""
+    if isinstance(error, RenderQueueFullError):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(error),
+            headers={"Retry-After": "5"}
+        )
+    return HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(error))
+
+
 @router.post("/pdf", response_model=ExportResponse, status_code=status.HTTP_201_CREATED)
 async def export_to_pdf(
     request: ExportRequest,
@@ -112,6 +121,8 @@ async def export_to_pdf(
             metadata=export.export_metadata
         )
     
+    except (RenderQueueFullError, RenderTimeoutError) as e:
+        raise _render_unavailable(e)
     except ValueError as e:
         logger.error(f"ValueError in PDF export: {str(e)}")
         raise HTTPException(
@@ -171,6 +182,8 @@ async def export_to_docx(
             metadata=export.export_metadata
         )
     
+    except (RenderQueueFullError, RenderTimeoutError) as e:
+        raise _render_unavailable(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -224,6 +237,8 @@ async def batch_export(
             metadata=export.export_metadata
         )
     
+    except (RenderQueueFullError, RenderTimeoutError) as e:
+        raise _render_unavailable(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -450,6 +465,62 @@ async def list_exports(
         )
 
 
+@router.get("/files/summary", response_model=ExportSummaryListResponse)
+async def list_export_summaries(
+    format: Optional[ExportFormat] = None,
+    job_id: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    current_user: int = Depends(get_current_user),
+    export_service: ExportService = Depends(get_export_service)
+):
+    """
+    List user's exported files for list screens.
+    
+    Same filters and pagination as `GET /files`, but skips export options
+    and local cache fields.
+    """
+    try:
+        summaries = await export_service.list_export_summaries(
+            user_id=current_user,
+            format=format,
+            job_id=job_id,
+            limit=limit,
+            offset=offset
+        )
+        
+        summary_responses = [
+            ExportSummaryResponse(
+                id=summary.id,
+                generation_id=summary.generation_id,
+                job_id=summary.job_id,
+                format=summary.format,
+                template=summary.template,
+                filename=summary.filename,
+                file_size_bytes=summary.file_size_bytes,
+                page_count=summary.page_count,
+                download_url=summary.download_url,
+                expires_at=summary.expires_at,
+                created_at=summary.created_at,
+                metadata=summary.export_metadata
+            )
+            for summary in summaries
+        ]
+        
+        return ExportSummaryListResponse(
+            exports=summary_responses,
+            total=len(summary_responses),
+            limit=limit,
+            offset=offset
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to list exports: {str(e)}"
+        )
+
+
 @router.get("/files/{export_id}/download", response_model=ExportResponse)
 async def get_download_url(
     export_id: str,
@@ -628,9 +699,12 @@ async def download_file(
         )
     
     # Get file from local storage
-    storage_path = Path(__file__).parent.parent.parent.parent / "storage" / "exports" / filename
+    storage = get_storage()
+    storage_path = None
+    if isinstance(storage, LocalAsyncStorage):
+        storage_path = await storage.local_path(filename)
     
-    if not storage_path.exists():
+    if storage_path is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="File not found"
@@ -1,11 +1,16 @@
 """AI Generation API router."""
 
+import json
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional
 from uuid import UUID
 
 from app.core.dependencies import get_db_session, get_current_user
 from app.domain.enums.document_type import DocumentType
+from app.domain.enums.generation_status import GenerationStatus
 from app.presentation.schemas.generation import (
     EnhanceProfileRequest,
     EnhanceProfileResponse,
@@ -13,10 +18,21 @@ from app.presentation.schemas.generation import (
     RankingResponse,
     GenerateResumeRequest,
     GenerateCoverLetterRequest,
+    BatchGenerateRequest,
+    BatchJobResultResponse,
+    BatchGenerationSummaryResponse,
     GenerationResponse,
-    GenerationHistoryResponse
+    GenerationHistoryResponse,
+    GenerationSummaryResponse,
+    GenerationSummaryHistoryResponse,
+    AtsScoreResponse
+)
+from app.core.config import get_settings
+from app.infrastructure.adapters.llm.llm_client import (
+    LLMQueueTimeoutError,
+    LLMRateLimitError,
+    get_llm_adapter
 )
-from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
 from app.infrastructure.repositories.sample_repository import SampleRepository
 from app.infrastructure.repositories.writing_style_repository import WritingStyleRepository
 from app.infrastructure.repositories.ranking_repository import RankingRepository
@@ -26,16 +42,43 @@ from app.infrastructure.repositories.job_repository import JobRepository
 from app.application.services.style_extraction_service import StyleExtractionService
 from app.application.services.enhancement_service import EnhancementService
 from app.application.services.ranking_service import RankingService
-from app.application.services.generation_service import GenerationService
-from app.core.config import get_settings
+from app.application.services.generation_service import (
+    BatchGenerationContext,
+    BatchJobResult,
+    CoverLetterContext,
+    GenerationService,
+    wait_for_ats_score
+)
+from app.domain.entities.generation import Generation
 
 router = APIRouter(prefix="/api/v1", tags=["AI Generation"])
+logger = logging.getLogger(__name__)
 
 
-def get_llm_adapter():
-    """Get LLM adapter instance."""
-    settings = get_settings()
-    return GroqAdapter(api_key=settings.groq_api_key)
+def _rate_limited(error: LLMRateLimitError) -> HTTPException:
+    """429 for a caller whose LLM token budget is used up."""
+    return HTTPException(
+        status_code=429,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after_seconds)}
+    )
+
+
+def _to_generation_response(generation: Generation) -> GenerationResponse:
+    """API representation of a generation, including its structured content."""
+    return GenerationResponse(
+        generation_id=generation.id,
+        job_id=generation.job_id,
+        document_type=generation.document_type.value,
+        status=generation.status.value,
+        content_text=generation.content_text,
+        content_structured=generation.content_structured,
+        ats_score=generation.ats_score,
+        ats_feedback=generation.ats_feedback,
+        ats_status=generation.ats_status.value if generation.ats_status else None,
+        llm_metadata={"raw": generation.llm_metadata} if generation.llm_metadata else None,
+        created_at=generation.created_at
+    )
 
 
 # Profile Enhancement Endpoint
@@ -64,6 +107,10 @@ async def enhance_profile(
         return EnhanceProfileResponse(**result)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except LLMRateLimitError as e:
+        raise _rate_limited(e)
+    except LLMQueueTimeoutError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Enhancement failed: {str(e)}")
 
@@ -87,7 +134,9 @@ async def create_ranking(
         ranking = await ranking_service.create_ranking(
             user_id=current_user,
             job_id=request.job_id,
-            custom_prompt=request.custom_prompt
+            custom_prompt=request.custom_prompt,
+            mode=request.mode,
+            force=request.force
         )
         
         return RankingResponse(
@@ -105,6 +154,10 @@ async def create_ranking(
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except LLMRateLimitError as e:
+        raise _rate_limited(e)
+    except LLMQueueTimeoutError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ranking failed: {str(e)}")
 
@@ -171,22 +224,17 @@ async def generate_resume(
             max_experiences=request.max_experiences,
             max_projects=request.max_projects,
             include_summary=request.include_summary,
-            custom_prompt=request.custom_prompt
+            custom_prompt=request.custom_prompt,
+            defer_ats=request.defer_ats_score
         )
         
-        return GenerationResponse(
-            generation_id=generation.id,
-            job_id=generation.job_id,
-            document_type=generation.document_type.value,
-            status=generation.status.value,
-            content_text=generation.content_text,
-            ats_score=generation.ats_score,
-            ats_feedback=generation.ats_feedback,
-            llm_metadata={"raw": generation.llm_metadata} if generation.llm_metadata else None,
-            created_at=generation.created_at
-        )
+        return _to_generation_response(generation)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except LLMRateLimitError as e:
+        raise _rate_limited(e)
+    except LLMQueueTimeoutError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Resume generation failed: {str(e)}")
 
@@ -219,25 +267,192 @@ async def generate_cover_letter(
             company_name=request.company_name,
             hiring_manager_name=request.hiring_manager_name,
             max_paragraphs=request.max_paragraphs,
-            custom_prompt=request.custom_prompt
+            custom_prompt=request.custom_prompt,
+            defer_ats=request.defer_ats_score
         )
         
-        return GenerationResponse(
-            generation_id=generation.id,
-            job_id=generation.job_id,
-            document_type=generation.document_type.value,
-            status=generation.status.value,
-            content_text=generation.content_text,
-            content_structured=generation.content_structured,
-            ats_score=generation.ats_score,
-            ats_feedback=generation.ats_feedback,
-            llm_metadata={"raw": generation.llm_metadata} if generation.llm_metadata else None,
-            created_at=generation.created_at
+        return _to_generation_response(generation)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except LLMRateLimitError as e:
+        raise _rate_limited(e)
+    except LLMQueueTimeoutError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Cover letter generation failed: {str(e)}")
+
+
+def _sse_event(event: str, data: str) -> str:
+    """Format one Server-Sent Event frame."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _cover_letter_events(
+    generation_service: GenerationService,
+    context: CoverLetterContext,
+    defer_ats: bool = False
+) -> AsyncIterator[str]:
+    """Relay streamed cover letter tokens as SSE, ending with the saved generation."""
+    try:
+        async for item in generation_service.stream_cover_letter(context, defer_ats=defer_ats):
+            if isinstance(item, Generation):
+                yield _sse_event("complete", _to_generation_response(item).model_dump_json())
+            else:
+                yield _sse_event("token", json.dumps({"text": item}))
+    except Exception as e:
+        # Headers are already sent, so report failures in-band
+        logger.error(f"Cover letter stream failed: {e}")
+        yield _sse_event("error", json.dumps({"detail": f"Cover letter generation failed: {str(e)}"}))
+
+
+@router.post("/generations/cover-letter/stream")
+async def stream_cover_letter(
+    request: GenerateCoverLetterRequest,
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """
+    Generate a cover letter, streaming tokens as Server-Sent Events.
+    
+    Events:
+    - **token**: `{"text": "..."}` for each chunk of generated text
+    - **complete**: the saved generation (same shape as `POST /generations/cover-letter`)
+    - **error**: `{"detail": "..."}` if generation fails mid-stream
+    
+    Missing profile or job is reported as a normal 404 before the stream opens.
+    """
+    llm = get_llm_adapter()
+    generation_repo = GenerationRepository(session)
+    profile_repo = ProfileRepository(session)
+    job_repo = JobRepository(session)
+    ranking_repo = RankingRepository(session)
+    sample_repo = SampleRepository(session)
+    style_repo = WritingStyleRepository(session)
+    
+    ranking_service = RankingService(llm, ranking_repo, profile_repo, job_repo)
+    style_service = StyleExtractionService(llm, sample_repo, style_repo)
+    generation_service = GenerationService(
+        llm, generation_repo, profile_repo, job_repo, ranking_service, style_service
+    )
+    
+    try:
+        context = await generation_service.prepare_cover_letter(
+            user_id=current_user,
+            job_id=request.job_id,
+            company_name=request.company_name,
+            hiring_manager_name=request.hiring_manager_name,
+            max_paragraphs=request.max_paragraphs
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except LLMRateLimitError as e:
+        raise _rate_limited(e)
+    except LLMQueueTimeoutError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Cover letter generation failed: {str(e)}")
+    
+    return StreamingResponse(
+        _cover_letter_events(generation_service, context, request.defer_ats_score),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _batch_events(
+    generation_service: GenerationService,
+    context: BatchGenerationContext,
+    request: BatchGenerateRequest
+) -> AsyncIterator[str]:
+    """Relay per-job batch results as SSE, ending with the saved summary."""
+    try:
+        async for item in generation_service.stream_batch(
+            context,
+            max_experiences=request.max_experiences,
+            max_projects=request.max_projects,
+            include_summary=request.include_summary,
+            max_paragraphs=request.max_paragraphs,
+            defer_ats=request.defer_ats_score
+        ):
+            if isinstance(item, BatchJobResult):
+                response = BatchJobResultResponse(
+                    job_id=item.job_id,
+                    success=item.error is None,
+                    error=item.error,
+                    generations=[_to_generation_response(generation) for generation in item.generations]
+                )
+                yield _sse_event("job", response.model_dump_json())
+            else:
+                summary = BatchGenerationSummaryResponse(
+                    total_jobs=item.total_jobs,
+                    succeeded=item.succeeded,
+                    failed=item.failed,
+                    generation_ids=item.generation_ids
+                )
+                yield _sse_event("complete", summary.model_dump_json())
+    except Exception as e:
+        # Headers are already sent, so report failures in-band
+        logger.error(f"Batch generation stream failed: {e}")
+        yield _sse_event("error", json.dumps({"detail": f"Batch generation failed: {str(e)}"}))
+
+
+@router.post("/generations/batch")
+async def generate_batch(
+    request: BatchGenerateRequest,
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """
+    Generate resumes and/or cover letters for several jobs, streamed as Server-Sent Events.
+    
+    The profile and writing style are loaded once; jobs are ranked and
+    generated concurrently and reported in the order they finish.
+    
+    Events:
+    - **job**: `{"job_id", "success", "error", "generations": [...]}` per job
+    - **complete**: totals and generation IDs, sent once every generation is saved
+    - **error**: `{"detail": "..."}` if the batch fails mid-stream (nothing is saved)
+    
+    A missing profile is a 404 before the stream opens; a missing job only fails its own entry.
+    """
+    max_jobs = get_settings().batch_generation_max_jobs
+    if len(request.job_ids) > max_jobs:
+        raise HTTPException(status_code=422, detail=f"At most {max_jobs} jobs per batch")
+    
+    llm = get_llm_adapter()
+    generation_repo = GenerationRepository(session)
+    profile_repo = ProfileRepository(session)
+    job_repo = JobRepository(session)
+    ranking_repo = RankingRepository(session)
+    sample_repo = SampleRepository(session)
+    style_repo = WritingStyleRepository(session)
+    
+    ranking_service = RankingService(llm, ranking_repo, profile_repo, job_repo)
+    style_service = StyleExtractionService(llm, sample_repo, style_repo)
+    generation_service = GenerationService(
+        llm, generation_repo, profile_repo, job_repo, ranking_service, style_service
+    )
+    
+    try:
+        context = await generation_service.prepare_batch(
+            user_id=current_user,
+            job_ids=request.job_ids,
+            document_types=request.document_types
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except LLMRateLimitError as e:
+        raise _rate_limited(e)
+    except LLMQueueTimeoutError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch generation failed: {str(e)}")
+    
+    return StreamingResponse(
+        _batch_events(generation_service, context, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/generations/history", response_model=GenerationHistoryResponse)
@@ -274,23 +489,52 @@ async def get_generation_history(
         offset=offset
     )
     
+    response_items = [_to_generation_response(gen) for gen in generations]
+    
+    return GenerationHistoryResponse(
+        generations=response_items,
+        total=len(response_items),
+        limit=limit,
+        offset=offset
+    )
+
+
+@router.get("/generations/history/summary", response_model=GenerationSummaryHistoryResponse)
+async def get_generation_history_summary(
+    document_type: Optional[str] = Query(None, description="Filter by resume/cover_letter"),
+    job_id: Optional[UUID] = Query(None, description="Filter by job"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """Get lightweight generation history (no content) for list screens."""
+    generation_repo = GenerationRepository(session)
+    
+    doc_type = DocumentType(document_type) if document_type else None
+    
+    summaries = await generation_repo.list_summaries_by_user(
+        user_id=current_user,
+        document_type=doc_type,
+        job_id=job_id,
+        limit=limit,
+        offset=offset
+    )
+    
     response_items = [
-        GenerationResponse(
-            generation_id=gen.id,
-            job_id=gen.job_id,
-            document_type=gen.document_type.value,
-            status=gen.status.value,
-            content_text=gen.content_text,
-            content_structured=gen.content_structured,
-            ats_score=gen.ats_score,
-            ats_feedback=gen.ats_feedback,
-            llm_metadata={"raw": gen.llm_metadata} if gen.llm_metadata else None,
-            created_at=gen.created_at
+        GenerationSummaryResponse(
+            generation_id=summary.id,
+            job_id=summary.job_id,
+            document_type=summary.document_type.value,
+            status=summary.status.value,
+            ats_score=summary.ats_score,
+            ats_status=summary.ats_status.value if summary.ats_status else None,
+            created_at=summary.created_at
         )
-        for gen in generations
+        for summary in summaries
     ]
     
-    return GenerationHistoryResponse(
+    return GenerationSummaryHistoryResponse(
         generations=response_items,
         total=len(response_items),
         limit=limit,
@@ -298,6 +542,55 @@ async def get_generation_history(
     )
 
 
+@router.get("/generations/{generation_id}", response_model=GenerationResponse)
+async def get_generation(
+    generation_id: UUID,
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """Get a single generation with its full content."""
+    generation_repo = GenerationRepository(session)
+    
+    generation = await generation_repo.get_by_id(generation_id)
+    if not generation or generation.user_id != current_user:
+        raise HTTPException(status_code=404, detail="Generation not found")
+    
+    return _to_generation_response(generation)
+
+
+@router.get("/generations/{generation_id}/ats", response_model=AtsScoreResponse)
+async def get_generation_ats_score(
+    generation_id: UUID,
+    wait: float = Query(0, ge=0, le=30, description="Seconds to wait for a pending score"),
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """
+    Get the ATS score of a generation created with `defer_ats_score`.
+    
+    While `ats_status` is `pending`, poll this endpoint, or pass `wait` to
+    hold the request open until the score is ready (long poll).
+    """
+    generation_repo = GenerationRepository(session)
+    
+    generation = await generation_repo.get_by_id(generation_id)
+    if not generation or generation.user_id != current_user:
+        raise HTTPException(status_code=404, detail="Generation not found")
+    
+    if generation.ats_status == GenerationStatus.PENDING and wait > 0:
+        if await wait_for_ats_score(generation_id, wait):
+            # End the read transaction so the re-read sees the background write
+            await session.rollback()
+            generation = await generation_repo.get_by_id(generation_id) or generation
+    
+    return AtsScoreResponse(
+        generation_id=generation.id,
+        ats_status=generation.ats_status.value if generation.ats_status else None,
+        ats_score=generation.ats_score,
+        ats_feedback=generation.ats_feedback
+    )
+
+
 @router.delete("/generations/{generation_id}", status_code=204)
 async def delete_generation(
     generation_id: UUID,
@@ -4,9 +4,10 @@ from typing import Annotated, List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 from pydantic import BaseModel, Field
 
-from app.application.services.job_service import JobService
+from app.application.services.job_service import JobService, encode_job_cursor
+from app.core.config import get_settings
 from app.core.dependencies import get_current_user, get_job_service
-from app.domain.entities.job import Job
+from app.domain.entities.job import Job, JobSummary
 
 
 router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
@@ -38,6 +39,26 @@ class JobCreateStructured(BaseModel):
     status: Optional[str] = Field(default="active", pattern="^(active|archived|draft)$", description="Job status")
 
 
+class JobBulkImportRequest(BaseModel):
+    """Request model for importing several jobs at once."""
+    jobs: List[Union[JobCreateFromText, JobCreateStructured]] = Field(..., min_length=1, description="Raw texts and/or structured jobs")
+
+
+class JobImportItemResult(BaseModel):
+    """Outcome of one posting in a bulk import."""
+    index: int = Field(..., description="Position of the posting in the request")
+    success: bool
+    job: Optional[Job] = None
+    error: Optional[str] = None
+
+
+class JobBulkImportResponse(BaseModel):
+    """Response model for bulk job import."""
+    results: List[JobImportItemResult]
+    created: int
+    failed: int
+
+
 class JobUpdateRequest(BaseModel):
     """Request model for updating job."""
     title: Optional[str] = Field(None, min_length=1, max_length=200, description="Job title")
@@ -61,6 +82,7 @@ class PaginationMeta(BaseModel):
     offset: int
     total: int
     has_more: bool = Field(alias="hasMore")
+    next_cursor: Optional[str] = Field(default=None, alias="nextCursor")
     
     class Config:
         populate_by_name = True
@@ -73,6 +95,13 @@ class JobListResponse(BaseModel):
     pagination: PaginationMeta
 
 
+class JobSummaryListResponse(BaseModel):
+    """Response model for lightweight job lists."""
+    jobs: List[JobSummary]
+    total: int
+    pagination: PaginationMeta
+
+
 class BrowseJobListResponse(BaseModel):
     """Response model for browse jobs."""
     jobs: List[Job]
@@ -157,6 +186,58 @@ async def create_job(
         )
 
 
+@router.post("/bulk", response_model=JobBulkImportResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_import_jobs(
+    request: JobBulkImportRequest,
+    service: JobService = Depends(get_job_service),
+    user_id: int = Depends(get_current_user)
+) -> JobBulkImportResponse:
+    """
+    Import several job postings in one request.
+    
+    Raw texts are parsed in parallel and all valid jobs are saved in one
+    batched insert. A posting that cannot be parsed or validated is reported
+    in its result entry without failing the rest of the batch.
+    
+    Raises:
+    - **422 Unprocessable Entity**: Malformed request or too many postings
+    - **500 Internal Server Error**: Jobs could not be saved (none were)
+    """
+    max_items = get_settings().job_bulk_import_max_items
+    if len(request.jobs) > max_items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {max_items} jobs can be imported at once"
+        )
+    
+    items = [
+        item.raw_text if isinstance(item, JobCreateFromText) else item.model_dump(exclude_none=True)
+        for item in request.jobs
+    ]
+    try:
+        results = await service.bulk_import(user_id=user_id, items=items)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to import jobs: {str(e)}"
+        )
+    
+    created = sum(1 for result in results if result.job is not None)
+    return JobBulkImportResponse(
+        results=[
+            JobImportItemResult(
+                index=result.index,
+                success=result.job is not None,
+                job=result.job,
+                error=result.error
+            )
+            for result in results
+        ],
+        created=created,
+        failed=len(results) - created
+    )
+
+
 @router.get("", response_model=JobListResponse)
 async def get_user_jobs(
     status_filter: Annotated[Optional[str], Query(alias="status", pattern="^(active|archived|draft)$", description="Filter by job status")] = None,
@@ -165,6 +246,7 @@ async def get_user_jobs(
     remote: Annotated[Optional[bool], Query(description="Filter remote jobs only")] = None,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum results per page")] = 20,
     offset: Annotated[int, Query(ge=0, description="Pagination offset")] = 0,
+    cursor: Annotated[Optional[str], Query(max_length=200, description="Keyset cursor from a previous page's nextCursor")] = None,
     service: JobService = Depends(get_job_service),
     user_id: int = Depends(get_current_user)
 ) -> JobListResponse:
@@ -182,16 +264,26 @@ async def get_user_jobs(
     - **remote**: Filter remote jobs only
     - **limit**: Max results (1-100, default 20)
     - **offset**: Pagination offset (default 0)
+    - **cursor**: `nextCursor` from the previous page; seeks past it instead
+      of using offset, so deep pages stay fast
     
-    Returns paginated list of user's saved jobs with metadata.
+    Returns paginated list of user's saved jobs with metadata. List screens
+    that only show titles and dates should use `/summary` instead.
     """
-    jobs = await service.get_user_jobs(
-        user_id=user_id,
-        status=status_filter,
-        source=source,
-        limit=limit,
-        offset=offset
-    )
+    try:
+        jobs = await service.get_user_jobs(
+            user_id=user_id,
+            status=status_filter,
+            source=source,
+            limit=limit,
+            offset=offset,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
     
     # Get total count
     total = await service.count_user_jobs(user_id=user_id, status=status_filter, source=source)
@@ -199,12 +291,70 @@ async def get_user_jobs(
     return JobListResponse(
         jobs=jobs,
         total=total,
-        pagination=PaginationMeta(
+        pagination=_user_jobs_pagination(jobs, total, limit, offset, cursor)
+    )
+
+
+@router.get("/summary", response_model=JobSummaryListResponse)
+async def get_user_job_summaries(
+    status_filter: Annotated[Optional[str], Query(alias="status", pattern="^(active|archived|draft)$", description="Filter by job status")] = None,
+    source: Annotated[Optional[str], Query(pattern="^(user_created|indeed|linkedin|glassdoor|imported|url_import)$", description="Filter by job source")] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum results per page")] = 20,
+    offset: Annotated[int, Query(ge=0, description="Pagination offset")] = 0,
+    cursor: Annotated[Optional[str], Query(max_length=200, description="Keyset cursor from a previous page's nextCursor")] = None,
+    service: JobService = Depends(get_job_service),
+    user_id: int = Depends(get_current_user)
+) -> JobSummaryListResponse:
+    """
+    Get a lightweight list of user's saved jobs for list screens.
+    
+    Same filters and pagination as `GET /jobs`, but each item carries only
+    title, company, location, status and dates. Fetch `GET /jobs/{job_id}`
+    for the description, raw text, keywords and requirements.
+    """
+    try:
+        jobs = await service.get_user_job_summaries(
+            user_id=user_id,
+            status=status_filter,
+            source=source,
             limit=limit,
             offset=offset,
-            total=total,
-            hasMore=offset + len(jobs) < total
+            cursor=cursor
         )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    
+    total = await service.count_user_jobs(user_id=user_id, status=status_filter, source=source)
+    
+    return JobSummaryListResponse(
+        jobs=jobs,
+        total=total,
+        pagination=_user_jobs_pagination(jobs, total, limit, offset, cursor)
+    )
+
+
+def _user_jobs_pagination(
+    jobs: List[Union[Job, JobSummary]],
+    total: int,
+    limit: int,
+    offset: int,
+    cursor: Optional[str]
+) -> PaginationMeta:
+    """Build pagination metadata for offset or keyset pages of a user's jobs."""
+    if cursor:
+        has_more = len(jobs) == limit
+    else:
+        has_more = offset + len(jobs) < total
+    
+    return PaginationMeta(
+        limit=limit,
+        offset=offset,
+        total=total,
+        hasMore=has_more,
+        nextCursor=encode_job_cursor(jobs[-1]) if has_more and jobs else None
     )
 
 
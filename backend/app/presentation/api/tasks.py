@@ -0,0 +1,92 @@
+"""Background task API: queue long-running work and poll for its result."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.application.services.task_handlers import BATCH_EXPORT, COVER_LETTER, ENHANCE_PROFILE
+from app.application.services.task_queue import get_task_queue
+from app.core.dependencies import get_current_user, get_db_session
+from app.domain.entities.background_task import BackgroundTask
+from app.domain.enums.generation_status import GenerationStatus
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.presentation.schemas.export import BatchExportRequest
+from app.presentation.schemas.generation import EnhanceProfileRequest, GenerateCoverLetterRequest
+from app.presentation.schemas.task import TaskAcceptedResponse, TaskStatusResponse
+
+router = APIRouter(prefix="/api/v1/tasks", tags=["Background Tasks"])
+
+
+async def _enqueue(session, user_id: int, task_type: str, payload: dict) -> TaskAcceptedResponse:
+    task = await get_task_queue().enqueue(session, user_id, task_type, payload)
+    return TaskAcceptedResponse(
+        task_id=task.id,
+        task_type=task.task_type,
+        status=task.status.value,
+        status_url=f"{router.prefix}/{task.id}"
+    )
+
+
+@router.post("/profile-enhancement", response_model=TaskAcceptedResponse, status_code=status.HTTP_202_ACCEPTED)
+async def queue_profile_enhancement(
+    request: EnhanceProfileRequest,
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """Queue `POST /profile/enhance`; the task result is the same response body."""
+    return await _enqueue(session, current_user, ENHANCE_PROFILE, request.model_dump(mode="json"))
+
+
+@router.post("/cover-letter", response_model=TaskAcceptedResponse, status_code=status.HTTP_202_ACCEPTED)
+async def queue_cover_letter(
+    request: GenerateCoverLetterRequest,
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """Queue `POST /generations/cover-letter`; the result holds the saved `generation_id`."""
+    return await _enqueue(session, current_user, COVER_LETTER, request.model_dump(mode="json"))
+
+
+@router.post("/batch-export", response_model=TaskAcceptedResponse, status_code=status.HTTP_202_ACCEPTED)
+async def queue_batch_export(
+    request: BatchExportRequest,
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """Queue `POST /exports/batch`; the result holds the `export_id` and download URL."""
+    return await _enqueue(session, current_user, BATCH_EXPORT, request.model_dump(mode="json"))
+
+
+@router.get("/{task_id}", response_model=TaskStatusResponse)
+async def get_task(
+    task_id: UUID,
+    current_user: int = Depends(get_current_user),
+    session = Depends(get_db_session)
+):
+    """
+    Get the status of a queued task.
+    
+    `status` is `pending` while queued (or waiting to retry), `generating`
+    while a worker runs it, then `completed` with `result` or `failed` with `error`.
+    """
+    task = await TaskRepository(session).get_by_id(task_id, current_user)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return _to_status_response(task)
+
+
+def _to_status_response(task: BackgroundTask) -> TaskStatusResponse:
+    retrying = task.status == GenerationStatus.PENDING and task.attempts > 0
+    return TaskStatusResponse(
+        task_id=task.id,
+        task_type=task.task_type,
+        status=task.status.value,
+        attempts=task.attempts,
+        max_attempts=task.max_attempts,
+        result=task.result,
+        error=task.error,
+        created_at=task.created_at,
+        started_at=task.started_at,
+        completed_at=task.completed_at,
+        retry_at=task.run_after if retrying else None
+    )
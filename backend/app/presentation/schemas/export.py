@@ -135,6 +135,30 @@ class ExportedFileListResponse(BaseModel):
         }
 
 
+class ExportSummaryResponse(BaseModel):
+    """Export list item without options or local cache fields."""
+    id: str = Field(..., description="Export ID")
+    generation_id: Optional[str] = Field(None, description="Generation ID (null for batch exports)")
+    job_id: Optional[str] = Field(None, description="Job ID")
+    format: ExportFormat = Field(..., description="Export format")
+    template: TemplateType = Field(..., description="Template used")
+    filename: str = Field(..., description="Filename")
+    file_size_bytes: int = Field(..., description="File size in bytes")
+    page_count: Optional[int] = Field(None, description="Page count (PDF only)")
+    download_url: str = Field(..., description="Presigned download URL (1-hour expiry)")
+    expires_at: datetime = Field(..., description="Export expiry date (30 days)")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata (job title, company, ats_score)")
+
+
+class ExportSummaryListResponse(BaseModel):
+    """Lightweight list of exported files."""
+    exports: List[ExportSummaryResponse] = Field(..., description="List of export summaries")
+    total: int = Field(..., description="Total count")
+    limit: int = Field(..., description="Page size")
+    offset: int = Field(..., description="Page offset")
+
+
 class JobExportsResponse(BaseModel):
     """Job-specific exports grouped by date."""
     job_id: str = Field(..., description="Job ID")
@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 
+from app.domain.enums.document_type import DocumentType
+
 
 # Enhancement Schemas
 class EnhanceProfileRequest(BaseModel):
@@ -28,6 +30,11 @@ class CreateRankingRequest(BaseModel):
     """Request to create ranking."""
     job_id: UUID
     custom_prompt: Optional[str] = Field(None, max_length=500)
+    mode: Optional[str] = Field(
+        None, pattern="^(llm|local|hybrid)$",
+        description="Ranker to use; defaults to the RANKING_MODE setting"
+    )
+    force: bool = Field(False, description="Regenerate even if the job and profile are unchanged")
 
 
 class RankingResponse(BaseModel):
@@ -53,6 +60,10 @@ class GenerateResumeRequest(BaseModel):
     max_projects: int = Field(default=3, ge=0)
     include_summary: bool = True
     custom_prompt: Optional[str] = Field(None, max_length=500)
+    defer_ats_score: bool = Field(
+        default=False,
+        description="Return immediately with ats_status 'pending'; poll GET /generations/{id}/ats for the score"
+    )
 
 
 class GenerateCoverLetterRequest(BaseModel):
@@ -62,6 +73,10 @@ class GenerateCoverLetterRequest(BaseModel):
     hiring_manager_name: Optional[str] = None
     max_paragraphs: int = Field(default=4, ge=3, le=6)
     custom_prompt: Optional[str] = Field(None, max_length=500)
+    defer_ats_score: bool = Field(
+        default=False,
+        description="Return immediately with ats_status 'pending'; poll GET /generations/{id}/ats for the score"
+    )
 
 
 class GenerationResponse(BaseModel):
@@ -74,13 +89,74 @@ class GenerationResponse(BaseModel):
     content_structured: Optional[str] = None
     ats_score: Optional[float] = None
     ats_feedback: Optional[str] = None
+    ats_status: Optional[str] = None
     llm_metadata: Optional[Dict[str, Any]] = None
     created_at: datetime
 
 
+class BatchGenerateRequest(BaseModel):
+    """Request to generate documents for several jobs at once."""
+    job_ids: List[UUID] = Field(..., min_length=1)
+    document_types: List[DocumentType] = Field(
+        default=[DocumentType.RESUME, DocumentType.COVER_LETTER],
+        min_length=1
+    )
+    max_experiences: int = Field(default=5, ge=1, le=10)
+    max_projects: int = Field(default=3, ge=0)
+    include_summary: bool = True
+    max_paragraphs: int = Field(default=4, ge=3, le=6)
+    defer_ats_score: bool = Field(
+        default=False,
+        description="Save without waiting for ATS scores; poll GET /generations/{id}/ats for them"
+    )
+
+
+class BatchJobResultResponse(BaseModel):
+    """Outcome of one job in a batch generation."""
+    job_id: UUID
+    success: bool
+    error: Optional[str] = None
+    generations: List[GenerationResponse] = []
+
+
+class BatchGenerationSummaryResponse(BaseModel):
+    """Totals for a finished batch generation."""
+    total_jobs: int
+    succeeded: int
+    failed: int
+    generation_ids: List[UUID]
+
+
+class AtsScoreResponse(BaseModel):
+    """ATS scoring state of a generation (pending, completed or failed)."""
+    generation_id: UUID
+    ats_status: Optional[str] = None
+    ats_score: Optional[float] = None
+    ats_feedback: Optional[str] = None
+
+
 class GenerationHistoryResponse(BaseModel):
     """Response for generation history."""
     generations: List[GenerationResponse]
     total: int
     limit: int
     offset: int
+
+
+class GenerationSummaryResponse(BaseModel):
+    """Generation list item without content (fetch GET /generations/{id} for it)."""
+    generation_id: UUID
+    job_id: UUID
+    document_type: str
+    status: str
+    ats_score: Optional[float] = None
+    ats_status: Optional[str] = None
+    created_at: datetime
+
+
+class GenerationSummaryHistoryResponse(BaseModel):
+    """Response for lightweight generation history."""
+    generations: List[GenerationSummaryResponse]
+    total: int
+    limit: int
+    offset: int
@@ -0,0 +1,30 @@
+"""Pydantic schemas for the background task API."""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TaskAcceptedResponse(BaseModel):
+    """Returned with 202 when work is queued."""
+    task_id: UUID
+    task_type: str
+    status: str = Field(..., description="pending (queued), generating (running), completed or failed")
+    status_url: str = Field(..., description="Poll this URL for progress and the result")
+
+
+class TaskStatusResponse(BaseModel):
+    """State of a queued task and, once completed, its result."""
+    task_id: UUID
+    task_type: str
+    status: str = Field(..., description="pending (queued), generating (running), completed or failed")
+    attempts: int
+    max_attempts: int
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = Field(None, description="Last failure; set while waiting to retry too")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    retry_at: Optional[datetime] = Field(None, description="When a queued retry becomes due")
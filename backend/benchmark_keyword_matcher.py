@@ -0,0 +1,102 @@
+"""Benchmark the precompiled keyword matcher against the per-keyword regex scan.
+
+The legacy implementation (one ``re.search`` per keyword, rebuilt on every
+call) is reproduced here for comparison, over every spelling in the keyword
+taxonomy. Both run over the mock job corpus, and the raw matches are checked
+for equality before timing; the compiled timing includes canonicalization.
+
+Usage:
+    python benchmark_keyword_matcher.py [--repeat 50]
+"""
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+from app.application.services.keyword_taxonomy import get_keyword_taxonomy
+
+MOCK_JOBS_PATH = Path(__file__).parent / "data" / "mock_jobs.json"
+
+
+def legacy_parse_keywords(text: str, keywords: list) -> list:
+    """Keyword extraction as JobService._parse_keywords did it before the matcher."""
+    tech_keywords = list(keywords)
+    text_lower = text.lower()
+    found_keywords = set()
+    tech_keywords.sort(key=len, reverse=True)
+
+    for keyword in tech_keywords:
+        if '#' in keyword or '++' in keyword:
+            if keyword in text or keyword.upper() in text or keyword.lower() in text:
+                found_keywords.add(keyword)
+        elif keyword in ['r', 'c', 'd', 'f', 'go']:
+            pattern = r'\b' + re.escape(keyword) + r'\b'
+            if re.search(pattern, text_lower, re.IGNORECASE):
+                context_patterns = {
+                    'r': r'\b(r\s+language|r\s+programming|ggplot|dplyr|tidyverse|cran)\b',
+                    'c': r'\b(c\s+language|c\s+programming|ansi\s+c|iso\s+c)\b',
+                    'd': r'\b(d\s+language|d\s+programming|dlang)\b',
+                    'f': r'\b(f#|f\s+sharp)\b',
+                    'go': r'\b(golang|go\s+lang)\b'
+                }
+                if keyword in context_patterns and re.search(context_patterns[keyword], text_lower, re.IGNORECASE):
+                    found_keywords.add(keyword)
+                elif keyword == 'go' and re.search(r'\bgolang\b', text_lower, re.IGNORECASE):
+                    found_keywords.add('go')
+        else:
+            pattern = r'\b' + re.escape(keyword) + r'\b'
+            if re.search(pattern, text_lower, re.IGNORECASE):
+                found_keywords.add(keyword)
+
+    return sorted(list(found_keywords))
+
+
+def load_corpus() -> list:
+    """Full posting text for every mock job."""
+    jobs = json.loads(MOCK_JOBS_PATH.read_text(encoding="utf-8"))["tech_jobs"]
+    return [
+        "\n".join([
+            job["title"], job["company"], job.get("location") or "", job.get("description") or "",
+            *job.get("requirements", []), *job.get("benefits", []),
+        ])
+        for job in jobs
+    ]
+
+
+def time_per_text(parse, corpus: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            parse(text)
+    return (time.perf_counter() - start) / (repeat * len(corpus))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="passes over the corpus")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    taxonomy = get_keyword_taxonomy()
+    terms = taxonomy.terms
+    for text in corpus:
+        assert taxonomy.matcher.find(text) == legacy_parse_keywords(text, terms), "outputs differ"
+
+    legacy = time_per_text(lambda text: legacy_parse_keywords(text, terms), corpus, args.repeat)
+    compiled = time_per_text(taxonomy.extract, corpus, args.repeat)
+    raw_count = sum(len(legacy_parse_keywords(text, terms)) for text in corpus)
+    canonical_count = sum(len(taxonomy.extract(text)) for text in corpus)
+    avg_chars = sum(len(text) for text in corpus) / len(corpus)
+
+    print(f"{len(corpus)} postings, {avg_chars:.0f} chars on average, {args.repeat} passes")
+    print(f"legacy regex scan : {legacy * 1000:8.3f} ms/posting")
+    print(f"compiled matcher  : {compiled * 1000:8.3f} ms/posting")
+    print(f"speedup           : {legacy / compiled:8.1f}x")
+    print(f"keywords per posting: {raw_count / len(corpus):.1f} raw, "
+          f"{canonical_count / len(corpus):.1f} canonical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Measure LLM call tail latency against a local fake Groq server.
+
+The fake server answers most requests quickly but stalls a fraction of
+them and fails another fraction with 503 or 429 (with Retry-After). The
+same workload runs through GroqAdapter with no resilience policy, with
+deadlines and retries, and with hedging on top, and reports p50/p95/p99
+latency, error counts and the policy's counters.
+
+Usage:
+    python benchmark_llm_resilience.py [--calls 300] [--concurrency 16]
+        [--stall-rate 0.05] [--stall 2.0] [--error-rate 0.03] [--deadline 0.5]
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import time
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from groq import AsyncGroq
+
+from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
+from app.infrastructure.adapters.llm.resilience import LLMResiliencePolicy
+
+MODEL = "llama-3.3-70b-versatile"
+
+
+def fake_groq_app(args) -> FastAPI:
+    """Chat completions endpoint with configurable stalls and transient errors."""
+    app = FastAPI()
+
+    @app.post("/openai/v1/chat/completions")
+    async def chat_completions(body: dict):
+        roll = random.random()
+        if roll < args.error_rate / 2:
+            return JSONResponse({"error": {"message": "overloaded"}}, status_code=503)
+        if roll < args.error_rate:
+            return JSONResponse({"error": {"message": "rate limited"}}, status_code=429,
+                                headers={"retry-after": "0.2"})
+        stalled = random.random() < args.stall_rate
+        await asyncio.sleep(args.stall if stalled else random.uniform(0.02, 0.08))
+        return {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "ok"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+        }
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_workload(adapter: GroqAdapter, calls: int, concurrency: int) -> tuple:
+    """(sorted latencies of successful calls, error count)."""
+    gate = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def one():
+        nonlocal errors
+        async with gate:
+            start = time.perf_counter()
+            try:
+                await adapter.generate_completion("Say ok", max_tokens=5, model=MODEL, cache=False)
+                latencies.append(time.perf_counter() - start)
+            except Exception:
+                errors += 1
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return sorted(latencies), errors
+
+
+def percentile(latencies: list, q: float) -> float:
+    return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else 0.0
+
+
+async def main(args):
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(fake_groq_app(args), port=port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    policies = {
+        "none": None,
+        "deadline+retry": LLMResiliencePolicy(
+            {MODEL: args.deadline}, args.deadline, max_retries=2, backoff_base=0.05
+        ),
+        "deadline+retry+hedge": LLMResiliencePolicy(
+            {MODEL: args.deadline}, args.deadline, max_retries=2, backoff_base=0.05,
+            hedge=True, hedge_min_delay=0.05
+        ),
+    }
+
+    print(f"{'policy':<22}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>8}")
+    try:
+        for name, policy in policies.items():
+            client = AsyncGroq(api_key="fake", base_url=f"http://127.0.0.1:{port}", max_retries=0)
+            adapter = GroqAdapter(client=client, resilience=policy)
+            if policy is not None:
+                # Warm the latency window so hedging has a p95 to work from
+                await run_workload(adapter, policy.latency.min_samples * 2, args.concurrency)
+            latencies, errors = await run_workload(adapter, args.calls, args.concurrency)
+            print(f"{name:<22}{percentile(latencies, 0.5):>10.1f}{percentile(latencies, 0.95):>10.1f}"
+                  f"{percentile(latencies, 0.99):>10.1f}{(latencies[-1] * 1000 if latencies else 0):>10.1f}"
+                  f"{errors:>8}")
+            if policy is not None:
+                counters = {k: v for k, v in policy.snapshot().items() if k != "latency"}
+                print(f"{'':<22}{counters}")
+            await client.close()
+    finally:
+        server.should_exit = True
+        await serving
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--stall-rate", type=float, default=0.05)
+    parser.add_argument("--stall", type=float, default=2.0)
+    parser.add_argument("--error-rate", type=float, default=0.03)
+    parser.add_argument("--deadline", type=float, default=0.5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,157 @@
+"""Measure the local BM25 ranker against the LLM ranking on the evaluation data.
+
+Each evaluation query (and every mock job) is ranked against its own profile
+and against the master test resume. Local ranking latency is always measured;
+with --llm the same profiles are ranked by the LLM (full and hybrid) to
+report latency and how closely the local and hybrid orders agree with it.
+
+Usage:
+    python benchmark_local_ranker.py [--repeat 20] [--llm] [--top-k 5]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.application.services.local_ranker import rank_profile_content
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def load_profiles() -> dict:
+    """Experiences and projects per profile, as attribute objects with IDs."""
+    resume = json.loads((DATA_DIR / "test_master_resume.json").read_text(encoding="utf-8"))
+    profiles = {
+        "master_resume": (
+            [_experience(exp["id"], exp) for exp in resume["professional_experience"]],
+            [SimpleNamespace(id=proj["id"], name=proj["name"], description=proj["description"],
+                             technologies=proj.get("technologies", []))
+             for proj in resume["projects"]],
+        )
+    }
+    for query in json.loads((DATA_DIR / "evaluation_queries.json").read_text(encoding="utf-8")):
+        experiences = query["user_profile"].get("experiences", [])
+        profiles[query["query_id"]] = (
+            [_experience(f"{query['query_id']}-exp-{i}", exp) for i, exp in enumerate(experiences, 1)],
+            [],
+        )
+    return profiles
+
+
+def _experience(exp_id: str, exp: dict) -> SimpleNamespace:
+    achievements = exp.get("achievements", []) + exp.get("key_responsibilities", [])
+    return SimpleNamespace(id=exp_id, title=exp["title"], company=exp["company"],
+                           description=exp.get("description"), achievements=achievements)
+
+
+def load_cases(profiles: dict) -> list:
+    """(name, job, experiences, projects) for every job/profile pair to rank."""
+    jobs = []
+    for query in json.loads((DATA_DIR / "evaluation_queries.json").read_text(encoding="utf-8")):
+        job = SimpleNamespace(title=query["job_title"], company=query["company"],
+                              description=query["job_description"],
+                              requirements=query["job_requirements"], parsed_keywords=[])
+        jobs.append((query["query_id"], job, [query["query_id"], "master_resume"]))
+    for i, mock in enumerate(json.loads((DATA_DIR / "mock_jobs.json").read_text(encoding="utf-8"))["tech_jobs"]):
+        job = SimpleNamespace(title=mock["title"], company=mock["company"],
+                              description=mock.get("description"),
+                              requirements=mock.get("requirements", []),
+                              parsed_keywords=mock.get("parsed_keywords", []))
+        jobs.append((f"mock{i}", job, ["master_resume"]))
+
+    return [
+        (f"{job_name}/{profile_name}", job, *profiles[profile_name])
+        for job_name, job, profile_names in jobs
+        for profile_name in profile_names
+    ]
+
+
+def kendall_tau(reference: list, candidate: list) -> float:
+    """Rank correlation over the items both orders contain (1.0 = identical)."""
+    common = [item for item in reference if item in candidate]
+    if len(common) < 2:
+        return 1.0
+    position = {item: candidate.index(item) for item in common}
+    pairs = concordant = 0
+    for i in range(len(common)):
+        for j in range(i + 1, len(common)):
+            pairs += 1
+            concordant += position[common[i]] < position[common[j]]
+    return (2 * concordant - pairs) / pairs
+
+
+async def rank_with_llm(service, job, experiences, projects):
+    start = time.perf_counter()
+    exps, projs, _ = await service._rank_with_llm(job, experiences, projects)
+    return exps, projs, time.perf_counter() - start
+
+
+async def compare_with_llm(cases: list, top_k: int) -> None:
+    from app.application.services.ranking_service import RankingService
+    from app.core.config import get_settings
+    from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
+
+    settings = get_settings()
+    service = RankingService(GroqAdapter(api_key=settings.groq_api_key), None, None, None)
+    settings.ranking_hybrid_top_k = top_k
+
+    full_times, hybrid_times, top1_local, top1_hybrid, tau_local, tau_hybrid = [], [], [], [], [], []
+    for name, job, experiences, projects in cases:
+        local = rank_profile_content(job, experiences, projects)
+        llm_exps, llm_projs, full_time = await rank_with_llm(service, job, experiences, projects)
+
+        start = time.perf_counter()
+        hyb_exps, hyb_projs, _ = await service._rank_hybrid(job, experiences, projects, local)
+        hybrid_times.append(time.perf_counter() - start)
+        full_times.append(full_time)
+
+        for reference, local_order, hybrid_order in [
+            (llm_exps, local.ranked_experience_ids, hyb_exps),
+            (llm_projs, local.ranked_project_ids, hyb_projs),
+        ]:
+            if not reference:
+                continue
+            top1_local.append(reference[0] == local_order[0])
+            top1_hybrid.append(reference[0] == hybrid_order[0])
+            tau_local.append(kendall_tau(reference, local_order))
+            tau_hybrid.append(kendall_tau(reference, hybrid_order))
+        print(f"  {name:28s} llm {full_time * 1000:7.0f} ms")
+
+    print(f"LLM ranking    : {statistics.median(full_times) * 1000:8.0f} ms median")
+    print(f"hybrid (top {top_k}) : {statistics.median(hybrid_times) * 1000:8.0f} ms median")
+    print(f"top-1 agreement: local {sum(top1_local) / len(top1_local):.0%}, "
+          f"hybrid {sum(top1_hybrid) / len(top1_hybrid):.0%}")
+    print(f"Kendall tau    : local {statistics.mean(tau_local):.2f}, "
+          f"hybrid {statistics.mean(tau_hybrid):.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the cases for local timing")
+    parser.add_argument("--llm", action="store_true", help="also rank with the LLM (needs GROQ_API_KEY)")
+    parser.add_argument("--top-k", type=int, default=5, help="hybrid shortlist size")
+    args = parser.parse_args()
+
+    cases = load_cases(load_profiles())
+    rank_profile_content(*cases[0][1:])  # warm up the keyword taxonomy
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for _, job, experiences, projects in cases:
+            rank_profile_content(job, experiences, projects)
+    local_time = (time.perf_counter() - start) / (args.repeat * len(cases))
+
+    items = sum(len(exps) + len(projs) for _, _, exps, projs in cases) / len(cases)
+    print(f"{len(cases)} job/profile pairs, {items:.1f} items per profile, {args.repeat} passes")
+    print(f"local ranking  : {local_time * 1000:8.3f} ms per job")
+
+    if args.llm:
+        asyncio.run(compare_with_llm(cases, args.top_k))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark read/write throughput with and without the SQLite production profile.
+
+Runs concurrent job inserts and job list reads through JobRepository against a
+fresh database file, once with the default engine and once with
+SQLITE_PRODUCTION_MODE (WAL, tuned pragmas, single writer connection).
+
+Usage:
+    python benchmark_sqlite_profile.py [--writers 8] [--readers 16] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import get_settings
+from app.infrastructure.database.connection import (
+    dispose_engine,
+    get_session_factory,
+    get_writer_engine,
+    init_engine,
+)
+from app.infrastructure.database.models import Base
+from app.infrastructure.repositories.job_repository import JobRepository
+
+USER_ID = 1
+SEED_JOBS = 200
+
+
+def job_payload(i: int) -> dict:
+    """Build a realistic job row with a few KB of text."""
+    return {
+        "user_id": USER_ID,
+        "source": "user_created",
+        "title": f"Backend Engineer {i}",
+        "company": f"Company {i % 50}",
+        "location": "Seattle, WA",
+        "description": "Build and operate Python services on AWS. " * 40,
+        "raw_text": "Full posting text with requirements and benefits. " * 80,
+        "parsed_keywords": ["python", "fastapi", "aws", "docker", "postgresql"],
+        "requirements": ["5+ years Python", "AWS experience"],
+        "benefits": ["Health insurance", "401k"],
+    }
+
+
+async def writer(deadline: float, counters: dict) -> None:
+    factory = get_session_factory()
+    i = 0
+    while time.perf_counter() < deadline:
+        async with factory() as session:
+            try:
+                await JobRepository(session).create(job_payload(i))
+                counters["writes"] += 1
+            except OperationalError:
+                counters["errors"] += 1
+                await session.rollback()
+        i += 1
+
+
+async def reader(deadline: float, counters: dict) -> None:
+    factory = get_session_factory()
+    while time.perf_counter() < deadline:
+        async with factory() as session:
+            try:
+                await JobRepository(session).get_user_jobs(USER_ID, limit=20)
+                counters["reads"] += 1
+            except OperationalError:
+                counters["errors"] += 1
+
+
+async def run_scenario(production_mode: bool, writers: int, readers: int, seconds: float) -> dict:
+    settings = get_settings()
+    db_dir = tempfile.mkdtemp(prefix="jobwise-bench-")
+    settings.database_url = f"sqlite+aiosqlite:///{os.path.join(db_dir, 'bench.db')}"
+    settings.sqlite_production_mode = production_mode
+    # Give both scenarios the same number of connections to share
+    settings.db_pool_size = writers + readers
+    settings.sqlite_reader_pool_size = readers
+
+    await dispose_engine()
+    init_engine()
+    async with get_writer_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with get_session_factory()() as session:
+        repo = JobRepository(session)
+        for i in range(SEED_JOBS):
+            await repo.create(job_payload(i))
+
+    counters = {"writes": 0, "reads": 0, "errors": 0}
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(
+        *(writer(deadline, counters) for _ in range(writers)),
+        *(reader(deadline, counters) for _ in range(readers)),
+    )
+    await dispose_engine()
+
+    return {
+        "writes_per_sec": counters["writes"] / seconds,
+        "reads_per_sec": counters["reads"] / seconds,
+        "errors": counters["errors"],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{args.writers} writers, {args.readers} readers, {args.seconds}s per scenario\n")
+    print(f"{'profile':<12}{'writes/s':>12}{'reads/s':>12}{'errors':>10}")
+    for production_mode in (False, True):
+        result = await run_scenario(production_mode, args.writers, args.readers, args.seconds)
+        label = "production" if production_mode else "default"
+        print(
+            f"{label:<12}{result['writes_per_sec']:>12.1f}"
+            f"{result['reads_per_sec']:>12.1f}{result['errors']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,21 +1,23 @@
-"""Initialize database and create tables."""
+"""Initialize database and apply schema migrations."""
 
 import asyncio
-from app.infrastructure.database.connection import create_engine
-from app.infrastructure.database.models import Base
+from app.infrastructure.database.connection import dispose_engine, get_writer_engine
+from app.infrastructure.database.migrations import get_current_version, upgrade
 
 
 async def init_database():
-    """Initialize database and create all tables."""
-    engine = create_engine()
+    """Create all tables and bring the schema to the latest version."""
+    engine = get_writer_engine()
 
-    # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    applied = await upgrade(engine)
+    version = await get_current_version(engine)
 
-    await engine.dispose()
-    print("Database initialized successfully")
+    await dispose_engine()
+    if applied:
+        print(f"Applied migrations {applied}; schema at version {version}")
+    else:
+        print(f"Database already at schema version {version}")
 
 
 if __name__ == "__main__":
-    asyncio.run(init_database())
\ No newline at end of file
+    asyncio.run(init_database())
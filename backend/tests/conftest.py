@@ -1,14 +1,18 @@
 """Test configuration and fixtures for authentication API tests."""
 
 import os
+from types import SimpleNamespace
+from uuid import uuid4
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
+from app.application.services.generation_service import CoverLetterContext
 from app.core.config import get_settings
-from app.infrastructure.database.connection import get_database_url, get_db_session
+from app.infrastructure.database.connection import get_db_session
 from app.infrastructure.database.models import Base
 from app.main import app
 
@@ -81,8 +85,7 @@ async def db_session():
     """Create async database session for testing."""
     from sqlalchemy.ext.asyncio import async_sessionmaker
     
-    database_url = get_database_url()
-    engine = create_async_engine(database_url, echo=False, future=True)
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False, future=True)
     
     async_session_factory = async_sessionmaker(
         engine,
@@ -133,4 +136,26 @@ def invalid_email_data():
         "email": "invalid-email",
         "password": "SecurePass123!",
         "full_name": "Invalid Email User"
-    }
\ No newline at end of file
+    }
+
+
+@pytest.fixture
+def cover_letter_context():
+    """Cover letter context with a minimal profile and job, for generation service tests."""
+    return CoverLetterContext(
+        user_id=1,
+        job_id=uuid4(),
+        ranking=SimpleNamespace(id=uuid4()),
+        profile=SimpleNamespace(personal_info=SimpleNamespace(
+            full_name="Ada Lovelace", email="ada@example.com", phone=None, location=None,
+            linkedin=None, github=None, website=None,
+        )),
+        job=SimpleNamespace(title="Engineer", company="Acme", description="Build things",
+                            parsed_keywords=[]),
+        style=None,
+        profile_data={"full_name": "Ada Lovelace", "experiences": [], "projects": []},
+        job_description="Build things",
+        company_name="Acme",
+        hiring_manager_name=None,
+        max_paragraphs=3,
+    )
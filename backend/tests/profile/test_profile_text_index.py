@@ -0,0 +1,92 @@
+"""Tests for the stored profile text index built on profile writes."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services.local_ranker import rank_profile_content
+from app.application.services.profile_text_index import build_experience_index
+from app.application.services.profile_service import ProfileService
+from app.domain.entities.profile import Experience
+from app.infrastructure.repositories.profile_repository import ProfileRepository
+
+
+def make_profile_data() -> dict:
+    return {
+        "personal_info": {"full_name": "Ada Lovelace", "email": "ada@example.com"},
+        "experiences": [
+            {"title": "Backend Engineer", "company": "Acme", "start_date": "2020-01-01",
+             "description": "Built Python services on Kubernetes."},
+            {"title": "Barista", "company": "Cafe", "start_date": "2018-01-01",
+             "description": "Made coffee."},
+        ],
+        "projects": [
+            {"name": "Tracker", "description": "Job tracker app", "technologies": ["ReactJS", "FastAPI"],
+             "start_date": "2023-01-01"},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_rows_are_indexed_on_create(db_session: AsyncSession):
+    """Creating a profile stores term frequencies and canonical skills per row."""
+    repo = ProfileRepository(db_session)
+    profile = await ProfileService(repo).create_profile(user_id=1, **make_profile_data())
+
+    index = await repo.get_text_index(profile.id)
+
+    backend, project = profile.experiences[0], profile.projects[0]
+    assert index[backend.id]["terms"]["python"] == 1
+    assert index[backend.id]["skills"] == ["kubernetes", "python"]
+    assert index[project.id]["skills"] == ["fastapi", "react"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_reindexes_only_touched_rows(db_session: AsyncSession):
+    """Bulk experience updates rebuild the edited row and leave the others alone."""
+    repo = ProfileRepository(db_session)
+    service = ProfileService(repo)
+    profile = await service.create_profile(user_id=1, **make_profile_data())
+    before = await repo.get_text_index(profile.id)
+
+    barista = profile.experiences[1].model_copy(update={"description": "Ran the espresso bar in Go."})
+    await service.update_experiences_bulk(profile.id, 1, [barista.model_dump()])
+    after = await repo.get_text_index(profile.id)
+
+    assert after[barista.id]["hash"] != before[barista.id]["hash"]
+    assert "espresso" in after[barista.id]["terms"]
+    assert after[profile.experiences[0].id] == before[profile.experiences[0].id]
+    assert after[profile.projects[0].id] == before[profile.projects[0].id]
+
+
+@pytest.mark.asyncio
+async def test_profile_update_keeps_unchanged_entries(db_session: AsyncSession):
+    """A full profile update reuses entries whose text did not change."""
+    repo = ProfileRepository(db_session)
+    service = ProfileService(repo)
+    profile = await service.create_profile(user_id=1, **make_profile_data())
+    before = await repo.get_text_index(profile.id)
+
+    experiences = [exp.model_dump() for exp in profile.experiences]
+    experiences[0]["description"] = "Built Rust services."
+    await service.update_profile(profile.id, 1, experiences=experiences)
+    after = await repo.get_text_index(profile.id)
+
+    assert after[profile.experiences[0].id]["skills"] == ["rust"]
+    assert after[profile.experiences[1].id] == before[profile.experiences[1].id]
+
+
+def test_ranker_reads_stored_index_entries():
+    """A current stored entry is used as-is instead of re-tokenizing the row."""
+    experience = Experience(id="exp", title="Barista", company="Cafe", start_date="2018-01-01",
+                            description="Made coffee.")
+    other = Experience(id="other", title="Clerk", company="Shop", start_date="2017-01-01")
+    stored = build_experience_index(experience)
+    stored = {**stored, "terms": {"kw:python": 3}}
+
+    job = SimpleNamespace(title="Dev", description="", requirements=[], parsed_keywords=["python"])
+
+    ranking = rank_profile_content(job, [other, experience], [], {"exp": stored})
+
+    assert ranking.ranked_experience_ids == ["exp", "other"]
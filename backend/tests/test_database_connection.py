@@ -0,0 +1,117 @@
+"""Tests for the shared database engine and connection pool."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.infrastructure.database import connection
+from app.infrastructure.database.connection import (
+    InstrumentedAsyncQueuePool,
+    dispose_engine,
+    get_db_session,
+    get_engine,
+    get_pool_status,
+    get_writer_engine,
+    init_engine,
+    pool_metrics,
+)
+
+
+@pytest_asyncio.fixture
+async def shared_engine(tmp_path, monkeypatch):
+    """Point the shared engine at a throwaway database file."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "database_url", f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+    await dispose_engine()
+    pool_metrics.reset()
+
+    yield init_engine()
+
+    await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_init_engine_is_singleton(shared_engine):
+    """Repeated initialisation returns the same pooled engine."""
+    assert init_engine() is shared_engine
+    assert get_engine() is shared_engine
+    assert isinstance(shared_engine.pool, InstrumentedAsyncQueuePool)
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_pooled_connection(shared_engine):
+    """Sequential request sessions reuse the same pooled connection."""
+    for _ in range(3):
+        async for session in get_db_session():
+            result = await session.execute(text("SELECT 1"))
+            assert result.scalar() == 1
+
+    status = get_pool_status()
+    assert status["initialized"] is True
+    assert status["checkouts"] == 3
+    assert status["checked_out"] == 0
+    assert status["checked_in"] == 1
+    assert get_engine() is shared_engine
+
+
+@pytest.mark.asyncio
+async def test_dispose_engine_resets_singleton(shared_engine):
+    """Disposing drops the engine so the next call builds a new one."""
+    await dispose_engine()
+
+    assert connection._engine is None
+    assert get_pool_status()["initialized"] is False
+    assert init_engine() is not shared_engine
+
+
+@pytest_asyncio.fixture
+async def profiled_engine(tmp_path, monkeypatch):
+    """Shared engine with the SQLite production profile switched on."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "database_url", f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}")
+    monkeypatch.setattr(settings, "sqlite_production_mode", True)
+    await dispose_engine()
+
+    engine = init_engine()
+    async with get_writer_engine().begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+
+    yield engine
+
+    await dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_production_profile_applies_pragmas(profiled_engine):
+    """Reader and writer connections both run in WAL with tuned pragmas."""
+    for engine in (profiled_engine, get_writer_engine()):
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 5000
+
+    assert get_writer_engine() is not profiled_engine
+    assert get_writer_engine().pool.size() == 1
+
+
+@pytest.mark.asyncio
+async def test_production_profile_routes_reads_and_writes(profiled_engine):
+    """Reads use the reader pool; writes and reads after a write use the writer."""
+    reader = profiled_engine.sync_engine
+    writer = get_writer_engine().sync_engine
+
+    async for session in get_db_session():
+        select_items = text("SELECT COUNT(*) FROM items")
+        assert session.sync_session.get_bind(clause=select_items) is reader
+
+        await session.execute(text("INSERT INTO items (name) VALUES ('a')"))
+        # Pinned to the writer so the uncommitted row is visible
+        assert session.sync_session.get_bind(clause=select_items) is writer
+        assert (await session.execute(select_items)).scalar() == 1
+        await session.commit()
+
+        assert session.sync_session.get_bind(clause=select_items) is reader
+        assert (await session.execute(select_items)).scalar() == 1
+
+    assert get_pool_status()["writer"]["checkouts"] >= 1
@@ -0,0 +1,106 @@
+"""Tests for deferred (background) ATS scoring of generations."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.application.services.generation_service import (
+    GenerationService,
+    flush_ats_scoring,
+    wait_for_ats_score,
+)
+from app.domain.enums.generation_status import GenerationStatus
+from app.infrastructure.repositories.generation_repository import GenerationRepository
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Session factory on the test database, as the background scorer uses."""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def cover_letter_context(cover_letter_context):
+    """Shared context with job keywords, so the letter gets an ATS score."""
+    cover_letter_context.job.parsed_keywords = ["python"]
+    return cover_letter_context
+
+
+def make_service(llm, session, session_factory):
+    async def letter(**kwargs):
+        yield "Dear Acme, I write Python."
+
+    llm.stream_cover_letter = MagicMock(side_effect=letter)
+    return GenerationService(
+        llm, GenerationRepository(session), AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock(),
+        session_factory=session_factory,
+    )
+
+
+@pytest.mark.asyncio
+async def test_deferred_generation_is_saved_before_scoring(db_session, session_factory, cover_letter_context):
+    """The generation is returned pending and the background score updates the row."""
+    release = asyncio.Event()
+
+    async def score(**kwargs):
+        await release.wait()
+        return {"score": 88.0, "analysis": "Strong match", "llm_metadata": {}}
+
+    llm = MagicMock()
+    llm.calculate_ats_score = AsyncMock(side_effect=score)
+    service = make_service(llm, db_session, session_factory)
+
+    items = [item async for item in service.stream_cover_letter(cover_letter_context, defer_ats=True)]
+    generation = items[-1]
+
+    assert generation.ats_status == GenerationStatus.PENDING
+    assert generation.ats_score is None
+    saved = await GenerationRepository(db_session).get_by_id(generation.id)
+    assert saved.ats_status == GenerationStatus.PENDING
+
+    release.set()
+    assert await wait_for_ats_score(generation.id, timeout=1) is True
+
+    async with session_factory() as session:
+        scored = await GenerationRepository(session).get_by_id(generation.id)
+    assert scored.ats_status == GenerationStatus.COMPLETED
+    assert scored.ats_score == 88.0
+    assert scored.ats_feedback == "Strong match"
+    assert scored.content_text == "Dear Acme, I write Python."
+
+
+@pytest.mark.asyncio
+async def test_deferred_scoring_failure_is_recorded(db_session, session_factory, cover_letter_context):
+    """A failed background score marks the row failed instead of leaving it pending."""
+    llm = MagicMock()
+    llm.calculate_ats_score = AsyncMock(side_effect=RuntimeError("model overloaded"))
+    service = make_service(llm, db_session, session_factory)
+
+    items = [item async for item in service.stream_cover_letter(cover_letter_context, defer_ats=True)]
+    await flush_ats_scoring()
+
+    async with session_factory() as session:
+        scored = await GenerationRepository(session).get_by_id(items[-1].id)
+    assert scored.ats_status == GenerationStatus.FAILED
+    assert scored.ats_score is None
+    assert "model overloaded" in scored.ats_feedback
+    assert await wait_for_ats_score(scored.id, timeout=0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_inline_scoring_still_default(db_session, session_factory, cover_letter_context):
+    """Without defer_ats the score is computed before the generation is returned."""
+    llm = MagicMock()
+    llm.calculate_ats_score = AsyncMock(return_value={"score": 70.0, "analysis": "ok"})
+    service = make_service(llm, db_session, session_factory)
+
+    items = [item async for item in service.stream_cover_letter(cover_letter_context)]
+
+    assert items[-1].ats_status == GenerationStatus.COMPLETED
+    assert items[-1].ats_score == 70.0
@@ -0,0 +1,127 @@
+"""Tests for concurrent, streamed batch ZIP exports."""
+
+import asyncio
+import io
+import time
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.services.export_renderer import ExportRenderer
+from app.application.services.export_service import ExportService
+from app.domain.enums.document_type import DocumentType
+from app.domain.enums.export_format import ExportFormat
+from app.domain.enums.template_type import TemplateType
+from app.infrastructure.storage.async_storage import InMemoryStorage
+
+
+def make_generation(gen_id, user_id=1, content=True):
+    return SimpleNamespace(
+        id=gen_id, user_id=user_id, job_id=None,
+        content_structured={"sections": [{"type": "professional_summary", "content": gen_id}]}
+        if content else None,
+        document_type=DocumentType.RESUME
+    )
+
+
+class SlowExecutor:
+    """Render executor stand-in that takes a fixed time per document."""
+
+    def __init__(self, workers, seconds=0.05):
+        self.workers = workers
+        self.seconds = seconds
+        self.in_flight = 0
+        self.peak = 0
+
+    async def render(self, format, structured_content, template, options=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.seconds)
+        self.in_flight -= 1
+        return f"doc {structured_content['sections'][0]['content']}".encode()
+
+
+def make_service(generations, render_executor):
+    storage = InMemoryStorage()
+    by_id = {generation.id: generation for generation in generations}
+    service = ExportService(
+        export_renderer=MagicMock(spec=ExportRenderer),
+        storage=storage,
+        generation_repository=MagicMock(get_by_id=AsyncMock(side_effect=by_id.get)),
+        export_repository=MagicMock(create=AsyncMock()),
+        job_repository=MagicMock(),
+        render_executor=render_executor
+    )
+    return service, storage
+
+
+@pytest.mark.asyncio
+async def test_batch_renders_concurrently_and_streams_zip():
+    """Members render in parallel and land in one uploaded ZIP, named in request order."""
+    generations = [make_generation(f"gen-{i}") for i in range(4)]
+    executor = SlowExecutor(workers=4)
+    service, storage = make_service(generations, executor)
+
+    start = time.perf_counter()
+    export = await service.batch_export(
+        1, [g.id for g in generations], ExportFormat.PDF, TemplateType.MODERN
+    )
+    elapsed = time.perf_counter() - start
+
+    assert executor.peak == 4
+    assert elapsed < 4 * executor.seconds
+    zip_bytes, content_type = storage.files[export.file_path]
+    assert content_type == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+        names = sorted(archive.namelist())
+        assert [name[:3] for name in names] == ["01_", "02_", "03_", "04_"]
+        assert archive.read(names[2]) == b"doc gen-2"
+    assert export.file_size_bytes == len(zip_bytes)
+    assert export.export_metadata["file_count"] == 4
+    assert export.format == ExportFormat.ZIP
+
+
+@pytest.mark.asyncio
+async def test_batch_concurrency_is_bounded_by_render_workers():
+    generations = [make_generation(f"gen-{i}") for i in range(6)]
+    executor = SlowExecutor(workers=2, seconds=0.01)
+    service, _ = make_service(generations, executor)
+
+    await service.batch_export(1, [g.id for g in generations], ExportFormat.DOCX, TemplateType.MODERN)
+
+    assert executor.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_foreign_and_empty_generations():
+    generations = [
+        make_generation("mine"),
+        make_generation("theirs", user_id=2),
+        make_generation("empty", content=False),
+    ]
+    service, storage = make_service(generations, SlowExecutor(workers=2, seconds=0))
+
+    export = await service.batch_export(
+        1, ["mine", "theirs", "empty", "missing"], ExportFormat.PDF, TemplateType.MODERN
+    )
+
+    assert export.export_metadata["generation_ids"] == ["mine"]
+    with zipfile.ZipFile(io.BytesIO(storage.files[export.file_path][0])) as archive:
+        assert len(archive.namelist()) == 1
+
+    with pytest.raises(ValueError, match="No valid generations"):
+        await service.batch_export(1, ["theirs"], ExportFormat.PDF, TemplateType.MODERN)
+
+
+@pytest.mark.asyncio
+async def test_failed_member_fails_batch_and_cancels_the_rest():
+    generations = [make_generation(f"gen-{i}") for i in range(3)]
+    executor = SlowExecutor(workers=3)
+    executor.render = AsyncMock(side_effect=[RuntimeError("render crashed"), b"a", b"b"])
+    service, storage = make_service(generations, executor)
+
+    with pytest.raises(RuntimeError, match="render crashed"):
+        await service.batch_export(1, [g.id for g in generations], ExportFormat.PDF, TemplateType.MODERN)
+    assert storage.files == {}
@@ -0,0 +1,98 @@
+"""Tests for reusing identical exports instead of re-rendering them."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.services.export_renderer import ExportRenderer
+from app.application.services.export_service import ExportService, render_fingerprint
+from app.domain.entities.export import Export
+from app.domain.enums.document_type import DocumentType
+from app.domain.enums.export_format import ExportFormat
+from app.domain.enums.template_type import TemplateType
+from app.infrastructure.repositories.export_repository import ExportRepository
+from app.infrastructure.storage.async_storage import InMemoryStorage
+
+CONTENT = {
+    "header": {"name": "Ada Lovelace"},
+    "sections": [{"type": "professional_summary", "content": "Engineer."}],
+}
+
+
+def make_service(export_repository):
+    generation = SimpleNamespace(
+        id="gen-1", user_id=1, job_id=None, content_structured=CONTENT,
+        document_type=DocumentType.RESUME
+    )
+    renderer = MagicMock(spec=ExportRenderer)
+    renderer.render_docx.return_value = b"PK docx"
+    storage = InMemoryStorage()
+    service = ExportService(
+        export_renderer=renderer,
+        storage=storage,
+        generation_repository=MagicMock(get_by_id=AsyncMock(return_value=generation)),
+        export_repository=export_repository,
+        job_repository=MagicMock()
+    )
+    return service, renderer, storage
+
+
+def test_fingerprint_normalizes_options_and_separates_inputs():
+    base = render_fingerprint(CONTENT, ExportFormat.PDF, TemplateType.MODERN, {"a": 1, "b": 2})
+
+    assert render_fingerprint(
+        CONTENT, ExportFormat.PDF, TemplateType.MODERN, {"b": 2, "a": 1, "c": None}
+    ) == base
+    assert render_fingerprint(
+        '{"header": {"name": "Ada Lovelace"}, "sections": '
+        '[{"type": "professional_summary", "content": "Engineer."}]}',
+        ExportFormat.PDF, TemplateType.MODERN, {"a": 1, "b": 2}
+    ) == base
+    assert render_fingerprint(CONTENT, ExportFormat.DOCX, TemplateType.MODERN, {"a": 1, "b": 2}) != base
+    assert render_fingerprint(CONTENT, ExportFormat.PDF, TemplateType.CLASSIC, {"a": 1, "b": 2}) != base
+    assert render_fingerprint(CONTENT, ExportFormat.PDF, TemplateType.MODERN, {"a": 2, "b": 2}) != base
+
+
+@pytest.mark.asyncio
+async def test_identical_export_reuses_stored_file(db_session):
+    """The second identical export skips render and upload and gets a fresh URL."""
+    service, renderer, storage = make_service(ExportRepository(db_session))
+
+    first = await service.export_to_docx(1, "gen-1", TemplateType.MODERN, {"font": "Inter"})
+    second = await service.export_to_docx(1, "gen-1", TemplateType.MODERN, {"font": "Inter"})
+
+    assert second.id == first.id
+    assert second.file_path == first.file_path
+    assert second.download_url.startswith(f"memory://{first.file_path}?expires=")
+    renderer.render_docx.assert_called_once()
+    assert list(storage.files) == [first.file_path]
+
+    other = await service.export_to_docx(1, "gen-1", TemplateType.CLASSIC, {"font": "Inter"})
+    assert other.id != first.id
+    assert renderer.render_docx.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_or_foreign_exports_are_not_reused(db_session):
+    repository = ExportRepository(db_session)
+    render_hash = "f" * 64
+    await repository.create(Export(
+        id="old", user_id=1, generation_id="gen-1", job_id=None, format=ExportFormat.PDF,
+        template=TemplateType.MODERN, filename="resume.pdf", file_path="exports/1/old.pdf",
+        file_size_bytes=10, expires_at=datetime.utcnow() - timedelta(days=1),
+        render_hash=render_hash
+    ))
+
+    assert await repository.get_by_render_hash(1, "gen-1", render_hash) is None
+
+    await repository.create(Export(
+        id="new", user_id=1, generation_id="gen-1", job_id=None, format=ExportFormat.PDF,
+        template=TemplateType.MODERN, filename="resume.pdf", file_path="exports/1/new.pdf",
+        file_size_bytes=10, render_hash=render_hash
+    ))
+
+    assert (await repository.get_by_render_hash(1, "gen-1", render_hash)).id == "new"
+    assert await repository.get_by_render_hash(2, "gen-1", render_hash) is None
+    assert await repository.get_by_render_hash(1, "gen-2", render_hash) is None
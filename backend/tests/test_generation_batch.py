@@ -0,0 +1,193 @@
+"""Tests for batch generation of resumes and cover letters across several jobs."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.generation_service import (
+    BatchJobResult,
+    BatchSummary,
+    GenerationService,
+)
+from app.core.config import get_settings
+from app.core.dependencies import get_current_user
+from app.domain.entities.profile import Experience, PersonalInfo, Profile, Project, Skills
+from app.domain.enums.document_type import DocumentType
+from app.domain.enums.generation_status import GenerationStatus
+from app.infrastructure.adapters.llm.llm_client import LLMQueueTimeoutError
+from app.main import app
+from app.presentation.api.generation import _batch_events
+from app.presentation.schemas.generation import BatchGenerateRequest
+
+
+def make_profile() -> Profile:
+    return Profile(
+        user_id=1,
+        personal_info=PersonalInfo(full_name="Ada Lovelace", email="ada@example.com"),
+        professional_summary="Engineer.",
+        skills=Skills(technical=["Python"]),
+        experiences=[
+            Experience(title="Backend Engineer", company="Acme", start_date="2020-01-01",
+                       description="Built Python services."),
+        ],
+        projects=[
+            Project(name="Tracker", description="Job tracker app", start_date="2023-01-01"),
+        ],
+    )
+
+
+def make_job(title: str):
+    return SimpleNamespace(title=title, company="Acme", description=f"{title} role",
+                           requirements=[], parsed_keywords=[])
+
+
+def make_service(jobs, cover_letter=None):
+    """GenerationService with mocked repositories, ranker and LLM."""
+    profile = make_profile()
+    profile_repo = AsyncMock()
+    profile_repo.get_active_by_user_id.return_value = profile
+    profile_repo.get_experiences_by_profile_id.return_value = profile.experiences
+    profile_repo.get_text_index.return_value = {}
+
+    job_repo = AsyncMock()
+    job_repo.get_by_id.side_effect = lambda job_id, user_id: jobs.get(job_id)
+
+    ranking_service = AsyncMock()
+    ranking_service.get_ranking_for_job.return_value = None
+    ranking_service.compute_ranking.side_effect = lambda user_id, job_id, *args: SimpleNamespace(
+        id=uuid4(), job_id=job_id,
+        ranked_experience_ids=[exp.id for exp in profile.experiences],
+        ranked_project_ids=[proj.id for proj in profile.projects],
+    )
+
+    llm = MagicMock()
+    llm.generate_cover_letter = cover_letter or AsyncMock(return_value="Dear Acme,")
+    generation_repo = AsyncMock()
+    service = GenerationService(
+        llm, generation_repo, profile_repo, job_repo, ranking_service, AsyncMock()
+    )
+    service._calculate_ats_score = AsyncMock(return_value={"score": 80.0, "analysis": "ok"})
+    return service
+
+
+async def run_batch(service, job_ids, **kwargs):
+    context = await service.prepare_batch(1, job_ids, [DocumentType.RESUME, DocumentType.COVER_LETTER])
+    return [item async for item in service.stream_batch(context, **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_each_job_and_saves_once():
+    """Each job yields its documents; a missing job fails alone; everything is saved in one insert."""
+    found, other, missing = uuid4(), uuid4(), uuid4()
+    service = make_service({str(found): make_job("Backend"), str(other): make_job("Data")})
+
+    items = await run_batch(service, [found, other, missing])
+
+    results = {item.job_id: item for item in items if isinstance(item, BatchJobResult)}
+    summary = items[-1]
+    assert isinstance(summary, BatchSummary)
+    assert results[missing].error == "Job not found"
+    assert [g.document_type for g in results[found].generations] == [
+        DocumentType.RESUME, DocumentType.COVER_LETTER
+    ]
+    assert all(g.ats_score == 80.0 for g in results[other].generations)
+    assert (summary.total_jobs, summary.succeeded, summary.failed) == (3, 2, 1)
+
+    service.profile_repo.get_active_by_user_id.assert_awaited_once()
+    service.style_service.get_user_style.assert_awaited_once()
+    service.generation_repo.create.assert_not_awaited()
+    service.generation_repo.create_many.assert_awaited_once()
+    saved = service.generation_repo.create_many.await_args.args[0]
+    assert [g.id for g in saved] == summary.generation_ids
+    assert len(service.ranking_service.save_rankings.await_args.args[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_bounds_concurrent_llm_calls(monkeypatch):
+    """No more than batch_generation_concurrency jobs call the LLM at once."""
+    monkeypatch.setattr(get_settings(), "batch_generation_concurrency", 2)
+    in_flight, peak = 0, 0
+
+    async def cover_letter(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "Dear Acme,"
+
+    job_ids = [uuid4() for _ in range(5)]
+    service = make_service({str(job_id): make_job("Backend") for job_id in job_ids}, cover_letter)
+
+    items = await run_batch(service, job_ids)
+
+    assert peak == 2
+    assert items[-1].succeeded == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_defers_ats_until_saved():
+    """Deferred scoring leaves results pending and starts only after the insert."""
+    job_id = uuid4()
+    service = make_service({str(job_id): make_job("Backend")})
+    service._schedule_ats_score = MagicMock()
+
+    items = await run_batch(service, [job_id], defer_ats=True)
+
+    generations = items[0].generations
+    assert all(g.ats_status == GenerationStatus.PENDING for g in generations)
+    service._calculate_ats_score.assert_not_awaited()
+    assert service._schedule_ats_score.call_count == len(generations)
+
+
+@pytest.mark.asyncio
+async def test_batch_events_format_sse():
+    """Per-job results become `job` events and the summary a `complete` event."""
+    job_id = uuid4()
+    service = make_service({str(job_id): make_job("Backend")})
+    request = BatchGenerateRequest(job_ids=[job_id], document_types=[DocumentType.RESUME])
+    context = await service.prepare_batch(1, request.job_ids, request.document_types)
+
+    frames = [frame async for frame in _batch_events(service, context, request)]
+
+    assert frames[0].startswith("event: job\n")
+    job_event = json.loads(frames[0].split("data: ", 1)[1])
+    assert job_event["success"] is True
+    assert job_event["generations"][0]["document_type"] == "resume"
+    assert frames[1].startswith("event: complete\n")
+    service.style_service.get_user_style.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_events_report_save_failure_in_band():
+    """If the final insert fails the stream ends with an `error` event."""
+    job_id = uuid4()
+    service = make_service({str(job_id): make_job("Backend")})
+    service.generation_repo.create_many.side_effect = RuntimeError("database is locked")
+    request = BatchGenerateRequest(job_ids=[job_id])
+    context = await service.prepare_batch(1, request.job_ids, request.document_types)
+
+    frames = [frame async for frame in _batch_events(service, context, request)]
+
+    assert frames[0].startswith("event: job\n")
+    assert frames[-1].startswith("event: error\n")
+    assert "database is locked" in frames[-1]
+
+
+@pytest.mark.asyncio
+async def test_batch_prepare_queue_timeout_is_503(client, monkeypatch):
+    """Style extraction timing out on an LLM slot is a 503, as on the other endpoints."""
+    app.dependency_overrides[get_current_user] = lambda: 1
+    monkeypatch.setattr(
+        GenerationService, "prepare_batch", AsyncMock(side_effect=LLMQueueTimeoutError("m", 5))
+    )
+
+    response = await client.post("/api/v1/generations/batch", json={
+        "job_ids": ["8a1e2c7e-35c4-4a59-9a43-64b1e0c6b0f1"]
+    })
+
+    assert response.status_code == 503
@@ -0,0 +1,104 @@
+"""Tests for streamed (SSE) cover letter generation."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.generation_service import GenerationService
+from app.domain.entities.generation import Generation
+from app.domain.enums.document_type import DocumentType
+from app.domain.enums.generation_status import GenerationStatus
+from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
+from app.infrastructure.adapters.llm.llm_client import ModelConcurrencyLimiter
+from app.presentation.api.generation import _cover_letter_events
+
+
+def stream_chunks(*texts):
+    """Async iterator shaped like a Groq streaming response."""
+    async def iterate():
+        for text in texts:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None))])
+    return iterate()
+
+
+@pytest.mark.asyncio
+async def test_stream_completion_yields_deltas_within_model_slot():
+    """Deltas are yielded as they arrive while the model slot is held."""
+    limiter = ModelConcurrencyLimiter({}, default_limit=1, queue_timeout=1)
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=stream_chunks("Dear ", "Hiring"))
+    adapter = GroqAdapter(client=client, limiter=limiter)
+
+    deltas = []
+    async for delta in adapter.stream_completion("prompt", model="m"):
+        deltas.append((delta, limiter.snapshot()["m"]["in_flight"]))
+
+    assert deltas == [("Dear ", 1), ("Hiring", 1)]
+    assert limiter.snapshot()["m"]["in_flight"] == 0
+    assert client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_service_stream_saves_generation_after_last_token(cover_letter_context):
+    """The service relays every delta, then persists and yields the full letter."""
+    llm = MagicMock()
+    llm.stream_cover_letter = MagicMock(return_value=stream_text("Dear Acme,", "\n\nThanks."))
+    generation_repo = AsyncMock()
+    service = GenerationService(llm, generation_repo, AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock())
+
+    items = [item async for item in service.stream_cover_letter(cover_letter_context)]
+
+    assert items[:2] == ["Dear Acme,", "\n\nThanks."]
+    generation = items[-1]
+    assert isinstance(generation, Generation)
+    assert generation.content_text == "Dear Acme,\n\nThanks."
+    generation_repo.create.assert_awaited_once_with(generation)
+
+
+@pytest.mark.asyncio
+async def test_cover_letter_events_format_sse(cover_letter_context):
+    """Tokens become `token` events and the saved generation a `complete` event."""
+    generation = Generation(
+        id=uuid4(), user_id=1, job_id=uuid4(), ranking_id=None,
+        document_type=DocumentType.COVER_LETTER, content_text="Hi",
+        status=GenerationStatus.COMPLETED,
+    )
+    service = MagicMock()
+    service.stream_cover_letter = MagicMock(return_value=stream_items("Hi", generation))
+
+    frames = [frame async for frame in _cover_letter_events(service, cover_letter_context)]
+
+    assert frames[0] == 'event: token\ndata: {"text": "Hi"}\n\n'
+    assert frames[1].startswith("event: complete\ndata: ")
+    assert json.loads(frames[1].split("data: ", 1)[1])["generation_id"] == str(generation.id)
+
+
+@pytest.mark.asyncio
+async def test_cover_letter_events_report_errors_in_band(cover_letter_context):
+    """A failure after the stream opened is sent as an `error` event."""
+    async def failing(context, defer_ats=False):
+        yield "Dear"
+        raise RuntimeError("upstream closed")
+
+    service = MagicMock()
+    service.stream_cover_letter = failing
+
+    frames = [frame async for frame in _cover_letter_events(service, cover_letter_context)]
+
+    assert frames[-1].startswith("event: error\n")
+    assert "upstream closed" in frames[-1]
+
+
+async def stream_text(*texts):
+    for text in texts:
+        yield text
+
+
+async def stream_items(*items):
+    for item in items:
+        yield item
+
@@ -5,7 +5,7 @@ from httpx import AsyncClient
 from unittest.mock import AsyncMock, patch
 
 from app.main import app
-from app.domain.entities.job import Job
+from app.domain.entities.job import Job, JobSummary
 from app.core.dependencies import get_current_user, get_job_service
 from datetime import datetime
 
@@ -186,6 +186,54 @@ async def test_get_user_jobs_empty_list(authenticated_client, mock_job_service):
     assert data["pagination"]["hasMore"] is False
 
 
+@pytest.mark.asyncio
+async def test_get_user_jobs_next_cursor(authenticated_client, mock_job_service, sample_job):
+    """Test a full page returns a nextCursor that is passed back to the service."""
+    mock_job_service.get_user_jobs.return_value = [sample_job]
+    mock_job_service.count_user_jobs.return_value = 3
+    
+    async with authenticated_client as client:
+        response = await client.get("/api/v1/jobs", params={"limit": 1})
+        next_cursor = response.json()["pagination"]["nextCursor"]
+        assert next_cursor
+        
+        response = await client.get("/api/v1/jobs", params={"limit": 1, "cursor": next_cursor})
+    
+    assert response.status_code == 200
+    assert mock_job_service.get_user_jobs.call_args.kwargs["cursor"] == next_cursor
+
+
+@pytest.mark.asyncio
+async def test_get_user_jobs_invalid_cursor(authenticated_client, mock_job_service):
+    """Test a malformed cursor is rejected with 422."""
+    mock_job_service.get_user_jobs.side_effect = ValueError("Invalid pagination cursor")
+    
+    async with authenticated_client as client:
+        response = await client.get("/api/v1/jobs", params={"cursor": "bogus"})
+    
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_user_job_summaries(authenticated_client, mock_job_service, sample_job):
+    """Test the summary list returns slim items without description or raw text."""
+    mock_job_service.get_user_job_summaries.return_value = [
+        JobSummary(**sample_job.model_dump(include=set(JobSummary.model_fields)))
+    ]
+    mock_job_service.count_user_jobs.return_value = 1
+    
+    async with authenticated_client as client:
+        response = await client.get("/api/v1/jobs/summary", params={"status": "active"})
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["jobs"][0]["title"] == "Senior Python Developer"
+    assert "raw_text" not in data["jobs"][0]
+    assert "description" not in data["jobs"][0]
+    assert mock_job_service.get_user_job_summaries.call_args.kwargs["status"] == "active"
+
+
 # Test GET /jobs/browse - Browse mock jobs
 @pytest.mark.asyncio
 async def test_browse_jobs(mock_job_service, sample_job):
@@ -366,3 +414,45 @@ async def test_pagination_zero_limit(authenticated_client, mock_job_service):
     
     # Should either reject with 422 or accept with minimum value
     assert response.status_code in [200, 422]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_jobs(authenticated_client, mock_job_service, sample_job):
+    """Test bulk import reports created and failed postings."""
+    from app.application.services.job_service import JobImportResult
+    mock_job_service.bulk_import.return_value = [
+        JobImportResult(index=0, job=sample_job),
+        JobImportResult(index=1, error="Mock jobs cannot be saved to database."),
+    ]
+    
+    async with authenticated_client as client:
+        response = await client.post(
+            "/api/v1/jobs/bulk",
+            json={"jobs": [
+                {"raw_text": "Senior Python Developer\nTechCorp\nGreat opportunity"},
+                {"source": "mock", "title": "Fake", "company": "Nowhere"},
+            ]}
+        )
+    
+    assert response.status_code == 201
+    data = response.json()
+    assert data["created"] == 1
+    assert data["failed"] == 1
+    assert data["results"][0]["job"]["id"] == "job_test123"
+    assert data["results"][1]["success"] is False
+    
+    items = mock_job_service.bulk_import.call_args.kwargs["items"]
+    assert items[0] == "Senior Python Developer\nTechCorp\nGreat opportunity"
+    assert items[1]["source"] == "mock"
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_jobs_too_many(authenticated_client, mock_job_service):
+    """Test bulk import rejects batches over the configured limit."""
+    jobs = [{"raw_text": f"Job posting number {i}"} for i in range(101)]
+    
+    async with authenticated_client as client:
+        response = await client.post("/api/v1/jobs/bulk", json={"jobs": jobs})
+    
+    assert response.status_code == 422
+    mock_job_service.bulk_import.assert_not_called()
@@ -245,3 +245,101 @@ async def test_pagination(db_session: AsyncSession):
     # Ensure no duplicates
     all_ids = [job.id for job in page1 + page2 + page3]
     assert len(all_ids) == len(set(all_ids))
+
+
+@pytest.mark.asyncio
+async def test_count_user_jobs(db_session: AsyncSession):
+    """Test counting user jobs applies the same filters as the list query."""
+    repo = JobRepository(db_session)
+    
+    for status, source in [("active", "user_created"), ("archived", "user_created"),
+                           ("active", "imported"), ("active", "mock")]:
+        await repo.create({
+            "user_id": 1,
+            "source": source,
+            "title": f"{status} {source}",
+            "company": "Company",
+            "status": status
+        })
+    await repo.create({"user_id": 2, "source": "user_created", "title": "Other", "company": "Company"})
+    
+    assert await repo.count_user_jobs(user_id=1) == 3
+    assert await repo.count_user_jobs(user_id=1, status="active") == 2
+    assert await repo.count_user_jobs(user_id=1, source="user_created") == 2
+    assert await repo.count_user_jobs(user_id=1, status="active", source="imported") == 1
+    assert await repo.count_user_jobs(user_id=3) == 0
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination(db_session: AsyncSession):
+    """Test keyset pages match offset pages, including jobs with equal created_at."""
+    repo = JobRepository(db_session)
+    
+    created_at = datetime(2025, 1, 1, 12, 0, 0)
+    for i in range(5):
+        await repo.create({
+            "user_id": 1,
+            "source": "user_created",
+            "title": f"Job {i}",
+            "company": f"Company {i}",
+            # Three jobs share a timestamp so the id tie-breaker is exercised
+            "created_at": created_at if i < 3 else datetime(2025, 1, 2, i)
+        })
+    
+    offset_ids = [job.id for job in await repo.get_user_jobs(user_id=1, limit=10)]
+    
+    keyset_ids = []
+    page = await repo.get_user_jobs(user_id=1, limit=2)
+    while page:
+        keyset_ids.extend(job.id for job in page)
+        last = page[-1]
+        page = await repo.get_user_jobs_after(
+            user_id=1, after_created_at=last.created_at, after_id=last.id, limit=2
+        )
+    
+    assert keyset_ids == offset_ids
+    assert len(keyset_ids) == 5
+
+
+@pytest.mark.asyncio
+async def test_get_user_job_summaries(db_session: AsyncSession):
+    """Test job summaries match the full list without carrying the text columns."""
+    repo = JobRepository(db_session)
+    
+    for i in range(3):
+        await repo.create({
+            "user_id": 1,
+            "source": "user_created",
+            "title": f"Job {i}",
+            "company": f"Company {i}",
+            "description": "Long description " * 100,
+            "raw_text": "Original posting " * 100
+        })
+    
+    jobs = await repo.get_user_jobs(user_id=1)
+    summaries = await repo.get_user_job_summaries(user_id=1)
+    
+    assert [s.id for s in summaries] == [j.id for j in jobs]
+    assert [s.title for s in summaries] == [j.title for j in jobs]
+    assert not hasattr(summaries[0], "raw_text")
+    
+    page = await repo.get_user_job_summaries(
+        user_id=1, limit=1, after=(summaries[0].created_at, summaries[0].id)
+    )
+    assert [s.id for s in page] == [summaries[1].id]
+
+
+@pytest.mark.asyncio
+async def test_create_many_jobs(db_session: AsyncSession):
+    """Test inserting several jobs in one batch."""
+    repo = JobRepository(db_session)
+    jobs = [
+        Job(user_id=1, source="user_created", title=f"Job {i}", company="Tech Corp",
+            parsed_keywords=["python"])
+        for i in range(3)
+    ]
+    
+    created = await repo.create_many(jobs)
+    
+    assert [job.id for job in created] == [job.id for job in jobs]
+    assert await repo.count_user_jobs(user_id=1) == 3
@@ -5,7 +5,7 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.application.services.job_service import JobService
+from app.application.services.job_service import JobService, encode_job_cursor
 from app.domain.entities.job import Job
 from app.infrastructure.repositories.job_repository import JobRepository
 
@@ -166,6 +166,49 @@ async def test_get_user_jobs_with_filters(job_service, mock_repository):
     )
 
 
+@pytest.mark.asyncio
+async def test_get_user_jobs_with_cursor(job_service, mock_repository):
+    """Test a cursor switches the service to keyset pagination."""
+    last = Job(
+        id="job_1",
+        user_id=1,
+        source="user_created",
+        title="Job 1",
+        company="Company 1",
+        created_at=datetime(2025, 1, 1, 12, 0, 0),
+        updated_at=datetime(2025, 1, 1, 12, 0, 0)
+    )
+    mock_repository.get_user_jobs_after.return_value = []
+    
+    await job_service.get_user_jobs(user_id=1, limit=10, cursor=encode_job_cursor(last))
+    
+    mock_repository.get_user_jobs_after.assert_called_once_with(
+        user_id=1,
+        after_created_at=last.created_at,
+        after_id="job_1",
+        status=None,
+        source=None,
+        limit=10
+    )
+    mock_repository.get_user_jobs.assert_not_called()
+    
+    with pytest.raises(ValueError):
+        await job_service.get_user_jobs(user_id=1, cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_count_user_jobs_uses_sql_count(job_service, mock_repository):
+    """Test counting delegates to the repository COUNT query."""
+    mock_repository.count_user_jobs.return_value = 42
+    
+    assert await job_service.count_user_jobs(user_id=1, status="active") == 42
+    
+    mock_repository.count_user_jobs.assert_called_once_with(
+        user_id=1, status="active", source=None
+    )
+    mock_repository.get_user_jobs.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_browse_mock_jobs(job_service):
     """Test browsing mock job listings from JSON file."""
@@ -327,3 +370,45 @@ async def test_get_job_by_id(job_service, mock_repository):
     assert result.id == job_id
     assert result.title == "Test Job"
     mock_repository.get_by_id.assert_called_once_with(job_id)
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_reports_per_item_errors(job_service, mock_repository, monkeypatch):
+    """Valid postings are inserted together; invalid ones get their own error."""
+    monkeypatch.setattr("app.application.services.job_service.get_job_parse_pool", lambda: None)
+    
+    results = await job_service.bulk_import(user_id=1, items=[
+        "Python Developer\nTechCorp\nRemote\nWork with Django and AWS.",
+        {"source": "mock", "title": "Fake", "company": "Nowhere"},
+        {"title": "Go Engineer", "company": "Acme", "description": "Golang services", "source": "linkedin"},
+        "x" * 300,
+    ])
+    
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert results[0].job.title == "Python Developer"
+    assert "django" in results[0].job.parsed_keywords
+    assert results[1].job is None and "Mock jobs" in results[1].error
+    assert results[2].job.parsed_keywords == ["go"]
+    assert results[3].job is None and "title" in results[3].error
+    
+    saved = mock_repository.create_many.call_args.args[0]
+    assert [job.title for job in saved] == ["Python Developer", "Go Engineer"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_parses_on_worker_pool(job_service, mock_repository):
+    """Raw texts parsed in worker processes match in-process parsing."""
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    
+    texts = [f"Engineer {i}\nCompany {i}\nKubernetes and Python required" for i in range(3)]
+    pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        with patch("app.application.services.job_service.get_job_parse_pool", return_value=pool):
+            results = await job_service.bulk_import(user_id=1, items=texts)
+    finally:
+        pool.shutdown()
+    
+    assert [result.job.title for result in results] == ["Engineer 0", "Engineer 1", "Engineer 2"]
+    assert all(result.job.parsed_keywords == ["kubernetes", "python"] for result in results)
+    mock_repository.create_many.assert_called_once()
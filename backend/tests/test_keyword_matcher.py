@@ -0,0 +1,100 @@
+"""Golden tests for the precompiled job keyword matcher and keyword taxonomy."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.application.services import keyword_taxonomy
+from app.application.services.keyword_matcher import KeywordMatcher
+from app.application.services.keyword_taxonomy import (
+    KeywordTaxonomy,
+    TaxonomyEntry,
+    get_keyword_taxonomy,
+)
+
+GOLDEN_PATH = Path(__file__).parent / "data" / "parse_keywords_golden.json"
+GOLDEN_CASES = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))["cases"]
+
+
+@pytest.mark.parametrize("case", GOLDEN_CASES, ids=[case["name"] for case in GOLDEN_CASES])
+def test_matches_golden_keywords(case):
+    """Raw matches are identical to the per-keyword regex implementation it replaced."""
+    assert get_keyword_taxonomy().matcher.find(case["text"]) == case["keywords"]
+
+
+@pytest.mark.parametrize("case", GOLDEN_CASES, ids=[case["name"] for case in GOLDEN_CASES])
+def test_extract_is_canonical_golden_keywords(case):
+    """Extraction reports the golden keywords with aliases folded into canonical names."""
+    taxonomy = get_keyword_taxonomy()
+    expected = sorted(set(taxonomy.canonicalize(case["keywords"])))
+
+    assert taxonomy.extract(case["text"]) == expected
+
+
+def test_boundaries_follow_keyword_edges():
+    """Word boundaries apply on word-character edges; punctuation edges need a word beside them."""
+    matcher = KeywordMatcher(["spring", "spring boot", ".net", "ci/cd"])
+
+    assert matcher.find("Spring Boot") == ["spring", "spring boot"]
+    assert matcher.find("springboot") == []
+    assert matcher.find("asp.net ci/cd") == [".net", "ci/cd"]
+    assert matcher.find("use .net") == []
+
+
+def test_special_tokens_and_context_rules():
+    """C#/C++ are substring matches; R and Go need supporting context."""
+    taxonomy = get_keyword_taxonomy()
+
+    assert taxonomy.extract("Senior C# and C++ engineer") == ["c#", "c++"]
+    assert "r" not in taxonomy.extract("R is a plus")
+    assert "r" in taxonomy.extract("R programming with tidyverse")
+    assert "go" in taxonomy.extract("Go (golang) services")
+
+
+def test_aliases_fold_to_canonical_names():
+    """Variant spellings produce one canonical keyword."""
+    taxonomy = get_keyword_taxonomy()
+
+    assert taxonomy.extract("React and ReactJS with K8s") == ["kubernetes", "react"]
+    assert taxonomy.canonicalize(["reactjs", "react", "Postgres", "custom-tool"]) == [
+        "react", "postgresql", "custom-tool",
+    ]
+    assert taxonomy.category("nodejs") == "backend"
+
+
+def test_conflicting_aliases_rejected():
+    """An alias may only belong to one canonical keyword."""
+    with pytest.raises(ValueError):
+        KeywordTaxonomy([
+            TaxonomyEntry("react", "frontend", aliases=["rx"]),
+            TaxonomyEntry("rxjs", "frontend", aliases=["rx"]),
+        ])
+
+
+def test_taxonomy_hot_reloads_when_file_changes(tmp_path, monkeypatch):
+    """Editing the file takes effect on the next lookup; a broken edit keeps the old taxonomy."""
+    path = tmp_path / "taxonomy.json"
+    monkeypatch.setattr(keyword_taxonomy, "get_taxonomy_path", lambda: path)
+    monkeypatch.setattr(keyword_taxonomy, "_taxonomy", None)
+    monkeypatch.setattr(keyword_taxonomy, "_taxonomy_mtime", None)
+
+    path.write_text(json.dumps({"keywords": [{"canonical": "python", "category": "languages"}]}))
+    assert get_keyword_taxonomy().extract("Python and Rust") == ["python"]
+
+    path.write_text(json.dumps({"version": 2, "keywords": [
+        {"canonical": "python", "category": "languages"},
+        {"canonical": "rust", "category": "languages", "aliases": ["rustlang"]},
+    ]}))
+    _bump_mtime(path)
+    assert get_keyword_taxonomy().extract("Python and Rustlang") == ["python", "rust"]
+
+    path.write_text("{not json")
+    _bump_mtime(path)
+    assert get_keyword_taxonomy().version == 2
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
@@ -0,0 +1,113 @@
+"""Tests for the shared LLM client and per-model concurrency limiter."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+
+from app.infrastructure.adapters.llm import llm_client
+from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
+from app.infrastructure.adapters.llm.llm_client import (
+    LLMQueueTimeoutError,
+    ModelConcurrencyLimiter,
+    close_llm_adapter,
+    get_llm_adapter,
+    get_llm_status,
+    init_llm_adapter,
+)
+
+
+@pytest_asyncio.fixture
+async def shared_adapter():
+    """Fresh process-wide adapter, closed after the test."""
+    await close_llm_adapter()
+    yield init_llm_adapter()
+    await close_llm_adapter()
+
+
+@pytest.mark.asyncio
+async def test_init_llm_adapter_is_singleton(shared_adapter):
+    """Every caller gets the same adapter and pooled HTTP client."""
+    assert init_llm_adapter() is shared_adapter
+    assert get_llm_adapter() is shared_adapter
+    assert shared_adapter.client._client is llm_client._http_client
+
+    status = get_llm_status()
+    assert status["initialized"] is True
+    assert set(status["models"]) == {shared_adapter.fast_model, shared_adapter.quality_model}
+
+
+@pytest.mark.asyncio
+async def test_close_llm_adapter_resets_singleton(shared_adapter):
+    """Closing drops the adapter so the next call builds a new one."""
+    await close_llm_adapter()
+
+    assert get_llm_status() == {"initialized": False}
+    assert get_llm_adapter() is not shared_adapter
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_concurrency_per_model():
+    """No more than the model's limit run at once; the rest queue."""
+    limiter = ModelConcurrencyLimiter({"fast": 2}, default_limit=1, queue_timeout=5)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with limiter.slot("fast"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    metrics = limiter.snapshot()["fast"]
+    assert peak == 2
+    assert metrics["acquired"] == 6
+    assert metrics["max_queued"] >= 4
+    assert metrics["queued"] == 0
+    assert metrics["in_flight"] == 0
+    assert metrics["max_wait_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_queue_timeout():
+    """A caller that cannot get a slot in time fails and is counted."""
+    limiter = ModelConcurrencyLimiter({"quality": 1}, default_limit=1, queue_timeout=0.01)
+
+    async with limiter.slot("quality"):
+        with pytest.raises(LLMQueueTimeoutError):
+            async with limiter.slot("quality"):
+                pass
+
+    metrics = limiter.snapshot()["quality"]
+    assert metrics["timeouts"] == 1
+    assert metrics["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_completion_holds_model_slot():
+    """The adapter runs each API call inside the model's concurrency slot."""
+    limiter = ModelConcurrencyLimiter({}, default_limit=1, queue_timeout=1)
+    client = MagicMock()
+    in_flight = []
+
+    async def create(**kwargs):
+        in_flight.append(limiter.snapshot()[kwargs["model"]]["in_flight"])
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))],
+            usage=SimpleNamespace(total_tokens=3, prompt_tokens=2, completion_tokens=1),
+        )
+
+    client.chat.completions.create = AsyncMock(side_effect=create)
+    adapter = GroqAdapter(client=client, limiter=limiter)
+
+    result = await adapter.generate_completion("prompt", model=adapter.fast_model)
+
+    assert result["content"] == "ok"
+    assert in_flight == [1]
+    assert limiter.snapshot()[adapter.fast_model]["in_flight"] == 0
@@ -0,0 +1,165 @@
+"""Tests for per-user LLM token budgets and weighted-fair slot scheduling."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.services.generation_service import GenerationService
+from app.core.dependencies import get_current_user
+from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
+from app.infrastructure.adapters.llm.llm_client import FairSlots, ModelConcurrencyLimiter
+from app.infrastructure.adapters.llm.rate_limit import (
+    LLMRateLimitError,
+    UserTokenLimiter,
+    current_llm_user,
+)
+from app.main import app
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_limiter(clock, tokens_per_minute=600, max_wait=5.0):
+    # 600 tokens/minute refills 10 tokens per second
+    return UserTokenLimiter({"m": tokens_per_minute}, default_tokens_per_minute=0,
+                            max_wait=max_wait, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_budget_is_per_user_and_rejects_long_waits():
+    """A user over budget gets a retry hint; another user is unaffected."""
+    limiter = make_limiter(FakeClock())
+
+    await limiter.reserve(1, "m", 600)
+    with pytest.raises(LLMRateLimitError) as error:
+        await limiter.reserve(1, "m", 100)
+    await limiter.reserve(2, "m", 600)
+
+    assert error.value.retry_after == pytest.approx(10.0)
+    assert error.value.retry_after_seconds == 10
+    assert limiter.snapshot()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_waits_for_short_refills(monkeypatch):
+    """A small deficit is waited out instead of rejected."""
+    limiter = make_limiter(FakeClock())
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    await limiter.reserve(1, "m", 600)
+    await limiter.reserve(1, "m", 20)
+
+    assert sleeps == [pytest.approx(2.0)]
+    assert limiter.snapshot()["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_settle_charges_actual_usage():
+    """Unused reserved tokens are refunded once the real usage is known."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+
+    reservation = await limiter.reserve(1, "m", 600)
+    limiter.settle(reservation, 100)
+
+    await limiter.reserve(1, "m", 500)
+    with pytest.raises(LLMRateLimitError):
+        await limiter.reserve(1, "m", 100)
+
+
+@pytest.mark.asyncio
+async def test_models_without_quota_are_unlimited():
+    limiter = make_limiter(FakeClock())
+    assert await limiter.reserve(1, "other", 10 ** 6) is None
+
+
+@pytest.mark.asyncio
+async def test_fair_slots_interleave_users():
+    """A user with a backlog takes turns with a user who queued later."""
+    slots = FairSlots(limit=1)
+    order = []
+
+    async def call(user):
+        await slots.acquire(user, cost=100)
+        order.append(user)
+        await asyncio.sleep(0)
+        slots.release()
+
+    await slots.acquire("holder")
+    waiters = [asyncio.create_task(call("heavy")) for _ in range(3)]
+    await asyncio.sleep(0)
+    waiters.append(asyncio.create_task(call("light")))
+    await asyncio.sleep(0)
+    slots.release()
+    await asyncio.gather(*waiters)
+
+    assert order.index("light") < 2
+    assert slots.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_completion_charges_current_user():
+    """The adapter reserves from the request's user and settles to real usage."""
+    token_limiter = make_limiter(FakeClock())
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))],
+        usage=SimpleNamespace(total_tokens=550, prompt_tokens=500, completion_tokens=50),
+    ))
+    adapter = GroqAdapter(
+        client=client,
+        limiter=ModelConcurrencyLimiter({}, default_limit=1, queue_timeout=1),
+        token_limiter=token_limiter,
+    )
+
+    token = current_llm_user.set(7)
+    try:
+        await adapter.generate_completion("prompt", max_tokens=100, model="m", cache=False)
+        with pytest.raises(LLMRateLimitError):
+            await adapter.generate_completion("prompt", max_tokens=100, model="m", cache=False)
+    finally:
+        current_llm_user.reset(token)
+
+    assert client.chat.completions.create.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_api_returns_429_with_retry_after(client, monkeypatch):
+    """An exhausted budget surfaces as 429 with a Retry-After header."""
+    app.dependency_overrides[get_current_user] = lambda: 1
+    monkeypatch.setattr(
+        GenerationService, "generate_resume", AsyncMock(side_effect=LLMRateLimitError("m", 2.5))
+    )
+
+    response = await client.post("/api/v1/generations/resume", json={
+        "job_id": "8a1e2c7e-35c4-4a59-9a43-64b1e0c6b0f1"
+    })
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_batch_api_returns_429_when_budget_runs_out_in_prepare(client, monkeypatch):
+    app.dependency_overrides[get_current_user] = lambda: 1
+    monkeypatch.setattr(
+        GenerationService, "prepare_batch", AsyncMock(side_effect=LLMRateLimitError("m", 2.5))
+    )
+
+    response = await client.post("/api/v1/generations/batch", json={
+        "job_ids": ["8a1e2c7e-35c4-4a59-9a43-64b1e0c6b0f1"]
+    })
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
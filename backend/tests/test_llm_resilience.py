@@ -0,0 +1,237 @@
+"""Tests for LLM call deadlines, retries, hedging and model fallback."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import groq
+import httpx
+import pytest
+
+from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
+from app.infrastructure.adapters.llm.llm_client import ModelConcurrencyLimiter
+from app.infrastructure.adapters.llm.resilience import (
+    LLMDeadlineExceeded,
+    LLMResiliencePolicy,
+    LLMUpstreamError,
+)
+from app.infrastructure.adapters.llm.rate_limit import (
+    UserTokenLimiter,
+    current_llm_user,
+    estimate_tokens,
+)
+
+REQUEST = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+
+
+def api_error(status_code, headers=None):
+    error_type = {429: groq.RateLimitError, 400: groq.BadRequestError}.get(
+        status_code, groq.InternalServerError
+    )
+    response = httpx.Response(status_code, headers=headers or {}, request=REQUEST)
+    return error_type(f"status {status_code}", response=response, body=None)
+
+
+def completion(content="ok"):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(total_tokens=3, prompt_tokens=2, completion_tokens=1),
+    )
+
+
+def make_adapter(create, **policy):
+    client = MagicMock()
+    client.chat.completions.create = create
+    options = {"deadlines": {}, "default_deadline": 1.0, "backoff_base": 0, **policy}
+    adapter = GroqAdapter(client=client, resilience=LLMResiliencePolicy(**options))
+    return adapter, client
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of waiting them out (patches asyncio.sleep everywhere)."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr("app.infrastructure.adapters.llm.resilience.asyncio.sleep", fake_sleep)
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors_respecting_retry_after(sleeps):
+    """A 429 waits at least its Retry-After; a 503 is retried with backoff."""
+    create = AsyncMock(side_effect=[
+        api_error(429, {"retry-after": "2"}), api_error(503), completion("done")
+    ])
+    adapter, _ = make_adapter(create, max_retries=2)
+
+    result = await adapter.generate_completion("prompt", model="m", cache=False)
+
+    assert result["content"] == "done"
+    assert create.await_count == 3
+    assert sleeps[0] >= 2
+    assert adapter.resilience.snapshot()["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_client_errors_and_long_retry_after_are_not_retried(sleeps):
+    """A 400, or a Retry-After beyond the backoff cap, fails straight away."""
+    adapter, _ = make_adapter(AsyncMock(side_effect=api_error(400)))
+    with pytest.raises(LLMUpstreamError, match="Groq API error") as error:
+        await adapter.generate_completion("prompt", model="m", cache=False)
+    assert error.value.retryable is False
+
+    create = AsyncMock(side_effect=api_error(429, {"retry-after": "120"}))
+    adapter, _ = make_adapter(create, backoff_max=8.0)
+    with pytest.raises(LLMUpstreamError):
+        await adapter.generate_completion("prompt", model="m", cache=False)
+    assert create.await_count == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_deadline_then_fallback_model():
+    """Attempts past the deadline are retried, then the fallback model answers."""
+    async def create(model, **kwargs):
+        if model == "quality":
+            await asyncio.sleep(1)
+        return completion(model)
+
+    adapter, _ = make_adapter(
+        create, deadlines={"quality": 0.01}, max_retries=1, fallbacks={"quality": "fast"}
+    )
+
+    result = await adapter.generate_completion("prompt", model="quality", cache=False)
+
+    assert result["model"] == "fast"
+    assert result["content"] == "fast"
+    snapshot = adapter.resilience.snapshot()
+    assert snapshot["deadline_timeouts"] == 2
+    assert snapshot["fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_error_without_fallback():
+    async def create(**kwargs):
+        await asyncio.sleep(1)
+
+    adapter, _ = make_adapter(create, default_deadline=0.01, max_retries=0)
+
+    with pytest.raises(LLMUpstreamError) as error:
+        await adapter.generate_completion("prompt", model="m", cache=False)
+    assert isinstance(error.value.error, LLMDeadlineExceeded)
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_over_slow_primary():
+    """Past the p95 latency a duplicate is sent and the first answer is used."""
+    calls = 0
+
+    async def create(**kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+            return completion("slow")
+        return completion("hedge")
+
+    adapter, _ = make_adapter(create, hedge=True, hedge_min_delay=0.01)
+    for _ in range(adapter.resilience.latency.min_samples):
+        adapter.resilience.latency.record("m", 0.005)
+
+    result = await asyncio.wait_for(
+        adapter.generate_completion("prompt", model="m", cache=False), timeout=0.5
+    )
+
+    assert result["content"] == "hedge"
+    snapshot = adapter.resilience.snapshot()
+    assert snapshot["hedges"] == 1
+    assert snapshot["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_until_latency_is_known():
+    policy = LLMResiliencePolicy({}, default_deadline=1.0, hedge=True)
+    assert policy.hedge_delay("m") is None
+
+
+@pytest.mark.asyncio
+async def test_deep_quality_queue_routes_to_fast_model():
+    """While the quality model's queue is deep, new calls go to the fast model."""
+    create = AsyncMock(return_value=completion())
+    adapter, _ = make_adapter(create, fallbacks={"quality": "fast"}, fallback_queue_depth=1)
+    adapter.limiter = ModelConcurrencyLimiter({"quality": 1}, default_limit=1, queue_timeout=1)
+
+    async with adapter.limiter.slot("quality"):
+        waiting = asyncio.create_task(
+            adapter.generate_completion("prompt", model="quality", cache=False)
+        )
+        await asyncio.sleep(0)
+        routed = await adapter.generate_completion("prompt", model="quality", cache=False)
+    queued = await waiting
+
+    assert routed["model"] == "fast"
+    assert queued["model"] == "quality"
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_skipped_when_the_model_has_no_free_slot():
+    """A hedge never pushes a model past its concurrency limit."""
+    create = AsyncMock(side_effect=[completion("slow")])
+
+    async def slow_create(**kwargs):
+        await asyncio.sleep(0.05)
+        return await create(**kwargs)
+
+    adapter, _ = make_adapter(slow_create, hedge=True, hedge_min_delay=0.01)
+    adapter.limiter = ModelConcurrencyLimiter({"m": 1}, default_limit=1, queue_timeout=1)
+    for _ in range(adapter.resilience.latency.min_samples):
+        adapter.resilience.latency.record("m", 0.005)
+
+    result = await adapter.generate_completion("prompt", model="m", cache=False)
+
+    assert result["content"] == "slow"
+    assert create.await_count == 1
+    snapshot = adapter.resilience.snapshot()
+    assert snapshot["hedges"] == 0
+    assert snapshot["hedges_skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_charged_to_the_user_budget():
+    """An admitted hedge takes its own slot and its estimate from the user's budget."""
+    calls = 0
+
+    async def create(**kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+            return completion("slow")
+        return completion("hedge")
+
+    adapter, _ = make_adapter(create, hedge=True, hedge_min_delay=0.01)
+    adapter.limiter = ModelConcurrencyLimiter({"m": 2}, default_limit=2, queue_timeout=1)
+    adapter.token_limiter = UserTokenLimiter({"m": 6000}, default_tokens_per_minute=0,
+                                             max_wait=5.0, clock=lambda: 0.0)
+    for _ in range(adapter.resilience.latency.min_samples):
+        adapter.resilience.latency.record("m", 0.005)
+
+    token = current_llm_user.set(7)
+    try:
+        result = await asyncio.wait_for(
+            adapter.generate_completion("prompt", max_tokens=100, model="m", cache=False),
+            timeout=0.5,
+        )
+    finally:
+        current_llm_user.reset(token)
+
+    assert result["content"] == "hedge"
+    bucket = adapter.token_limiter._buckets[(7, "m")]
+    # The winner settles to its real usage (3); the hedge pays its full estimate
+    assert bucket.tokens == 6000 - 3 - estimate_tokens("prompt", 100)
+    assert adapter.limiter.snapshot()["m"]["in_flight"] == 0
@@ -0,0 +1,143 @@
+"""Tests for the content-addressed LLM response cache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.adapters.llm.groq_adapter import GroqAdapter
+from app.infrastructure.adapters.llm.response_cache import (
+    InMemoryLRUCache,
+    LLMResponseCache,
+    SQLiteResponseCache,
+    TieredCache,
+    make_cache_key,
+)
+from app.infrastructure.database.migrations import upgrade
+
+
+@pytest_asyncio.fixture
+async def cache_session_factory(tmp_path):
+    """Session factory on a migrated database with the llm_response_cache table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+    await upgrade(engine)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+def fake_client(content: str = "ok"):
+    """AsyncGroq stand-in that counts completion calls."""
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(total_tokens=30, prompt_tokens=20, completion_tokens=10),
+    ))
+    return client
+
+
+def test_cache_key_covers_every_parameter():
+    """Changing any request parameter changes the key; identical requests match."""
+    base = ("model-a", "prompt", 500, 0.3, {"type": "json_object"})
+
+    assert make_cache_key(*base) == make_cache_key(*base)
+    for i, changed in enumerate(["model-b", "other", 501, 0.2, None]):
+        variant = list(base)
+        variant[i] = changed
+        assert make_cache_key(*variant) != make_cache_key(*base)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    """The LRU drops the least recently read entry when full."""
+    cache = InMemoryLRUCache(max_entries=2, ttl_seconds=60)
+    await cache.set("a", "m", {"v": 1})
+    await cache.set("b", "m", {"v": 2})
+    await cache.get("a")
+    await cache.set("c", "m", {"v": 3})
+
+    assert await cache.get("a") == {"v": 1}
+    assert await cache.get("b") is None
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_entries():
+    """Entries past their TTL read as misses."""
+    cache = InMemoryLRUCache(max_entries=10, ttl_seconds=-1)
+    await cache.set("a", "m", {"v": 1})
+
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_survives_restart(cache_session_factory):
+    """A fresh tier (new process) finds responses stored by the previous one."""
+    first = TieredCache(
+        InMemoryLRUCache(10, 60), SQLiteResponseCache(60, session_factory=cache_session_factory)
+    )
+    await first.set("key", "model", {"content": "cached"})
+
+    restarted = TieredCache(
+        InMemoryLRUCache(10, 60), SQLiteResponseCache(60, session_factory=cache_session_factory)
+    )
+    assert await restarted.get("key") == {"content": "cached"}
+    assert await restarted.memory.get("key") == {"content": "cached"}
+
+    expired = SQLiteResponseCache(-1, session_factory=cache_session_factory)
+    await expired.set("old", "model", {"content": "stale"})
+    assert await expired.get("old") is None
+    assert await expired.purge_expired() == 1
+
+
+@pytest.mark.asyncio
+async def test_adapter_serves_repeated_deterministic_calls_from_cache():
+    """A repeated low-temperature call hits the cache and skips the API."""
+    client = fake_client()
+    cache = LLMResponseCache(InMemoryLRUCache(10, 60), max_temperature=0.3)
+    adapter = GroqAdapter(client=client, response_cache=cache)
+
+    first = await adapter.generate_completion("rank these", max_tokens=100, temperature=0.3)
+    await cache.flush()
+    second = await adapter.generate_completion("rank these", max_tokens=100, temperature=0.3)
+
+    assert client.chat.completions.create.await_count == 1
+    assert second["content"] == first["content"]
+    assert second["cached"] is True
+    assert "cached" not in first
+    assert cache.metrics.snapshot() == {
+        "hits": 1, "misses": 1, "stores": 1, "errors": 0, "hit_rate": 0.5, "tokens_saved": 30,
+    }
+
+
+@pytest.mark.asyncio
+async def test_adapter_skips_cache_for_creative_calls_and_opt_out():
+    """High-temperature calls and cache=False always reach the API."""
+    client = fake_client()
+    cache = LLMResponseCache(InMemoryLRUCache(10, 60), max_temperature=0.3)
+    adapter = GroqAdapter(client=client, response_cache=cache)
+
+    for _ in range(2):
+        await adapter.generate_completion("write a letter", temperature=0.8)
+        await adapter.generate_completion("score this", temperature=0.3, cache=False)
+        await cache.flush()
+
+    assert client.chat.completions.create.await_count == 4
+    assert cache.metrics.hits == cache.metrics.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_backend_errors_do_not_fail_calls():
+    """A broken backend is counted and bypassed."""
+    backend = MagicMock()
+    backend.get = AsyncMock(side_effect=RuntimeError("disk full"))
+    backend.set = AsyncMock(side_effect=RuntimeError("disk full"))
+    cache = LLMResponseCache(backend, max_temperature=0.3)
+    adapter = GroqAdapter(client=fake_client(), response_cache=cache)
+
+    result = await adapter.generate_completion("score this", temperature=0.3)
+    await cache.flush()
+
+    assert result["content"] == "ok"
+    assert cache.metrics.errors == 2
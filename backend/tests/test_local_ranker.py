@@ -0,0 +1,145 @@
+"""Tests for the local BM25 ranker and RankingService modes and reuse."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.local_ranker import LexicalIndex, rank_profile_content
+from app.application.services.ranking_service import RankingService
+
+
+def make_job(**overrides):
+    fields = dict(
+        user_id=1, title="Backend Engineer", company="Acme",
+        description="Build Python APIs with FastAPI and PostgreSQL on AWS.",
+        requirements=["3+ years Python", "Docker and Kubernetes"],
+        parsed_keywords=["python", "fastapi", "postgresql", "aws", "docker", "k8s"],
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+EXPERIENCES = [
+    SimpleNamespace(id="barista", title="Barista", company="Cafe",
+                    description="Served coffee and managed the register.", achievements=[]),
+    SimpleNamespace(id="backend", title="Software Engineer", company="Startup",
+                    description="Built REST APIs in Python with FastAPI backed by PostgreSQL.",
+                    achievements=["Moved services to Kubernetes on AWS"]),
+    SimpleNamespace(id="frontend", title="Frontend Developer", company="Agency",
+                    description="Built React dashboards in TypeScript on top of backend APIs.", achievements=[]),
+]
+
+PROJECTS = [
+    SimpleNamespace(id="game", name="Game", description="A Unity platformer", technologies=["C#"]),
+    SimpleNamespace(id="api", name="Job Tracker", description="Tracks applications",
+                    technologies=["Python", "FastAPI", "Docker"]),
+]
+
+
+def test_index_scores_matching_documents_higher():
+    """BM25 prefers documents with more (and rarer) query terms."""
+    index = LexicalIndex([("a", {"python": 1, "sql": 1}), ("b", {"java": 2}), ("c", {"python": 1})])
+
+    assert [doc_id for doc_id, _ in index.rank({"python": 1.0, "sql": 1.0})] == ["a", "c", "b"]
+    assert index.rank({"rust": 1.0}) == [("a", 0.0), ("b", 0.0), ("c", 0.0)]
+
+
+def test_rank_profile_content_orders_by_relevance():
+    """Relevant experiences and projects come first; scores and matches are reported."""
+    ranking = rank_profile_content(make_job(), EXPERIENCES, PROJECTS)
+
+    assert ranking.ranked_experience_ids == ["backend", "frontend", "barista"]
+    assert ranking.ranked_project_ids == ["api", "game"]
+    assert ranking.relevance_scores["backend"] > ranking.relevance_scores["barista"]
+    assert ranking.keyword_matches["kubernetes"] == 1
+    assert ranking.keyword_matches["python"] == 2
+
+
+def test_rank_profile_content_is_deterministic():
+    """The same inputs always give the same order."""
+    first = rank_profile_content(make_job(), EXPERIENCES, PROJECTS)
+    second = rank_profile_content(make_job(), EXPERIENCES, PROJECTS)
+
+    assert first == second
+
+
+def make_service(llm_result=None):
+    llm = AsyncMock()
+    llm.rank_content.return_value = llm_result or {}
+    profile_repo = AsyncMock()
+    profile_repo.get_active_by_user_id.return_value = SimpleNamespace(id=str(uuid4()), projects=PROJECTS)
+    profile_repo.get_experiences_by_profile_id.return_value = EXPERIENCES
+    profile_repo.get_text_index.return_value = {}
+    job_repo = AsyncMock()
+    job_repo.get_by_id.return_value = make_job()
+    ranking_repo = AsyncMock()
+    ranking_repo.get_by_job.return_value = None
+    return RankingService(llm, ranking_repo, profile_repo, job_repo), llm
+
+
+@pytest.mark.asyncio
+async def test_local_mode_skips_llm():
+    """Local rankings are saved without calling the LLM."""
+    service, llm = make_service()
+
+    ranking = await service.create_ranking(1, uuid4(), mode="local")
+
+    llm.rank_content.assert_not_called()
+    assert ranking.ranked_experience_ids[0] == "backend"
+    assert ranking.relevance_scores is not None
+    assert "'ranker': 'local'" in ranking.llm_metadata
+
+
+@pytest.mark.asyncio
+async def test_hybrid_mode_sends_only_shortlist_to_llm():
+    """Hybrid sends the local top-K to the LLM and appends the rest in local order."""
+    service, llm = make_service({
+        "ranked_experience_ids": [2, 1],
+        "ranked_project_ids": [1],
+        "ranking_rationale": "shortlist reranked",
+    })
+
+    with patch("app.application.services.ranking_service.get_settings") as settings:
+        settings.return_value.ranking_hybrid_top_k = 2
+        ranking = await service.create_ranking(1, uuid4(), mode="hybrid")
+
+    _, exp_list, proj_list = llm.rank_content.call_args.args
+    assert len(exp_list) == 2
+    assert len(proj_list) == 2
+    local = rank_profile_content(make_job(), EXPERIENCES, PROJECTS)
+    shortlist = local.ranked_experience_ids[:2]
+    assert ranking.ranked_experience_ids == [shortlist[1], shortlist[0], local.ranked_experience_ids[2]]
+    assert ranking.ranked_project_ids == local.ranked_project_ids
+    assert ranking.ranking_rationale == "shortlist reranked"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_content_reuses_stored_ranking():
+    """A matching fingerprint returns the stored ranking without re-ranking."""
+    service, llm = make_service()
+    first = await service.create_ranking(1, uuid4(), mode="llm")
+    service.ranking_repo.get_by_job.return_value = first
+
+    again = await service.create_ranking(1, first.job_id, mode="llm")
+
+    assert again is first
+    assert llm.rank_content.call_count == 1
+    service.ranking_repo.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changed_content_or_force_regenerates():
+    """Editing the profile, switching ranker or force=True replaces the ranking."""
+    service, llm = make_service()
+    stored = await service.create_ranking(1, uuid4(), mode="llm")
+    service.ranking_repo.get_by_job.return_value = stored
+
+    await service.create_ranking(1, stored.job_id, mode="llm", force=True)
+    await service.create_ranking(1, stored.job_id, mode="local")
+    service.profile_repo.get_experiences_by_profile_id.return_value = EXPERIENCES[:2]
+    await service.create_ranking(1, stored.job_id, mode="llm")
+
+    assert llm.rank_content.call_count == 3
+    assert service.ranking_repo.delete.call_count == 3
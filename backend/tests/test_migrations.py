@@ -0,0 +1,143 @@
+"""Tests for the versioned schema migration runner."""
+
+import sqlite3
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.database.migrations import (
+    SchemaOutOfDateError,
+    ensure_schema_current,
+    get_current_version,
+    latest_version,
+    upgrade,
+)
+from app.infrastructure.database.models import Base
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "migrations.db"
+
+
+@pytest_asyncio.fixture
+async def engine(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    yield engine
+    await engine.dispose()
+
+
+async def _columns(engine, table):
+    async with engine.connect() as conn:
+        return await conn.run_sync(
+            lambda sync_conn: [c["name"] for c in inspect(sync_conn).get_columns(table)]
+        )
+
+
+@pytest.mark.asyncio
+async def test_upgrade_fresh_database(engine):
+    """A fresh database is created at the latest version with every model table."""
+    assert await get_current_version(engine) == 0
+
+    applied = await upgrade(engine)
+
+    assert applied == list(range(1, latest_version() + 1))
+    assert await get_current_version(engine) == latest_version()
+    async with engine.connect() as conn:
+        tables = await conn.run_sync(lambda sync_conn: set(inspect(sync_conn).get_table_names()))
+    assert set(Base.metadata.tables) <= tables
+
+
+@pytest.mark.asyncio
+async def test_migrations_are_frozen_and_reach_the_model_schema(engine):
+    """Version 1 is the historical schema; the full chain adds every model column and index."""
+    await upgrade(engine, target=1)
+    assert "render_hash" not in await _columns(engine, "exports")
+    assert "text_index" not in await _columns(engine, "experiences")
+
+    await upgrade(engine)
+
+    def schema(sync_conn):
+        inspector = inspect(sync_conn)
+        return {
+            table: (
+                {column["name"] for column in inspector.get_columns(table)},
+                {index["name"] for index in inspector.get_indexes(table)},
+            )
+            for table in inspector.get_table_names()
+        }
+
+    async with engine.connect() as conn:
+        migrated = await conn.run_sync(schema)
+    for table in Base.metadata.tables.values():
+        columns, indexes = migrated[table.name]
+        assert {column.name for column in table.columns} <= columns, table.name
+        assert {index.name for index in table.indexes} <= indexes, table.name
+
+
+@pytest.mark.asyncio
+async def test_upgrade_is_idempotent(engine):
+    """Re-running upgrade on a current database applies nothing."""
+    await upgrade(engine)
+
+    assert await upgrade(engine) == []
+
+
+@pytest.mark.asyncio
+async def test_upgrade_legacy_database(engine, db_path):
+    """An unversioned database built by the old ad-hoc scripts is brought up to date."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE generations (
+            id TEXT PRIMARY KEY, user_id INTEGER NOT NULL, job_id TEXT NOT NULL,
+            ranking_id TEXT, document_type TEXT NOT NULL, content_text TEXT NOT NULL,
+            status TEXT, ats_score REAL, ats_feedback TEXT, llm_metadata TEXT,
+            created_at TIMESTAMP
+        );
+        CREATE TABLE exports (
+            id TEXT PRIMARY KEY, user_id INTEGER NOT NULL, generation_id TEXT,
+            format TEXT NOT NULL, template TEXT NOT NULL, filename TEXT NOT NULL,
+            file_path TEXT NOT NULL, file_size_bytes INTEGER NOT NULL, page_count INTEGER,
+            options TEXT, metadata TEXT, download_url TEXT,
+            expires_at TIMESTAMP NOT NULL, created_at TIMESTAMP NOT NULL
+        );
+        INSERT INTO generations (id, user_id, job_id, document_type, content_text)
+            VALUES ('gen-1', 1, 'job-1', 'resume', 'text');
+        INSERT INTO exports (id, user_id, generation_id, format, template, filename,
+            file_path, file_size_bytes, metadata, expires_at, created_at)
+            VALUES ('exp-1', 1, 'gen-1', 'pdf', 'modern', 'r.pdf', 'k', 10, '{}',
+            '2030-01-01', '2025-01-01');
+    """)
+    conn.commit()
+    conn.close()
+
+    await upgrade(engine)
+
+    export_columns = await _columns(engine, "exports")
+    assert "export_metadata" in export_columns
+    assert "metadata" not in export_columns
+    assert {"job_id", "local_cache_path", "cache_expires_at"} <= set(export_columns)
+    assert "content_structured" in await _columns(engine, "generations")
+
+    conn = sqlite3.connect(db_path)
+    job_id, export_metadata = conn.execute(
+        "SELECT job_id, export_metadata FROM exports WHERE id = 'exp-1'"
+    ).fetchone()
+    conn.close()
+    assert job_id == "job-1"
+    assert export_metadata == "{}"
+
+
+@pytest.mark.asyncio
+async def test_ensure_schema_current_refuses_outdated_schema(engine):
+    """Startup fails fast on an outdated schema unless auto-migrate is enabled."""
+    await upgrade(engine, target=1)
+
+    with pytest.raises(SchemaOutOfDateError) as exc_info:
+        await ensure_schema_current(engine, auto_migrate=False)
+    assert exc_info.value.current == 1
+
+    assert await ensure_schema_current(engine, auto_migrate=True) == latest_version()
+    assert await ensure_schema_current(engine) == latest_version()
@@ -0,0 +1,157 @@
+"""EXPLAIN QUERY PLAN checks for hot repository queries.
+
+Each test runs a real repository method against a migrated SQLite database,
+captures the SELECT it issues and fails if SQLite plans a full table scan
+or an extra sort instead of using one of the composite indexes.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.enums.document_type import DocumentType
+from app.domain.enums.export_format import ExportFormat
+from app.infrastructure.database.migrations import upgrade
+from app.infrastructure.repositories.export_repository import ExportRepository
+from app.infrastructure.repositories.generation_repository import GenerationRepository
+from app.infrastructure.repositories.job_repository import JobRepository
+from app.infrastructure.repositories.ranking_repository import RankingRepository
+from app.infrastructure.repositories.sample_repository import SampleRepository
+from app.infrastructure.repositories.writing_style_repository import WritingStyleRepository
+
+
+@pytest_asyncio.fixture
+async def plan_session(tmp_path):
+    """Session on a migrated database that records every SELECT it runs."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    await upgrade(engine)
+
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.info["captured"] = captured
+        yield session
+
+    await engine.dispose()
+
+
+async def explain_last_query(session: AsyncSession) -> list:
+    """Return the EXPLAIN QUERY PLAN detail lines for the last captured SELECT."""
+    statement, parameters = session.info["captured"][-1]
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [row[3] for row in result.fetchall()]
+
+
+def assert_indexed(plan: list, index_name: str) -> None:
+    """Fail on full scans, sorts that an index should provide, or the wrong index."""
+    assert not any(line.startswith("SCAN") for line in plan), f"Full scan: {plan}"
+    assert not any("TEMP B-TREE" in line for line in plan), f"Extra sort: {plan}"
+    assert any(index_name in line for line in plan), f"Expected {index_name}: {plan}"
+
+
+@pytest.mark.asyncio
+async def test_ranking_get_by_job_uses_index(plan_session):
+    await RankingRepository(plan_session).get_by_job(1, uuid4())
+
+    assert_indexed(await explain_last_query(plan_session), "ix_job_content_rankings_user_job_created")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters, index_name", [
+    ({}, "ix_generations_user_id_created_at"),
+    ({"document_type": DocumentType.RESUME}, "ix_generations_user_type_created"),
+    ({"job_id": uuid4()}, "ix_generations_user_job_created"),
+])
+async def test_generation_list_by_user_uses_index(plan_session, filters, index_name):
+    await GenerationRepository(plan_session).list_by_user(1, **filters)
+
+    assert_indexed(await explain_last_query(plan_session), index_name)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format, index_name", [
+    (None, "idx_exports_user_job_created"),
+    (ExportFormat.PDF, "ix_exports_user_job_format_created"),
+])
+async def test_export_list_by_job_uses_index(plan_session, format, index_name):
+    await ExportRepository(plan_session).list_by_job(1, str(uuid4()), format=format)
+
+    assert_indexed(await explain_last_query(plan_session), index_name)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format, index_name", [
+    (None, "ix_exports_user_id_created_at"),
+    (ExportFormat.DOCX, "ix_exports_user_format_created"),
+])
+async def test_export_list_by_user_uses_index(plan_session, format, index_name):
+    await ExportRepository(plan_session).list_by_user(1, format=format)
+
+    assert_indexed(await explain_last_query(plan_session), index_name)
+
+
+@pytest.mark.asyncio
+async def test_writing_style_get_by_user_uses_index(plan_session):
+    await WritingStyleRepository(plan_session).get_by_user(1)
+
+    assert_indexed(await explain_last_query(plan_session), "ix_writing_styles_user_id_extraction_date")
+
+
+@pytest.mark.asyncio
+async def test_sample_get_active_sample_uses_index(plan_session):
+    await SampleRepository(plan_session).get_active_sample(1, "resume")
+
+    assert_indexed(await explain_last_query(plan_session), "ix_sample_documents_user_type_active_created")
+
+
+@pytest.mark.asyncio
+async def test_job_get_user_jobs_uses_index(plan_session):
+    await JobRepository(plan_session).get_user_jobs(1)
+
+    assert_indexed(await explain_last_query(plan_session), "ix_jobs_user_created_id")
+
+
+@pytest.mark.asyncio
+async def test_job_get_user_jobs_after_seeks_index(plan_session):
+    await JobRepository(plan_session).get_user_jobs_after(1, datetime(2025, 1, 1), "job-id")
+
+    plan = await explain_last_query(plan_session)
+    assert_indexed(plan, "ix_jobs_user_created_id")
+    assert any("(created_at,id)<(?,?)" in line for line in plan), f"No keyset seek: {plan}"
+
+
+@pytest.mark.asyncio
+async def test_job_count_user_jobs_uses_index(plan_session):
+    await JobRepository(plan_session).count_user_jobs(1)
+
+    # Any user_id index will do; COUNT needs no ordering
+    assert_indexed(await explain_last_query(plan_session), "(user_id=?)")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("list_summaries, index_name, heavy_columns", [
+    (lambda s: JobRepository(s).get_user_job_summaries(1), "ix_jobs_user_created_id",
+     ["description", "raw_text", "parsed_keywords"]),
+    (lambda s: GenerationRepository(s).list_summaries_by_user(1), "ix_generations_user_id_created_at",
+     ["content_text", "content_structured", "ats_feedback"]),
+    (lambda s: ExportRepository(s).list_summaries_by_user(1), "ix_exports_user_id_created_at",
+     ["options", "local_cache_path"]),
+])
+async def test_summary_projections_skip_heavy_columns(plan_session, list_summaries, index_name, heavy_columns):
+    await list_summaries(plan_session)
+
+    statement, _ = plan_session.info["captured"][-1]
+    select_list = statement.split(" FROM ")[0]
+    assert not any(column in select_list for column in heavy_columns), select_list
+    assert_indexed(await explain_last_query(plan_session), index_name)
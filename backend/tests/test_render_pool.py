@@ -0,0 +1,179 @@
+"""Tests for the export render executor (process pool, queue limit, timeout)."""
+
+import asyncio
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.services.export_renderer import ExportRenderer
+from app.application.services.export_service import ExportService
+from app.application.services.render_pool import (
+    RenderExecutor,
+    RenderQueueFullError,
+    RenderTimeoutError,
+)
+from app.domain.enums.document_type import DocumentType
+from app.domain.enums.export_format import ExportFormat
+from app.domain.enums.template_type import TemplateType
+from app.infrastructure.storage.async_storage import InMemoryStorage
+
+CONTENT = {
+    "header": {"name": "Ada Lovelace", "email": "ada@example.com"},
+    "sections": [{"type": "professional_summary", "content": "Engineer."}],
+}
+
+
+@pytest.mark.asyncio
+async def test_docx_renders_on_worker_process():
+    """A spawned, warmed worker returns the same document the renderer builds in-process."""
+    executor = RenderExecutor(workers=1, max_queue=2, timeout=60)
+    try:
+        content = await executor.render(ExportFormat.DOCX, CONTENT, TemplateType.MODERN)
+    finally:
+        executor.shutdown()
+
+    assert content[:2] == b"PK"
+    assert executor.snapshot()["rendered"] == 1
+    assert executor.snapshot()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_renders(monkeypatch):
+    """Renders beyond workers + queue limit fail fast instead of piling up."""
+    release = asyncio.Event()
+
+    async def blocked_submit(*args):
+        await release.wait()
+        return b"doc"
+
+    executor = RenderExecutor(workers=1, max_queue=1, timeout=5)
+    monkeypatch.setattr(executor, "_submit", blocked_submit)
+
+    running = [
+        asyncio.create_task(executor.render(ExportFormat.PDF, CONTENT, TemplateType.MODERN))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    with pytest.raises(RenderQueueFullError):
+        await executor.render(ExportFormat.PDF, CONTENT, TemplateType.MODERN)
+
+    release.set()
+    assert await asyncio.gather(*running) == [b"doc", b"doc"]
+    assert executor.snapshot()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_render_times_out_without_blocking_loop(monkeypatch):
+    """A render past its timeout fails while the event loop keeps serving."""
+    monkeypatch.setattr(ExportRenderer, "render_docx", lambda self, *args: time.sleep(0.3))
+    executor = RenderExecutor(workers=0, max_queue=1, timeout=0.05)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticking = asyncio.create_task(ticker())
+    with pytest.raises(RenderTimeoutError):
+        await executor.render(ExportFormat.DOCX, CONTENT, TemplateType.MODERN)
+    ticking.cancel()
+
+    assert ticks >= 3
+    assert executor.snapshot()["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_render_holds_capacity_until_it_finishes(monkeypatch):
+    """A timed-out render still occupies its worker, so it still counts against capacity."""
+    monkeypatch.setattr(ExportRenderer, "render_docx", lambda self, *args: time.sleep(0.2))
+    executor = RenderExecutor(workers=0, max_queue=0, timeout=0.02)
+
+    with pytest.raises(RenderTimeoutError):
+        await executor.render(ExportFormat.DOCX, CONTENT, TemplateType.MODERN)
+    assert executor.snapshot()["pending"] == 1
+    with pytest.raises(RenderQueueFullError):
+        await executor.render(ExportFormat.DOCX, CONTENT, TemplateType.MODERN)
+
+    await asyncio.sleep(0.3)
+    assert executor.snapshot()["pending"] == 0
+
+
+class FakePool:
+    def __init__(self):
+        self.jobs = []
+        self.shutdowns = []
+
+    def submit(self, fn, *args):
+        job = Future()
+        self.jobs.append(job)
+        return job
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdowns.append(wait)
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_replaced_once_without_blocking(monkeypatch):
+    """Renders failing on the same broken pool never shut down its replacement."""
+    broken, fresh = FakePool(), FakePool()
+    executor = RenderExecutor(workers=1, max_queue=2, timeout=5)
+    executor._pool = broken
+
+    def start():
+        if executor._pool is None:
+            executor._pool = fresh
+
+    monkeypatch.setattr(executor, "start", start)
+
+    renders = [
+        asyncio.create_task(executor.render(ExportFormat.DOCX, CONTENT, TemplateType.MODERN))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    for job in broken.jobs:
+        job.set_exception(BrokenProcessPool("worker died"))
+    while len(fresh.jobs) < 2:
+        await asyncio.sleep(0)
+    for job in fresh.jobs:
+        job.set_result(b"doc")
+
+    assert await asyncio.gather(*renders) == [b"doc", b"doc"]
+    assert executor._pool is fresh
+    assert broken.shutdowns == [False, False]
+    assert fresh.shutdowns == []
+
+
+@pytest.mark.asyncio
+async def test_export_service_awaits_render_executor():
+    """With an executor, exports never call the in-process renderer."""
+    generation = SimpleNamespace(
+        id="gen-1", user_id=1, job_id=None, content_structured=CONTENT,
+        document_type=DocumentType.RESUME
+    )
+    generation_repo = MagicMock(get_by_id=AsyncMock(return_value=generation))
+    renderer = MagicMock(spec=ExportRenderer)
+    render_executor = MagicMock(render=AsyncMock(return_value=b"PK docx"))
+    service = ExportService(
+        export_renderer=renderer,
+        storage=InMemoryStorage(),
+        generation_repository=generation_repo,
+        export_repository=MagicMock(
+            create=AsyncMock(), get_by_render_hash=AsyncMock(return_value=None)
+        ),
+        job_repository=MagicMock(),
+        render_executor=render_executor
+    )
+
+    export = await service.export_to_docx(1, "gen-1", TemplateType.MODERN)
+
+    render_executor.render.assert_awaited_once_with(
+        ExportFormat.DOCX, CONTENT, TemplateType.MODERN, None
+    )
+    renderer.render_docx.assert_not_called()
+    assert export.file_size_bytes == len(b"PK docx")
@@ -0,0 +1,229 @@
+"""Tests for the storage backends, the shared instance and the S3 reconnect path."""
+
+import asyncio
+import io
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import EndpointConnectionError, NoCredentialsError
+
+from app.application.services.export_renderer import get_export_renderer
+from app.core.config import get_settings
+from app.infrastructure.storage import async_storage
+from app.infrastructure.storage.async_storage import (
+    LocalAsyncStorage,
+    S3AsyncStorage,
+    close_storage,
+    get_storage,
+    init_storage,
+)
+from app.infrastructure.storage.s3_storage_adapter import S3StorageAdapter
+from app.presentation.api.export import get_export_service
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    """Hand out MagicMock boto3 clients instead of connecting to AWS."""
+    created = []
+
+    def create_client(self):
+        created.append(MagicMock())
+        return created[-1]
+
+    monkeypatch.setattr(S3StorageAdapter, "_create_client", create_client)
+    return created
+
+
+def make_adapter():
+    return S3StorageAdapter(bucket_name="bucket", region="us-west-2", access_key="a", secret_key="b")
+
+
+def test_bucket_is_validated_once(clients):
+    adapter = make_adapter()
+    adapter.upload_file(b"one", "a.pdf")
+    adapter.file_exists("a.pdf")
+    adapter.generate_presigned_url("a.pdf")
+
+    assert adapter.use_s3 is True
+    assert len(clients) == 1
+    clients[0].head_bucket.assert_called_once_with(Bucket="bucket")
+
+
+def test_connection_error_rebuilds_client_and_retries(clients):
+    adapter = make_adapter()
+    clients[0].put_object.side_effect = EndpointConnectionError(endpoint_url="https://s3")
+
+    assert adapter.upload_file(b"doc", "a.pdf") == "a.pdf"
+
+    assert len(clients) == 2
+    assert adapter.s3_client is clients[1]
+    clients[1].head_bucket.assert_called_once_with(Bucket="bucket")
+    clients[1].put_object.assert_called_once()
+
+
+def test_concurrent_connection_errors_rebuild_client_once(clients):
+    """Threads failing on the same client share one rebuild, and the old client is closed."""
+    adapter = make_adapter()
+    both_failed = threading.Barrier(2)
+
+    def drop_connection(**kwargs):
+        both_failed.wait(timeout=5)
+        raise EndpointConnectionError(endpoint_url="https://s3")
+
+    clients[0].put_object.side_effect = drop_connection
+    threads = [
+        threading.Thread(target=adapter.upload_file, args=(b"doc", f"{i}.pdf")) for i in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(clients) == 2
+    assert adapter.s3_client is clients[1]
+    clients[0].close.assert_called_once()
+    clients[1].head_bucket.assert_called_once_with(Bucket="bucket")
+    assert clients[1].put_object.call_count == 2
+
+
+def test_unreachable_s3_at_startup_keeps_s3_selected(clients, monkeypatch):
+    """A network blip while starting up is retried on first use, not a switch to local disk."""
+    def create_client(self):
+        client = MagicMock()
+        if not clients:
+            client.head_bucket.side_effect = [EndpointConnectionError(endpoint_url="https://s3"), None]
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(S3StorageAdapter, "_create_client", create_client)
+    adapter = make_adapter()
+    assert adapter.use_s3 is True
+
+    assert adapter.upload_file(b"doc", "a.pdf") == "a.pdf"
+    assert len(clients) == 1
+    assert clients[0].head_bucket.call_count == 2
+    clients[0].put_object.assert_called_once()
+
+
+def test_missing_credentials_fall_back_to_local_storage(clients, monkeypatch):
+    def create_client(self):
+        client = MagicMock()
+        client.head_bucket.side_effect = NoCredentialsError()
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(S3StorageAdapter, "_create_client", create_client)
+
+    assert make_adapter().use_s3 is False
+
+
+def test_client_construction_error_falls_back_to_local_storage():
+    """A misconfigured client (here an invalid region) is not mistaken for an outage."""
+    adapter = S3StorageAdapter(bucket_name="bucket", region="bad region!", access_key="k", secret_key="s")
+
+    assert adapter.use_s3 is False
+    assert adapter.s3_client is None
+
+
+def test_streamed_upload_is_rewound_before_retry(clients):
+    adapter = make_adapter()
+
+    def drop_connection(Fileobj, **kwargs):
+        Fileobj.read()
+        raise EndpointConnectionError(endpoint_url="https://s3")
+
+    clients[0].upload_fileobj.side_effect = drop_connection
+    adapter.upload_fileobj(io.BytesIO(b"zip bytes"), "batch.zip", "application/zip")
+
+    assert clients[1].upload_fileobj.call_args.kwargs["Fileobj"].read() == b"zip bytes"
+
+
+@pytest.mark.asyncio
+async def test_s3_calls_run_on_bounded_pool_without_blocking_loop(clients):
+    """Slow boto3 calls run at most max_workers at a time while the loop keeps serving."""
+    storage = S3AsyncStorage(make_adapter(), max_workers=2)
+    running = peak = ticks = 0
+    lock = threading.Lock()
+
+    def slow_put(**kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    clients[0].put_object.side_effect = slow_put
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticking = asyncio.create_task(ticker())
+    try:
+        await asyncio.gather(*(storage.upload_file(b"doc", f"{i}.pdf") for i in range(4)))
+    finally:
+        ticking.cancel()
+        storage.close()
+
+    assert peak == 2
+    assert ticks >= 10
+    clients[0].close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_local_storage_round_trip(tmp_path):
+    storage = LocalAsyncStorage(tmp_path)
+
+    await storage.upload_file(b"pdf", "exports/1/a.pdf", "application/pdf")
+    await storage.upload_fileobj(io.BytesIO(b"zip"), "exports/1/b.zip", "application/zip")
+
+    assert await storage.get_file_content("exports/1/a.pdf") == b"pdf"
+    assert (tmp_path / "exports_1_b.zip").read_bytes() == b"zip"
+    assert (await storage.generate_presigned_url("exports/1/a.pdf")).startswith(
+        "/api/v1/exports/download/exports_1_a.pdf?token="
+    )
+    await storage.delete_file("exports/1/a.pdf")
+    await storage.delete_file("exports/1/missing.pdf")
+    assert await storage.file_exists("exports/1/a.pdf") is False
+    assert await storage.get_file_content("exports/1/a.pdf") is None
+
+
+@pytest.mark.asyncio
+async def test_download_serves_files_from_shared_local_storage(client, tmp_path, monkeypatch):
+    """The download endpoint reads from the storage root the shared backend was built with."""
+    storage = LocalAsyncStorage(tmp_path)
+    monkeypatch.setattr(async_storage, "_storage", storage)
+    await storage.upload_file(b"%PDF", "exports/1/a.pdf", "application/pdf")
+
+    url = await storage.generate_presigned_url("exports/1/a.pdf")
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.content == b"%PDF"
+
+    await storage.delete_file("exports/1/a.pdf")
+    assert (await client.get(url)).status_code == 404
+
+
+def test_export_service_reuses_shared_storage_and_renderer(clients, monkeypatch):
+    """Building a service per request must not open a new S3 client."""
+    monkeypatch.setattr(get_settings(), "aws_access_key_id", "a")
+    monkeypatch.setattr(get_settings(), "aws_secret_access_key", "b")
+    monkeypatch.setattr(async_storage, "_storage", None)
+    storage = init_storage()
+    try:
+        first = get_export_service(session=MagicMock())
+        second = get_export_service(session=MagicMock())
+
+        assert isinstance(storage, S3AsyncStorage)
+        assert first.storage is second.storage is storage is get_storage()
+        assert first.renderer is second.renderer is get_export_renderer()
+    finally:
+        close_storage()
+    assert len(clients) == 1
+    clients[0].close.assert_called_once()
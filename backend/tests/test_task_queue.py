@@ -0,0 +1,261 @@
+"""Tests for the SQLite-backed background task queue and its API."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.application.services.task_queue import TaskQueue
+from app.core.dependencies import get_current_user
+from app.domain.enums.generation_status import GenerationStatus
+from app.infrastructure.repositories.task_repository import TaskRepository
+from app.main import app
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Session factory on the test database, as the workers use."""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+def make_queue(session_factory, handler, **kwargs):
+    options = {"max_attempts": 3, "backoff_seconds": 0, "poll_interval": 0.01, **kwargs}
+    return TaskQueue({"echo": handler}, session_factory=session_factory, **options)
+
+
+async def get_task(session_factory, task_id, user_id=1):
+    async with session_factory() as session:
+        return await TaskRepository(session).get_by_id(task_id, user_id)
+
+
+@pytest.mark.asyncio
+async def test_run_next_records_result(session_factory):
+    """A claimed task runs its handler and stores the result as completed."""
+    async def echo(session, task):
+        return {"echo": task.payload["value"]}
+
+    queue = make_queue(session_factory, echo)
+    async with session_factory() as session:
+        task = await queue.enqueue(session, 1, "echo", {"value": 42})
+
+    assert await queue.run_next() is True
+    assert await queue.run_next() is False
+
+    stored = await get_task(session_factory, task.id)
+    assert stored.status == GenerationStatus.COMPLETED
+    assert stored.result == {"echo": 42}
+    assert stored.attempts == 1
+    assert stored.completed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_failures_retry_with_backoff_then_fail(session_factory):
+    """Transient errors are retried after an exponential delay until attempts run out."""
+    async def flaky(session, task):
+        raise ConnectionError("upstream reset")
+
+    queue = make_queue(session_factory, flaky, max_attempts=2)
+    async with session_factory() as session:
+        task = await queue.enqueue(session, 1, "echo", {})
+
+    await queue.run_next()
+    retrying = await get_task(session_factory, task.id)
+    assert retrying.status == GenerationStatus.PENDING
+    assert "upstream reset" in retrying.error
+
+    await queue.run_next()
+    failed = await get_task(session_factory, task.id)
+    assert failed.status == GenerationStatus.FAILED
+    assert failed.attempts == 2
+
+    assert [make_queue(session_factory, flaky, backoff_seconds=5).retry_delay(n) for n in (1, 2, 3)] == [5, 10, 20]
+
+
+@pytest.mark.asyncio
+async def test_retry_waits_until_due(session_factory):
+    """A task scheduled for later is not claimed early."""
+    async def flaky(session, task):
+        raise TimeoutError("slow")
+
+    queue = make_queue(session_factory, flaky, backoff_seconds=60)
+    async with session_factory() as session:
+        task = await queue.enqueue(session, 1, "echo", {})
+
+    await queue.run_next()
+    assert await queue.run_next() is False
+    stored = await get_task(session_factory, task.id)
+    assert stored.run_after > datetime.utcnow() + timedelta(seconds=50)
+
+
+@pytest.mark.asyncio
+async def test_value_error_fails_without_retry(session_factory):
+    """Missing or invalid input is permanent, so the task fails on the first attempt."""
+    async def missing(session, task):
+        raise ValueError("Profile not found")
+
+    queue = make_queue(session_factory, missing)
+    async with session_factory() as session:
+        task = await queue.enqueue(session, 1, "echo", {})
+
+    await queue.run_next()
+
+    stored = await get_task(session_factory, task.id)
+    assert stored.status == GenerationStatus.FAILED
+    assert stored.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_workers_bound_concurrency_and_requeue_interrupted(session_factory):
+    """Started workers drain the queue two at a time, including tasks whose lease expired."""
+    in_flight, peak = 0, 0
+
+    async def slow(session, task):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return {}
+
+    queue = make_queue(session_factory, slow, workers=2)
+    async with session_factory() as session:
+        tasks = [await queue.enqueue(session, 1, "echo", {}) for _ in range(5)]
+        # Simulate a task claimed by a process that then stopped renewing its lease
+        await TaskRepository(session).claim_next(
+            "dead-process", lease_seconds=60, now=datetime.utcnow() - timedelta(minutes=5)
+        )
+
+    await queue.start()
+    try:
+        for _ in range(200):
+            statuses = [(await get_task(session_factory, task.id)).status for task in tasks]
+            if all(status == GenerationStatus.COMPLETED for status in statuses):
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await queue.stop()
+
+    assert statuses == [GenerationStatus.COMPLETED] * 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_tasks_leased_to_another_process_are_not_requeued(session_factory):
+    """Starting a second process leaves another process's running task alone."""
+    async def echo(session, task):
+        return {}
+
+    queue = make_queue(session_factory, echo)
+    async with session_factory() as session:
+        task = await queue.enqueue(session, 1, "echo", {})
+        await TaskRepository(session).claim_next("other-process", lease_seconds=60)
+
+    assert await queue.requeue_expired() == 0
+    assert await queue.run_next() is False
+    stored = await get_task(session_factory, task.id)
+    assert stored.status == GenerationStatus.GENERATING
+    assert stored.claimed_by == "other-process"
+
+
+@pytest.mark.asyncio
+async def test_running_task_renews_its_lease(session_factory):
+    """The heartbeat keeps a long task's lease ahead of expiry until it finishes."""
+    leases = []
+
+    async def slow(session, task):
+        for _ in range(3):
+            await asyncio.sleep(0.05)
+            leases.append((await get_task(session_factory, task.id)).lease_expires_at)
+        return {}
+
+    queue = make_queue(session_factory, slow, lease_seconds=0.06)
+    async with session_factory() as session:
+        task = await queue.enqueue(session, 1, "echo", {})
+
+    await queue.run_next()
+
+    assert leases == sorted(leases) and leases[0] < leases[-1]
+    stored = await get_task(session_factory, task.id)
+    assert stored.status == GenerationStatus.COMPLETED
+    assert stored.claimed_by is None and stored.lease_expires_at is None
+
+
+async def steal_task(session_factory, task_id, owner="other-process"):
+    """Expire a running task's lease and let another process claim it."""
+    async with session_factory() as session:
+        repo = TaskRepository(session)
+        await repo.requeue_expired(now=datetime.utcnow() + timedelta(hours=1))
+        stolen = await repo.claim_next(owner, lease_seconds=60)
+    assert stolen.id == task_id
+
+
+@pytest.mark.asyncio
+async def test_run_that_lost_its_lease_does_not_record_outcome(session_factory):
+    """A run finishing after its task was reclaimed leaves the new run's row alone."""
+    async def overtaken(session, task):
+        await steal_task(session_factory, task.id)
+        return {"stale": True}
+
+    queue = make_queue(session_factory, overtaken)
+    async with session_factory() as session:
+        task = await queue.enqueue(session, 1, "echo", {})
+
+    await queue.run_next()
+
+    stored = await get_task(session_factory, task.id)
+    assert stored.status == GenerationStatus.GENERATING
+    assert stored.claimed_by == "other-process"
+    assert stored.result is None
+
+
+@pytest.mark.asyncio
+async def test_losing_the_lease_cancels_the_handler(session_factory):
+    """When the heartbeat finds the lease taken the handler stops instead of running on."""
+    cancelled = False
+
+    async def overtaken(session, task):
+        nonlocal cancelled
+        await steal_task(session_factory, task.id)
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return {}
+
+    queue = make_queue(session_factory, overtaken, lease_seconds=0.06)
+    async with session_factory() as session:
+        task = await queue.enqueue(session, 1, "echo", {})
+
+    assert await asyncio.wait_for(queue.run_next(), timeout=1) is True
+
+    assert cancelled
+    stored = await get_task(session_factory, task.id)
+    assert stored.status == GenerationStatus.GENERATING
+    assert stored.claimed_by == "other-process"
+
+
+@pytest.mark.asyncio
+async def test_api_queues_task_and_reports_status(client):
+    """Queue endpoints return 202 with a task ID that only its owner can poll."""
+    app.dependency_overrides[get_current_user] = lambda: 1
+    response = await client.post("/api/v1/tasks/cover-letter", json={
+        "job_id": "8a1e2c7e-35c4-4a59-9a43-64b1e0c6b0f1"
+    })
+    assert response.status_code == 202
+    body = response.json()
+    assert body["status"] == "pending"
+    assert body["status_url"] == f"/api/v1/tasks/{body['task_id']}"
+
+    status_response = await client.get(body["status_url"])
+    assert status_response.status_code == 200
+    assert status_response.json()["task_type"] == "cover_letter"
+    assert status_response.json()["attempts"] == 0
+
+    app.dependency_overrides[get_current_user] = lambda: 2
+    assert (await client.get(body["status_url"])).status_code == 404
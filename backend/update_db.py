@@ -1,18 +1,9 @@
-"""Update database tables with sample_documents."""
+"""Update database tables by applying pending schema migrations."""
 
 import asyncio
-from app.infrastructure.database.connection import create_engine
-from app.infrastructure.database.models import Base
 
-
-async def init_db():
-    """Initialize database tables."""
-    engine = create_engine()
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    await engine.dispose()
-    print('Database tables created/updated successfully')
+from init_database import init_database
 
 
 if __name__ == "__main__":
-    asyncio.run(init_db())
+    asyncio.run(init_database())